@@ -0,0 +1,28 @@
+"""add recommendation log session index
+
+Revision ID: 3b1f6c2d9a10
+Revises: e958a19b7516
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b1f6c2d9a10"
+down_revision: Union[str, None] = "e958a19b7516"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_recommendation_logs_session_created "
+        "ON recommendation_logs (session_id, created_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_recommendation_logs_session_created")
@@ -0,0 +1,78 @@
+"""add packed preference vector and country dictionary
+
+Revision ID: 7c4e2a9d5b31
+Revises: 3b1f6c2d9a10
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c4e2a9d5b31"
+down_revision: Union[str, None] = "3b1f6c2d9a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기본 속성 순서는 app.core.preference_vector.BASE_FIELDS와 같아야 함
+BASE_COLUMNS = [
+    ("spicy_preference", 0.5),
+    ("healthy_preference", 0.5),
+    ("vegetarian_preference", 0.5),
+    ("quick_preference", 0.5),
+    ("rice_preference", 0.5),
+    ("soup_preference", 0.5),
+    ("meat_preference", 0.5),
+    ("breakfast_preference", 0.33),
+    ("lunch_preference", 0.33),
+    ("dinner_preference", 0.34),
+]
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS preference_countries ("
+        "id SMALLSERIAL PRIMARY KEY, "
+        "name VARCHAR(50) NOT NULL UNIQUE)"
+    )
+    op.execute(
+        "ALTER TABLE user_preferences "
+        "ADD COLUMN IF NOT EXISTS preference_vector REAL[]"
+    )
+
+    # 카테고리와 기존 JSON에 등장한 국가를 사전에 등록
+    op.execute(
+        "INSERT INTO preference_countries (name) "
+        "SELECT name FROM ("
+        "  SELECT DISTINCT country AS name FROM categories"
+        "  UNION"
+        "  SELECT DISTINCT jsonb_object_keys(country_preferences::jsonb)"
+        "  FROM user_preferences"
+        "  WHERE country_preferences IS NOT NULL AND country_preferences <> ''"
+        ") countries ORDER BY name "
+        "ON CONFLICT (name) DO NOTHING"
+    )
+
+    # 개별 컬럼 + 국가 JSON을 패킹 벡터로 채움 (학습 안 된 국가/빈 id는 NaN)
+    base = ", ".join(
+        f"COALESCE({column}, {default})::real" for column, default in BASE_COLUMNS
+    )
+    op.execute(
+        "UPDATE user_preferences up SET preference_vector = "
+        f"ARRAY[{base}] || COALESCE(("
+        "  SELECT array_agg("
+        "    COALESCE((up.country_preferences::jsonb ->> pc.name)::real, 'NaN'::real)"
+        "    ORDER BY slot.id)"
+        "  FROM generate_series(1, (SELECT max(id) FROM preference_countries))"
+        "    AS slot(id)"
+        "  LEFT JOIN preference_countries pc ON pc.id = slot.id"
+        "), ARRAY[]::real[]) "
+        "WHERE preference_vector IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE user_preferences DROP COLUMN IF EXISTS preference_vector")
+    op.execute("DROP TABLE IF EXISTS preference_countries")
@@ -0,0 +1,46 @@
+"""add ab group bandit posteriors
+
+Revision ID: a6e1d9c4f082
+Revises: f3a8c2d6b915
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6e1d9c4f082"
+down_revision: Union[str, None] = "f3a8c2d6b915"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS ab_group_posteriors ("
+        "ab_group VARCHAR(50) PRIMARY KEY, "
+        "trials BIGINT NOT NULL DEFAULT 0, "
+        "successes BIGINT NOT NULL DEFAULT 0, "
+        "updated_at TIMESTAMP WITH TIME ZONE DEFAULT now())"
+    )
+    # 시간별 집계로 초기값 채우기
+    # - 시행 = 추천 노출, 성공 = 사용자의 favorite/recommend_select (시행 수까지만)
+    # - 퀴즈 자동 기록(auto_select)은 시행도 성공도 아님
+    op.execute(
+        "INSERT INTO ab_group_posteriors (ab_group, trials, successes) "
+        "SELECT ab_group, trials, LEAST(successes, trials) FROM ("
+        "SELECT ab_group, "
+        "COALESCE(SUM(count) FILTER (WHERE action_type NOT IN "
+        "('click', 'favorite', 'search', 'recommend_select', 'auto_select')), 0) "
+        "AS trials, "
+        "COALESCE(SUM(count) FILTER (WHERE action_type IN "
+        "('favorite', 'recommend_select')), 0) AS successes "
+        "FROM ab_test_hourly_rollups GROUP BY ab_group) AS seed "
+        "ON CONFLICT (ab_group) DO NOTHING"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ab_group_posteriors")
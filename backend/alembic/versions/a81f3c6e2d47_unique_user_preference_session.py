@@ -0,0 +1,56 @@
+"""unique user preference per session and user
+
+Revision ID: a81f3c6e2d47
+Revises: 7c4e2a9d5b31
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a81f3c6e2d47"
+down_revision: Union[str, None] = "7c4e2a9d5b31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _dedupe(column: str) -> None:
+    """같은 값의 행 중 상호작용이 가장 많고 최근 갱신된 행만 남김"""
+    op.execute(
+        "DELETE FROM user_preferences WHERE id IN ("
+        "  SELECT id FROM ("
+        "    SELECT id, row_number() OVER ("
+        f"      PARTITION BY {column}"
+        "      ORDER BY total_interactions DESC NULLS LAST,"
+        "               last_updated DESC NULLS LAST, id"
+        "    ) AS rank"
+        f"    FROM user_preferences WHERE {column} IS NOT NULL"
+        "  ) ranked WHERE rank > 1"
+        ")"
+    )
+
+
+def upgrade() -> None:
+    _dedupe("session_id")
+    _dedupe("user_id")
+    op.execute("DROP INDEX IF EXISTS ix_user_preferences_session_id")
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_user_preferences_session_id "
+        "ON user_preferences (session_id)"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_user_preferences_user_id "
+        "ON user_preferences (user_id) WHERE user_id IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_user_preferences_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_user_preferences_session_id")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_user_preferences_session_id "
+        "ON user_preferences (session_id)"
+    )
@@ -0,0 +1,73 @@
+"""add menu full-text and trigram search
+
+Revision ID: b4c7e2a9d516
+Revises: a6e1d9c4f082
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4c7e2a9d516"
+down_revision: Union[str, None] = "a6e1d9c4f082"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 공백/구두점으로 단어 분리 후 단어별 글자 2-gram (한 글자 단어는 그대로)
+KOREAN_BIGRAMS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION korean_bigrams(input text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(
+        CASE WHEN char_length(w) = 1 THEN w ELSE substr(w, i, 2) END, ' '), '')
+    FROM regexp_split_to_table(lower(coalesce(input, '')), '[[:space:][:punct:]]+') AS w,
+         generate_series(1, greatest(char_length(w) - 1, 1)) AS i
+    WHERE w <> ''
+$$
+"""
+
+MENU_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', korean_bigrams(name)), 'A') || "
+    "setweight(to_tsvector('simple', korean_bigrams(coalesce(ingredients, ''))), 'B') || "
+    "setweight(to_tsvector('simple', korean_bigrams(coalesce(description, ''))), 'C')"
+)
+CATEGORY_SEARCH_VECTOR = "to_tsvector('simple', korean_bigrams(name))"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(KOREAN_BIGRAMS_FUNCTION)
+    # 글자 2-gram tsvector 생성 컬럼 (이름 A, 재료 B, 설명 C)
+    op.execute(
+        "ALTER TABLE menus ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({MENU_SEARCH_VECTOR}) STORED"
+    )
+    op.execute(
+        "ALTER TABLE categories ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({CATEGORY_SEARCH_VECTOR}) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_menus_search_vector "
+        "ON menus USING gin (search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_menus_name_trgm "
+        "ON menus USING gin (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_categories_search_vector "
+        "ON categories USING gin (search_vector)"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_menus_category_id ON menus (category_id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_menus_category_id")
+    op.execute("DROP INDEX IF EXISTS ix_categories_search_vector")
+    op.execute("DROP INDEX IF EXISTS ix_menus_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_menus_search_vector")
+    op.execute("ALTER TABLE categories DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE menus DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP FUNCTION IF EXISTS korean_bigrams(text)")
@@ -0,0 +1,28 @@
+"""add user preference version column
+
+Revision ID: c5d9e1f0a274
+Revises: a81f3c6e2d47
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d9e1f0a274"
+down_revision: Union[str, None] = "a81f3c6e2d47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE user_preferences "
+        "ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE user_preferences DROP COLUMN IF EXISTS version")
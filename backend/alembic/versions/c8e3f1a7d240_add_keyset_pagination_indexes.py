@@ -0,0 +1,47 @@
+"""add keyset pagination indexes
+
+Revision ID: c8e3f1a7d240
+Revises: b4c7e2a9d516
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e3f1a7d240"
+down_revision: Union[str, None] = "b4c7e2a9d516"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 메뉴 목록/검색 기본 정렬 (표시 순서 NULL은 마지막 → 이름 → id)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_menus_active_display_order "
+        "ON menus (coalesce(display_order, 2147483647), name, id) WHERE is_active"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_menus_category_display_order "
+        "ON menus (category_id, coalesce(display_order, 2147483647), name, id) "
+        "WHERE is_active"
+    )
+    # /search/menus 평점순 (NULL은 0)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_menus_rating_name "
+        "ON menus (coalesce(rating, 0) DESC, name, id)"
+    )
+    # 유저별 즐겨찾기 최신순
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_favorites_user_created "
+        "ON favorites (user_id, created_at DESC, id DESC) WHERE is_active"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_favorites_user_created")
+    op.execute("DROP INDEX IF EXISTS ix_menus_rating_name")
+    op.execute("DROP INDEX IF EXISTS ix_menus_category_display_order")
+    op.execute("DROP INDEX IF EXISTS ix_menus_active_display_order")
@@ -0,0 +1,80 @@
+"""add ab test hourly rollups
+
+Revision ID: d2b7a4e9f163
+Revises: c5d9e1f0a274
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b7a4e9f163"
+down_revision: Union[str, None] = "c5d9e1f0a274"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 선호도 행이 없을 때만 쓰는 대체 규칙 (md5 첫 바이트 % 그룹 수)
+# - 실제로 배정된 그룹은 user_preferences.ab_group에 있으므로 그쪽을 우선
+AB_GROUP_SQL = (
+    "(ARRAY['A', 'B', 'C'])" "[get_byte(decode(md5({key}), 'hex'), 0) % 3 + 1]"
+)
+
+# 기록 행(x)의 세션/유저와 일치하는 선호도 행의 그룹 (유저ID 행 우선)
+SERVED_GROUP_JOIN = (
+    "LEFT JOIN LATERAL ("
+    "SELECT p.ab_group FROM user_preferences p "
+    "WHERE p.session_id = x.session_id "
+    "OR (x.user_id IS NOT NULL AND p.user_id = x.user_id) "
+    "ORDER BY (p.user_id = x.user_id) DESC NULLS LAST LIMIT 1"
+    ") up ON true"
+)
+
+# 퀴즈 응답 때 자동으로 남긴 recommend_select (사용자 행동이 아니므로 auto_select로 집계)
+# - 이전 기록은 태그가 없어 퀴즈 경로의 고정값(강도 0.8, 빈 extra_data)으로 구분
+AUTO_SELECT_SQL = (
+    "x.interaction_type = 'recommend_select' AND ("
+    'x.extra_data LIKE \'%"source": "quiz"%\' '
+    "OR (x.interaction_strength = 0.8 AND COALESCE(x.extra_data, '{}') = '{}'))"
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS ab_test_hourly_rollups ("
+        "hour TIMESTAMP WITH TIME ZONE NOT NULL, "
+        "ab_group VARCHAR(50) NOT NULL, "
+        "action_type VARCHAR(50) NOT NULL, "
+        "count BIGINT NOT NULL DEFAULT 0, "
+        "PRIMARY KEY (hour, ab_group, action_type))"
+    )
+    # 기존 추천 로그/상호작용으로 집계 채우기
+    group = AB_GROUP_SQL.format(key="COALESCE(x.user_id::text, x.session_id)")
+    op.execute(
+        "INSERT INTO ab_test_hourly_rollups (hour, ab_group, action_type, count) "
+        "SELECT date_trunc('hour', x.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', "
+        f"COALESCE(x.ab_group, up.ab_group, {group}), x.action_type, count(*) "
+        f"FROM recommendation_logs x {SERVED_GROUP_JOIN} "
+        "WHERE x.created_at IS NOT NULL "
+        "GROUP BY 1, 2, 3 "
+        "ON CONFLICT (hour, ab_group, action_type) "
+        "DO UPDATE SET count = ab_test_hourly_rollups.count + EXCLUDED.count"
+    )
+    op.execute(
+        "INSERT INTO ab_test_hourly_rollups (hour, ab_group, action_type, count) "
+        "SELECT date_trunc('hour', x.created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', "
+        f"COALESCE(up.ab_group, {group}), "
+        f"CASE WHEN {AUTO_SELECT_SQL} THEN 'auto_select' "
+        "ELSE x.interaction_type END, count(*) "
+        f"FROM user_interactions x {SERVED_GROUP_JOIN} "
+        "WHERE x.created_at IS NOT NULL "
+        "GROUP BY 1, 2, 3 "
+        "ON CONFLICT (hour, ab_group, action_type) "
+        "DO UPDATE SET count = ab_test_hourly_rollups.count + EXCLUDED.count"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ab_test_hourly_rollups")
@@ -0,0 +1,47 @@
+"""add menu favorite_count counter
+
+Revision ID: d5a9b3e8c417
+Revises: c8e3f1a7d240
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a9b3e8c417"
+down_revision: Union[str, None] = "c8e3f1a7d240"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE menus "
+        "ADD COLUMN IF NOT EXISTS favorite_count integer NOT NULL DEFAULT 0"
+    )
+    # 기존 즐겨찾기로 채움 (수정 시각은 유지)
+    op.execute(
+        """
+        UPDATE menus AS m
+        SET favorite_count = f.favorites
+        FROM (
+            SELECT menu_id, count(*) AS favorites
+            FROM favorites
+            WHERE is_active
+            GROUP BY menu_id
+        ) AS f
+        WHERE f.menu_id = m.id
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_menus_popular "
+        "ON menus (favorite_count DESC, name) WHERE is_active"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_menus_popular")
+    op.execute("ALTER TABLE menus DROP COLUMN IF EXISTS favorite_count")
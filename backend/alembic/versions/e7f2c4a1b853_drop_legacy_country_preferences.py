@@ -0,0 +1,70 @@
+"""drop legacy country_preferences JSON column
+
+Revision ID: e7f2c4a1b853
+Revises: d5a9b3e8c417
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f2c4a1b853"
+down_revision: Union[str, None] = "d5a9b3e8c417"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기본 속성 순서는 app.core.preference_vector.BASE_FIELDS와 같아야 함
+BASE_COLUMNS = [
+    ("spicy_preference", 0.5),
+    ("healthy_preference", 0.5),
+    ("vegetarian_preference", 0.5),
+    ("quick_preference", 0.5),
+    ("rice_preference", 0.5),
+    ("soup_preference", 0.5),
+    ("meat_preference", 0.5),
+    ("breakfast_preference", 0.33),
+    ("lunch_preference", 0.33),
+    ("dinner_preference", 0.34),
+]
+BASE_SIZE = len(BASE_COLUMNS)
+
+
+def upgrade() -> None:
+    # 패킹 벡터가 아직 없는 행은 JSON을 지우기 전에 마지막으로 채움 (7c4e2a9d5b31과 같은 규칙)
+    base = ", ".join(
+        f"COALESCE({column}, {default})::real" for column, default in BASE_COLUMNS
+    )
+    op.execute(
+        "UPDATE user_preferences up SET preference_vector = "
+        f"ARRAY[{base}] || COALESCE(("
+        "  SELECT array_agg("
+        "    COALESCE((up.country_preferences::jsonb ->> pc.name)::real, 'NaN'::real)"
+        "    ORDER BY slot.id)"
+        "  FROM generate_series(1, (SELECT max(id) FROM preference_countries))"
+        "    AS slot(id)"
+        "  LEFT JOIN preference_countries pc ON pc.id = slot.id"
+        "), ARRAY[]::real[]) "
+        "WHERE preference_vector IS NULL"
+    )
+    # 국가별 선호도는 preference_vector에만 기록되므로 JSON 컬럼은 제거
+    op.execute("ALTER TABLE user_preferences DROP COLUMN IF EXISTS country_preferences")
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE user_preferences "
+        "ADD COLUMN IF NOT EXISTS country_preferences VARCHAR(1000) DEFAULT '{}'"
+    )
+    # 패킹 벡터의 국가 구간(NaN 제외)을 JSON으로 되돌림
+    op.execute(
+        "UPDATE user_preferences up SET country_preferences = COALESCE(("
+        "  SELECT jsonb_object_agg(pc.name, up.preference_vector"
+        f"[{BASE_SIZE} + pc.id])::text"
+        "  FROM preference_countries pc"
+        f"  WHERE {BASE_SIZE} + pc.id <= COALESCE(array_length(up.preference_vector, 1), 0)"
+        f"    AND up.preference_vector[{BASE_SIZE} + pc.id] <> 'NaN'::real"
+        "), '{}')"
+    )
@@ -0,0 +1,34 @@
+"""add versioned weight sets
+
+Revision ID: f3a8c2d6b915
+Revises: d2b7a4e9f163
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a8c2d6b915"
+down_revision: Union[str, None] = "d2b7a4e9f163"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 행이 없는 그룹은 코드 기본값(버전 0)을 사용하므로 초기 데이터는 넣지 않음
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS weight_sets ("
+        "id UUID PRIMARY KEY, "
+        "ab_group VARCHAR(50) NOT NULL, "
+        "version INTEGER NOT NULL, "
+        "weights TEXT NOT NULL, "
+        "created_at TIMESTAMP WITH TIME ZONE DEFAULT now(), "
+        "CONSTRAINT uq_weight_sets_group_version UNIQUE (ab_group, version))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS weight_sets")
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config_weights import WEIGHT_SETS, weight_registry
+from app.core.response import api_error, api_success
+from app.db.database import get_db
+from app.schemas.error_codes import ErrorCode
+from app.schemas.recommendation import WeightSetUpdateRequest
+from app.services.ab_test_service import AbTestService, ab_bandit, ab_rollup_counter
+from app.services.auth_service import get_current_user
+from app.services.weight_set_service import WeightSetConflictError, WeightSetService
+
+# 관리자 API는 모두 로그인 사용자만 호출
+router = APIRouter(dependencies=[Depends(get_current_user)])
+
+
+@router.get("/ab-stats", response_model=dict)
+async def get_ab_stats(
+    days: int = Query(7, ge=1, le=365, description="집계 기간(일)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    A/B 테스트 그룹별 통계
+    - 시간별 집계 테이블에서 추천 노출 수, 상호작용 수, 노출 대비 비율 조회
+    - 그룹 배정 밴딧의 사후분포(Beta)와 현재 배정 비율
+    - 로그 이력 크기와 관계없이 기간(시간 수 × 그룹 × 타입)만큼의 행만 읽음
+    """
+    try:
+        statistics = await AbTestService.get_statistics(db, days)
+        return api_success(
+            {
+                **statistics,
+                "rollup": {
+                    "enabled": ab_rollup_counter.is_running,
+                    **ab_rollup_counter.get_stats(),
+                },
+                "bandit": {
+                    "enabled": ab_bandit.is_running,
+                    **ab_bandit.get_stats(),
+                },
+            }
+        )
+    except Exception:
+        return api_error(
+            "A/B 테스트 통계 조회 실패", error_code=ErrorCode.GENERAL_ERROR
+        )
+
+
+@router.get("/weight-sets", response_model=dict)
+async def get_weight_sets():
+    """
+    현재 적용 중인 ab_group별 가중치 세트와 버전
+    - 버전 0은 코드 기본값 (DB에 저장된 버전 없음)
+    """
+    weight_sets = {}
+    for group in WEIGHT_SETS:
+        compiled = weight_registry.get(group)
+        weight_sets[group] = {
+            "version": compiled.version,
+            "weights": dict(compiled.weights),
+        }
+    return api_success(weight_sets)
+
+
+@router.put("/weight-sets/{ab_group}", response_model=dict)
+async def update_weight_set(
+    ab_group: str,
+    request: WeightSetUpdateRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    ab_group 가중치 세트를 새 버전으로 저장
+    - 이 워커는 바로, 다른 워커는 다음 갱신 주기(weight_set_refresh_interval_seconds)에 교체
+    """
+    if ab_group not in WEIGHT_SETS:
+        return api_error(
+            f"알 수 없는 ab_group입니다: {ab_group}",
+            error_code=ErrorCode.GENERAL_ERROR,
+        )
+    try:
+        compiled = await WeightSetService.create_version(db, ab_group, request.weights)
+    except ValueError as e:
+        return api_error(str(e), error_code=ErrorCode.GENERAL_ERROR)
+    except WeightSetConflictError as e:
+        return api_error(
+            str(e), error_code=ErrorCode.WEIGHT_SET_CONFLICT, status_code=409
+        )
+    return api_success(
+        {
+            "ab_group": ab_group,
+            "version": compiled.version,
+            "weights": dict(compiled.weights),
+        }
+    )
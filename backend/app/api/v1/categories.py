@@ -53,17 +53,23 @@ async def get_categories(
     country: Optional[str] = Query(None, description="국가 필터"),
     cuisine_type: Optional[str] = Query(None, description="요리 타입 필터"),
     include_menu_count: bool = Query(False, description="메뉴 개수 포함 여부"),
+    cursor: Optional[str] = Query(
+        None, description="다음 페이지 커서 (지정 시 page 무시)"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
     카테고리 목록 조회 (필터링/페이징)
     - include_menu_count: True면 각 카테고리별 메뉴 개수 포함
+    - cursor: 이전 응답의 next_cursor (깊은 페이지도 OFFSET 없이 조회)
     """
     service = CategoryService(db)
     skip = (page - 1) * size
     try:
         if include_menu_count:
-            categories_data = await service.get_categories_with_menu_count(skip, size)
+            categories_data = await service.get_categories_with_menu_count(
+                skip, size, cursor
+            )
             categories = [
                 CategoryResponse(
                     id=cat["id"],
@@ -79,6 +85,7 @@ async def get_categories(
                 )
                 for cat in categories_data
             ]
+            next_cursor = categories_data.next_cursor
         else:
             categories = await service.get_categories(
                 skip=skip,
@@ -86,7 +93,9 @@ async def get_categories(
                 country=country,
                 cuisine_type=cuisine_type,
                 is_active=True,
+                cursor=cursor,
             )
+            next_cursor = categories.next_cursor
             categories = [
                 CategoryResponse.model_validate(category_to_dict(cat))
                 for cat in categories
@@ -94,9 +103,15 @@ async def get_categories(
         total_count = await service.get_total_count(country, cuisine_type)
         return api_success(
             CategoryListResponse(
-                categories=categories, total_count=total_count, page=page, size=size
+                categories=categories,
+                total_count=total_count,
+                page=page,
+                size=size,
+                next_cursor=next_cursor,
             )
         )
+    except ValueError as e:
+        return api_error(str(e), error_code=ErrorCode.VALIDATION_ERROR)
     except Exception:
         return api_error(
             "카테고리 목록 조회 실패", error_code=ErrorCode.CATEGORY_NOT_FOUND
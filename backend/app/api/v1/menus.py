@@ -9,6 +9,7 @@ from app.core.response import (
     api_error,
     api_no_content,
     api_not_found,
+    api_page,
     api_success,
 )
 from app.core.utils import favorite_to_dict, menu_to_dict
@@ -71,17 +72,26 @@ async def get_menus(
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(50, ge=1, le=100, description="가져올 레코드 수"),
     category_id: Optional[uuid.UUID] = Query(None, description="카테고리 ID"),
+    cursor: Optional[str] = Query(
+        None, description="다음 페이지 커서 (지정 시 skip 무시)"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    """메뉴 목록 조회"""
+    """메뉴 목록 조회 (응답의 next_cursor로 다음 페이지 조회)"""
     menu_service = MenuService(db)
-    if category_id:
-        menus = await menu_service.get_menus_by_category(category_id, skip, limit)
-    else:
-        menus = await menu_service.get_all_with_category(skip, limit)
+    try:
+        if category_id:
+            menus = await menu_service.get_menus_by_category(
+                category_id, skip, limit, cursor
+            )
+        else:
+            menus = await menu_service.get_all_with_category(skip, limit, cursor)
+    except ValueError as e:
+        return api_error(str(e), error_code=ErrorCode.VALIDATION_ERROR)
 
-    return api_success(
-        [MenuResponse.model_validate(menu_to_dict(menu)) for menu in menus]
+    return api_page(
+        [MenuResponse.model_validate(menu_to_dict(menu)) for menu in menus],
+        menus.next_cursor,
     )
 
 
@@ -94,28 +104,38 @@ async def search_menus(
     cooking_time: Optional[int] = Query(None, ge=1, description="최대 조리 시간(분)"),
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(50, ge=1, le=100, description="가져올 레코드 수"),
+    cursor: Optional[str] = Query(
+        None, description="다음 페이지 커서 (지정 시 skip 무시)"
+    ),
+    include_total: bool = Query(
+        True, description="전체 건수 포함 여부 (무한 스크롤은 false로 생략)"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    """메뉴 검색"""
+    """메뉴 검색 (total은 검색 조건에 맞는 전체 건수)"""
     menu_service = MenuService(db)
-    menus = await menu_service.search_menus(
-        query=q,
-        category_id=category_id,
-        cuisine_type=cuisine_type,
-        difficulty=difficulty,
-        cooking_time=cooking_time,
-        skip=skip,
-        limit=limit,
-    )
-
-    total = await menu_service.count()
+    try:
+        menus = await menu_service.search_menus(
+            query=q,
+            category_id=category_id,
+            cuisine_type=cuisine_type,
+            difficulty=difficulty,
+            cooking_time=cooking_time,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        return api_error(str(e), error_code=ErrorCode.VALIDATION_ERROR)
 
     return api_success(
         MenuSearchResponse(
             items=[MenuResponse.model_validate(menu_to_dict(menu)) for menu in menus],
-            total=total,
+            total=menus.total,
             skip=skip,
             limit=limit,
+            next_cursor=menus.next_cursor,
         )
     )
 
@@ -208,21 +228,27 @@ async def add_favorite(
 async def get_user_favorites(
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(50, ge=1, le=100, description="가져올 레코드 수"),
+    cursor: Optional[str] = Query(
+        None, description="다음 페이지 커서 (지정 시 skip 무시)"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """사용자별 즐겨찾기 목록 조회"""
+    """사용자별 즐겨찾기 목록 조회 (최근 찜한 순)"""
     try:
         favorite_service = FavoriteService(db)
         favorites = await favorite_service.get_user_favorites(
-            current_user.id, skip, limit
+            current_user.id, skip, limit, cursor
         )
-        return api_success(
+        return api_page(
             [
                 FavoriteResponse.model_validate(favorite_to_dict(fav))
                 for fav in favorites
-            ]
+            ],
+            favorites.next_cursor,
         )
+    except ValueError as e:
+        return api_error(str(e), error_code=ErrorCode.VALIDATION_ERROR)
     except Exception as e:
         return api_error(
             f"즐겨찾기 목록 조회 실패: {str(e)}",
@@ -237,10 +263,13 @@ async def get_user_favorites(
 async def get_user_favorites_slash(
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(50, ge=1, le=100, description="가져올 레코드 수"),
+    cursor: Optional[str] = Query(
+        None, description="다음 페이지 커서 (지정 시 skip 무시)"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await get_user_favorites(skip, limit, db, current_user)
+    return await get_user_favorites(skip, limit, cursor, db, current_user)
 
 
 @router.delete("/favorites", status_code=status.HTTP_204_NO_CONTENT)
@@ -3,19 +3,25 @@ import uuid
 from typing import List, Optional
 import traceback
 
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, Depends, Header, Query, Request
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.core.batch_queue import BatchQueueFull
 from app.core.cache import get_cache_stats, invalidate_recommendation_cache
+from app.core.config import settings
 from app.core.config_weights import get_weight_set
-from app.core.response import api_error, api_created, api_success
+from app.core.response import api_accepted, api_error, api_created, api_success
 from app.core.utils import menu_to_dict
+from app.db.batch_writer import recommendation_log_writer
 from app.db.database import get_db
 from app.models.menu import Menu
 from app.models.menu import TimeSlot as ModelTimeSlot
 from app.schemas.error_codes import ErrorCode
 from app.schemas.menu import MenuRecommendation, MenuResponse
 from app.schemas.recommendation import (
+    LatentRecommendationRequest,
     QuizRecommendationRequest,
     RecommendationResponse,
     SimpleRecommendationRequest,
@@ -26,7 +32,18 @@ from app.schemas.user_preference import (
     UserInteractionCreate,
 )
 from app.services.auth_service import AuthService
+from app.services.interaction_buffer import interaction_buffer
+from app.services.interaction_ingest import (
+    InteractionBatchError,
+    InteractionBatchTooLarge,
+    InteractionIngestService,
+    parse_interaction_batch,
+    read_limited_body,
+)
+from app.services.item_cf_service import ItemCFService, item_cf_model
+from app.services.menu_search_index import MenuSearchIndexService
 from app.services.preference_service import PreferenceService
+from app.services.preference_store import preference_store
 from app.services.recommendation_service import RecommendationService
 
 router = APIRouter()
@@ -82,9 +99,7 @@ async def get_simple_recommendations(
                 continue
 
         # A/B 테스트 정보 조회
-        preference = await PreferenceService.get_or_create_preference(
-            db, session_id, user_id
-        )
+        preference = await PreferenceService.get_preference(db, session_id, user_id)
         ab_group = getattr(preference, "ab_group", "A")
         weight_set = get_weight_set(ab_group)
 
@@ -149,9 +164,7 @@ async def get_quiz_recommendations(
         ]
 
         # A/B 테스트 정보 조회
-        preference = await PreferenceService.get_or_create_preference(
-            db, session_id, user_id
-        )
+        preference = await PreferenceService.get_preference(db, session_id, user_id)
         ab_group = getattr(preference, "ab_group", "A")
         weight_set = get_weight_set(ab_group)
 
@@ -218,9 +231,7 @@ async def get_collaborative_recommendations(
         ]
 
         # A/B 테스트 정보 조회
-        preference = await PreferenceService.get_or_create_preference(
-            db, session_id, user_id
-        )
+        preference = await PreferenceService.get_preference(db, session_id, user_id)
         ab_group = getattr(preference, "ab_group", "A")
         weight_set = get_weight_set(ab_group)
 
@@ -242,6 +253,62 @@ async def get_collaborative_recommendations(
         )
 
 
+@router.post("/latent", response_model=RecommendationResponse)
+async def get_latent_recommendations(
+    request: LatentRecommendationRequest,
+    db: AsyncSession = Depends(get_db),
+    authorization: Optional[str] = Header(None),
+):
+    """
+    ALS 잠재요인 기반 추천
+    - 오프라인 학습(train_als.py)된 세션/메뉴 요인의 내적으로 점수 계산
+    - 학습 이후 생긴 세션은 최근 상호작용으로 즉석 fold-in
+    """
+    try:
+        user_id = None
+
+        # 로그인 사용자인 경우 사용자 ID 추출
+        if authorization and authorization.startswith("Bearer "):
+            try:
+                token = authorization.replace("Bearer ", "")
+                user = await AuthService.get_current_user(db, token)
+                user_id = user.id if user else None
+            except Exception:
+                pass
+
+        # 선호도는 한 번만 조회해 추천/로그/A/B 정보에 함께 사용
+        preference = await PreferenceService.get_preference(
+            db, request.session_id, user_id
+        )
+        recommendations = await RecommendationService.get_latent_recommendations(
+            db=db,
+            session_id=request.session_id,
+            preference=preference,
+            limit=request.limit or 5,
+        )
+
+        # A/B 테스트 정보
+        ab_group = getattr(preference, "ab_group", "A")
+        weight_set = get_weight_set(ab_group)
+
+        response_data = {
+            "recommendations": recommendations,
+            "session_id": request.session_id,
+            "total_count": len(recommendations),
+            "ab_test_info": {
+                "ab_group": ab_group,
+                "weight_set": weight_set,
+                "recommendation_type": "als_latent",
+            },
+        }
+
+        return api_created(response_data)
+    except Exception:
+        return api_error(
+            "잠재요인 추천 생성 실패", error_code=ErrorCode.RECOMMENDATION_FAILED
+        )
+
+
 @router.get("/preference-analysis", response_model=PreferenceAnalysis)
 async def get_preference_analysis(
     session_id: str,
@@ -299,6 +366,37 @@ async def record_interaction(
         # 사용자 ID 업데이트
         interaction.user_id = user_id
 
+        # 비동기 모드: 메뉴만 확인 후 버퍼에 넣고 바로 202 반환 (학습은 flush 시 일괄 처리)
+        if interaction_buffer.is_running:
+            if interaction.menu_id and not await MenuSearchIndexService.menu_exists(
+                db, interaction.menu_id
+            ):
+                return api_error(
+                    "존재하지 않는 메뉴입니다",
+                    error_code=ErrorCode.MENU_NOT_FOUND,
+                    status_code=404,
+                )
+            try:
+                queued = interaction.model_dump()
+                # id를 미리 정해 flush 재시도 시 같은 행이 두 번 기록되지 않게 함
+                queued["id"] = uuid.uuid4()
+                queued["extra_data"] = json.dumps(
+                    queued["extra_data"] or {}, ensure_ascii=False
+                )
+                await interaction_buffer.put(queued)
+            except BatchQueueFull:
+                return api_error(
+                    "상호작용 처리 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요",
+                    error_code=ErrorCode.INTERACTION_QUEUE_FULL,
+                    status_code=503,
+                )
+            return api_accepted(
+                {
+                    "message": "상호작용이 기록 대기열에 추가되었습니다",
+                    "queued": True,
+                }
+            )
+
         # menu_id 존재 여부 체크
         menu_id = getattr(interaction, "menu_id", None)
         if menu_id:
@@ -331,6 +429,103 @@ async def record_interaction(
         return api_error("상호작용 기록 실패", error_code=ErrorCode.GENERAL_ERROR)
 
 
+@router.post("/interactions:batch")
+async def record_interactions_batch(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    authorization: Optional[str] = Header(None),
+):
+    """
+    상호작용 대량 기록 (오프라인 수집분 재전송)
+    - JSON 배열 또는 NDJSON(application/x-ndjson) 본문
+    - 전체 레코드를 한 번에 검증, 카탈로그에 없는 메뉴는 거절 목록으로 반환
+    - COPY로 적재 후 세션별 선호도 학습은 한 번만 적용
+    """
+    try:
+        user_id = None
+
+        # 로그인 사용자인 경우 사용자 ID 추출
+        if authorization and authorization.startswith("Bearer "):
+            try:
+                token = authorization.replace("Bearer ", "")
+                user = await AuthService.get_current_user(db, token)
+                user_id = user.id if user else None
+            except Exception:
+                pass
+
+        try:
+            # 크기 제한은 본문을 읽거나 검증하기 전에 확인
+            content_length = request.headers.get("content-length", "")
+            if (
+                content_length.isdigit()
+                and int(content_length) > settings.interaction_batch_max_bytes
+            ):
+                raise InteractionBatchTooLarge(
+                    f"본문은 최대 {settings.interaction_batch_max_bytes} bytes까지 보낼 수 있습니다"
+                )
+            interactions = parse_interaction_batch(
+                await read_limited_body(
+                    request.stream(), settings.interaction_batch_max_bytes
+                ),
+                request.headers.get("content-type"),
+                max_records=settings.interaction_batch_max_records,
+            )
+        except InteractionBatchTooLarge as e:
+            return api_error(
+                str(e), error_code=ErrorCode.VALIDATION_ERROR, status_code=413
+            )
+        except InteractionBatchError as e:
+            return api_error(
+                str(e),
+                error_code=ErrorCode.VALIDATION_ERROR,
+                status_code=422,
+                details={"errors": e.errors[:100]} if e.errors else None,
+            )
+        if not interactions:
+            return api_created({"received": 0, "inserted": 0, "rejected": []})
+
+        result = await InteractionIngestService.ingest(db, interactions, user_id)
+        return api_created(result)
+    except Exception:
+        return api_error("상호작용 대량 기록 실패", error_code=ErrorCode.GENERAL_ERROR)
+
+
+@router.get("/interaction/buffer-stats", response_model=dict)
+async def get_interaction_buffer_stats():
+    """
+    상호작용 write-behind 버퍼 현황
+    - 대기/기록/실패/거절 건수
+    """
+    return api_success(
+        {"enabled": interaction_buffer.is_running, **interaction_buffer.get_stats()}
+    )
+
+
+@router.get("/log-writer/stats", response_model=dict)
+async def get_log_writer_stats():
+    """
+    추천 로그 백그라운드 기록기 현황
+    - 대기/기록/실패 건수, overflow로 버려진(dropped)/거절된(rejected) 건수
+    """
+    return api_success(
+        {
+            "enabled": recommendation_log_writer.is_running,
+            **recommendation_log_writer.get_stats(),
+        }
+    )
+
+
+@router.get("/preference-store/stats", response_model=dict)
+async def get_preference_store_stats():
+    """
+    선호도 write-back 저장소 현황
+    - 적중/미스, 기록 대기(dirty) 수, 기록/버전 충돌 건수
+    """
+    return api_success(
+        {"enabled": preference_store.is_running, **preference_store.get_stats()}
+    )
+
+
 @router.get("/collaborative-users", response_model=List[CollaborativeRecommendation])
 async def get_collaborative_recommendations_raw(
     session_id: str,
@@ -364,6 +559,54 @@ async def get_collaborative_recommendations_raw(
         )
 
 
+@router.get("/similar-menus", response_model=List[MenuRecommendation])
+async def get_similar_menus(
+    menu_ids: List[uuid.UUID] = Query(..., description="시드 메뉴 ID 목록"),
+    limit: int = Query(10, ge=1, le=50, description="가져올 메뉴 수"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    아이템 기반 협업 필터링 추천
+    - "이 메뉴를 고른 사용자들이 함께 고른 메뉴"
+    - 상호작용(세션별)과 즐겨찾기(사용자별) 동시출현 기반
+    """
+    try:
+        similar = await ItemCFService.get_similar_menus(db, menu_ids, limit)
+        if not similar:
+            return api_success([])
+
+        result = await db.execute(
+            select(Menu)
+            .options(selectinload(Menu.category))
+            .where(Menu.id.in_([menu_id for menu_id, _ in similar]), Menu.is_active)
+        )
+        menus_by_id = {menu.id: menu for menu in result.scalars().all()}
+        max_score = similar[0][1] or 1.0
+        recommendations = [
+            MenuRecommendation(
+                menu=MenuResponse.model_validate(menu_to_dict(menus_by_id[menu_id])),
+                score=min(score / max_score, 1.0),
+                reason="이 메뉴를 고른 사용자들이 함께 고른 메뉴",
+            )
+            for menu_id, score in similar
+            if menu_id in menus_by_id
+        ]
+        return api_success(recommendations)
+    except Exception:
+        return api_error(
+            "함께 고른 메뉴 조회 실패", error_code=ErrorCode.RECOMMENDATION_FAILED
+        )
+
+
+@router.get("/item-cf/stats", response_model=dict)
+async def get_item_cf_stats():
+    """
+    아이템 협업 필터링 모델 메모리 현황
+    - 메뉴/바구니 수, nnz, CSR/델타/바구니 메모리 사용량
+    """
+    return api_success(item_cf_model.memory_report())
+
+
 @router.get("/cache-stats", response_model=dict)
 async def get_cache_statistics(
     db: AsyncSession = Depends(get_db),
@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.api.v1 import (
+    admin,
     auth,
     categories,
     menus,
@@ -27,3 +28,5 @@ api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 
 api_router.include_router(search.router, prefix="/search", tags=["search"])
+
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
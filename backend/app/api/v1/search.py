@@ -1,26 +1,93 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, any_, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.response import api_success, api_error
+from app.core.config import settings
+from app.core.pagination import KeysetOrder, fetch_page, zero_if_null
+from app.core.response import api_page, api_success, api_error
+from app.core.text_search import text_match_and_rank
 from app.core.utils import menu_to_dict
 from app.db.database import AsyncSessionLocal
 from app.models.category import Category
 from app.models.menu import Menu
 from app.schemas.error_codes import ErrorCode
 from app.schemas.menu import MenuResponse
+from app.services.menu_search_index import (
+    FLAG_FILTERS,
+    MenuSearchIndexService,
+    menu_search_index,
+    parse_facets,
+)
+from app.services.search_stats_service import SearchStatsService
+from app.services.suggest_service import SUGGESTION_TOP_K, suggestion_trie
 
 router = APIRouter()
 
+# 검색 결과 키셋 정렬 (평점 NULL은 0으로 보고 마지막)
+SEARCH_RATING_ORDER = (
+    (zero_if_null(Menu.rating), True),
+    (Menu.name, False),
+    (Menu.id, False),
+)
+
+# 값별 패싯 집계 열
+VALUE_FACET_COLUMNS = {
+    "time_slot": Menu.time_slot,
+    "difficulty": Menu.difficulty,
+    "country": Category.country,
+    "cuisine_type": Category.cuisine_type,
+}
+
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
 
 
+async def _facet_counts(
+    db: AsyncSession, conditions: List, facets: Sequence[str]
+) -> Dict[str, Any]:
+    """
+    검색 조건에 맞는 결과 전체의 패싯별 수 (GROUPING SETS 쿼리 한 번)
+    - 값 패싯은 열마다 grouping set 하나, 참/거짓 패싯은 전체 행의 FILTER 집계
+    """
+    value_names = [name for name in facets if name in VALUE_FACET_COLUMNS]
+    flag_names = [name for name in facets if name in FLAG_FILTERS]
+    columns = [VALUE_FACET_COLUMNS[name] for name in value_names]
+    stmt = (
+        select(
+            *(func.grouping(column) for column in columns),
+            *columns,
+            func.count(Menu.id),
+            *(func.count(Menu.id).filter(getattr(Menu, name)) for name in flag_names),
+        )
+        .select_from(Menu)
+        .join(Category, Menu.category_id == Category.id)
+        .group_by(func.grouping_sets(tuple_(), *(tuple_(column) for column in columns)))
+    )
+    if conditions:
+        stmt = stmt.where(and_(*conditions))
+
+    width = len(columns)
+    counts: Dict[str, Any] = {name: {} for name in value_names}
+    counts.update({name: 0 for name in flag_names})
+    for row in (await db.execute(stmt)).all():
+        groupings, values = row[:width], row[width : 2 * width]
+        if all(groupings):
+            # 전체 행 (grouping set ())
+            counts.update(zip(flag_names, row[2 * width + 1 :]))
+            continue
+        index = list(groupings).index(0)
+        if values[index] is not None:
+            counts[value_names[index]][values[index]] = row[2 * width]
+    for name in value_names:
+        counts[name] = dict(sorted(counts[name].items(), key=lambda item: -item[1]))
+    return {name: counts[name] for name in facets}
+
+
 @router.get("/menus", response_model=List[MenuResponse])
 async def search_menus(
     q: Optional[str] = Query(None, description="검색어"),
@@ -43,26 +110,76 @@ async def search_menus(
     cuisine_type: Optional[str] = Query(None, description="요리 타입"),
     limit: int = Query(20, description="결과 개수 제한"),
     offset: int = Query(0, description="페이지 오프셋"),
+    cursor: Optional[str] = Query(
+        None, description="다음 페이지 커서 (지정 시 offset 무시)"
+    ),
+    facets: Optional[str] = Query(
+        None,
+        description=(
+            "결과 전체의 패싯별 수 (쉼표 구분, 예: is_spicy,time_slot,country). "
+            "참/거짓 속성은 참인 결과 수, 값 속성은 값별 결과 수"
+        ),
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    """메뉴 검색 및 필터링"""
+    """메뉴 검색 및 필터링 (응답의 next_cursor로 다음 페이지 조회)"""
     try:
+        facet_names = parse_facets(facets)
+        # 검색어가 있으면 인메모리 역색인으로 처리 (DB는 결과 행 적재만)
+        if q and settings.menu_search_index_enabled and menu_search_index.is_built:
+            filters = {
+                "time_slot": time_slot,
+                "is_spicy": is_spicy,
+                "is_healthy": is_healthy,
+                "is_vegetarian": is_vegetarian,
+                "is_quick": is_quick,
+                "has_rice": has_rice,
+                "has_soup": has_soup,
+                "has_meat": has_meat,
+                "difficulty": difficulty,
+                "min_calories": min_calories,
+                "max_calories": max_calories,
+                "min_rating": min_rating,
+                "category_id": category_id,
+                "country": country,
+                "cuisine_type": cuisine_type,
+            }
+            menus, facet_counts = await MenuSearchIndexService.search_with_facets(
+                db, q, filters, offset, limit, cursor, facet_names
+            )
+            return api_page(
+                [MenuResponse.model_validate(menu_to_dict(menu)) for menu in menus],
+                menus.next_cursor,
+                facet_counts if facet_names else None,
+            )
+
         # 기본 쿼리 생성
         query = (
             select(Menu)
             .options(selectinload(Menu.category))
             .join(Category, Menu.category_id == Category.id)
         )
-        conditions = []
+        # 인메모리 인덱스와 같은 범위 (활성 메뉴만, 부분 인덱스 조건과 동일)
+        conditions = [Menu.is_active]
+        order = KeysetOrder("search_rating", *SEARCH_RATING_ORDER)
 
-        # 검색어 필터
+        # 검색어 필터 (전문 검색 + 이름 부분 일치 + 카테고리명, 관련도순)
         if q:
-            search_condition = or_(
-                Menu.name.contains(q),
-                Menu.description.contains(q),
-                Category.name.contains(q),
+            tsquery, search_condition, rank = text_match_and_rank(
+                Menu.search_vector, Menu.name, q
             )
+            if tsquery is not None:
+                # 카테고리는 인덱스로 먼저 찾아 id 배열로 비교 (조인 OR 조건 회피)
+                matched_categories = func.array(
+                    select(Category.id)
+                    .where(Category.search_vector.op("@@")(tsquery))
+                    .scalar_subquery()
+                )
+                search_condition = or_(
+                    search_condition, Menu.category_id == any_(matched_categories)
+                )
             conditions.append(search_condition)
+            order = KeysetOrder("search_rank", (rank, True), *SEARCH_RATING_ORDER)
 
         # 시간대 필터
         if time_slot:
@@ -110,21 +227,44 @@ async def search_menus(
         if conditions:
             query = query.where(and_(*conditions))
 
-        # 정렬 및 페이징
-        query = query.order_by(Menu.rating.desc(), Menu.name.asc())
-        query = query.offset(offset).limit(limit)
-
-        # 실행
-        result = await db.execute(query)
-        menus = result.scalars().all()
+        # 정렬 및 페이징 (커서가 있으면 키셋, 없으면 offset)
+        menus = await fetch_page(db, query, order, limit, cursor, offset)
+        facet_counts = None
+        if facet_names:
+            facet_counts = await _facet_counts(db, conditions, facet_names)
 
-        return api_success(
-            [MenuResponse.model_validate(menu_to_dict(menu)) for menu in menus]
+        return api_page(
+            [MenuResponse.model_validate(menu_to_dict(menu)) for menu in menus],
+            menus.next_cursor,
+            facet_counts,
         )
+    except ValueError as e:
+        return api_error(str(e), error_code=ErrorCode.VALIDATION_ERROR)
     except Exception:
         return api_error("메뉴 검색 실패", error_code=ErrorCode.GENERAL_ERROR)
 
 
+@router.get("/suggest", response_model=List[str])
+async def suggest(
+    prefix: str = Query(
+        ..., min_length=1, max_length=50, description="입력 중인 검색어"
+    ),
+    limit: int = Query(
+        SUGGESTION_TOP_K, ge=1, le=SUGGESTION_TOP_K, description="추천어 개수"
+    ),
+):
+    """
+    검색어 자동완성 (메뉴명/카테고리명/재료, 인기순)
+    - 트라이는 시작 시 적재와 갱신 작업에서만 구성 (적재 전에는 빈 목록)
+    """
+    try:
+        if not suggestion_trie.is_built:
+            return api_success([])
+        return api_success(suggestion_trie.suggest(prefix, limit))
+    except Exception:
+        return api_error("자동완성 조회 실패", error_code=ErrorCode.GENERAL_ERROR)
+
+
 @router.get("/categories", response_model=List[dict])
 async def search_categories(
     country: Optional[str] = Query(None, description="국가"),
@@ -172,42 +312,8 @@ async def search_categories(
 
 @router.get("/stats", response_model=dict)
 async def get_search_stats(db: AsyncSession = Depends(get_db)):
-    """검색 통계 정보"""
+    """검색 통계 정보 (메모리 집계, 테이블을 다시 읽지 않음)"""
     try:
-        # 전체 메뉴 수
-        menu_count_result = await db.execute(select(Menu))
-        total_menus = len(menu_count_result.scalars().all())
-
-        # 시간대별 메뉴 수
-        time_slot_stats = {}
-        for time_slot in ["breakfast", "lunch", "dinner"]:
-            result = await db.execute(select(Menu).where(Menu.time_slot == time_slot))
-            time_slot_stats[time_slot] = len(result.scalars().all())
-
-        # 국가별 메뉴 수
-        country_stats_result = await db.execute(
-            select(Category.country, Menu.id).join(
-                Menu, Category.id == Menu.category_id
-            )
-        )
-        country_stats = {}
-        for country, menu_id in country_stats_result.all():
-            if country not in country_stats:
-                country_stats[country] = 0
-            country_stats[country] += 1
-
-        # 평균 평점
-        rating_result = await db.execute(select(Menu.rating))
-        ratings = [r for r in rating_result.scalars().all() if r is not None]
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
-
-        return api_success(
-            {
-                "total_menus": total_menus,
-                "time_slot_distribution": time_slot_stats,
-                "country_distribution": country_stats,
-                "average_rating": round(avg_rating, 2),
-            }
-        )
+        return api_success(await SearchStatsService.get_stats(db))
     except Exception:
         return api_error("검색 통계 조회 실패", error_code=ErrorCode.GENERAL_ERROR)
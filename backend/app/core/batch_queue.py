@@ -0,0 +1,212 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class BatchQueueFull(Exception):
+    """큐가 가득 차 제한 시간 안에 넣지 못함"""
+
+
+def jsonl_dead_letter(
+    path: str, encode: Optional[Callable[[T], Any]] = None
+) -> Callable[[List[T]], Awaitable[None]]:
+    """
+    재시도 후에도 기록하지 못한 배치를 JSON Lines 파일에 덧붙이는 dead-letter 처리기
+    Args:
+        encode: 항목 → JSON 직렬화 가능한 값 (없으면 그대로, 그 외 타입은 문자열)
+    """
+
+    def _write(batch: List[T]) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for item in batch:
+                value = encode(item) if encode else item
+                f.write(json.dumps(value, ensure_ascii=False, default=str) + "\n")
+
+    async def _handler(batch: List[T]) -> None:
+        await asyncio.to_thread(_write, batch)
+
+    return _handler
+
+
+class BatchQueue(Generic[T]):
+    """
+    비동기 배치 쓰기 큐 (write-behind)
+    - 크기 제한이 있는 asyncio.Queue에 항목을 쌓고
+      flush_interval 경과 또는 batch_size 도달 시 handler로 한 번에 전달
+    - 큐가 가득 찼을 때 정책
+      - block: put이 대기 (백프레셔), put_timeout 초과 시 BatchQueueFull
+      - drop: 바로 버리고 dropped 카운터 증가
+    - handler 실패 시 retry_backoff부터 두 배씩 늘려 max_retries 번 재시도,
+      그래도 실패하면 dead_letter로 넘김 (재시도 중에는 새 배치를 꺼내지 않아 백프레셔 유지)
+    - stop() 호출 시 남은 항목을 모두 flush 후 종료
+    """
+
+    OVERFLOW_POLICIES = ("block", "drop")
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[List[T]], Awaitable[None]],
+        max_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 0.2,
+        put_timeout: Optional[float] = 1.0,
+        overflow_policy: str = "block",
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        dead_letter: Optional[Callable[[List[T]], Awaitable[None]]] = None,
+    ):
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"지원하지 않는 overflow 정책입니다: {overflow_policy}")
+        self.name = name
+        self.handler = handler
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.overflow_policy = overflow_policy
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.dead_letter = dead_letter
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[T] = []
+        self._stats = {
+            "enqueued": 0,
+            "flushed": 0,
+            "failed": 0,
+            "retries": 0,
+            "dead_lettered": 0,
+            "rejected": 0,
+            "dropped": 0,
+            "batches": 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> asyncio.Task:
+        """flush 백그라운드 작업 시작 (이벤트 루프 안에서 호출)"""
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run(), name=f"{self.name}FlushTask")
+        logger.info(f"{self.name} 배치 큐 시작 (최대 {self.max_size}건)")
+        return self._task
+
+    async def put(self, item: T) -> bool:
+        """
+        항목 추가
+        Returns:
+            큐에 들어갔으면 True, drop 정책으로 버려졌으면 False
+        Raises:
+            BatchQueueFull: block 정책에서 put_timeout 안에 자리가 나지 않음
+        """
+        if not self.is_running:
+            raise RuntimeError(f"{self.name} 배치 큐가 실행 중이 아닙니다")
+        if self.overflow_policy == "drop":
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self._stats["dropped"] += 1
+                return False
+        else:
+            try:
+                await asyncio.wait_for(self._queue.put(item), self.put_timeout)
+            except asyncio.TimeoutError:
+                self._stats["rejected"] += 1
+                raise BatchQueueFull(f"{self.name} 배치 큐가 가득 찼습니다")
+        self._stats["enqueued"] += 1
+        return True
+
+    async def stop(self) -> None:
+        """남은 항목을 모두 flush 후 종료"""
+        if self._task is None:
+            return
+        # wait_for가 get 완료와 동시에 취소를 삼킬 수 있어 종료될 때까지 반복
+        while not self._task.done():
+            self._task.cancel()
+            await asyncio.wait([self._task], timeout=0.1)
+        await self._drain()
+        self._task = None
+        logger.info(f"{self.name} 배치 큐 종료 ({self._stats})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 통계"""
+        return {
+            **self._stats,
+            "pending": (self._queue.qsize() if self._queue else 0) + len(self._batch),
+            "max_size": self.max_size,
+            "overflow_policy": self.overflow_policy,
+        }
+
+    async def _run(self):
+        while True:
+            self._batch.append(await self._queue.get())
+            deadline = time.monotonic() + self.flush_interval
+            while len(self._batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._flush()
+
+    async def _drain(self):
+        while self._batch or (self._queue and not self._queue.empty()):
+            while self._queue and not self._queue.empty():
+                if len(self._batch) >= self.batch_size:
+                    break
+                self._batch.append(self._queue.get_nowait())
+            await self._flush()
+
+    async def _flush(self):
+        """
+        모인 배치를 handler로 전달
+        - 실패하면 지수 백오프로 재시도, 모두 실패하면 dead_letter로 넘김
+        - 종료 중 취소되면 배치를 그대로 두어 drain에서 다시 처리
+        """
+        batch = self._batch
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.handler(batch)
+                self._stats["flushed"] += len(batch)
+                self._stats["batches"] += 1
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt < self.max_retries:
+                    delay = self.retry_backoff * (2**attempt)
+                    self._stats["retries"] += 1
+                    logger.warning(
+                        f"{self.name} 배치 flush 실패 ({len(batch)}건), "
+                        f"{delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {e}"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                self._stats["failed"] += len(batch)
+                logger.error(f"{self.name} 배치 flush 실패 ({len(batch)}건): {e}")
+                await self._dead_letter(batch)
+        self._batch = []
+
+    async def _dead_letter(self, batch: List[T]) -> None:
+        if self.dead_letter is None:
+            return
+        try:
+            await self.dead_letter(batch)
+            self._stats["dead_lettered"] += len(batch)
+        except Exception as e:
+            logger.error(f"{self.name} dead-letter 기록 실패 ({len(batch)}건): {e}")
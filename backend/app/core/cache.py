@@ -7,6 +7,7 @@ from collections import OrderedDict
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Union
 
+from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -210,6 +211,10 @@ def cache_key(*args, **kwargs) -> str:
 recommendation_cache = MemoryCache(max_size=500, default_ttl=900)  # 15분
 user_preference_cache = MemoryCache(max_size=1000, default_ttl=3600)  # 1시간
 menu_cache = MemoryCache(max_size=2000, default_ttl=7200)  # 2시간
+# 메뉴 검색 조건별 전체 건수 (메뉴 변경 시 비움)
+search_count_cache = MemoryCache(
+    max_size=2000, default_ttl=settings.menu_search_count_cache_ttl_seconds
+)
 
 
 # 주기적 정리 스케줄러
@@ -276,6 +281,7 @@ def get_cache_stats() -> Dict[str, Dict[str, Union[int, float]]]:
         "recommendation_cache": recommendation_cache.get_stats(),
         "user_preference_cache": user_preference_cache.get_stats(),
         "menu_cache": menu_cache.get_stats(),
+        "search_count_cache": search_count_cache.get_stats(),
     }
 
 
@@ -343,10 +349,27 @@ def invalidate_menu_cache(menu_id: str = None, category_id: str = None):
         logger.info("전체 메뉴 캐시 무효화 완료")
 
 
+def invalidate_cached_results(*key_prefixes: str):
+    """@cached 결과 중 key_prefix가 일치하는 항목 무효화 (설정 변경 시)"""
+    keys_to_delete = []
+    with cache._lock:
+        for key in list(cache._cache.keys()):
+            if key.split(":", 1)[0] in key_prefixes:
+                keys_to_delete.append(key)
+
+    for key in keys_to_delete:
+        cache.delete(key)
+
+    logger.info(
+        f"{', '.join(key_prefixes)} 캐시 {len(keys_to_delete)}개 항목 무효화 완료"
+    )
+
+
 def invalidate_all_caches():
     """모든 캐시 무효화"""
     cache.clear()
     recommendation_cache.clear()
     user_preference_cache.clear()
     menu_cache.clear()
+    search_count_cache.clear()
     logger.info("모든 캐시 무효화 완료")
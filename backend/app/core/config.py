@@ -89,6 +89,177 @@ class Settings(BaseSettings):
     password_min_length: int = Field(8, description="최소 비밀번호 길이")
     session_timeout_minutes: int = Field(30, description="세션 타임아웃(분)")
 
+    # 협업 필터링 이웃 사전 계산 설정
+    collaborative_neighbor_count: int = Field(20, description="세션별 보관할 이웃 수")
+    collaborative_candidate_count: int = Field(
+        50, description="세션별 보관할 후보 메뉴 수"
+    )
+    collaborative_min_similarity: float = Field(0.3, description="이웃 유사도 임계값")
+    collaborative_min_interactions: int = Field(
+        5, description="이웃 후보가 되기 위한 최소 상호작용 수"
+    )
+    collaborative_refresh_interval_seconds: int = Field(
+        300, description="이웃 목록 전체 재계산 주기(초)"
+    )
+    collaborative_dirty_check_interval_seconds: int = Field(
+        5, description="변경된 세션 이웃 목록 재계산 주기(초)"
+    )
+    collaborative_drift_threshold: float = Field(
+        0.1, description="이웃 목록을 재계산할 선호도 벡터 변화량(L2)"
+    )
+    collaborative_max_transient_sessions: int = Field(
+        10000, description="활성 행렬 밖 세션의 이웃 목록을 보관할 최대 수 (LRU)"
+    )
+
+    # 아이템 기반 협업 필터링(동시출현) 설정
+    item_cf_interaction_types: list = Field(
+        ["click", "favorite", "recommend_select"],
+        description="동시출현 집계에 사용할 상호작용 타입",
+    )
+    item_cf_max_basket_size: int = Field(200, description="바구니당 최대 메뉴 수")
+    item_cf_compact_threshold: int = Field(
+        50000, description="CSR로 병합할 델타 쌍 개수 임계치"
+    )
+    item_cf_refresh_interval_seconds: int = Field(
+        30, description="신규 상호작용 증분 반영 주기(초)"
+    )
+    item_cf_rebuild_interval_seconds: int = Field(
+        3600, description="동시출현 행렬 전체 재구축 주기(초)"
+    )
+    item_cf_watermark_overlap_seconds: int = Field(
+        120, description="늦게 커밋된 행을 위해 워터마크 앞에서 다시 조회할 구간(초)"
+    )
+
+    # ALS 잠재요인 추천 설정
+    als_model_dir: str = Field("./models/als", description="ALS 요인 파일 디렉토리")
+    als_factors: int = Field(32, description="잠재요인 차원 수")
+    als_regularization: float = Field(0.05, description="ALS 정규화 계수")
+    als_alpha: float = Field(20.0, description="상호작용 강도 → 신뢰도 배율")
+    als_iterations: int = Field(12, description="ALS 반복 횟수")
+    als_fold_in_limit: int = Field(
+        200, description="미학습 세션 fold-in에 사용할 최근 상호작용 수"
+    )
+    als_reload_interval_seconds: int = Field(
+        30, description="새 요인 파일/비활성 메뉴 확인 주기(초)"
+    )
+    als_keep_versions: int = Field(3, description="보관할 요인 파일 버전 수")
+
+    # 배치 쓰기 큐 공통 설정 (상호작용 버퍼, 추천 로그 기록기)
+    batch_queue_max_retries: int = Field(3, description="flush 실패 시 재시도 횟수")
+    batch_queue_retry_backoff_seconds: float = Field(
+        0.5, description="첫 재시도 대기 시간(초), 이후 두 배씩 증가"
+    )
+    batch_queue_dead_letter_dir: str = Field(
+        "logs/dead_letter", description="재시도 후에도 실패한 배치를 기록할 디렉토리"
+    )
+
+    # 상호작용 write-behind 버퍼 설정
+    interaction_buffer_enabled: bool = Field(
+        False, description="상호작용 비동기 기록(202) 모드 사용"
+    )
+    interaction_buffer_max_size: int = Field(10000, description="버퍼 최대 대기 건수")
+    interaction_buffer_batch_size: int = Field(
+        500, description="한 번에 기록할 최대 건수"
+    )
+    interaction_buffer_flush_interval_ms: int = Field(200, description="flush 주기(ms)")
+    interaction_buffer_put_timeout_seconds: float = Field(
+        1.0, description="버퍼가 가득 찼을 때 대기할 최대 시간(초)"
+    )
+
+    interaction_batch_max_records: int = Field(
+        20000, description="대량 상호작용 적재 요청당 최대 건수"
+    )
+    interaction_batch_max_bytes: int = Field(
+        10 * 1024 * 1024, description="대량 상호작용 적재 요청 본문 최대 크기(bytes)"
+    )
+
+    # 추천 로그 백그라운드 기록 설정
+    recommendation_log_async_enabled: bool = Field(
+        True, description="추천 로그를 요청 경로 밖에서 배치로 기록"
+    )
+    recommendation_log_queue_size: int = Field(5000, description="로그 큐 최대 건수")
+    recommendation_log_batch_size: int = Field(
+        500, description="한 번에 기록할 최대 로그 수"
+    )
+    recommendation_log_flush_interval_ms: int = Field(
+        1000, description="flush 주기(ms)"
+    )
+    recommendation_log_overflow_policy: str = Field(
+        "drop", description="큐가 가득 찼을 때 정책 (drop/block)"
+    )
+    recommendation_log_put_timeout_seconds: float = Field(
+        0.5, description="block 정책에서 대기할 최대 시간(초)"
+    )
+
+    # 최근 추천 메뉴 링 버퍼 설정
+    recent_recommendation_max_sessions: int = Field(
+        20000, description="최근 추천 메뉴를 보관할 최대 세션 수"
+    )
+    recent_recommendation_items_per_session: int = Field(
+        50, description="세션당 보관할 최근 추천 메뉴 수"
+    )
+    recent_recommendation_ttl_seconds: int = Field(
+        1800, description="최근 추천 메뉴 보관 시간(초)"
+    )
+
+    # 선호도 write-back 저장소 설정
+    preference_store_enabled: bool = Field(
+        True, description="선호도를 프로세스 메모리에서 학습 후 주기적으로 기록"
+    )
+    preference_store_max_entries: int = Field(
+        50000, description="메모리에 보관할 최대 선호도 수 (LRU)"
+    )
+    preference_store_flush_interval_seconds: float = Field(
+        5.0, description="변경된 선호도 기록 주기(초)"
+    )
+    preference_store_flush_batch_size: int = Field(
+        500, description="UPDATE 한 번에 기록할 최대 선호도 수"
+    )
+    preference_store_ttl_seconds: int = Field(
+        300, description="변경 없는 선호도를 DB에서 다시 읽기까지의 시간(초)"
+    )
+
+    # 가중치 세트 설정
+    weight_set_refresh_interval_seconds: int = Field(
+        30, description="가중치 세트 버전 변경 확인 주기(초)"
+    )
+
+    # A/B 테스트 시간별 집계 설정
+    ab_rollup_enabled: bool = Field(
+        True, description="집계 증분을 메모리에 모아 주기적으로 기록"
+    )
+    ab_rollup_flush_interval_seconds: float = Field(
+        5.0, description="집계 증분 기록 주기(초)"
+    )
+    ab_bandit_enabled: bool = Field(
+        True,
+        description="A/B 그룹을 Thompson sampling 밴딧으로 배정 (끄면 해시 균등 배정)",
+    )
+    ab_bandit_flush_interval_seconds: float = Field(
+        10.0, description="밴딧 카운터 기록/동기화 주기(초)"
+    )
+    ab_bandit_max_assignments: int = Field(
+        100000, description="행 저장 전 배정 그룹을 기억할 최대 키 수 (LRU)"
+    )
+
+    # 메뉴 검색 인메모리 색인 설정
+    menu_search_index_enabled: bool = Field(
+        True, description="검색어가 있는 메뉴 검색을 인메모리 역색인으로 처리"
+    )
+    menu_search_index_refresh_interval_seconds: float = Field(
+        5.0, description="카탈로그 버전 확인/증분 반영 주기(초)"
+    )
+    menu_search_count_cache_ttl_seconds: int = Field(
+        60, description="검색 조건별 전체 건수 캐시 시간(초)"
+    )
+    search_stats_rebuild_interval_seconds: float = Field(
+        600.0,
+        description="이 워커 변경으로만 바뀐 카탈로그 버전도 검색 통계를 재집계하는 주기(초)",
+    )
+    suggest_popularity_refresh_interval_seconds: float = Field(
+        300.0, description="자동완성 인기도(즐겨찾기 수) 확인 주기(초)"
+    )
+
     @field_validator("database_url", "test_database_url")
     @classmethod
     def validate_database_url(cls, v):
@@ -121,6 +292,14 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",")]
         return v
 
+    @field_validator("recommendation_log_overflow_policy")
+    @classmethod
+    def validate_recommendation_log_overflow_policy(cls, v):
+        """추천 로그 큐 overflow 정책 검증"""
+        if v not in ["drop", "block"]:
+            raise ValueError("overflow 정책은 drop, block 중 하나여야 합니다.")
+        return v
+
     @field_validator("env")
     @classmethod
     def validate_env(cls, v):
@@ -1,9 +1,19 @@
 """
 A/B 테스트용 추천 가중치 세트 관리 파일
-- 각 ab_group별 가중치 딕셔너리 정의
-- 조회 함수 제공 (향후 DB 연동 확장 가능)
+- ab_group별 가중치는 weight_sets 테이블에 버전별로 저장 (최신 버전 사용)
+- 로드 시 메뉴 속성 순서(ATTRIBUTE_KEYS)의 읽기 전용 벡터로 컴파일해 보관
+- 버전이 바뀌면 레지스트리를 통째로 교체 (요청 중에는 같은 세트를 계속 사용)
+- 테이블에 없는 그룹은 아래 기본값(버전 0) 사용
 """
 
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+
+from app.core.preference_vector import ATTRIBUTE_KEYS
+
 WEIGHT_SETS = {
     "A": {
         "spicy": 3.0,
@@ -34,9 +44,96 @@ WEIGHT_SETS = {
     },
 }
 
+DEFAULT_AB_GROUP = "A"
+
+
+def compile_weights(weights: Mapping[str, float]) -> np.ndarray:
+    """
+    가중치 딕셔너리 → 읽기 전용 float32 벡터 (ATTRIBUTE_KEYS 순서)
+    Raises:
+        ValueError: 속성 키가 빠졌거나 모르는 키가 있음
+    """
+    unknown = set(weights) - set(ATTRIBUTE_KEYS)
+    missing = set(ATTRIBUTE_KEYS) - set(weights)
+    if unknown or missing:
+        raise ValueError(
+            f"가중치 키가 올바르지 않습니다 (누락: {sorted(missing)}, 알 수 없음: {sorted(unknown)})"
+        )
+    vector = np.array([float(weights[key]) for key in ATTRIBUTE_KEYS], dtype=np.float32)
+    vector.setflags(write=False)
+    return vector
+
+
+class CompiledWeightSet:
+    """ab_group 하나의 컴파일된 가중치 세트 (불변)"""
+
+    __slots__ = ("ab_group", "version", "weights", "vector")
+
+    def __init__(self, ab_group: str, version: int, weights: Mapping[str, float]):
+        self.ab_group = ab_group
+        self.version = version
+        self.vector = compile_weights(weights)
+        self.weights = MappingProxyType(
+            {key: float(value) for key, value in zip(ATTRIBUTE_KEYS, self.vector)}
+        )
+
+    def __repr__(self):
+        return (
+            f"<CompiledWeightSet(ab_group='{self.ab_group}', version={self.version})>"
+        )
+
+
+class WeightSetRegistry:
+    """
+    ab_group → 컴파일된 가중치 세트
+    - 조회는 현재 딕셔너리 참조 하나만 읽으므로 잠금 없음
+    - 교체는 새 딕셔너리를 만든 뒤 참조만 바꿈 (원자적)
+    """
+
+    def __init__(self):
+        self._sets: Dict[str, CompiledWeightSet] = {}
+        self._lock = threading.Lock()
+        self.reset()
+
+    def get(self, ab_group: Optional[str]) -> CompiledWeightSet:
+        """그룹의 가중치 세트 (모르는 그룹이면 기본 그룹)"""
+        sets = self._sets
+        return sets.get(ab_group or DEFAULT_AB_GROUP) or sets[DEFAULT_AB_GROUP]
+
+    def versions(self) -> Dict[str, int]:
+        return {group: compiled.version for group, compiled in self._sets.items()}
+
+    def swap(self, rows: Iterable[Tuple[str, int, Mapping[str, float]]]) -> None:
+        """
+        DB에서 읽은 (그룹, 버전, 가중치)로 교체
+        - 행이 없는 그룹은 기본값 유지
+        """
+        compiled = {
+            group: CompiledWeightSet(group, version, weights)
+            for group, version, weights in rows
+        }
+        with self._lock:
+            self._sets = {**self._defaults(), **compiled}
+
+    def reset(self) -> None:
+        """기본값(버전 0)으로 초기화"""
+        with self._lock:
+            self._sets = self._defaults()
+
+    @staticmethod
+    def _defaults() -> Dict[str, CompiledWeightSet]:
+        return {
+            group: CompiledWeightSet(group, 0, weights)
+            for group, weights in WEIGHT_SETS.items()
+        }
+
+
+# 전역 가중치 세트 레지스트리 (워커 프로세스별, 시작 시/버전 변경 시 DB에서 적재)
+weight_registry = WeightSetRegistry()
+
 
 def get_weight_set(ab_group: str) -> dict:
     """
     ab_group별 가중치 세트 반환 (기본값 A)
     """
-    return WEIGHT_SETS.get(ab_group or "A", WEIGHT_SETS["A"])
+    return dict(weight_registry.get(ab_group).weights)
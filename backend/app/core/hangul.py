@@ -0,0 +1,255 @@
+"""
+한글 자모 분해와 초성/자모 검색 색인
+- 완성형 음절을 자판 입력 단위 자모로 분해 (겹받침/이중모음도 나눔, 예: 닭 → ㄷㅏㄹㄱ)
+- 초성만 입력 (예: "ㄱㅊㅉㄱ" → 김치찌개), 입력 중인 음절 (예: "김치ㅉ")은 접두 일치
+- 자모 단위 오타는 자모 2-gram 후보 추출 후 편집 거리로 확인
+"""
+
+import bisect
+import threading
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+import numpy as np
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ("",) + tuple("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+# 두 번 눌러 입력하는 겹받침/이중모음
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+}
+
+_SYLLABLE_FIRST = 0xAC00  # 가
+_SYLLABLE_LAST = 0xD7A3  # 힣
+_JAMO_FIRST = 0x3131  # ㄱ (호환 자모)
+_JAMO_LAST = 0x3163  # ㅣ
+_CHOSUNG_SET = frozenset(CHOSUNG)
+
+
+def _is_syllable(char: str) -> bool:
+    return _SYLLABLE_FIRST <= ord(char) <= _SYLLABLE_LAST
+
+
+def has_jamo(text: str) -> bool:
+    """낱자모(ㄱ~ㅣ)가 섞인 입력인지"""
+    return any(_JAMO_FIRST <= ord(char) <= _JAMO_LAST for char in text or "")
+
+
+def is_chosung_query(text: str) -> bool:
+    """공백을 빼면 모두 초성(자음)인 입력인지"""
+    chars = "".join((text or "").split())
+    return bool(chars) and all(char in _CHOSUNG_SET for char in chars)
+
+
+def decompose_jamo(text: str) -> str:
+    """소문자화 후 공백을 빼고 자판 입력 단위 자모열로 분해 (한글 외 문자는 그대로)"""
+    out = []
+    for char in "".join((text or "").lower().split()):
+        if _is_syllable(char):
+            index = ord(char) - _SYLLABLE_FIRST
+            parts = (
+                CHOSUNG[index // 588],
+                JUNGSUNG[(index // 28) % 21],
+                JONGSUNG[index % 28],
+            )
+            out.extend(COMPOUND_JAMO.get(part, part) for part in parts)
+        else:
+            out.append(COMPOUND_JAMO.get(char, char))
+    return "".join(out)
+
+
+def chosung(text: str) -> str:
+    """소문자화 후 공백을 빼고 음절마다 초성만 (한글 외 문자는 그대로)"""
+    return "".join(
+        CHOSUNG[(ord(char) - _SYLLABLE_FIRST) // 588] if _is_syllable(char) else char
+        for char in "".join((text or "").lower().split())
+    )
+
+
+def max_edit_distance(jamo_length: int) -> int:
+    """자모 길이별 허용 오타 수 (짧은 입력은 오타 허용 안 함)"""
+    if jamo_length < 4:
+        return 0
+    return 1 if jamo_length < 10 else 2
+
+
+def substring_edit_distance(pattern: str, text: str, limit: int) -> int:
+    """
+    text의 어느 부분 문자열과 pattern 사이의 최소 편집 거리
+    - limit을 넘으면 limit + 1 (행 최소값으로 조기 종료)
+    """
+    previous = [0] * (len(text) + 1)  # 시작 위치 자유
+    for i, pattern_char in enumerate(pattern, 1):
+        current = [i]
+        for j, text_char in enumerate(text, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (pattern_char != text_char),
+                )
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(min(previous), limit + 1)
+
+
+def _word_suffixes(text: str) -> List[str]:
+    """전체 문자열과 두 번째 단어부터 시작하는 부분"""
+    words = (text or "").split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+def _bigrams(jamo: str) -> Set[str]:
+    return {jamo[i : i + 2] for i in range(len(jamo) - 1)}
+
+
+class JamoIndex:
+    """
+    정수 id → 문자열의 초성/자모 검색 색인
+    - 초성열/자모열(단어 시작 위치별)을 정렬 배열로 보관해 이진 탐색으로 접두 일치
+    - 자모 2-gram 포스팅으로 공통 2-gram이 충분한 후보만 골라 편집 거리 확인
+    - 변경은 id 단위로 반영하고 정렬 배열은 다음 조회(또는 prepare) 때 한 번 재구성
+    - 스레드 안전
+    """
+
+    def __init__(self, max_fuzzy_candidates: int = 64):
+        self.max_fuzzy_candidates = max_fuzzy_candidates
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jamo: Dict[int, str] = {}
+            self._keys: Dict[int, Tuple[List[str], List[str]]] = {}
+            self._postings: Dict[str, Set[int]] = {}
+            self._posting_arrays: Dict[str, np.ndarray] = {}
+            self._sorted_jamo: Tuple[List[str], List[int]] = ([], [])
+            self._sorted_chosung: Tuple[List[str], List[int]] = ([], [])
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._jamo)
+
+    def update(self, texts: Mapping[int, str], removed: Iterable[int] = ()) -> None:
+        """id별 문자열 추가/교체와 제거"""
+        with self._lock:
+            for item_id in list(removed) + list(texts):
+                jamo = self._jamo.pop(item_id, None)
+                self._keys.pop(item_id, None)
+                if jamo is None:
+                    continue
+                for gram in _bigrams(jamo):
+                    postings = self._postings.get(gram)
+                    if postings is not None:
+                        postings.discard(item_id)
+                        if not postings:
+                            del self._postings[gram]
+                    self._posting_arrays.pop(gram, None)
+                self._dirty = True
+            for item_id, text in texts.items():
+                jamo = decompose_jamo(text)
+                self._jamo[item_id] = jamo
+                suffixes = _word_suffixes(text)
+                self._keys[item_id] = (
+                    [decompose_jamo(s) for s in suffixes],
+                    [chosung(s) for s in suffixes],
+                )
+                for gram in _bigrams(jamo):
+                    self._postings.setdefault(gram, set()).add(item_id)
+                    self._posting_arrays.pop(gram, None)
+                self._dirty = True
+
+    def prepare(self) -> None:
+        """변경 후 정렬 배열 재구성 (조회 전에 미리 호출 가능)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            jamo_pairs, chosung_pairs = [], []
+            for item_id, (jamo_keys, chosung_keys) in self._keys.items():
+                jamo_pairs.extend((key, item_id) for key in jamo_keys)
+                chosung_pairs.extend((key, item_id) for key in chosung_keys)
+            self._sorted_jamo = self._split(sorted(jamo_pairs))
+            self._sorted_chosung = self._split(sorted(chosung_pairs))
+            self._dirty = False
+
+    def prefix_ids(self, query: str) -> List[int]:
+        """
+        접두 일치 id (중복 제거, 키 순서)
+        - 모두 초성이면 초성열, 아니면 자모열에서 찾음
+        """
+        with self._lock:
+            self.prepare()
+            if is_chosung_query(query):
+                keys, ids = self._sorted_chosung
+                prefix = chosung(query)
+            else:
+                keys, ids = self._sorted_jamo
+                prefix = decompose_jamo(query)
+            if not prefix:
+                return []
+            start = bisect.bisect_left(keys, prefix)
+            end = bisect.bisect_left(keys, prefix + "\uffff", lo=start)
+            return list(dict.fromkeys(ids[start:end]))
+
+    def fuzzy(self, query: str) -> List[Tuple[int, int]]:
+        """
+        자모 편집 거리 허용 검색 (부분 문자열 기준)
+        Returns:
+            (id, 거리) 목록, 거리 → id 순
+        """
+        pattern = decompose_jamo(query)
+        limit = max_edit_distance(len(pattern))
+        grams = _bigrams(pattern)
+        # 편집 1회는 2-gram을 최대 2개 깨뜨림
+        threshold = len(grams) - 2 * limit
+        if limit == 0 or threshold < 1:
+            return []
+        with self._lock:
+            arrays = [self._posting_array(gram) for gram in grams]
+            arrays = [array for array in arrays if array.size]
+            if not arrays:
+                return []
+            counts = np.bincount(np.concatenate(arrays))
+            candidates = np.flatnonzero(counts >= threshold)
+            if candidates.size > self.max_fuzzy_candidates:
+                top = np.argpartition(
+                    -counts[candidates], self.max_fuzzy_candidates - 1
+                )[: self.max_fuzzy_candidates]
+                candidates = candidates[top]
+            matches = []
+            for item_id in candidates.tolist():
+                distance = substring_edit_distance(pattern, self._jamo[item_id], limit)
+                if distance <= limit:
+                    matches.append((item_id, distance))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def _posting_array(self, gram: str) -> np.ndarray:
+        array = self._posting_arrays.get(gram)
+        if array is None:
+            array = np.fromiter(self._postings.get(gram, ()), dtype=np.int64)
+            self._posting_arrays[gram] = array
+        return array
+
+    @staticmethod
+    def _split(pairs: List[Tuple[str, int]]) -> Tuple[List[str], List[int]]:
+        return [key for key, _ in pairs], [item_id for _, item_id in pairs]
@@ -0,0 +1,191 @@
+"""
+키셋(커서) 페이지네이션
+- 정렬 키의 마지막 행 값을 불투명 토큰(next_cursor)으로 내려주고,
+  다음 요청은 OFFSET 대신 "그 값 이후" 조건으로 이어서 조회
+- 정렬 키 마지막에는 항상 고유 키(id)를 둬서 동점 행이 빠지거나 겹치지 않음
+- 기존 skip/offset 파라미터는 커서가 없을 때만 사용 (호환용)
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, literal_column, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+# NULL 정렬 키 대체값 (PostgreSQL 기본 NULLS LAST와 같은 순서)
+NULLS_LAST_INT = 2147483647
+
+
+def nulls_last(column: ColumnElement) -> ColumnElement:
+    """
+    NULL을 가장 큰 정수로 바꾼 정렬 키
+    - 상수는 바인드 파라미터가 아닌 리터럴로 넣어 식 인덱스와 일치시킴
+    """
+    return func.coalesce(column, literal_column(str(NULLS_LAST_INT)))
+
+
+def zero_if_null(column: ColumnElement) -> ColumnElement:
+    """NULL을 0으로 바꾼 정렬 키 (식 인덱스와 일치하도록 리터럴 사용)"""
+    return func.coalesce(column, literal_column("0"))
+
+
+class Page(list):
+    """
+    조회 결과 목록 + 다음 페이지 커서 (없으면 None, 기존 list 반환과 호환)
+    - total: 조건에 맞는 전체 건수 (계산하지 않았으면 None)
+    """
+
+    def __init__(
+        self,
+        items: Sequence[Any] = (),
+        next_cursor: Optional[str] = None,
+        total: Optional[int] = None,
+    ):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+        self.total = total
+
+
+class KeysetOrder:
+    """
+    키셋 정렬 정의
+    Args:
+        name: 커서 발급 정렬 이름 (다른 정렬의 커서는 거부)
+        keys: (정렬 식, 내림차순 여부) 목록, 마지막은 고유 키
+    """
+
+    def __init__(self, name: str, *keys: Tuple[ColumnElement, bool]):
+        self.name = name
+        self.keys = keys
+
+    def order_by(self) -> List[ColumnElement]:
+        return [expr.desc() if desc else expr.asc() for expr, desc in self.keys]
+
+    def after(self, values: Sequence[Any]) -> ColumnElement:
+        """커서 값 이후 행 조건"""
+        directions = {desc for _, desc in self.keys}
+        if len(directions) == 1:
+            # 방향이 모두 같으면 행 비교 한 번 (복합 인덱스 범위 스캔)
+            left = tuple_(*(expr for expr, _ in self.keys))
+            right = tuple_(*values)
+            return left < right if directions.pop() else left > right
+        # 방향이 섞이면 (k1 넘음) OR (k1 같고 k2 넘음) OR ...
+        clauses = []
+        for i, (expr, desc) in enumerate(self.keys):
+            equal = [self.keys[j][0] == values[j] for j in range(i)]
+            beyond = expr < values[i] if desc else expr > values[i]
+            clauses.append(and_(*equal, beyond))
+        first, first_desc = self.keys[0]
+        # 첫 키 범위를 따로 걸어 인덱스 범위 스캔이 가능하게 함
+        bound = first <= values[0] if first_desc else first >= values[0]
+        return and_(bound, or_(*clauses))
+
+    def encode(self, values: Sequence[Any]) -> str:
+        return _pack(self.name, values)
+
+    def decode(self, cursor: str) -> List[Any]:
+        """
+        Raises:
+            ValueError: 형식이 잘못됐거나 다른 정렬의 커서
+        """
+        return _unpack(self.name, cursor, len(self.keys))
+
+
+def encode_offset_cursor(name: str, offset: int) -> str:
+    """메모리 색인처럼 위치 이동 비용이 없는 결과용 커서 (다음 시작 위치)"""
+    return _pack(name, [offset])
+
+
+def decode_offset_cursor(name: str, cursor: str) -> int:
+    """
+    Raises:
+        ValueError: 형식이 잘못됐거나 다른 결과의 커서
+    """
+    (offset,) = _unpack(name, cursor, 1)
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("잘못된 커서입니다.")
+    return offset
+
+
+def _pack(name: str, values: Sequence[Any]) -> str:
+    payload = [name, [_encode_value(value) for value in values]]
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def _unpack(name: str, cursor: str, width: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_name, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_decode_value(value) for value in values]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+    if cursor_name != name or len(values) != width:
+        raise ValueError("잘못된 커서입니다.")
+    return values
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return {"u": str(value)}
+    if isinstance(value, datetime):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "u" in value:
+            return uuid.UUID(value["u"])
+        return datetime.fromisoformat(value["d"])
+    return value
+
+
+async def fetch_page(
+    db: AsyncSession,
+    stmt: Select,
+    order: KeysetOrder,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    entity_only: bool = True,
+    with_total: bool = False,
+) -> Page:
+    """
+    키셋 페이지 조회
+    - 정렬 키를 함께 조회해 마지막 행으로 다음 커서 생성
+    - limit + 1건을 읽어 다음 페이지 존재 여부 확인 (추가 count 쿼리 없음)
+    - 커서가 없으면 skip(OFFSET)으로 시작 위치 지정
+    - entity_only가 False면 정렬 키를 뺀 행 튜플을 반환
+    - with_total이면 같은 쿼리의 count(*) OVER()로 전체 건수를 채움
+      (커서 조건이 걸린 쿼리나 skip 뒤 빈 페이지는 알 수 없어 None)
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    with_total = with_total and not cursor
+    extra = [expr.label(f"_page_key_{i}") for i, (expr, _) in enumerate(order.keys)]
+    if with_total:
+        extra.append(func.count().over().label("_page_total"))
+    stmt = stmt.add_columns(*extra).order_by(*order.order_by())
+    if cursor:
+        stmt = stmt.where(order.after(order.decode(cursor)))
+    elif skip:
+        stmt = stmt.offset(skip)
+    rows = (await db.execute(stmt.limit(limit + 1))).all()
+    width = len(extra)
+    total = None
+    if with_total:
+        total = rows[0][-1] if rows else (0 if not skip else None)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if rows:
+            next_cursor = order.encode(rows[-1][-width:][: len(order.keys)])
+    if entity_only:
+        return Page([row[0] for row in rows], next_cursor, total)
+    return Page([tuple(row[:-width]) for row in rows], next_cursor, total)
@@ -0,0 +1,218 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 기본 선호도 속성 (순서 고정 - 패킹 컬럼/유사도 계산/점수 계산 공통)
+BASE_FIELDS = [
+    "spicy_preference",
+    "healthy_preference",
+    "vegetarian_preference",
+    "quick_preference",
+    "rice_preference",
+    "soup_preference",
+    "meat_preference",
+    "breakfast_preference",
+    "lunch_preference",
+    "dinner_preference",
+]
+BASE_DEFAULTS = [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.33, 0.33, 0.34]
+BASE_SIZE = len(BASE_FIELDS)
+
+# 메뉴 속성 플래그 → 가중치 키 (BASE_FIELDS 앞 7개와 같은 순서)
+ATTRIBUTE_FLAGS = [
+    "is_spicy",
+    "is_healthy",
+    "is_vegetarian",
+    "is_quick",
+    "has_rice",
+    "has_soup",
+    "has_meat",
+]
+ATTRIBUTE_KEYS = ["spicy", "healthy", "vegetarian", "quick", "rice", "soup", "meat"]
+ATTRIBUTE_SIZE = len(ATTRIBUTE_FLAGS)
+
+TIME_SLOT_INDEX = {"breakfast": 7, "lunch": 8, "dinner": 9}
+
+# 학습된 적 없는 국가의 시작 선호도
+COUNTRY_DEFAULT = 0.5
+
+
+class CountryDictionary:
+    """
+    국가명 ↔ 벡터 인덱스 사전
+    - 인덱스는 preference_countries 테이블의 id에서 오며 추가만 가능 (재사용/변경 없음)
+    - 벡터 위치 = BASE_SIZE + id - 1
+    """
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[int]:
+        """국가의 벡터 위치 (모르는 국가면 None)"""
+        return self._index.get(name)
+
+    def missing(self, names: Iterable[Optional[str]]) -> List[str]:
+        """사전에 없는 국가명 목록"""
+        return sorted({name for name in names if name and name not in self._index})
+
+    def register(self, rows: Iterable[Tuple[int, str]]) -> None:
+        """DB에서 읽은 (id, 국가명) 반영"""
+        with self._lock:
+            for country_id, name in rows:
+                position = BASE_SIZE + country_id - 1
+                self._index[name] = position
+                self._names[position] = name
+
+    def name(self, position: int) -> Optional[str]:
+        return self._names.get(position)
+
+    @property
+    def size(self) -> int:
+        """국가까지 포함한 벡터 길이"""
+        return max(self._names, default=BASE_SIZE - 1) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index.clear()
+            self._names.clear()
+
+
+# 전역 국가 사전 (워커 프로세스별, 시작 시 DB에서 적재)
+country_dictionary = CountryDictionary()
+
+
+class PreferenceVector:
+    """
+    선호도 벡터 값 타입
+    - float32 배열 하나에 기본 속성 10개 + 국가별 선호도(밀집)를 담음
+    - 학습된 적 없는 국가는 NaN
+    - user_preferences.preference_vector(REAL[]) 컬럼에 그대로 패킹
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+
+    @classmethod
+    def default(cls) -> "PreferenceVector":
+        return cls(np.array(BASE_DEFAULTS, dtype=np.float32))
+
+    @classmethod
+    def from_packed(cls, packed: Sequence[float]) -> "PreferenceVector":
+        """패킹 컬럼 값에서 생성"""
+        return cls(np.array(packed, dtype=np.float32))
+
+    @classmethod
+    def from_legacy(cls, preference) -> "PreferenceVector":
+        """
+        개별 float 컬럼에서 생성 (패킹 컬럼이 비어 있는 행, 국가 선호도는 학습 전 상태)
+        """
+        return cls(
+            np.array(
+                [
+                    value if value is not None else default
+                    for value, default in zip(
+                        (getattr(preference, f, None) for f in BASE_FIELDS),
+                        BASE_DEFAULTS,
+                    )
+                ],
+                dtype=np.float32,
+            )
+        )
+
+    def to_packed(self) -> List[float]:
+        """패킹 컬럼에 저장할 값"""
+        return self.values.tolist()
+
+    def copy(self) -> "PreferenceVector":
+        return PreferenceVector(self.values.copy())
+
+    @property
+    def base(self) -> np.ndarray:
+        """기본 속성 10개 (유사도 계산용 뷰)"""
+        return self.values[:BASE_SIZE]
+
+    def get(self, field: str) -> float:
+        return float(self.values[BASE_FIELDS.index(field)])
+
+    def time_slot(self, slot: Optional[str]) -> float:
+        """시간대 선호도 (알 수 없는 시간대면 1.0)"""
+        position = TIME_SLOT_INDEX.get(slot)
+        return 1.0 if position is None else float(self.values[position])
+
+    def country(self, name: str) -> Optional[float]:
+        position = country_dictionary.get(name)
+        if position is None or position >= self.values.size:
+            return None
+        value = self.values[position]
+        return None if np.isnan(value) else float(value)
+
+    def country_preferences(self) -> Dict[str, float]:
+        """학습된 국가별 선호도"""
+        result = {}
+        for position in range(BASE_SIZE, self.values.size):
+            name = country_dictionary.name(position)
+            if name and not np.isnan(self.values[position]):
+                result[name] = float(self.values[position])
+        return result
+
+    def attribute_score(self, menu, weights: np.ndarray) -> float:
+        """
+        메뉴가 가진 속성의 선호도 × 가중치 합
+        - weights는 ATTRIBUTE_KEYS 순서의 벡터 (config_weights.compile_weights)
+        """
+        values = self.values
+        return sum(
+            float(values[i] * weights[i])
+            for i, flag in enumerate(ATTRIBUTE_FLAGS)
+            if getattr(menu, flag)
+        )
+
+    def cosine(self, other: "PreferenceVector") -> float:
+        """기본 속성 기준 코사인 유사도"""
+        a, b = self.base, other.base
+        magnitude = float(np.linalg.norm(a)) * float(np.linalg.norm(b))
+        if magnitude == 0:
+            return 0.0
+        return float(np.dot(a, b)) / magnitude
+
+    def learn(self, menu, interaction_strength: float) -> None:
+        """
+        메뉴 상호작용 하나를 반영 (제자리 갱신)
+        - 메뉴 속성이 있으면 +학습률, 없으면 -학습률/2 (0.0 ~ 1.0)
+        - 메뉴 시간대/국가 선호도는 +학습률 (국가는 처음이면 0.5에서 시작)
+        """
+        learning_rate = 0.1 * interaction_strength
+        values = self.values
+        for i, flag in enumerate(ATTRIBUTE_FLAGS):
+            if getattr(menu, flag):
+                values[i] = min(1.0, values[i] + learning_rate)
+            else:
+                values[i] = max(0.0, values[i] - learning_rate * 0.5)
+
+        position = TIME_SLOT_INDEX.get(menu.time_slot)
+        if position is not None:
+            values[position] = min(1.0, values[position] + learning_rate)
+
+        category = getattr(menu, "category", None)
+        position = country_dictionary.get(category.country) if category else None
+        if position is not None:
+            self._ensure_size(position + 1)
+            current = self.values[position]
+            if np.isnan(current):
+                current = COUNTRY_DEFAULT
+            self.values[position] = min(1.0, current + learning_rate)
+
+    def _ensure_size(self, size: int) -> None:
+        """국가가 추가되어 길이가 부족하면 NaN으로 확장"""
+        if self.values.size < size:
+            extended = np.full(size, np.nan, dtype=np.float32)
+            extended[: self.values.size] = self.values
+            self.values = extended
+
+    def __repr__(self):
+        return f"<PreferenceVector({self.values.tolist()})>"
@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, Optional, Set
+
+from app.core.config import settings
+
+
+class _RecentEntry:
+    """세션 하나의 최근 항목 링 버퍼"""
+
+    __slots__ = ("items", "complete", "expires_at")
+
+    def __init__(self, capacity: int, expires_at: float):
+        self.items: deque = deque(maxlen=capacity)
+        self.complete = False  # DB 이력까지 반영되었는지 여부
+        self.expires_at = expires_at
+
+
+class RecentItemsBuffer:
+    """
+    세션별 최근 추천 메뉴 링 버퍼
+    - 세션당 최대 items_per_session개 (오래된 것부터 밀려남)
+    - 세션 수는 max_sessions로 제한 (LRU), 전체 메모리 상한 = 두 값의 곱
+    - 마지막 기록 후 ttl초가 지나면 만료
+    - DB 이력을 반영하지 않은(complete=False) 세션은 조회 시 None을 반환해
+      호출 측이 DB에서 한 번 채우도록 함
+    """
+
+    def __init__(
+        self, max_sessions: int = 10000, items_per_session: int = 50, ttl: int = 1800
+    ):
+        self.max_sessions = max_sessions
+        self.items_per_session = items_per_session
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, _RecentEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "records": 0, "evictions": 0}
+
+    def get(self, session_id: str) -> Optional[Set[str]]:
+        """최근 항목 집합 조회 (모르는 세션/만료/미완성이면 None)"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or not entry.complete or self._expired(entry):
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self._stats["hits"] += 1
+            return set(entry.items)
+
+    def record(self, session_id: str, items: Iterable[str]) -> None:
+        """추천 제공 시 호출 - 항목을 링 버퍼 뒤에 추가"""
+        with self._lock:
+            entry = self._entry(session_id)
+            entry.items.extend(items)
+            self._stats["records"] += 1
+
+    def seed(self, session_id: str, items: Iterable[str]) -> Set[str]:
+        """
+        DB 이력(오래된 것 → 최근 순)으로 채우고 완성 표시
+        - 그 사이 record된 항목은 뒤쪽(최근)에 유지
+        """
+        with self._lock:
+            entry = self._entry(session_id)
+            recorded = list(entry.items)
+            entry.items.clear()
+            entry.items.extend(items)
+            entry.items.extend(recorded)
+            entry.complete = True
+            return set(entry.items)
+
+    def invalidate(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "sessions": len(self._entries),
+                "items": sum(len(entry.items) for entry in self._entries.values()),
+                "max_sessions": self.max_sessions,
+                "items_per_session": self.items_per_session,
+            }
+
+    def _expired(self, entry: _RecentEntry) -> bool:
+        return entry.expires_at <= time.monotonic()
+
+    def _entry(self, session_id: str) -> _RecentEntry:
+        """항목 조회/생성 후 TTL 갱신, 상한 초과 시 가장 오래된 세션 제거"""
+        expires_at = time.monotonic() + self.ttl
+        entry = self._entries.get(session_id)
+        if entry is None or self._expired(entry):
+            entry = _RecentEntry(self.items_per_session, expires_at)
+            self._entries[session_id] = entry
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        entry.expires_at = expires_at
+        self._entries.move_to_end(session_id)
+        return entry
+
+
+# 전역 최근 추천 메뉴 버퍼 (워커 프로세스별)
+recent_recommendations = RecentItemsBuffer(
+    max_sessions=settings.recent_recommendation_max_sessions,
+    items_per_session=settings.recent_recommendation_items_per_session,
+    ttl=settings.recent_recommendation_ttl_seconds,
+)
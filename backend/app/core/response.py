@@ -23,6 +23,19 @@ class ResponseHandler:
             status_code=status_code,
         )
 
+    @staticmethod
+    def page(
+        data: Any,
+        next_cursor: Optional[str],
+        facets: Optional[Dict[str, Any]] = None,
+    ) -> JSONResponse:
+        """목록 성공 응답 + 다음 페이지 커서 (마지막 페이지면 None), 요청 시 패싯별 수"""
+        content = succeed_response(data)
+        content["next_cursor"] = next_cursor
+        if facets is not None:
+            content["facets"] = facets
+        return JSONResponse(content=jsonable_encoder(content))
+
     @staticmethod
     def error(
         message: str,
@@ -55,6 +68,11 @@ class ResponseHandler:
         """생성 성공 응답"""
         return ResponseHandler.success(data, message, status.HTTP_201_CREATED)
 
+    @staticmethod
+    def accepted(data: Any = None, message: str = "접수되었습니다.") -> JSONResponse:
+        """비동기 처리 접수 응답 (202 Accepted)"""
+        return ResponseHandler.success(data, message, status.HTTP_202_ACCEPTED)
+
     @staticmethod
     def no_content() -> Response:
         """삭제 성공 응답 (204 No Content)"""
@@ -67,6 +85,13 @@ def api_success(data: Any = None, **kwargs) -> JSONResponse:
     return ResponseHandler.success(data, **kwargs)
 
 
+def api_page(
+    data: Any, next_cursor: Optional[str], facets: Optional[Dict[str, Any]] = None
+) -> JSONResponse:
+    """API 목록 응답 (커서 페이지)"""
+    return ResponseHandler.page(data, next_cursor, facets)
+
+
 def api_error(message: str, **kwargs) -> JSONResponse:
     """API 에러 응답"""
     return ResponseHandler.error(message, **kwargs)
@@ -82,6 +107,11 @@ def api_created(data: Any = None, **kwargs) -> JSONResponse:
     return ResponseHandler.created(data, **kwargs)
 
 
+def api_accepted(data: Any = None, **kwargs) -> JSONResponse:
+    """API 비동기 처리 접수 응답"""
+    return ResponseHandler.accepted(data, **kwargs)
+
+
 def api_no_content() -> Response:
     """API 삭제 성공 응답"""
     return ResponseHandler.no_content()
@@ -0,0 +1,91 @@
+"""
+한국어 전문 검색 도우미
+- 형태소 분석기 없이 단어를 글자 2-gram으로 나눠 tsvector/tsquery를 만듦
+  (예: "김치찌개" → 김치 치찌 찌개)
+- DB의 korean_bigrams() 함수(생성 컬럼용)와 같은 규칙으로 검색어를 토큰화
+"""
+
+import re
+from typing import List, Optional
+
+from sqlalchemy import func, or_
+
+# 텍스트 검색 설정 (어간 추출/불용어 없이 토큰 그대로 사용)
+SEARCH_CONFIG = "simple"
+
+# 생성 컬럼이 사용하는 IMMUTABLE 함수 (공백/구두점으로 단어 분리 후 단어별 2-gram, 한 글자 단어는 그대로)
+KOREAN_BIGRAMS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION korean_bigrams(input text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(
+        CASE WHEN char_length(w) = 1 THEN w ELSE substr(w, i, 2) END, ' '), '')
+    FROM regexp_split_to_table(lower(coalesce(input, '')), '[[:space:][:punct:]]+') AS w,
+         generate_series(1, greatest(char_length(w) - 1, 1)) AS i
+    WHERE w <> ''
+$$
+"""
+
+MENU_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', korean_bigrams(name)), 'A') || "
+    "setweight(to_tsvector('simple', korean_bigrams(coalesce(ingredients, ''))), 'B') || "
+    "setweight(to_tsvector('simple', korean_bigrams(coalesce(description, ''))), 'C')"
+)
+CATEGORY_SEARCH_VECTOR = "to_tsvector('simple', korean_bigrams(name))"
+
+_WORD_SPLIT = re.compile(r"[\s\W_]+")
+
+
+def split_words(text: str) -> List[str]:
+    return [word for word in _WORD_SPLIT.split((text or "").lower()) if word]
+
+
+def bigram_tokens(text: str) -> List[str]:
+    """korean_bigrams()와 같은 토큰 목록"""
+    tokens = []
+    for word in split_words(text):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def build_tsquery(query: str) -> Optional[str]:
+    """
+    검색어 → to_tsquery('simple', ...) 입력 문자열
+    - 모든 2-gram을 AND로 연결 (부분 문자열 검색과 같은 효과)
+    - 한 글자 단어는 접두 일치 (예: '국':* → 국밥, 국수)
+    - 토큰이 없으면 None
+    """
+    terms = []
+    for word in split_words(query):
+        if len(word) == 1:
+            terms.append(f"'{word}':*")
+        else:
+            terms.extend(f"'{word[i : i + 2]}'" for i in range(len(word) - 1))
+    return " & ".join(dict.fromkeys(terms)) or None
+
+
+def like_pattern(query: str) -> str:
+    """ILIKE 부분 일치 패턴 (%, _, \\ 이스케이프)"""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def text_match_and_rank(search_vector, name_column, query: str):
+    """
+    검색 조건과 관련도 점수 식
+    - search_vector @@ 2-gram tsquery (GIN) 또는 이름 부분 일치 (pg_trgm GIN)
+    - 관련도 = ts_rank(가중치 A/B/C) + 이름 유사도
+    Returns:
+        (tsquery 식 또는 None, 검색 조건, 관련도 식)
+    """
+    name_match = name_column.ilike(like_pattern(query), escape="\\")
+    similarity = func.similarity(name_column, query)
+    tsquery_text = build_tsquery(query)
+    if tsquery_text is None:
+        return None, name_match, similarity
+    tsquery = func.to_tsquery(SEARCH_CONFIG, tsquery_text)
+    condition = or_(search_vector.op("@@")(tsquery), name_match)
+    rank = func.ts_rank(search_vector, tsquery) + similarity
+    return tsquery, condition, rank
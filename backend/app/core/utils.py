@@ -92,6 +92,7 @@ def menu_to_dict(menu: Menu) -> Dict[str, Any]:
         "difficulty": menu.difficulty,
         "rating": menu.rating,
         "image_url": menu.image_url,
+        "favorite_count": menu.favorite_count,
         "is_active": menu.is_active,
         "display_order": menu.display_order,
         "created_at": menu.created_at,
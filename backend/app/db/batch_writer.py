@@ -0,0 +1,51 @@
+import os
+from typing import Dict, List, Tuple
+
+from sqlalchemy import insert
+
+from app.core.batch_queue import BatchQueue, jsonl_dead_letter
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.database import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+ModelRow = Tuple[type, Dict]
+# 함께 기록해야 하는 행 묶음 (로그 1건 + 추천 행) - 큐에는 묶음 단위로 들어감
+ModelRowSet = List[ModelRow]
+
+
+async def insert_model_rows(row_sets: List[ModelRowSet]) -> None:
+    """
+    (모델, 컬럼 값) 행 묶음 목록을 모델별 다중 행 INSERT로 기록
+    - 큐에 들어온 순서대로 모델을 처리해 FK 순서를 유지
+    """
+    grouped: Dict[type, List[Dict]] = {}
+    for rows in row_sets:
+        for model, values in rows:
+            grouped.setdefault(model, []).append(values)
+
+    async with AsyncSessionLocal() as db:
+        for model, values in grouped.items():
+            await db.execute(insert(model), values)
+        await db.commit()
+
+
+# 추천 로그(RecommendationLog + Recommendation) 백그라운드 기록기
+recommendation_log_writer: BatchQueue[ModelRowSet] = BatchQueue(
+    name="RecommendationLogWriter",
+    handler=insert_model_rows,
+    max_size=settings.recommendation_log_queue_size,
+    batch_size=settings.recommendation_log_batch_size,
+    flush_interval=settings.recommendation_log_flush_interval_ms / 1000,
+    put_timeout=settings.recommendation_log_put_timeout_seconds,
+    overflow_policy=settings.recommendation_log_overflow_policy,
+    max_retries=settings.batch_queue_max_retries,
+    retry_backoff=settings.batch_queue_retry_backoff_seconds,
+    dead_letter=jsonl_dead_letter(
+        os.path.join(settings.batch_queue_dead_letter_dir, "recommendation_logs.jsonl"),
+        encode=lambda rows: [
+            {"table": model.__tablename__, "values": values} for model, values in rows
+        ],
+    ),
+)
@@ -1,3 +1,4 @@
+from .ab_test_rollup import AbGroupPosterior, AbTestRollup
 from .category import Category
 from .favorite import Favorite
 from .menu import Menu, TimeSlot
@@ -5,7 +6,8 @@ from .question import Question
 from .recommendation import Recommendation
 from .user import User
 from .user_answer import UserAnswer
-from .user_preference import UserInteraction, UserPreference
+from .user_preference import PreferenceCountry, UserInteraction, UserPreference
+from .weight_set import WeightSet
 
 __all__ = [
     "User",
@@ -18,4 +20,8 @@ __all__ = [
     "Favorite",
     "UserPreference",
     "UserInteraction",
+    "PreferenceCountry",
+    "AbTestRollup",
+    "AbGroupPosterior",
+    "WeightSet",
 ]
@@ -0,0 +1,41 @@
+from sqlalchemy import BigInteger, Column, DateTime, String
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class AbTestRollup(Base):
+    """
+    A/B 테스트 시간별 집계 모델
+    - (시각(정시), ab_group, action_type)별 건수
+    - 추천 로그/상호작용 기록 시 증분 갱신 (통계 조회는 로그를 스캔하지 않음)
+    """
+
+    __tablename__ = "ab_test_hourly_rollups"
+
+    hour = Column(DateTime(timezone=True), primary_key=True)
+    ab_group = Column(String(50), primary_key=True)
+    action_type = Column(String(50), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<AbTestRollup(hour='{self.hour}', ab_group='{self.ab_group}', action_type='{self.action_type}')>"
+
+
+class AbGroupPosterior(Base):
+    """
+    A/B 그룹 배정용 밴딧 누적 카운터
+    - trials: 추천 노출 수, successes: 사용자의 보상 상호작용(favorite/recommend_select) 수
+      (퀴즈 자동 기록 auto_select는 제외)
+    - 워커별 증분을 주기적으로 더해 기록 (Beta 사후분포의 파라미터)
+    """
+
+    __tablename__ = "ab_group_posteriors"
+
+    ab_group = Column(String(50), primary_key=True)
+    trials = Column(BigInteger, nullable=False, default=0)
+    successes = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<AbGroupPosterior(ab_group='{self.ab_group}', trials={self.trials}, successes={self.successes})>"
@@ -1,10 +1,11 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Computed, DateTime, Index, Integer, String
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
+from app.core.text_search import CATEGORY_SEARCH_VECTOR
 from app.db.database import Base
 
 
@@ -16,6 +17,9 @@ class Category(Base):
     """
 
     __tablename__ = "categories"
+    __table_args__ = (
+        Index("ix_categories_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False, index=True)
@@ -28,6 +32,10 @@ class Category(Base):
     color_code = Column(String(7), nullable=True)  # HEX 색상 코드
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 검색용 생성 컬럼 (조회 시에는 로드하지 않음)
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(CATEGORY_SEARCH_VECTOR, persisted=True))
+    )
 
     # 메뉴와의 관계
     menus = relationship(
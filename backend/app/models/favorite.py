@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -32,3 +32,13 @@ class Favorite(Base):
 
     def __repr__(self):
         return f"<Favorite(user_id='{self.user_id}', menu_id='{self.menu_id}')>"
+
+
+# 유저별 최신순 키셋 페이지 (FavoriteRepository.get_user_favorites)
+Index(
+    "ix_favorites_user_created",
+    Favorite.user_id,
+    Favorite.created_at.desc(),
+    Favorite.id.desc(),
+    postgresql_where=Favorite.is_active,
+)
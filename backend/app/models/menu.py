@@ -3,21 +3,33 @@ import uuid
 
 import sqlalchemy.types as types
 from sqlalchemy import (
+    DDL,
     Boolean,
     Column,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    event,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
+from app.core.pagination import nulls_last, zero_if_null
+from app.core.text_search import KOREAN_BIGRAMS_FUNCTION, MENU_SEARCH_VECTOR
 from app.db.database import Base
 
+# 검색 생성 컬럼/인덱스가 쓰는 확장과 함수 (create_all 시 테이블보다 먼저 생성)
+event.listen(
+    Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+event.listen(Base.metadata, "before_create", DDL(KOREAN_BIGRAMS_FUNCTION))
+
 
 class TimeSlot(enum.Enum):
     """
@@ -58,6 +70,17 @@ class Menu(Base):
     """
 
     __tablename__ = "menus"
+    __table_args__ = (
+        # 전문 검색 (글자 2-gram tsvector)
+        Index("ix_menus_search_vector", "search_vector", postgresql_using="gin"),
+        # 부분 문자열(ILIKE)/유사도 검색
+        Index(
+            "ix_menus_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(200), nullable=False, index=True)
@@ -94,6 +117,8 @@ class Menu(Base):
     difficulty = Column(String(20), nullable=True, index=True)  # easy, medium, hard
     rating = Column(Float, default=0.0)
     image_url = Column(String(500), nullable=True)
+    # 활성 즐겨찾기 수 (찜 추가/해제와 같은 트랜잭션에서 증감)
+    favorite_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -104,8 +129,15 @@ class Menu(Base):
         nullable=False,
     )
 
+    # 검색용 생성 컬럼 (이름 > 재료 > 설명 가중치, 조회 시에는 로드하지 않음)
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(MENU_SEARCH_VECTOR, persisted=True))
+    )
+
     # 카테고리 연관관계
-    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=True)
+    category_id = Column(
+        UUID(as_uuid=True), ForeignKey("categories.id"), nullable=True, index=True
+    )
     category = relationship("Category", back_populates="menus")
 
     # 연관관계
@@ -121,3 +153,29 @@ class Menu(Base):
 
     def __repr__(self):
         return f"<Menu(name='{self.name}', time_slot='{self.time_slot}')>"
+
+
+# 키셋 페이지 정렬 식 인덱스 (app.core.pagination의 정렬 키와 같은 식)
+Index(
+    "ix_menus_active_display_order",
+    nulls_last(Menu.display_order),
+    Menu.name,
+    Menu.id,
+    postgresql_where=Menu.is_active,
+)
+Index(
+    "ix_menus_category_display_order",
+    Menu.category_id,
+    nulls_last(Menu.display_order),
+    Menu.name,
+    Menu.id,
+    postgresql_where=Menu.is_active,
+)
+Index("ix_menus_rating_name", zero_if_null(Menu.rating).desc(), Menu.name, Menu.id)
+# 인기 메뉴 (즐겨찾기 수 → 이름)
+Index(
+    "ix_menus_popular",
+    Menu.favorite_count.desc(),
+    Menu.name,
+    postgresql_where=Menu.is_active,
+)
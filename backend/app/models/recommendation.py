@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -36,6 +36,10 @@ class RecommendationLog(Base):
     """추천 로그 모델 (A/B 테스트 및 상세 정보 저장)"""
 
     __tablename__ = "recommendation_logs"
+    __table_args__ = (
+        # 세션별 최근 로그 조회용
+        Index("ix_recommendation_logs_session_created", "session_id", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
@@ -1,13 +1,28 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    inspect,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REAL, UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
+from app.core.preference_vector import BASE_FIELDS, PreferenceVector
 from app.db.database import Base
 
 
+def _default_packed_vector():
+    return PreferenceVector.default().to_packed()
+
+
 class UserPreference(Base):
     """
     사용자 선호도 학습 모델
@@ -16,12 +31,23 @@ class UserPreference(Base):
     """
 
     __tablename__ = "user_preferences"
+    __table_args__ = (
+        # 로그인 사용자당 선호도 1개 (비로그인 행은 user_id가 NULL)
+        Index(
+            "uq_user_preferences_user_id",
+            "user_id",
+            unique=True,
+            postgresql_where=text("user_id IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )  # 로그인 사용자
-    session_id = Column(String(255), nullable=False, index=True)  # 비로그인 사용자 세션
+    session_id = Column(
+        String(255), nullable=False, unique=True, index=True
+    )  # 비로그인 사용자 세션
 
     # 선호도 속성 (0.0 ~ 1.0)
     spicy_preference = Column(Float, default=0.5)  # 매운맛 선호도
@@ -37,11 +63,15 @@ class UserPreference(Base):
     lunch_preference = Column(Float, default=0.33)
     dinner_preference = Column(Float, default=0.34)
 
-    # 국가별 선호도 (JSON 형태로 저장)
-    country_preferences = Column(String(1000), default="{}")  # JSON string
+    # 패킹된 선호도 벡터 (기본 속성 10개 + 국가별 선호도, PreferenceVector 참고)
+    # - 국가별 선호도는 이 컬럼에만 저장 (기존 JSON 컬럼은 e7f2c4a1b853에서 제거)
+    preference_vector = Column(ARRAY(REAL), default=_default_packed_vector)
 
     # 학습 데이터
     total_interactions = Column(Integer, default=0)  # 총 상호작용 수
+    version = Column(
+        Integer, nullable=False, server_default="0"
+    )  # 낙관적 동시성 제어용 버전 (갱신할 때마다 +1, 비교는 선호도 저장소 UPDATE에서만)
     last_updated = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
@@ -52,10 +82,55 @@ class UserPreference(Base):
     # 연관관계
     user = relationship("User", back_populates="preferences")
 
+    @property
+    def is_persisted(self) -> bool:
+        """DB에 저장된 행인지 (처음 보는 세션의 기본 선호도면 False)"""
+        return inspect(self).has_identity
+
+    @property
+    def vector(self) -> PreferenceVector:
+        """
+        선호도 벡터 (패킹 컬럼에서 한 번만 변환해 인스턴스에 보관)
+        - 패킹 컬럼이 비어 있는 기존 행은 개별 컬럼에서 생성
+        """
+        packed = self.preference_vector
+        cached = self.__dict__.get("_vector_cache")
+        if cached is not None and cached[0] is packed:
+            return cached[1]
+        if packed:
+            vector = PreferenceVector.from_packed(packed)
+        else:
+            vector = PreferenceVector.from_legacy(self)
+        self._vector_cache = (packed, vector)
+        return vector
+
+    def store_vector(self, vector: PreferenceVector) -> None:
+        """벡터를 패킹 컬럼에 저장하고 개별 float 컬럼도 같은 값으로 맞춤"""
+        packed = vector.to_packed()
+        self.preference_vector = packed
+        for field, value in zip(BASE_FIELDS, packed):
+            setattr(self, field, value)
+        self._vector_cache = (packed, vector)
+
     def __repr__(self):
         return f"<UserPreference(user_id='{self.user_id}', session_id='{self.session_id}', ab_group='{self.ab_group}')>"
 
 
+class PreferenceCountry(Base):
+    """
+    선호도 벡터의 국가 사전
+    - id가 벡터 내 국가 위치를 결정하므로 행은 추가만 함 (삭제/변경 금지)
+    """
+
+    __tablename__ = "preference_countries"
+
+    id = Column(SmallInteger, primary_key=True, autoincrement=True)
+    name = Column(String(50), nullable=False, unique=True)
+
+    def __repr__(self):
+        return f"<PreferenceCountry(id={self.id}, name='{self.name}')>"
+
+
 class UserInteraction(Base):
     """
     사용자 상호작용 로그
@@ -0,0 +1,29 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class WeightSet(Base):
+    """
+    A/B 테스트 추천 가중치 세트 (버전 관리)
+    - 변경할 때마다 같은 ab_group에 version을 1 올린 행을 추가 (기존 행은 이력으로 유지)
+    - 그룹별 최신 버전이 적용됨
+    """
+
+    __tablename__ = "weight_sets"
+    __table_args__ = (
+        UniqueConstraint("ab_group", "version", name="uq_weight_sets_group_version"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    ab_group = Column(String(50), nullable=False)
+    version = Column(Integer, nullable=False)
+    weights = Column(Text, nullable=False)  # 속성별 가중치 (JSON)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<WeightSet(ab_group='{self.ab_group}', version={self.version})>"
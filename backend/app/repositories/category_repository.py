@@ -3,10 +3,19 @@ from typing import List, Optional
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import KeysetOrder, Page, fetch_page, nulls_last
 from app.models.category import Category
 from app.models.menu import Menu
 from app.repositories.base_repository import BaseRepository
 
+# 카테고리 목록 정렬 (표시 순서, NULL은 마지막 → 이름 → id)
+CATEGORY_DISPLAY_ORDER = KeysetOrder(
+    "category_display",
+    (nulls_last(Category.display_order), False),
+    (Category.name, False),
+    (Category.id, False),
+)
+
 
 class CategoryRepository(BaseRepository[Category]):
     """
@@ -23,8 +32,9 @@ class CategoryRepository(BaseRepository[Category]):
         country: Optional[str] = None,
         cuisine_type: Optional[str] = None,
         is_active: Optional[bool] = None,
-    ) -> List[Category]:
-        """카테고리 목록 조회 (필터링/페이징 지원)"""
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """카테고리 목록 조회 (필터링/커서 페이지 지원)"""
         query = select(Category)
         filters = []
         if country:
@@ -35,15 +45,14 @@ class CategoryRepository(BaseRepository[Category]):
             filters.append(Category.is_active == is_active)
         if filters:
             query = query.where(and_(*filters))
-        query = query.order_by(Category.display_order, Category.name)
-        query = query.offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return await fetch_page(
+            self.db, query, CATEGORY_DISPLAY_ORDER, limit, cursor, skip
+        )
 
     async def get_categories_with_menu_count(
-        self, skip: int = 0, limit: int = 100
-    ) -> List[dict]:
-        """메뉴 개수와 함께 카테고리 목록 조회"""
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Page:
+        """메뉴 개수와 함께 카테고리 목록 조회 (커서 페이지)"""
         menu_count_subquery = (
             select(Menu.category_id, func.count(Menu.id).label("menu_count"))
             .group_by(Menu.category_id)
@@ -58,15 +67,23 @@ class CategoryRepository(BaseRepository[Category]):
                 menu_count_subquery, Category.id == menu_count_subquery.c.category_id
             )
             .where(Category.is_active)
-            .order_by(Category.display_order, Category.name)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await self.db.execute(query)
-        return [
-            {**category.__dict__, "menu_count": menu_count}
-            for category, menu_count in result.all()
-        ]
+        rows = await fetch_page(
+            self.db,
+            query,
+            CATEGORY_DISPLAY_ORDER,
+            limit,
+            cursor,
+            skip,
+            entity_only=False,
+        )
+        return Page(
+            [
+                {**category.__dict__, "menu_count": menu_count}
+                for category, menu_count in rows
+            ],
+            rows.next_cursor,
+        )
 
     async def get_categories_by_country(self, country: str) -> List[Category]:
         """국가별 카테고리 조회"""
@@ -1,14 +1,20 @@
 import uuid
-from typing import List, Optional
+from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import KeysetOrder, Page, fetch_page
 from app.models.favorite import Favorite
 from app.models.menu import Menu
 from app.repositories.base_repository import BaseRepository
 
+# 즐겨찾기 목록 정렬 (최신순 → id)
+FAVORITE_RECENT = KeysetOrder(
+    "favorite_recent", (Favorite.created_at, True), (Favorite.id, True)
+)
+
 
 class FavoriteRepository(BaseRepository[Favorite]):
     """
@@ -28,17 +34,33 @@ class FavoriteRepository(BaseRepository[Favorite]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def add(self, user_id: uuid.UUID, menu_id: uuid.UUID) -> Favorite:
+        """즐겨찾기 추가 (flush만, 커밋은 호출 측 트랜잭션)"""
+        favorite = Favorite(
+            id=uuid.uuid4(), user_id=user_id, menu_id=menu_id, is_active=True
+        )
+        self.db.add(favorite)
+        await self.db.flush()
+        return favorite
+
+    async def remove(self, favorite_id: uuid.UUID) -> bool:
+        """즐겨찾기 삭제 (커밋은 호출 측 트랜잭션)"""
+        result = await self.db.execute(
+            delete(Favorite).where(Favorite.id == favorite_id)
+        )
+        return result.rowcount > 0
+
     async def get_user_favorites(
-        self, user_id: uuid.UUID, skip: int = 0, limit: int = 50
-    ) -> List[Favorite]:
-        """유저별 즐겨찾기 목록 조회"""
+        self,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """유저별 즐겨찾기 목록 조회 (최신순, 커서 페이지)"""
         stmt = (
             select(Favorite)
             .options(selectinload(Favorite.menu).selectinload(Menu.category))
             .where(Favorite.user_id == user_id, Favorite.is_active)
-            .order_by(Favorite.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return await fetch_page(self.db, stmt, FAVORITE_RECENT, limit, cursor, skip)
@@ -1,14 +1,24 @@
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import KeysetOrder, Page, fetch_page, nulls_last
+from app.core.text_search import text_match_and_rank
 from app.models.favorite import Favorite
 from app.models.menu import Menu
 from app.repositories.base_repository import BaseRepository
 
+# 메뉴 목록 기본 정렬 (표시 순서, NULL은 마지막 → 이름 → id)
+MENU_DISPLAY_ORDER = KeysetOrder(
+    "menu_display",
+    (nulls_last(Menu.display_order), False),
+    (Menu.name, False),
+    (Menu.id, False),
+)
+
 
 class MenuRepository(BaseRepository[Menu]):
     """
@@ -26,33 +36,27 @@ class MenuRepository(BaseRepository[Menu]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_all_with_category(self, skip: int = 0, limit: int = 50) -> List[Menu]:
-        """카테고리와 함께 모든 메뉴 조회"""
-        stmt = (
-            select(Menu)
-            .options(selectinload(Menu.category))
-            .where(Menu.is_active)
-            .order_by(Menu.display_order, Menu.name)
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
+    async def get_all_with_category(
+        self, skip: int = 0, limit: int = 50, cursor: Optional[str] = None
+    ) -> Page:
+        """카테고리와 함께 모든 메뉴 조회 (표시 순서 → 이름, 커서 페이지)"""
+        stmt = select(Menu).options(selectinload(Menu.category)).where(Menu.is_active)
+        return await fetch_page(self.db, stmt, MENU_DISPLAY_ORDER, limit, cursor, skip)
 
     async def get_menus_by_category(
-        self, category_id: uuid.UUID, skip: int = 0, limit: int = 50
-    ) -> List[Menu]:
-        """카테고리별 메뉴 조회"""
+        self,
+        category_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """카테고리별 메뉴 조회 (표시 순서 → 이름, 커서 페이지)"""
         stmt = (
             select(Menu)
             .options(selectinload(Menu.category))
             .where(Menu.category_id == category_id, Menu.is_active)
-            .order_by(Menu.display_order, Menu.name)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return await fetch_page(self.db, stmt, MENU_DISPLAY_ORDER, limit, cursor, skip)
 
     async def search_menus(
         self,
@@ -63,16 +67,60 @@ class MenuRepository(BaseRepository[Menu]):
         cooking_time: Optional[int] = None,
         skip: int = 0,
         limit: int = 50,
-    ) -> List[Menu]:
-        """메뉴 검색 (다중 조건 지원)"""
+        cursor: Optional[str] = None,
+        with_total: bool = False,
+    ) -> Page:
+        """
+        메뉴 검색 (다중 조건 지원, 커서 페이지)
+        - with_total이면 같은 쿼리에서 조건에 맞는 전체 건수도 계산 (커서 없을 때)
+        """
+        conditions, order = self._search_conditions(
+            query, category_id, cuisine_type, difficulty, cooking_time
+        )
+        stmt = (
+            select(Menu).options(selectinload(Menu.category)).where(and_(*conditions))
+        )
+        return await fetch_page(
+            self.db, stmt, order, limit, cursor, skip, with_total=with_total
+        )
+
+    async def count_search_menus(
+        self,
+        query: str,
+        category_id: Optional[uuid.UUID] = None,
+        cuisine_type: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        cooking_time: Optional[int] = None,
+    ) -> int:
+        """검색 조건에 맞는 메뉴 수"""
+        conditions, _ = self._search_conditions(
+            query, category_id, cuisine_type, difficulty, cooking_time
+        )
+        result = await self.db.execute(
+            select(func.count(Menu.id)).where(and_(*conditions))
+        )
+        return result.scalar_one()
+
+    @staticmethod
+    def _search_conditions(
+        query: str,
+        category_id: Optional[uuid.UUID],
+        cuisine_type: Optional[str],
+        difficulty: Optional[str],
+        cooking_time: Optional[int],
+    ) -> Tuple[List, KeysetOrder]:
+        """검색 조건 목록과 정렬"""
         conditions = []
+        order = MENU_DISPLAY_ORDER
         if query:
-            search_condition = or_(
-                Menu.name.ilike(f"%{query}%"),
-                Menu.description.ilike(f"%{query}%"),
-                Menu.ingredients.ilike(f"%{query}%"),
+            # 전문 검색(이름/재료/설명) + 이름 부분 일치, 관련도순 정렬
+            _, search_condition, rank = text_match_and_rank(
+                Menu.search_vector, Menu.name, query
             )
             conditions.append(search_condition)
+            order = KeysetOrder(
+                "menu_search", (rank, True), (Menu.name, False), (Menu.id, False)
+            )
         filters = {
             "category_id": category_id,
             "cuisine_type": cuisine_type,
@@ -84,30 +132,53 @@ class MenuRepository(BaseRepository[Menu]):
         if cooking_time:
             conditions.append(Menu.cooking_time <= cooking_time)
         conditions.append(Menu.is_active)
+        return conditions, order
+
+    async def get_popular_menus(self, limit: int = 10) -> List[Menu]:
+        """인기 메뉴 조회 (즐겨찾기 수 카운터 인덱스 순서로 LIMIT)"""
         stmt = (
             select(Menu)
             .options(selectinload(Menu.category))
-            .where(and_(*conditions))
-            .order_by(Menu.display_order, Menu.name)
-            .offset(skip)
+            .where(Menu.is_active)
+            .order_by(Menu.favorite_count.desc(), Menu.name)
             .limit(limit)
         )
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
-    async def get_popular_menus(self, limit: int = 10) -> List[Menu]:
-        """인기 메뉴 조회 (즐겨찾기 수 기준)"""
-        stmt = (
-            select(Menu, func.count(Favorite.id).label("favorite_count"))
-            .options(selectinload(Menu.category))
-            .outerjoin(Favorite, Menu.id == Favorite.menu_id)
-            .where(Menu.is_active)
-            .group_by(Menu.id)
-            .order_by(func.count(Favorite.id).desc(), Menu.name)
-            .limit(limit)
+    async def add_favorite_count(self, menu_id: uuid.UUID, delta: int) -> None:
+        """
+        즐겨찾기 수 증감 (커밋하지 않음, 호출 측 트랜잭션에 포함)
+        - 카운터 변경은 메뉴 수정이 아니므로 updated_at(카탈로그 버전)은 유지
+        """
+        await self.db.execute(
+            update(Menu)
+            .where(Menu.id == menu_id)
+            .values(
+                favorite_count=Menu.favorite_count + delta,
+                updated_at=Menu.updated_at,
+            )
         )
-        result = await self.db.execute(stmt)
-        return [row[0] for row in result.all()]
+
+    async def reconcile_favorite_counts(self) -> int:
+        """
+        즐겨찾기 수 카운터를 실제 활성 즐겨찾기 수로 보정
+        Returns:
+            보정한 메뉴 수
+        """
+        expected = (
+            select(func.count(Favorite.id))
+            .where(Favorite.menu_id == Menu.id, Favorite.is_active)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(Menu)
+            .where(Menu.favorite_count != expected)
+            .values(favorite_count=expected, updated_at=Menu.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return result.rowcount
 
     async def get_menus_by_attributes(
         self,
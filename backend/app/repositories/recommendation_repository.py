@@ -1,10 +1,15 @@
-from typing import Dict, List
+import json
+import uuid
+from typing import Dict, List, Optional, Tuple
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-import json
 
 from app.models.recommendation import Recommendation, RecommendationLog
 from app.repositories.base_repository import BaseRepository
+from app.core.batch_queue import BatchQueueFull
+from app.core.recent_items import recent_recommendations
+from app.db.batch_writer import recommendation_log_writer
 
 
 class RecommendationRepository(BaseRepository[Recommendation]):
@@ -16,36 +21,106 @@ class RecommendationRepository(BaseRepository[Recommendation]):
         super().__init__(db, Recommendation)
 
     async def get_recent_recommended_menus(self, session_id: str) -> set:
-        """세션별 최근 추천 메뉴 ID 집합 조회"""
+        """
+        세션별 최근 추천 메뉴 ID 집합 조회
+        - 프로세스 내 링 버퍼에 있으면 DB 조회 없음
+        - 없으면 최근 로그 20건의 recommended_menus(JSON)를 한 번 읽어 버퍼를 채움
+        """
+        recent = recent_recommendations.get(session_id)
+        if recent is not None:
+            return recent
+
         stmt = (
-            select(RecommendationLog)
+            select(RecommendationLog.recommended_menus)
             .where(RecommendationLog.session_id == session_id)
             .order_by(RecommendationLog.created_at.desc())
             .limit(20)
         )
         result = await self.db.execute(stmt)
-        logs = result.scalars().all()
-        menu_ids = set()
-        for log in logs:
-            for rec in log.recommendations or []:
-                menu_id = rec.get("menu", {}).get("id")
-                if menu_id:
-                    menu_ids.add(str(menu_id))
-        return menu_ids
+        menu_ids = []
+        for recommended_menus in reversed(result.scalars().all()):
+            try:
+                menu_ids.extend(str(m) for m in json.loads(recommended_menus or "[]"))
+            except (TypeError, ValueError):
+                continue
+        return recent_recommendations.seed(session_id, menu_ids)
+
+    @staticmethod
+    def build_log_rows(
+        session_id: str,
+        answers: Dict,
+        recommendations: List,
+        rec_type: str,
+        ab_group: Optional[str] = None,
+    ) -> List[Tuple[type, Dict]]:
+        """추천 결과를 (모델, 컬럼 값) 행 목록으로 변환 - RecommendationLog 1건 + 메뉴별 Recommendation"""
+        rows: List[Tuple[type, Dict]] = [
+            (
+                RecommendationLog,
+                {
+                    "id": uuid.uuid4(),
+                    "session_id": session_id,
+                    "ab_group": ab_group,
+                    "weight_set": json.dumps(answers, ensure_ascii=False),
+                    "recommended_menus": json.dumps(
+                        [str(r.menu.id) for r in recommendations], ensure_ascii=False
+                    ),
+                    "action_type": rec_type,
+                },
+            )
+        ]
+        for r in recommendations:
+            rows.append(
+                (
+                    Recommendation,
+                    {
+                        "id": uuid.uuid4(),
+                        "session_id": session_id,
+                        "menu_id": r.menu.id,
+                        "recommendation_type": rec_type,
+                        "score": r.score,
+                        "reason": r.reason,
+                    },
+                )
+            )
+        return rows
 
     async def save_recommendation_log(
-        self, session_id: str, answers: Dict, recommendations: List, rec_type: str
-    ):
-        """추천 로그 저장"""
-        log = RecommendationLog(
-            session_id=session_id,
-            weight_set=json.dumps(answers, ensure_ascii=False),
-            recommended_menus=json.dumps(
-                [str(r.menu.id) for r in recommendations], ensure_ascii=False
-            ),
-            action_type=rec_type,
+        self,
+        session_id: str,
+        answers: Dict,
+        recommendations: List,
+        rec_type: str,
+        commit: bool = True,
+        persist: bool = True,
+        ab_group: Optional[str] = None,
+    ) -> Optional[RecommendationLog]:
+        """
+        추천 로그 저장
+        - 백그라운드 로그 기록기가 실행 중이면 로그와 추천 행을 한 항목으로 큐에 넣고 바로 반환
+          (묶음 단위로 들어가므로 drop 정책에서도 일부만 기록되지 않음)
+        - 아니면 세션에 추가, commit=False면 호출 측 트랜잭션에서 함께 커밋
+        - persist=False면 최근 추천 버퍼에만 기록 (처음 보는 세션은 DB 쓰기 없음)
+        Returns:
+            저장한(또는 큐에 넣은) 로그 객체 (id는 미리 정해짐), persist=False면 None
+        """
+        recent_recommendations.record(
+            session_id, [str(r.menu.id) for r in recommendations]
+        )
+        if not persist:
+            return None
+        rows = self.build_log_rows(
+            session_id, answers, recommendations, rec_type, ab_group
         )
-        self.db.add(log)
-        await self.db.commit()
-        await self.db.refresh(log)
-        return log
+        if recommendation_log_writer.is_running:
+            try:
+                await recommendation_log_writer.put(rows)
+            except BatchQueueFull:
+                pass  # 로그 유실은 기록기의 rejected 카운터로 집계 (요청은 계속 진행)
+            return RecommendationLog(**rows[0][1])
+
+        instances = [model(**values) for model, values in rows]
+        self.db.add_all(instances)
+        if commit:
+            await self.db.commit()
+        return instances[0]
@@ -1,12 +1,97 @@
 import uuid
-from typing import List, Optional
-from sqlalchemy import select
+from typing import List, NamedTuple, Optional, Tuple
+from sqlalchemy import case, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.preference_vector import (
+    ATTRIBUTE_FLAGS,
+    BASE_DEFAULTS,
+    BASE_FIELDS,
+    BASE_SIZE,
+    COUNTRY_DEFAULT,
+    TIME_SLOT_INDEX,
+)
 from app.models.user_preference import UserPreference
 from app.repositories.base_repository import BaseRepository
 
 
+def _build_learning_update_sql() -> str:
+    """
+    학습 규칙(PreferenceVector.learn)을 UPDATE 한 문장으로 표현
+    - 메뉴 속성 플래그/시간대/국가는 menus·categories·preference_countries 조인으로 읽음
+    - SET 식은 갱신 전 값을 참조하므로 같은 식으로 개별 컬럼과 패킹 벡터를 함께 계산
+    - 행 잠금 후 최신 값으로 다시 계산되므로 동시 상호작용도 유실 없음
+    """
+    base = []
+    for i, (field, default) in enumerate(zip(BASE_FIELDS, BASE_DEFAULTS)):
+        current = f"COALESCE(up.preference_vector[{i + 1}], up.{field}, {default})"
+        if i < len(ATTRIBUTE_FLAGS):
+            expr = (
+                f"CASE WHEN m.{ATTRIBUTE_FLAGS[i]} "
+                f"THEN LEAST(1.0, {current} + :rate) "
+                f"ELSE GREATEST(0.0, {current} - :rate * 0.5) END"
+            )
+        else:
+            slot = next(k for k, v in TIME_SLOT_INDEX.items() if v == i)
+            expr = (
+                f"CASE WHEN m.time_slot = '{slot}' "
+                f"THEN LEAST(1.0, {current} + :rate) ELSE {current} END"
+            )
+        base.append((field, f"({expr})::real"))
+
+    # 국가 구간: 메뉴 국가 위치만 +학습률 (처음이면 0.5에서 시작), 나머지는 유지
+    countries = (
+        "COALESCE(("
+        "SELECT array_agg(CASE WHEN slot.id = pc.id "
+        f"THEN LEAST(1.0, COALESCE(NULLIF(up.preference_vector[{BASE_SIZE} + slot.id], "
+        f"'NaN'::real), {COUNTRY_DEFAULT}) + :rate)::real "
+        f"ELSE COALESCE(up.preference_vector[{BASE_SIZE} + slot.id], 'NaN'::real) END "
+        "ORDER BY slot.id) "
+        "FROM generate_series(1, GREATEST("
+        f"COALESCE(array_length(up.preference_vector, 1), 0) - {BASE_SIZE}, "
+        "COALESCE(pc.id, 0))) AS slot(id)"
+        "), ARRAY[]::real[])"
+    )
+    assignments = ", ".join(f"{field} = {expr}" for field, expr in base)
+    vector = "ARRAY[" + ", ".join(expr for _, expr in base) + "] || " + countries
+    return (
+        "UPDATE user_preferences AS up SET "
+        f"{assignments}, "
+        f"preference_vector = {vector}, "
+        "total_interactions = COALESCE(up.total_interactions, 0) + 1, "
+        "version = up.version + 1, "
+        "last_updated = now() "
+        "FROM menus AS m "
+        "LEFT JOIN categories AS c ON c.id = m.category_id "
+        "LEFT JOIN preference_countries AS pc ON pc.name = c.country "
+        "WHERE m.id = :menu_id AND up.id = ("
+        "SELECT p.id FROM user_preferences AS p "
+        "WHERE p.session_id = :session_id OR p.user_id = :user_id "
+        "ORDER BY (p.user_id = :user_id) DESC NULLS LAST LIMIT 1) "
+        "RETURNING up.id, up.session_id, up.preference_vector, up.total_interactions, "
+        "up.ab_group, up.version"
+    )
+
+
+LEARNING_UPDATE = text(
+    _build_learning_update_sql()
+    .replace(":rate", "CAST(:rate AS real)")
+    .replace(":user_id", "CAST(:user_id AS uuid)")
+)
+
+
+class LearnedPreference(NamedTuple):
+    """학습 UPDATE의 RETURNING 결과"""
+
+    id: uuid.UUID
+    session_id: str
+    preference_vector: List[float]
+    total_interactions: int
+    ab_group: Optional[str]
+    version: int
+
+
 class UserPreferenceRepository(BaseRepository[UserPreference]):
     """
     사용자 선호도 도메인 특화 레포지토리
@@ -16,22 +101,103 @@ class UserPreferenceRepository(BaseRepository[UserPreference]):
         super().__init__(db, UserPreference)
 
     async def get_by_session_or_user(
-        self, session_id: str, user_id: Optional[uuid.UUID] = None
+        self,
+        session_id: str,
+        user_id: Optional[uuid.UUID] = None,
+        for_update: bool = False,
     ) -> Optional[UserPreference]:
-        """세션ID 또는 유저ID로 선호도 조회"""
-        stmt = (
-            select(UserPreference)
-            .where(
-                (UserPreference.session_id == session_id)
-                | (UserPreference.user_id == user_id)
+        """
+        세션ID 또는 유저ID로 선호도 조회
+        - 둘 다 일치하는 행이 있으면 유저ID 행을 우선
+        - user_id가 없으면 세션ID로만 조회 (user_id IS NULL 행 전체와 일치하지 않도록)
+        - for_update면 행을 잠그고 최신 값으로 다시 읽음 (읽고-수정-쓰기 경로)
+        """
+        if user_id is None:
+            stmt = select(UserPreference).where(UserPreference.session_id == session_id)
+        else:
+            stmt = (
+                select(UserPreference)
+                .where(
+                    (UserPreference.session_id == session_id)
+                    | (UserPreference.user_id == user_id)
+                )
+                .order_by(case((UserPreference.user_id == user_id, 0), else_=1))
+                .limit(1)
             )
-            .limit(1)
-        )
+        if for_update:
+            stmt = stmt.with_for_update().execution_options(populate_existing=True)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_or_create(
+        self,
+        session_id: str,
+        user_id: Optional[uuid.UUID],
+        ab_group: str,
+        for_update: bool = False,
+    ) -> Tuple[UserPreference, bool]:
+        """
+        선호도 조회, 없으면 INSERT ... ON CONFLICT DO NOTHING RETURNING으로 생성
+        - session_id/user_id 유니크 인덱스로 동시 요청에도 중복 행이 생기지 않음
+        - 충돌(다른 요청이 먼저 생성)하면 그 행을 다시 조회
+        - for_update면 기존 행을 잠가 조회 (새로 넣은 행은 이미 이 트랜잭션이 잠금)
+        - 커밋하지 않음 (호출 측 트랜잭션)
+        Returns:
+            (선호도, 이번 호출에서 생성했는지 여부)
+        """
+        preference = await self.get_by_session_or_user(session_id, user_id, for_update)
+        if preference:
+            return preference, False
+
+        stmt = (
+            pg_insert(UserPreference)
+            .values(
+                id=uuid.uuid4(),
+                session_id=session_id,
+                user_id=user_id,
+                ab_group=ab_group,
+            )
+            .on_conflict_do_nothing()
+            .returning(UserPreference)
+        )
+        result = await self.db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        )
+        preference = result.first()
+        if preference is None:
+            return (
+                await self.get_by_session_or_user(session_id, user_id, for_update),
+                False,
+            )
+        return preference, True
+
     async def get_by_ab_group(self, ab_group: str) -> List[UserPreference]:
         """AB 그룹별 선호도 조회"""
         stmt = select(UserPreference).where(UserPreference.ab_group == ab_group)
         result = await self.db.execute(stmt)
         return result.scalars().all()
+
+    async def apply_interaction(
+        self,
+        session_id: str,
+        user_id: Optional[uuid.UUID],
+        menu_id: uuid.UUID,
+        interaction_strength: float,
+    ) -> Optional[LearnedPreference]:
+        """
+        상호작용 하나를 UPDATE ... FROM menus ... RETURNING 한 번으로 학습
+        - 커밋하지 않음 (호출 측 트랜잭션)
+        Returns:
+            갱신된 벡터, 선호도 행 또는 메뉴가 없으면 None
+        """
+        result = await self.db.execute(
+            LEARNING_UPDATE,
+            {
+                "session_id": session_id,
+                "user_id": user_id,
+                "menu_id": menu_id,
+                "rate": 0.1 * interaction_strength,
+            },
+        )
+        row = result.first()
+        return LearnedPreference(*row) if row else None
@@ -61,3 +61,4 @@ class CategoryListResponse(BaseModel):
     total_count: int
     page: int
     size: int
+    next_cursor: Optional[str] = None
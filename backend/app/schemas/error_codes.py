@@ -38,8 +38,12 @@ class ErrorCode(str, Enum):
     # 추천 관련
     RECOMMENDATION_FAILED = "E6001"
     RECOMMENDATION_NOT_FOUND = "E6002"
+    INTERACTION_QUEUE_FULL = "E6003"
 
     # 검색 관련
     SEARCH_FAILED = "E7001"
     SEARCH_INVALID_QUERY = "E7002"
+
+    # 관리자 관련
+    WEIGHT_SET_CONFLICT = "E8001"
     # 필요한 에러 코드를 여기에 추가
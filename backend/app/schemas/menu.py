@@ -103,6 +103,7 @@ class MenuResponse(MenuBase):
     id: uuid.UUID
     category_id: uuid.UUID
     category: Optional[CategoryResponse] = None
+    favorite_count: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -119,9 +120,10 @@ class MenuSearchResponse(BaseModel):
     """메뉴 검색 응답 스키마"""
 
     items: List[MenuResponse]
-    total: int
+    total: Optional[int] = None  # include_total=false면 None
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class MenuRecommendation(BaseModel):
@@ -58,6 +58,13 @@ class CollaborativeRecommendationRequest(BaseModel):
     limit: Optional[int] = 10
 
 
+class LatentRecommendationRequest(BaseModel):
+    """ALS 잠재요인 추천 요청 스키마"""
+
+    session_id: str
+    limit: Optional[int] = 5
+
+
 class PreferenceAnalysisRequest(BaseModel):
     """선호도 분석 요청 스키마"""
 
@@ -72,3 +79,9 @@ class InteractionRecordRequest(BaseModel):
     interaction_type: str  # click, favorite, search, recommend_select
     interaction_strength: Optional[float] = 1.0
     extra_data: Optional[Dict[str, Any]] = None
+
+
+class WeightSetUpdateRequest(BaseModel):
+    """가중치 세트 변경 요청 스키마 (새 버전으로 저장)"""
+
+    weights: Dict[str, float]  # spicy, healthy, vegetarian, quick, rice, soup, meat
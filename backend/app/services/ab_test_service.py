@@ -0,0 +1,398 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.database import AsyncSessionLocal
+from app.models.ab_test_rollup import AbGroupPosterior, AbTestRollup
+
+logger = get_logger(__name__)
+
+RollupKey = Tuple[datetime, str, str]
+
+# A/B 테스트 그룹
+AB_GROUPS = ("A", "B", "C")
+
+# 퀴즈 응답 때 추천 결과마다 자동으로 남기는 recommend_select (사용자 행동 아님)
+# - 집계에는 이 타입으로 따로 기록해 노출 대비 비율(전환율)에서 제외
+AUTO_SELECT_ACTION_TYPE = "auto_select"
+
+# 상호작용 타입 (이 외의 action_type은 추천 로그 = 노출로 집계)
+INTERACTION_ACTION_TYPES = (
+    "click",
+    "favorite",
+    "search",
+    "recommend_select",
+    AUTO_SELECT_ACTION_TYPE,
+)
+
+# 밴딧 보상으로 쓰는 상호작용 타입 (사용자가 직접 한 행동만)
+# - 퀴즈 자동 기록은 auto_select로 들어오므로 보상이 아님
+REWARD_ACTION_TYPES = ("favorite", "recommend_select")
+
+
+def hour_bucket(moment: Optional[datetime] = None) -> datetime:
+    """집계 시각 (UTC 정시)"""
+    moment = moment or datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+class AbRollupCounter:
+    """
+    A/B 테스트 시간별 집계 카운터
+    - 기록은 메모리 딕셔너리에 더하기만 하고 flush 주기마다
+      INSERT ... ON CONFLICT DO UPDATE SET count = count + EXCLUDED.count 한 번으로 반영
+    - 같은 (시각, 그룹, 타입)은 주기 안에서 한 행으로 합쳐지므로 쓰기 양은 트래픽과 무관
+    - 실행 중이 아니면 기록할 때마다 바로 반영
+    """
+
+    def __init__(self, flush_interval: float = 5.0):
+        self.flush_interval = flush_interval
+        self._pending: Dict[RollupKey, int] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"recorded": 0, "written": 0, "flushes": 0, "failed": 0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def record(self, ab_group: str, action_type: str, count: int = 1) -> None:
+        """(그룹, 타입) 건수 증가"""
+        self.add(((ab_group, action_type, count),))
+        if not self.is_running:
+            await self.flush()
+
+    async def record_many(self, counts: Iterable[Tuple[str, str, int]]) -> None:
+        """(그룹, 타입, 건수) 여러 개를 한 번에 증가"""
+        self.add(counts)
+        if not self.is_running:
+            await self.flush()
+
+    def add(self, counts: Iterable[Tuple[str, str, int]]) -> None:
+        hour = hour_bucket()
+        for ab_group, action_type, count in counts:
+            key = (hour, ab_group, action_type)
+            self._pending[key] = self._pending.get(key, 0) + count
+            self._stats["recorded"] += count
+
+    async def flush(self) -> int:
+        """
+        모인 증분을 업서트 한 번으로 기록
+        - 실패하면 증분을 되돌려 다음 주기에 다시 시도
+        Returns:
+            기록된 집계 행 수
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+            stmt = pg_insert(AbTestRollup).values(
+                [
+                    {
+                        "hour": hour,
+                        "ab_group": ab_group,
+                        "action_type": action_type,
+                        "count": count,
+                    }
+                    for (hour, ab_group, action_type), count in pending.items()
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["hour", "ab_group", "action_type"],
+                set_={"count": AbTestRollup.count + stmt.excluded.count},
+            )
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(stmt)
+                    await db.commit()
+            except Exception as e:
+                for key, count in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + count
+                self._stats["failed"] += 1
+                logger.error(f"A/B 테스트 집계 기록 실패 ({len(pending)}행): {e}")
+                return 0
+            self._stats["written"] += len(pending)
+            self._stats["flushes"] += 1
+            return len(pending)
+
+    def start(self) -> asyncio.Task:
+        """주기적 flush 백그라운드 작업 시작 (이벤트 루프 안에서 호출)"""
+        self._task = asyncio.create_task(self._run(), name="AbRollupFlushTask")
+        logger.info(f"A/B 테스트 집계 시작 ({self.flush_interval}초마다 기록)")
+        return self._task
+
+    async def stop(self) -> None:
+        """flush 작업 종료 후 남은 증분 기록"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await self.flush()
+        logger.info(f"A/B 테스트 집계 종료 ({self._stats})")
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "pending": len(self._pending)}
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.shield(self.flush())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"A/B 테스트 집계 flush 실패: {e}")
+
+
+# 전역 A/B 테스트 집계 카운터 (워커 프로세스별)
+ab_rollup_counter = AbRollupCounter(
+    flush_interval=settings.ab_rollup_flush_interval_seconds
+)
+
+
+def _key_seed(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "little")
+
+
+class AbGroupBandit:
+    """
+    A/B 그룹 배정 Thompson sampling 밴딧
+    - 그룹별 Beta(1 + 성공, 1 + 실패) 사후분포를 메모리에 보관
+      (시행 = 추천 노출, 성공 = 사용자의 favorite/recommend_select, 성공은 시행 수까지만)
+    - 배정은 그룹별 Beta 표본 중 최댓값 (DB 조회 없음) → 성과가 좋은 그룹으로 트래픽 이동
+    - 배정한 키(유저ID/세션ID)는 LRU로 기억해 행이 저장되기 전까지 같은 그룹 유지
+      키 해시를 난수 시드로 쓰므로 다른 워커도 사후분포가 같으면 같은 그룹
+    - 증분은 flush 주기마다 ab_group_posteriors에 더하고 전체 누적값을 받아와
+      다른 워커의 관측도 반영
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[str] = AB_GROUPS,
+        flush_interval: float = 10.0,
+        max_assignments: int = 100000,
+    ):
+        self.groups = tuple(groups)
+        self.flush_interval = flush_interval
+        self.max_assignments = max_assignments
+        self._assigned: "OrderedDict[str, str]" = OrderedDict()
+        self._index = {group: i for i, group in enumerate(self.groups)}
+        # 그룹별 (시행, 성공) - DB 누적값과 아직 기록하지 않은 증분
+        self._totals = np.zeros((len(self.groups), 2), dtype=np.int64)
+        self._pending = np.zeros_like(self._totals)
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"flushes": 0, "failed": 0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def observe(self, ab_group: str, action_type: str, count: int = 1) -> None:
+        """추천 노출/보상 상호작용 반영 (퀴즈 자동 기록 등 그 외 상호작용은 무시)"""
+        i = self._index.get(ab_group)
+        if i is None:
+            return
+        if action_type in REWARD_ACTION_TYPES:
+            self._pending[i, 1] += count
+        elif action_type not in INTERACTION_ACTION_TYPES:
+            self._pending[i, 0] += count
+
+    def posteriors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        그룹별 Beta 파라미터 (alpha, beta)
+        - 노출 한 번에 보상이 여러 건일 수 있어 성공은 시행 수로 제한 (p ≤ 1 유지)
+        """
+        counts = self._totals + self._pending
+        trials = counts[:, 0]
+        successes = np.minimum(counts[:, 1], trials)
+        return 1 + successes, 1 + trials - successes
+
+    def choose(self, key: str) -> str:
+        """키의 그룹 배정 (그룹별 Beta 표본 하나씩 뽑아 최댓값)"""
+        group = self._assigned.get(key)
+        if group is not None:
+            self._assigned.move_to_end(key)
+            return group
+        alpha, beta = self.posteriors()
+        samples = np.random.default_rng(_key_seed(key)).beta(alpha, beta)
+        group = self.groups[int(np.argmax(samples))]
+        self._assigned[key] = group
+        if len(self._assigned) > self.max_assignments:
+            self._assigned.popitem(last=False)
+        return group
+
+    async def flush(self) -> bool:
+        """
+        증분을 더하고 전체 누적값을 다시 읽음 (INSERT ... ON CONFLICT DO UPDATE RETURNING)
+        - 실패하면 증분을 되돌려 다음 주기에 다시 시도
+        """
+        async with self._flush_lock:
+            pending = self._pending.copy()
+            self._pending -= pending
+            stmt = pg_insert(AbGroupPosterior).values(
+                [
+                    {
+                        "ab_group": group,
+                        "trials": int(pending[i, 0]),
+                        "successes": int(pending[i, 1]),
+                    }
+                    for i, group in enumerate(self.groups)
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["ab_group"],
+                set_={
+                    "trials": AbGroupPosterior.trials + stmt.excluded.trials,
+                    "successes": AbGroupPosterior.successes + stmt.excluded.successes,
+                    "updated_at": func.now(),
+                },
+            ).returning(
+                AbGroupPosterior.ab_group,
+                AbGroupPosterior.trials,
+                AbGroupPosterior.successes,
+            )
+            try:
+                async with AsyncSessionLocal() as db:
+                    rows = (await db.execute(stmt)).all()
+                    await db.commit()
+            except Exception as e:
+                self._pending += pending
+                self._stats["failed"] += 1
+                logger.error(f"A/B 밴딧 카운터 기록 실패: {e}")
+                return False
+            for group, trials, successes in rows:
+                self._totals[self._index[group]] = (trials, successes)
+            self._stats["flushes"] += 1
+            return True
+
+    def start(self) -> asyncio.Task:
+        """주기적 flush 백그라운드 작업 시작 (이벤트 루프 안에서 호출)"""
+        self._task = asyncio.create_task(self._run(), name="AbBanditFlushTask")
+        logger.info(f"A/B 밴딧 시작 ({self.flush_interval}초마다 기록)")
+        return self._task
+
+    async def stop(self) -> None:
+        """flush 작업 종료 후 남은 증분 기록"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await self.flush()
+        logger.info(f"A/B 밴딧 종료 ({self._stats})")
+
+    def reset(self) -> None:
+        self._totals[:] = 0
+        self._pending[:] = 0
+        self._assigned.clear()
+
+    def get_stats(self, samples: int = 2000) -> Dict[str, Any]:
+        """그룹별 사후분포와 현재 배정 확률 (표본 추정)"""
+        alpha, beta = self.posteriors()
+        draws = np.random.default_rng().beta(alpha, beta, size=(samples, len(alpha)))
+        share = np.bincount(draws.argmax(axis=1), minlength=len(alpha)) / samples
+        counts = self._totals + self._pending
+        return {
+            **self._stats,
+            "assignments": len(self._assigned),
+            "groups": {
+                group: {
+                    "trials": int(counts[i, 0]),
+                    "successes": int(counts[i, 1]),
+                    "alpha": int(alpha[i]),
+                    "beta": int(beta[i]),
+                    "mean": float(alpha[i] / (alpha[i] + beta[i])),
+                    "allocation": float(share[i]),
+                }
+                for i, group in enumerate(self.groups)
+            },
+        }
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.shield(self.flush())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"A/B 밴딧 flush 실패: {e}")
+
+
+# 전역 A/B 그룹 배정 밴딧 (워커 프로세스별, 누적값은 DB로 공유)
+ab_bandit = AbGroupBandit(
+    flush_interval=settings.ab_bandit_flush_interval_seconds,
+    max_assignments=settings.ab_bandit_max_assignments,
+)
+
+
+class AbTestService:
+    """
+    A/B 테스트 통계 서비스
+    - 시간별 집계 테이블만 읽으므로 조회 비용은 기간(시간 수 × 그룹 × 타입)에만 비례
+    """
+
+    @staticmethod
+    async def record_events(counts: Iterable[Tuple[str, str, int]]) -> None:
+        """(그룹, 타입, 건수) 기록 - 밴딧 사후분포와 시간별 집계에 함께 반영"""
+        counts = list(counts)
+        for ab_group, action_type, count in counts:
+            ab_bandit.observe(ab_group, action_type, count)
+        await ab_rollup_counter.record_many(counts)
+
+    @staticmethod
+    async def record_event(ab_group: str, action_type: str, count: int = 1) -> None:
+        await AbTestService.record_events([(ab_group, action_type, count)])
+
+    @staticmethod
+    async def get_statistics(db: AsyncSession, days: int = 7) -> Dict[str, Any]:
+        """
+        최근 days일 그룹별 추천 노출 수, 상호작용 수, 노출 대비 상호작용 비율
+        - 퀴즈 자동 기록(auto_select)은 상호작용 수에만 보이고 비율에서는 제외
+          (노출마다 여러 건씩 생기므로 전환율로 읽히면 안 됨)
+        - 현재 시각의 집계는 flush 주기만큼 늦게 반영될 수 있음
+        """
+        since = hour_bucket() - timedelta(days=days)
+        stmt = (
+            select(
+                AbTestRollup.ab_group,
+                AbTestRollup.action_type,
+                func.sum(AbTestRollup.count).label("cnt"),
+            )
+            .where(AbTestRollup.hour >= since)
+            .group_by(AbTestRollup.ab_group, AbTestRollup.action_type)
+        )
+        result = await db.execute(stmt)
+
+        groups: Dict[str, Dict[str, Any]] = {}
+        for ab_group, action_type, cnt in result.all():
+            group = groups.setdefault(
+                ab_group, {"recommendations": 0, "interactions": {}, "rates": {}}
+            )
+            if action_type in INTERACTION_ACTION_TYPES:
+                group["interactions"][action_type] = int(cnt)
+            else:
+                group["recommendations"] += int(cnt)
+
+        for group in groups.values():
+            total = group["recommendations"]
+            group["rates"] = {
+                action_type: (cnt / total if total else 0.0)
+                for action_type, cnt in group["interactions"].items()
+                if action_type != AUTO_SELECT_ACTION_TYPE
+            }
+        return {"since": since.isoformat(), "days": days, "groups": groups}
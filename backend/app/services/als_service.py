@@ -0,0 +1,530 @@
+import asyncio
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.menu import Menu
+from app.models.user_preference import UserInteraction
+
+logger = get_logger(__name__)
+
+LATEST_FILE = "LATEST"
+META_FILE = "meta.json"
+SESSION_IDS_FILE = "session_ids.npy"
+SESSION_FACTORS_FILE = "session_factors.npy"
+MENU_IDS_FILE = "menu_ids.npy"
+MENU_FACTORS_FILE = "menu_factors.npy"
+
+
+def build_confidence_csr(
+    row_codes: np.ndarray,
+    col_codes: np.ndarray,
+    strengths: np.ndarray,
+    n_rows: int,
+    n_cols: int,
+    alpha: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (행, 열, 강도) 목록으로 신뢰도 CSR 행렬 생성
+    - 같은 (행, 열)의 강도는 합산, 신뢰도 c = 1 + alpha * 강도
+    Returns:
+        (indptr, indices, confidence)
+    """
+    keys = row_codes.astype(np.int64) * n_cols + col_codes
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    summed = np.bincount(inverse, weights=np.clip(strengths, 0.0, None))
+    indptr = np.zeros(n_rows + 1, np.int64)
+    np.cumsum(np.bincount(unique_keys // n_cols, minlength=n_rows), out=indptr[1:])
+    indices = (unique_keys % n_cols).astype(np.int32)
+    return indptr, indices, 1.0 + alpha * summed
+
+
+def _transpose_csr(
+    indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, n_cols: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSR 전치 (메뉴 기준 행렬 생성용)"""
+    rows = np.repeat(np.arange(indptr.size - 1, dtype=np.int32), np.diff(indptr))
+    order = np.argsort(indices, kind="stable")
+    t_indptr = np.zeros(n_cols + 1, np.int64)
+    np.cumsum(np.bincount(indices, minlength=n_cols), out=t_indptr[1:])
+    return t_indptr, rows[order], data[order]
+
+
+def _least_squares_cg(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    confidence: np.ndarray,
+    fixed: np.ndarray,
+    current: np.ndarray,
+    regularization: float,
+    cg_steps: int = 3,
+    chunk_nnz: int = 1 << 18,
+) -> np.ndarray:
+    """
+    암시적 피드백 ALS 한쪽 단계 (Hu, Koren, Volinsky 2008)
+    x_u = (YᵀY + Yᵀ(C_u - I)Y + λI)⁻¹ Yᵀ C_u p_u
+    - 행마다 k×k 행렬을 만들어 푸는 대신 이전 요인에서 출발하는
+      켤레기울기법 몇 단계로 근사 (nnz×k 연산, Takács et al. 2011)
+    - 행 루프 없이 nnz 단위 청크로 묶어 reduceat으로 행별 합산
+    """
+    result = current.astype(np.float32, copy=True)
+    gram = (fixed.T @ fixed + regularization * np.eye(fixed.shape[1])).astype(
+        np.float32
+    )
+
+    row_nnz = np.diff(indptr)
+    active = np.flatnonzero(row_nnz)
+    result[row_nnz == 0] = 0.0
+    cumulative = np.cumsum(row_nnz[active])
+    start = 0
+    while start < active.size:
+        consumed = cumulative[start - 1] if start else 0
+        end = int(np.searchsorted(cumulative, consumed + chunk_nnz, side="right"))
+        end = max(end, start + 1)
+        rows = active[start:end]
+        lo, hi = indptr[rows[0]], indptr[rows[-1] + 1]
+        offsets = indptr[rows] - lo
+        owner = np.repeat(np.arange(rows.size), row_nnz[rows])
+
+        y = fixed[indices[lo:hi]]
+        c = confidence[lo:hi].astype(np.float32)
+
+        def apply(v: np.ndarray) -> np.ndarray:
+            weighted = (c - 1.0) * np.einsum("nk,nk->n", y, v[owner])
+            return v @ gram + np.add.reduceat(y * weighted[:, None], offsets, axis=0)
+
+        x = result[rows]
+        r = np.add.reduceat(y * c[:, None], offsets, axis=0) - apply(x)
+        p = r.copy()
+        rs_old = np.einsum("nk,nk->n", r, r)
+        for _ in range(cg_steps):
+            ap = apply(p)
+            denom = np.einsum("nk,nk->n", p, ap)
+            step = np.divide(rs_old, denom, out=np.zeros_like(rs_old), where=denom > 0)
+            x += step[:, None] * p
+            r -= step[:, None] * ap
+            rs_new = np.einsum("nk,nk->n", r, r)
+            beta = np.divide(
+                rs_new, rs_old, out=np.zeros_like(rs_new), where=rs_old > 0
+            )
+            p = r + beta[:, None] * p
+            rs_old = rs_new
+        result[rows] = x
+        start = end
+    return result
+
+
+def train_als(
+    row_codes: np.ndarray,
+    col_codes: np.ndarray,
+    strengths: np.ndarray,
+    n_rows: int,
+    n_cols: int,
+    factors: int = 32,
+    regularization: float = 0.05,
+    alpha: float = 20.0,
+    iterations: int = 12,
+    cg_steps: int = 3,
+    seed: int = 42,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    세션×메뉴 암시적 피드백 행렬로 ALS 학습
+    Returns:
+        (세션 요인 행렬 [n_rows, factors], 메뉴 요인 행렬 [n_cols, factors])
+    """
+    indptr, indices, confidence = build_confidence_csr(
+        row_codes, col_codes, strengths, n_rows, n_cols, alpha
+    )
+    t_indptr, t_indices, t_confidence = _transpose_csr(
+        indptr, indices, confidence, n_cols
+    )
+
+    rng = np.random.default_rng(seed)
+    user_factors = rng.normal(0.0, 0.01, (n_rows, factors)).astype(np.float32)
+    item_factors = rng.normal(0.0, 0.01, (n_cols, factors)).astype(np.float32)
+    for _ in range(iterations):
+        user_factors = _least_squares_cg(
+            indptr,
+            indices,
+            confidence,
+            item_factors,
+            user_factors,
+            regularization,
+            cg_steps,
+        )
+        item_factors = _least_squares_cg(
+            t_indptr,
+            t_indices,
+            t_confidence,
+            user_factors,
+            item_factors,
+            regularization,
+            cg_steps,
+        )
+    return user_factors, item_factors
+
+
+def save_factors(
+    directory: str,
+    session_ids: Sequence[str],
+    session_factors: np.ndarray,
+    menu_ids: Sequence[uuid.UUID],
+    menu_factors: np.ndarray,
+    meta: Dict,
+    keep_versions: int = 3,
+) -> str:
+    """
+    학습 결과를 메모리 매핑 가능한 .npy 파일로 저장
+    - 세션 ID는 정렬해 저장 (조회 시 이진 탐색)
+    - 버전 디렉토리에 모두 쓴 뒤 LATEST 파일을 원자적으로 교체
+    - 최신 keep_versions 개를 제외한 이전 버전 디렉토리는 삭제
+    """
+    version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    target = os.path.join(directory, version)
+    os.makedirs(target, exist_ok=True)
+
+    ids = np.asarray(session_ids, dtype=str)
+    order = np.argsort(ids)
+    np.save(os.path.join(target, SESSION_IDS_FILE), ids[order])
+    np.save(
+        os.path.join(target, SESSION_FACTORS_FILE),
+        np.ascontiguousarray(session_factors[order], np.float32),
+    )
+    np.save(
+        os.path.join(target, MENU_IDS_FILE),
+        np.asarray([str(menu_id) for menu_id in menu_ids], dtype=str),
+    )
+    np.save(
+        os.path.join(target, MENU_FACTORS_FILE),
+        np.ascontiguousarray(menu_factors, np.float32),
+    )
+    with open(os.path.join(target, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({**meta, "version": version}, f, ensure_ascii=False)
+
+    tmp = os.path.join(directory, f"{LATEST_FILE}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(tmp, os.path.join(directory, LATEST_FILE))
+    prune_versions(directory, keep_versions)
+    return target
+
+
+def prune_versions(directory: str, keep: int) -> List[str]:
+    """
+    최신 keep 개를 제외한 버전 디렉토리 삭제 (LATEST가 가리키는 버전은 항상 유지)
+    - 이전 버전을 mmap으로 열어둔 워커는 파일이 삭제돼도 계속 읽을 수 있음
+    Returns:
+        삭제한 버전 목록
+    """
+    try:
+        with open(os.path.join(directory, LATEST_FILE), encoding="utf-8") as f:
+            latest = f.read().strip()
+    except FileNotFoundError:
+        latest = None
+    versions = sorted(
+        (
+            name
+            for name in os.listdir(directory)
+            if os.path.isdir(os.path.join(directory, name))
+        ),
+        reverse=True,
+    )
+    removed = [v for v in versions[max(keep, 1) :] if v != latest]
+    for version in removed:
+        shutil.rmtree(os.path.join(directory, version), ignore_errors=True)
+    return removed
+
+
+class ALSModel:
+    """
+    ALS 요인 행렬 서빙 모델
+    - 세션 요인은 mmap으로 열어 필요한 행만 읽음
+    - 메뉴 요인은 메모리에 올려 점수 계산은 내적 한 번
+    - 학습되지 않은 세션은 상호작용으로 즉석 fold-in
+    - 비활성 메뉴는 top-k 선택 전에 제외 (목록은 백그라운드 작업이 갱신)
+    """
+
+    def __init__(self):
+        self.version: Optional[str] = None
+        self.meta: Dict = {}
+        self.session_ids: Optional[np.ndarray] = None
+        self.session_factors: Optional[np.ndarray] = None
+        self.menu_ids: List[uuid.UUID] = []
+        self.menu_index: Dict[uuid.UUID, int] = {}
+        self.menu_factors = np.zeros((0, 0), np.float32)
+        self._gram = np.zeros((0, 0), np.float64)
+        self._inactive_ids: Set[uuid.UUID] = set()
+        self._inactive = np.zeros(0, np.int64)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.version is not None
+
+    def load(self, directory: str) -> bool:
+        """
+        LATEST가 가리키는 버전 로드
+        Returns:
+            새 버전을 로드했으면 True
+        """
+        try:
+            with open(os.path.join(directory, LATEST_FILE), encoding="utf-8") as f:
+                version = f.read().strip()
+        except FileNotFoundError:
+            return False
+        if version == self.version:
+            return False
+
+        target = os.path.join(directory, version)
+        with open(os.path.join(target, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        menu_factors = np.load(os.path.join(target, MENU_FACTORS_FILE))
+        menu_ids = [
+            uuid.UUID(menu_id)
+            for menu_id in np.load(os.path.join(target, MENU_IDS_FILE))
+        ]
+
+        # 참조 교체는 한 번에 (요청 처리 중에도 일관된 버전 사용)
+        self.session_ids = np.load(
+            os.path.join(target, SESSION_IDS_FILE), mmap_mode="r"
+        )
+        self.session_factors = np.load(
+            os.path.join(target, SESSION_FACTORS_FILE), mmap_mode="r"
+        )
+        self.menu_ids = menu_ids
+        self.menu_index = {menu_id: i for i, menu_id in enumerate(menu_ids)}
+        self.menu_factors = menu_factors
+        self._gram = menu_factors.T.astype(np.float64) @ menu_factors
+        self.meta = meta
+        self.version = version
+        self.set_inactive(self._inactive_ids)
+        logger.info(
+            f"ALS 모델 로드: 버전 {version}, 세션 {self.session_ids.shape[0]}개, "
+            f"메뉴 {len(menu_ids)}개"
+        )
+        return True
+
+    def set_inactive(self, menu_ids: Iterable[uuid.UUID]) -> None:
+        """추천에서 제외할 비활성 메뉴 지정"""
+        inactive_ids = set(menu_ids)
+        self._inactive = np.asarray(
+            [self.menu_index[m] for m in inactive_ids if m in self.menu_index],
+            np.int64,
+        )
+        self._inactive_ids = inactive_ids
+
+    def session_vector(self, session_id: str) -> Optional[np.ndarray]:
+        """학습된 세션 요인 조회 (정렬된 ID 배열 이진 탐색)"""
+        if self.session_ids is None or self.session_ids.size == 0:
+            return None
+        pos = int(np.searchsorted(self.session_ids, session_id))
+        if pos < self.session_ids.size and self.session_ids[pos] == session_id:
+            return np.asarray(self.session_factors[pos], np.float32)
+        return None
+
+    def fold_in(self, strengths: Dict[uuid.UUID, float]) -> Optional[np.ndarray]:
+        """학습 이후 세션을 메뉴 요인 고정 상태로 한 번의 최소제곱으로 투영"""
+        items = [self.menu_index[m] for m in strengths if m in self.menu_index]
+        if not items:
+            return None
+        alpha = self.meta.get("alpha", settings.als_alpha)
+        regularization = self.meta.get("regularization", settings.als_regularization)
+        y = self.menu_factors[items].astype(np.float64)
+        c = 1.0 + alpha * np.clip(
+            [strengths[self.menu_ids[i]] for i in items], 0.0, None
+        )
+        a = self._gram + (y.T * (c - 1.0)) @ y + regularization * np.eye(y.shape[1])
+        return np.linalg.solve(a, y.T @ c).astype(np.float32)
+
+    def recommend(
+        self,
+        vector: np.ndarray,
+        limit: int = 10,
+        exclude: Iterable[uuid.UUID] = (),
+    ) -> List[Tuple[uuid.UUID, float]]:
+        """카탈로그 전체와 내적 한 번으로 상위 메뉴 선택 (비활성/제외 메뉴는 선택 전 마스킹)"""
+        if not self.menu_ids:
+            return []
+        scores = self.menu_factors @ vector
+        masked = np.zeros(len(self.menu_ids), bool)
+        masked[self._inactive] = True
+        masked[[self.menu_index[m] for m in exclude if m in self.menu_index]] = True
+        scores[masked] = -np.inf
+        k = min(limit, len(self.menu_ids) - int(masked.sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.menu_ids[i], float(scores[i])) for i in top]
+
+
+# 전역 ALS 모델 (워커 프로세스별)
+als_model = ALSModel()
+
+
+class ALSService:
+    """
+    ALS 잠재요인 추천 학습/조회 서비스
+    """
+
+    @staticmethod
+    async def load_training_data(
+        db: AsyncSession,
+    ) -> Tuple[List[str], List[uuid.UUID], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        user_interactions 전체를 스트리밍으로 읽어 정수 코드 배열로 변환
+        Returns:
+            (세션 ID 목록, 메뉴 ID 목록, 세션 코드, 메뉴 코드, 강도)
+        """
+        session_index: Dict[str, int] = {}
+        menu_index: Dict[uuid.UUID, int] = {}
+        row_codes: List[int] = []
+        col_codes: List[int] = []
+        strengths: List[float] = []
+
+        stmt = (
+            select(
+                UserInteraction.session_id,
+                UserInteraction.menu_id,
+                UserInteraction.interaction_strength,
+            )
+            .where(UserInteraction.menu_id.isnot(None))
+            .execution_options(yield_per=50000)
+        )
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            for session_id, menu_id, strength in partition:
+                row_codes.append(
+                    session_index.setdefault(session_id, len(session_index))
+                )
+                col_codes.append(menu_index.setdefault(menu_id, len(menu_index)))
+                strengths.append(1.0 if strength is None else strength)
+
+        return (
+            list(session_index),
+            list(menu_index),
+            np.asarray(row_codes, np.int32),
+            np.asarray(col_codes, np.int32),
+            np.asarray(strengths, np.float64),
+        )
+
+    @staticmethod
+    async def train(db: AsyncSession, directory: Optional[str] = None) -> Dict:
+        """오프라인 학습 후 요인 파일 저장 (train_als.py에서 호출)"""
+        directory = directory or settings.als_model_dir
+        started = time.perf_counter()
+        session_ids, menu_ids, rows, cols, strengths = (
+            await ALSService.load_training_data(db)
+        )
+        loaded = time.perf_counter()
+        if not menu_ids:
+            logger.warning("ALS 학습 데이터가 없습니다")
+            return {}
+
+        session_factors, menu_factors = train_als(
+            rows,
+            cols,
+            strengths,
+            len(session_ids),
+            len(menu_ids),
+            factors=settings.als_factors,
+            regularization=settings.als_regularization,
+            alpha=settings.als_alpha,
+            iterations=settings.als_iterations,
+        )
+        meta = {
+            "factors": settings.als_factors,
+            "regularization": settings.als_regularization,
+            "alpha": settings.als_alpha,
+            "iterations": settings.als_iterations,
+            "sessions": len(session_ids),
+            "menus": len(menu_ids),
+            "interactions": int(rows.size),
+            "load_seconds": round(loaded - started, 2),
+            "train_seconds": round(time.perf_counter() - loaded, 2),
+        }
+        path = save_factors(
+            directory,
+            session_ids,
+            session_factors,
+            menu_ids,
+            menu_factors,
+            meta,
+            keep_versions=settings.als_keep_versions,
+        )
+        logger.info(f"ALS 학습 완료: {path} {meta}")
+        return meta
+
+    @staticmethod
+    async def refresh(db: AsyncSession) -> bool:
+        """
+        새 버전 요인 파일 확인 후 로드, 비활성 메뉴 목록 갱신
+        Returns:
+            새 버전을 로드했으면 True
+        """
+        loaded = als_model.load(settings.als_model_dir)
+        if als_model.is_loaded:
+            result = await db.execute(select(Menu.id).where(Menu.is_active.is_(False)))
+            als_model.set_inactive(result.scalars().all())
+        return loaded
+
+    @staticmethod
+    async def get_recommendations(
+        db: AsyncSession, session_id: str, limit: int = 10
+    ) -> List[Tuple[uuid.UUID, float]]:
+        """세션의 잠재요인 추천 메뉴 ID/점수 목록 (모델 로드는 백그라운드 작업 담당)"""
+        if not als_model.is_loaded:
+            return []
+
+        vector = als_model.session_vector(session_id)
+        if vector is None:
+            stmt = (
+                select(UserInteraction.menu_id, UserInteraction.interaction_strength)
+                .where(
+                    UserInteraction.session_id == session_id,
+                    UserInteraction.menu_id.isnot(None),
+                )
+                .order_by(desc(UserInteraction.created_at))
+                .limit(settings.als_fold_in_limit)
+            )
+            strengths: Dict[uuid.UUID, float] = {}
+            for menu_id, strength in (await db.execute(stmt)).all():
+                strengths[menu_id] = strengths.get(menu_id, 0.0) + (
+                    1.0 if strength is None else strength
+                )
+            vector = als_model.fold_in(strengths)
+            if vector is None:
+                return []
+
+        return als_model.recommend(vector, limit)
+
+
+async def _als_reload_loop():
+    """ALS 요인 파일 새 버전/비활성 메뉴 목록을 주기적으로 반영하는 백그라운드 작업"""
+    from app.db.database import AsyncSessionLocal
+
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await ALSService.refresh(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"ALS 모델 갱신 중 오류: {e}")
+        await asyncio.sleep(settings.als_reload_interval_seconds)
+
+
+def start_als_reload_scheduler() -> asyncio.Task:
+    """ALS 모델 갱신 백그라운드 작업 시작"""
+    task = asyncio.create_task(_als_reload_loop(), name="ALSReloadTask")
+    logger.info("ALS 모델 갱신 스케줄러 시작")
+    return task
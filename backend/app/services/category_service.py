@@ -3,9 +3,11 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import Page
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
 from app.repositories.category_repository import CategoryRepository
+from app.services.preference_service import PreferenceService
 
 
 class CategoryService:
@@ -36,6 +38,8 @@ class CategoryService:
         self.category_repository.db.add(category)
         await self.category_repository.db.commit()
         await self.category_repository.db.refresh(category)
+        # 선호도 벡터 국가 사전에 등록 (SQL 학습 경로가 조인으로 위치를 찾음)
+        await PreferenceService.ensure_countries([category.country])
         return category
 
     async def get_categories(
@@ -45,18 +49,19 @@ class CategoryService:
         country: Optional[str] = None,
         cuisine_type: Optional[str] = None,
         is_active: Optional[bool] = None,
-    ) -> List[Category]:
-        """카테고리 목록 조회 (필터링/페이징 지원)"""
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """카테고리 목록 조회 (필터링/커서 페이지 지원)"""
         return await self.category_repository.get_categories(
-            skip, limit, country, cuisine_type, is_active
+            skip, limit, country, cuisine_type, is_active, cursor
         )
 
     async def get_categories_with_menu_count(
-        self, skip: int = 0, limit: int = 100
-    ) -> List[dict]:
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Page:
         """메뉴 개수와 함께 카테고리 목록 조회"""
         return await self.category_repository.get_categories_with_menu_count(
-            skip, limit
+            skip, limit, cursor
         )
 
     async def update_category(
@@ -71,6 +76,8 @@ class CategoryService:
             setattr(category, field, value)
         await self.category_repository.db.commit()
         await self.category_repository.db.refresh(category)
+        if "country" in update_data:
+            await PreferenceService.ensure_countries([category.country])
         return category
 
     async def delete_category(self, category_id: UUID) -> bool:
@@ -0,0 +1,37 @@
+import os
+from typing import List
+
+from app.core.batch_queue import BatchQueue, jsonl_dead_letter
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.preference_service import PreferenceService
+
+logger = get_logger(__name__)
+
+
+async def _flush_interactions(interactions: List[dict]) -> None:
+    """모인 상호작용을 한 트랜잭션으로 기록하고 세션별 선호도 학습"""
+    from app.db.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        recorded = await PreferenceService.record_interactions_bulk(db, interactions)
+    if recorded < len(interactions):
+        logger.warning(
+            f"존재하지 않는 메뉴의 상호작용 {len(interactions) - recorded}건 제외"
+        )
+
+
+# 상호작용 write-behind 버퍼 (interaction_buffer_enabled일 때만 시작)
+interaction_buffer: BatchQueue[dict] = BatchQueue(
+    name="InteractionBuffer",
+    handler=_flush_interactions,
+    max_size=settings.interaction_buffer_max_size,
+    batch_size=settings.interaction_buffer_batch_size,
+    flush_interval=settings.interaction_buffer_flush_interval_ms / 1000,
+    put_timeout=settings.interaction_buffer_put_timeout_seconds,
+    max_retries=settings.batch_queue_max_retries,
+    retry_backoff=settings.batch_queue_retry_backoff_seconds,
+    dead_letter=jsonl_dead_letter(
+        os.path.join(settings.batch_queue_dead_letter_dir, "interactions.jsonl")
+    ),
+)
@@ -0,0 +1,151 @@
+import json
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.schemas.user_preference import UserInteractionCreate
+from app.services.preference_service import PreferenceService
+
+logger = get_logger(__name__)
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson")
+
+_interaction_list_adapter = TypeAdapter(List[UserInteractionCreate])
+
+
+class InteractionBatchError(ValueError):
+    """배치 본문 파싱/검증 실패"""
+
+    def __init__(self, message: str, errors: Optional[List[Dict[str, Any]]] = None):
+        super().__init__(message)
+        self.errors = errors or []
+
+
+class InteractionBatchTooLarge(InteractionBatchError):
+    """배치 본문 크기 또는 레코드 수 초과"""
+
+
+async def read_limited_body(chunks: AsyncIterator[bytes], max_bytes: int) -> bytes:
+    """
+    요청 본문을 max_bytes까지만 읽음 (Content-Length 없는 chunked 업로드 포함)
+    Raises:
+        InteractionBatchTooLarge: max_bytes 초과 (나머지는 읽지 않음)
+    """
+    body = bytearray()
+    async for chunk in chunks:
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise InteractionBatchTooLarge(
+                f"본문은 최대 {max_bytes} bytes까지 보낼 수 있습니다"
+            )
+    return bytes(body)
+
+
+def parse_interaction_batch(
+    body: bytes,
+    content_type: Optional[str] = None,
+    max_records: Optional[int] = None,
+) -> List[UserInteractionCreate]:
+    """
+    JSON 배열 또는 NDJSON 본문을 한 번에 검증
+    - JSON은 배열 또는 {"interactions": [...]} 형태 허용
+    - 레코드 수는 검증 전에 확인 (NDJSON은 max_records + 1번째 줄에서 중단)
+    - 검증 오류는 모든 레코드를 한 번에 모아 인덱스와 함께 반환
+    Raises:
+        InteractionBatchTooLarge: 레코드 수가 max_records 초과
+        InteractionBatchError: 형식 오류 또는 검증 실패
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    too_large = InteractionBatchTooLarge(
+        f"한 번에 최대 {max_records}건까지 기록할 수 있습니다"
+    )
+    try:
+        text = body.decode("utf-8")
+        if media_type in NDJSON_CONTENT_TYPES:
+            items = []
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                if max_records is not None and len(items) >= max_records:
+                    raise too_large
+                items.append(json.loads(line))
+        else:
+            items = json.loads(text)
+            if isinstance(items, dict):
+                items = items.get("interactions")
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise InteractionBatchError(f"본문을 JSON으로 해석할 수 없습니다: {e}")
+
+    if not isinstance(items, list):
+        raise InteractionBatchError("상호작용 배열이 필요합니다")
+    if max_records is not None and len(items) > max_records:
+        raise too_large
+
+    try:
+        return _interaction_list_adapter.validate_python(items)
+    except ValidationError as e:
+        raise InteractionBatchError(
+            "상호작용 검증 실패",
+            [
+                {
+                    "index": error["loc"][0] if error["loc"] else None,
+                    "field": ".".join(str(part) for part in error["loc"][1:]),
+                    "message": error["msg"],
+                }
+                for error in e.errors()
+            ],
+        )
+
+
+class InteractionIngestService:
+    """
+    대량 상호작용 적재 서비스 (오프라인 수집분 재전송용)
+    """
+
+    @staticmethod
+    async def ingest(
+        db: AsyncSession,
+        interactions: List[UserInteractionCreate],
+        user_id: Optional[uuid.UUID] = None,
+    ) -> Dict[str, Any]:
+        """
+        카탈로그 확인 후 COPY로 적재하고 세션별 선호도 학습 1회 적용
+        Returns:
+            접수/적재/거절 건수, 거절된 레코드 인덱스, 처리량(rows/s)
+        """
+        started = time.perf_counter()
+        menus = await PreferenceService.load_menus_by_ids(
+            db, (interaction.menu_id for interaction in interactions)
+        )
+
+        rows: List[dict] = []
+        rejected: List[Dict[str, Any]] = []
+        for index, interaction in enumerate(interactions):
+            if interaction.menu_id and interaction.menu_id not in menus:
+                rejected.append({"index": index, "menu_id": str(interaction.menu_id)})
+                continue
+            row = interaction.model_dump()
+            row["user_id"] = user_id
+            row["extra_data"] = json.dumps(row["extra_data"] or {}, ensure_ascii=False)
+            rows.append(row)
+
+        inserted = await PreferenceService.record_interactions_bulk(
+            db, rows, use_copy=True, menus=menus
+        )
+        elapsed = time.perf_counter() - started
+        rows_per_second = round(inserted / elapsed, 1) if elapsed > 0 else None
+        logger.info(
+            f"상호작용 대량 적재: {inserted}/{len(interactions)}건, "
+            f"{elapsed * 1000:.1f}ms ({rows_per_second} rows/s)"
+        )
+        return {
+            "received": len(interactions),
+            "inserted": inserted,
+            "rejected": rejected,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "rows_per_second": rows_per_second,
+        }
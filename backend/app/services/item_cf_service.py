@@ -0,0 +1,469 @@
+import asyncio
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.favorite import Favorite
+from app.models.user_preference import UserInteraction
+
+logger = get_logger(__name__)
+
+
+def session_basket(session_id: str) -> str:
+    """세션 단위 바구니 키"""
+    return f"s:{session_id}"
+
+
+def user_basket(user_id: uuid.UUID) -> str:
+    """사용자(즐겨찾기) 단위 바구니 키"""
+    return f"u:{user_id}"
+
+
+def _latest(current: Optional[datetime], candidate: Optional[datetime]):
+    """워터마크 갱신용 - 더 최근 시각 반환"""
+    if current is None or (candidate is not None and candidate > current):
+        return candidate
+    return current
+
+
+class SourceWatermark:
+    """
+    증분 조회 원본(테이블)별 워터마크
+    - 실제로 읽은 행의 created_at 최댓값을 기준으로 overlap 만큼 앞에서 다시 조회
+      (created_at이 이른 행이 늦게 커밋돼도 누락되지 않음)
+    - 겹침 구간 안에서 이미 반영한 id는 기억해두고 건너뜀
+    """
+
+    def __init__(self, overlap: timedelta):
+        self.overlap = overlap
+        self.watermark: Optional[datetime] = None
+        self._recent: Dict[Any, datetime] = {}
+
+    @property
+    def since(self) -> Optional[datetime]:
+        """다음 조회 시작 시각 (이 시각 이후 created_at)"""
+        if self.watermark is None:
+            return None
+        return self.watermark - self.overlap
+
+    def take(self, rows: Iterable[Tuple]) -> List[Tuple]:
+        """
+        (id, created_at, ...) 행 중 처음 보는 행만 반환하고 워터마크 전진
+        """
+        fresh = []
+        for row in rows:
+            row_id, created_at = row[0], row[1]
+            if row_id in self._recent:
+                continue
+            fresh.append(row)
+            self._recent[row_id] = created_at
+            self.watermark = _latest(self.watermark, created_at)
+        cutoff = self.since
+        if cutoff is not None:
+            self._recent = {
+                row_id: created_at
+                for row_id, created_at in self._recent.items()
+                if created_at is not None and created_at > cutoff
+            }
+        return fresh
+
+
+def build_cooccurrence_csr(
+    basket_codes: np.ndarray, item_codes: np.ndarray, n_items: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (바구니, 메뉴) 쌍으로 메뉴×메뉴 동시출현 CSR 행렬 생성
+    Args:
+        basket_codes: 바구니 정수 코드 배열
+        item_codes: 메뉴 정수 코드 배열 (basket_codes와 같은 길이)
+        n_items: 전체 메뉴 수
+    Returns:
+        (indptr, indices, counts, item_counts)
+        - 대각 성분(자기 자신)은 제외, item_counts에 바구니 수로 따로 보관
+    """
+    if item_codes.size == 0:
+        return (
+            np.zeros(n_items + 1, np.int64),
+            np.zeros(0, np.int32),
+            np.zeros(0, np.float32),
+            np.zeros(n_items, np.float32),
+        )
+
+    # 바구니 내 중복 제거 후 바구니 순으로 정렬
+    keys = np.unique(basket_codes.astype(np.int64) * n_items + item_codes)
+    baskets = keys // n_items
+    items = (keys % n_items).astype(np.int32)
+    item_counts = np.bincount(items, minlength=n_items).astype(np.float32)
+
+    # 바구니별 크기/시작 위치 → 원소마다 같은 바구니의 모든 원소와 짝지음
+    _, starts, sizes = np.unique(baskets, return_index=True, return_counts=True)
+    element_sizes = np.repeat(sizes, sizes)
+    element_starts = np.repeat(starts, sizes)
+    rows = np.repeat(items, element_sizes)
+    offsets = np.arange(rows.size) - np.repeat(
+        np.cumsum(element_sizes) - element_sizes, element_sizes
+    )
+    cols = items[np.repeat(element_starts, element_sizes) + offsets]
+
+    off_diagonal = rows != cols
+    pair_keys, pair_counts = np.unique(
+        rows[off_diagonal].astype(np.int64) * n_items + cols[off_diagonal],
+        return_counts=True,
+    )
+    pair_rows = pair_keys // n_items
+    indices = (pair_keys % n_items).astype(np.int32)
+    indptr = np.zeros(n_items + 1, np.int64)
+    np.cumsum(np.bincount(pair_rows, minlength=n_items), out=indptr[1:])
+    return indptr, indices, pair_counts.astype(np.float32), item_counts
+
+
+class CooccurrenceModel:
+    """
+    아이템 기반 협업 필터링 모델 (메뉴×메뉴 동시출현 CSR)
+    - 같은 세션/사용자 바구니에 함께 등장한 횟수를 코사인 정규화
+      weight(i, j) = co(i, j) / sqrt(count(i) * count(j))
+    - 시드 집합 조회는 시드마다 CSR 행 하나만 읽음
+    - 신규 상호작용은 델타 사전에 누적 후 임계치에서 CSR로 압축
+    """
+
+    def __init__(self, max_basket_size: int = 200, compact_threshold: int = 50000):
+        self.max_basket_size = max_basket_size
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self.menu_ids: List[uuid.UUID] = []
+        self.menu_index: Dict[uuid.UUID, int] = {}
+        self.baskets: Dict[str, Set[int]] = {}
+        self.indptr = np.zeros(1, np.int64)
+        self.indices = np.zeros(0, np.int32)
+        self.counts = np.zeros(0, np.float32)
+        self.weights = np.zeros(0, np.float32)
+        self.item_counts = np.zeros(0, np.float32)
+        self._delta: Dict[int, Dict[int, float]] = {}
+        self._delta_pairs = 0
+        self.watermarks: Dict[str, SourceWatermark] = {}
+        self.built_at: Optional[float] = None
+
+    @property
+    def n_items(self) -> int:
+        return len(self.menu_ids)
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def build(self, pairs: Iterable[Tuple[str, uuid.UUID]]) -> None:
+        """(바구니 키, 메뉴 ID) 쌍 전체로 모델 재구축"""
+        menu_index: Dict[uuid.UUID, int] = {}
+        basket_index: Dict[str, int] = {}
+        baskets: Dict[str, Set[int]] = {}
+        basket_codes: List[int] = []
+        item_codes: List[int] = []
+        for basket_key, menu_id in pairs:
+            item = menu_index.setdefault(menu_id, len(menu_index))
+            members = baskets.setdefault(basket_key, set())
+            if item in members or len(members) >= self.max_basket_size:
+                continue
+            members.add(item)
+            basket_codes.append(basket_index.setdefault(basket_key, len(basket_index)))
+            item_codes.append(item)
+
+        n_items = len(menu_index)
+        indptr, indices, counts, item_counts = build_cooccurrence_csr(
+            np.asarray(basket_codes, np.int64),
+            np.asarray(item_codes, np.int32),
+            n_items,
+        )
+        with self._lock:
+            self.menu_index = menu_index
+            self.menu_ids = [None] * n_items
+            for menu_id, idx in menu_index.items():
+                self.menu_ids[idx] = menu_id
+            self.baskets = baskets
+            self.indptr, self.indices, self.counts = indptr, indices, counts
+            self.item_counts = item_counts
+            self.weights = self._normalize(indptr, indices, counts, item_counts)
+            self._delta = {}
+            self._delta_pairs = 0
+            self.built_at = time.time()
+
+    def add(self, basket_key: str, menu_id: uuid.UUID) -> bool:
+        """
+        상호작용 하나를 증분 반영
+        Returns:
+            새로운 (바구니, 메뉴) 쌍이면 True
+        """
+        with self._lock:
+            item = self.menu_index.get(menu_id)
+            if item is None:
+                item = self._append_item(menu_id)
+            members = self.baskets.setdefault(basket_key, set())
+            if item in members or len(members) >= self.max_basket_size:
+                return False
+            for other in members:
+                self._delta.setdefault(item, {})[other] = (
+                    self._delta.get(item, {}).get(other, 0.0) + 1.0
+                )
+                self._delta.setdefault(other, {})[item] = (
+                    self._delta.get(other, {}).get(item, 0.0) + 1.0
+                )
+                self._delta_pairs += 2
+            members.add(item)
+            self.item_counts[item] += 1.0
+            if self._delta_pairs >= self.compact_threshold:
+                self.compact()
+            return True
+
+    def compact(self) -> None:
+        """델타를 CSR에 병합하고 정규화 가중치 재계산"""
+        with self._lock:
+            if not self._delta:
+                return
+            n = self.n_items
+            rows = [np.repeat(np.arange(n, dtype=np.int64), np.diff(self.indptr))]
+            cols = [self.indices.astype(np.int64)]
+            vals = [self.counts]
+            for row, partners in self._delta.items():
+                rows.append(np.full(len(partners), row, np.int64))
+                cols.append(np.fromiter(partners.keys(), np.int64, len(partners)))
+                vals.append(np.fromiter(partners.values(), np.float32, len(partners)))
+            keys = np.concatenate(rows) * n + np.concatenate(cols)
+            values = np.concatenate(vals)
+            unique_keys, inverse = np.unique(keys, return_inverse=True)
+            merged = np.zeros(unique_keys.size, np.float32)
+            np.add.at(merged, inverse, values)
+
+            self.indptr = np.zeros(n + 1, np.int64)
+            np.cumsum(np.bincount(unique_keys // n, minlength=n), out=self.indptr[1:])
+            self.indices = (unique_keys % n).astype(np.int32)
+            self.counts = merged
+            self.weights = self._normalize(
+                self.indptr, self.indices, self.counts, self.item_counts
+            )
+            self._delta = {}
+            self._delta_pairs = 0
+
+    def similar(
+        self, seed_ids: Iterable[uuid.UUID], limit: int = 10
+    ) -> List[Tuple[uuid.UUID, float]]:
+        """
+        "X를 고른 사용자들이 함께 고른 메뉴" 조회
+        - 시드마다 CSR 행 하나 + 델타 행을 합산, 시드 자신은 제외
+        """
+        with self._lock:
+            seeds = [self.menu_index[m] for m in seed_ids if m in self.menu_index]
+            if not seeds or self.n_items == 0:
+                return []
+            scores = np.zeros(self.n_items, np.float32)
+            inv_sqrt = self._inv_sqrt(self.item_counts)
+            for seed in seeds:
+                start, end = self.indptr[seed], self.indptr[seed + 1]
+                scores[self.indices[start:end]] += self.weights[start:end]
+                for other, count in self._delta.get(seed, {}).items():
+                    scores[other] += count * inv_sqrt[seed] * inv_sqrt[other]
+            scores[seeds] = 0.0
+
+            k = min(limit, int(np.count_nonzero(scores)))
+            if k == 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(self.menu_ids[i], float(scores[i])) for i in top]
+
+    def memory_report(self) -> Dict[str, int]:
+        """모델이 차지하는 메모리 현황 (바이트 단위 추정치 포함)"""
+        with self._lock:
+            csr_bytes = (
+                self.indptr.nbytes
+                + self.indices.nbytes
+                + self.counts.nbytes
+                + self.weights.nbytes
+                + self.item_counts.nbytes
+            )
+            delta_bytes = sys.getsizeof(self._delta) + sum(
+                sys.getsizeof(partners) for partners in self._delta.values()
+            )
+            basket_bytes = sys.getsizeof(self.baskets) + sum(
+                sys.getsizeof(members) for members in self.baskets.values()
+            )
+            return {
+                "items": self.n_items,
+                "baskets": len(self.baskets),
+                "nnz": int(self.indices.size),
+                "density_ppm": (
+                    int(self.indices.size * 1_000_000 / (self.n_items**2))
+                    if self.n_items
+                    else 0
+                ),
+                "delta_pairs": self._delta_pairs,
+                "csr_bytes": csr_bytes,
+                "delta_bytes": delta_bytes,
+                "basket_bytes": basket_bytes,
+                "total_bytes": csr_bytes + delta_bytes + basket_bytes,
+            }
+
+    def _append_item(self, menu_id: uuid.UUID) -> int:
+        """처음 보는 메뉴를 빈 행으로 추가"""
+        item = len(self.menu_ids)
+        self.menu_ids.append(menu_id)
+        self.menu_index[menu_id] = item
+        self.indptr = np.append(self.indptr, self.indptr[-1])
+        self.item_counts = np.append(self.item_counts, np.float32(0.0))
+        return item
+
+    @staticmethod
+    def _inv_sqrt(item_counts: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            inv = 1.0 / np.sqrt(item_counts)
+        inv[~np.isfinite(inv)] = 0.0
+        return inv.astype(np.float32)
+
+    @classmethod
+    def _normalize(
+        cls,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        counts: np.ndarray,
+        item_counts: np.ndarray,
+    ) -> np.ndarray:
+        """코사인 정규화 가중치 계산"""
+        if counts.size == 0:
+            return np.zeros(0, np.float32)
+        inv_sqrt = cls._inv_sqrt(item_counts)
+        rows = np.repeat(np.arange(item_counts.size), np.diff(indptr))
+        return (counts * inv_sqrt[rows] * inv_sqrt[indices]).astype(np.float32)
+
+
+# 전역 아이템 협업 필터링 모델 (워커 프로세스별)
+item_cf_model = CooccurrenceModel(
+    max_basket_size=settings.item_cf_max_basket_size,
+    compact_threshold=settings.item_cf_compact_threshold,
+)
+
+
+class ItemCFService:
+    """
+    아이템 기반 협업 필터링 모델 구축/갱신/조회 서비스
+    """
+
+    @staticmethod
+    def _new_watermarks() -> Dict[str, SourceWatermark]:
+        overlap = timedelta(seconds=settings.item_cf_watermark_overlap_seconds)
+        return {
+            "interactions": SourceWatermark(overlap),
+            "favorites": SourceWatermark(overlap),
+        }
+
+    @staticmethod
+    def _interaction_query(since: Optional[datetime] = None):
+        stmt = select(
+            UserInteraction.id,
+            UserInteraction.created_at,
+            UserInteraction.session_id,
+            UserInteraction.menu_id,
+        ).where(
+            UserInteraction.menu_id.isnot(None),
+            UserInteraction.interaction_type.in_(settings.item_cf_interaction_types),
+        )
+        if since is not None:
+            stmt = stmt.where(UserInteraction.created_at > since)
+        return stmt.order_by(UserInteraction.created_at)
+
+    @staticmethod
+    def _favorite_query(since: Optional[datetime] = None):
+        stmt = select(
+            Favorite.id, Favorite.created_at, Favorite.user_id, Favorite.menu_id
+        ).where(Favorite.is_active)
+        if since is not None:
+            stmt = stmt.where(Favorite.created_at > since)
+        return stmt.order_by(Favorite.created_at)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> Dict[str, int]:
+        """상호작용(세션별)과 즐겨찾기(사용자별) 전체로 재구축"""
+        started = time.perf_counter()
+        pairs: List[Tuple[str, uuid.UUID]] = []
+        watermarks = ItemCFService._new_watermarks()
+        rows = (await db.execute(ItemCFService._interaction_query())).all()
+        for _, _, session_id, menu_id in watermarks["interactions"].take(rows):
+            pairs.append((session_basket(session_id), menu_id))
+        rows = (await db.execute(ItemCFService._favorite_query())).all()
+        for _, _, user_id, menu_id in watermarks["favorites"].take(rows):
+            pairs.append((user_basket(user_id), menu_id))
+
+        item_cf_model.build(pairs)
+        item_cf_model.watermarks = watermarks
+        report = item_cf_model.memory_report()
+        logger.info(
+            f"아이템 협업 필터링 모델 재구축 완료: 메뉴 {report['items']}개, "
+            f"nnz {report['nnz']}, {report['total_bytes']} bytes "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+        return report
+
+    @staticmethod
+    async def refresh(db: AsyncSession) -> int:
+        """원본별 워터마크(겹침 구간 포함) 이후 신규 상호작용/즐겨찾기만 증분 반영"""
+        if not item_cf_model.is_built:
+            await ItemCFService.rebuild(db)
+            return 0
+        watermarks = item_cf_model.watermarks
+        added = 0
+        interactions = watermarks["interactions"]
+        rows = (
+            await db.execute(ItemCFService._interaction_query(interactions.since))
+        ).all()
+        for _, _, session_id, menu_id in interactions.take(rows):
+            added += item_cf_model.add(session_basket(session_id), menu_id)
+        favorites = watermarks["favorites"]
+        rows = (await db.execute(ItemCFService._favorite_query(favorites.since))).all()
+        for _, _, user_id, menu_id in favorites.take(rows):
+            added += item_cf_model.add(user_basket(user_id), menu_id)
+        return added
+
+    @staticmethod
+    async def get_similar_menus(
+        db: AsyncSession, seed_ids: List[uuid.UUID], limit: int = 10
+    ) -> List[Tuple[uuid.UUID, float]]:
+        """시드 메뉴와 함께 선택된 메뉴 ID/점수 목록"""
+        if not item_cf_model.is_built:
+            await ItemCFService.rebuild(db)
+        return item_cf_model.similar(seed_ids, limit)
+
+
+async def _item_cf_refresh_loop():
+    """증분 갱신(짧은 주기)과 전체 재구축(긴 주기)을 수행하는 백그라운드 작업"""
+    from app.db.database import AsyncSessionLocal
+
+    last_rebuild = 0.0
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                now = time.time()
+                if now - last_rebuild >= settings.item_cf_rebuild_interval_seconds:
+                    await ItemCFService.rebuild(db)
+                    last_rebuild = now
+                else:
+                    added = await ItemCFService.refresh(db)
+                    if added:
+                        logger.debug(f"아이템 협업 필터링 증분 반영: {added}건")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"아이템 협업 필터링 갱신 중 오류: {e}")
+        await asyncio.sleep(settings.item_cf_refresh_interval_seconds)
+
+
+def start_item_cf_refresh_scheduler() -> asyncio.Task:
+    """아이템 협업 필터링 갱신 백그라운드 작업 시작"""
+    task = asyncio.create_task(_item_cf_refresh_loop(), name="ItemCFRefreshTask")
+    logger.info("아이템 협업 필터링 갱신 스케줄러 시작")
+    return task
@@ -0,0 +1,773 @@
+import asyncio
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.hangul import JamoIndex, has_jamo
+from app.core.logging import get_logger
+from app.core.pagination import Page, decode_offset_cursor, encode_offset_cursor
+from app.core.text_search import bigram_tokens, split_words
+from app.db.database import AsyncSessionLocal
+from app.models.category import Category
+from app.models.menu import Menu
+from app.services.search_stats_service import SearchStatsService
+from app.services.suggest_service import SuggestService, suggestion_trie
+
+logger = get_logger(__name__)
+
+# 필드별 토큰 가중치 (이름 > 카테고리명 > 재료 > 설명)
+FIELD_WEIGHTS = {"name": 8, "category_name": 4, "ingredients": 2, "description": 1}
+# 한 필드 안에서 같은 토큰이 반복될 때 인정하는 최대 횟수
+MAX_TERM_FREQUENCY = 3
+# 단어 전체 일치 토큰 접두어 (2-gram 토큰과 구분)
+WORD_TOKEN_PREFIX = "="
+# 단어 전체 일치 가산 배율
+WORD_MATCH_BOOST = 2
+# 초성/자모 일치 점수 (오타 허용 일치는 편집 거리만큼 감점)
+JAMO_MATCH_SCORE = 3
+
+FLAG_FILTERS = (
+    "is_spicy",
+    "is_healthy",
+    "is_vegetarian",
+    "is_quick",
+    "has_rice",
+    "has_soup",
+    "has_meat",
+)
+EQUALITY_FILTERS = (
+    "time_slot",
+    "difficulty",
+    "category_id",
+    "country",
+    "cuisine_type",
+) + FLAG_FILTERS
+RANGE_FILTERS = {
+    "min_calories": ("calories", np.greater_equal),
+    "max_calories": ("calories", np.less_equal),
+    "min_rating": ("rating", np.greater_equal),
+}
+
+# 패싯: 참/거짓 속성은 참인 결과 수, 값 속성은 값별 결과 수
+VALUE_FACETS = ("time_slot", "country", "difficulty", "cuisine_type")
+FACET_FIELDS = FLAG_FILTERS + VALUE_FACETS
+
+# 색인 검색 커서 이름 (결과가 메모리에 있어 다음 시작 위치만 담음)
+SEARCH_CURSOR_NAME = "menu_search_index"
+
+# (전체 메뉴 수, 메뉴 최종 수정 시각, 전체 카테고리 수, 카테고리 최종 수정 시각)
+CatalogVersion = Tuple[int, Optional[datetime], int, Optional[datetime]]
+
+
+def parse_facets(text: Optional[str]) -> List[str]:
+    """
+    쉼표로 구분한 패싯 이름 목록 (중복 제거)
+    Raises:
+        ValueError: 지원하지 않는 패싯
+    """
+    names = list(dict.fromkeys(n.strip() for n in (text or "").split(",") if n.strip()))
+    unknown = [name for name in names if name not in FACET_FIELDS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 패싯입니다: {', '.join(unknown)}")
+    return names
+
+
+def encode_postings(slots: np.ndarray, weights: np.ndarray) -> bytes:
+    """
+    포스팅 목록 압축 (정렬된 문서 번호 차분 + 가중치를 varint로 번갈아 기록)
+    """
+    out = bytearray()
+    previous = 0
+    for slot, weight in zip(slots.tolist(), weights.tolist()):
+        for value in (slot - previous, weight):
+            while value >= 0x80:
+                out.append((value & 0x7F) | 0x80)
+                value >>= 7
+            out.append(value)
+        previous = slot
+    return bytes(out)
+
+
+def decode_postings(data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """압축된 포스팅 목록 → (문서 번호 배열, 가중치 배열)"""
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(value)
+        value = shift = 0
+    pairs = np.array(values, dtype=np.int64).reshape(-1, 2)
+    return np.cumsum(pairs[:, 0]), pairs[:, 1]
+
+
+@dataclass
+class MenuDocument:
+    """색인 대상 메뉴 한 건 (카테고리 정보 포함)"""
+
+    menu_id: uuid.UUID
+    name: str
+    description: Optional[str]
+    ingredients: Optional[str]
+    category_name: Optional[str]
+    category_id: Optional[str]
+    country: Optional[str]
+    cuisine_type: Optional[str]
+    time_slot: Optional[str]
+    difficulty: Optional[str]
+    is_spicy: bool
+    is_healthy: bool
+    is_vegetarian: bool
+    is_quick: bool
+    has_rice: bool
+    has_soup: bool
+    has_meat: bool
+    calories: Optional[int]
+    rating: Optional[float]
+    is_active: bool = True
+
+    @classmethod
+    def from_menu(cls, menu: Menu) -> "MenuDocument":
+        category = menu.category
+        return cls(
+            menu_id=menu.id,
+            name=menu.name,
+            description=menu.description,
+            ingredients=menu.ingredients,
+            category_name=category.name if category else None,
+            category_id=str(menu.category_id) if menu.category_id else None,
+            country=category.country if category else None,
+            cuisine_type=category.cuisine_type if category else None,
+            time_slot=menu.time_slot,
+            difficulty=menu.difficulty,
+            is_spicy=bool(menu.is_spicy),
+            is_healthy=bool(menu.is_healthy),
+            is_vegetarian=bool(menu.is_vegetarian),
+            is_quick=bool(menu.is_quick),
+            has_rice=bool(menu.has_rice),
+            has_soup=bool(menu.has_soup),
+            has_meat=bool(menu.has_meat),
+            calories=menu.calories,
+            rating=menu.rating,
+            is_active=bool(menu.is_active),
+        )
+
+    def token_weights(self) -> Dict[str, int]:
+        """토큰 → 가중치 (필드 가중치 × 등장 횟수, 2-gram과 단어 전체)"""
+        weights: Dict[str, int] = {}
+        for field_name, field_weight in FIELD_WEIGHTS.items():
+            text = getattr(self, field_name) or ""
+            tokens = bigram_tokens(text) + [
+                WORD_TOKEN_PREFIX + word for word in split_words(text) if len(word) > 1
+            ]
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                weights[token] = weights.get(token, 0) + field_weight * min(
+                    count, MAX_TERM_FREQUENCY
+                )
+        return weights
+
+
+class MenuSearchIndex:
+    """
+    메뉴 검색 인메모리 역색인
+    - 토큰(글자 2-gram, 단어) → 압축 포스팅 목록(문서 번호, 가중치)
+    - 메뉴명 초성/자모 색인 (초성 입력, 입력 중 음절, 오타 허용)
+    - 속성 필터는 문서 번호 순서의 numpy 열로 보관해 마스크로 결합
+    - 카탈로그 버전이 바뀌면 바뀐 메뉴의 토큰만 갱신 (문서 번호 재사용)
+    - 스레드 안전 (변경/조회 모두 lock 안에서 수행)
+    """
+
+    def __init__(self, decoded_cache_size: int = 4096):
+        self.decoded_cache_size = decoded_cache_size
+        self._lock = threading.RLock()
+        self._reset()
+        self._stats = {"rebuilds": 0, "updates": 0, "queries": 0}
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, bytes] = {}
+        self._decoded: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._docs: List[Optional[MenuDocument]] = []
+        self._tokens_by_slot: List[Dict[str, int]] = []
+        self._slot_by_id: Dict[uuid.UUID, int] = {}
+        self._free_slots: List[int] = []
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+        self._vocabulary: Optional[List[str]] = None
+        # 메뉴명 초성/자모 색인 (문서 번호 기준)
+        self._jamo = JamoIndex()
+        self.version: Optional[CatalogVersion] = None
+        self.built_at: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    def __contains__(self, menu_id: uuid.UUID) -> bool:
+        return menu_id in self._slot_by_id
+
+    def documents(self) -> List[MenuDocument]:
+        """색인된 문서 전체"""
+        with self._lock:
+            return [doc for doc in self._docs if doc is not None]
+
+    def rebuild(
+        self, documents: Iterable[MenuDocument], version: Optional[CatalogVersion]
+    ) -> int:
+        """전체 문서로 다시 색인"""
+        with self._lock:
+            self._reset()
+            self._apply([doc for doc in documents if doc.is_active], [])
+            self.version = version
+            self.built_at = time.time()
+            self._stats["rebuilds"] += 1
+            return len(self._slot_by_id)
+
+    def update(
+        self,
+        documents: Iterable[MenuDocument],
+        live_ids: Optional[Iterable[uuid.UUID]],
+        version: Optional[CatalogVersion],
+    ) -> int:
+        """
+        증분 반영
+        - documents: 바뀐 메뉴 (비활성이면 제거)
+        - live_ids: 현재 존재하는 메뉴 id 전체 (없는 id는 제거, None이면 삭제 확인 생략)
+        Returns:
+            변경된 문서 수
+        """
+        documents = list(documents)
+        removed = [doc.menu_id for doc in documents if not doc.is_active]
+        if live_ids is not None:
+            live = set(live_ids)
+            removed.extend(mid for mid in self._slot_by_id if mid not in live)
+        with self._lock:
+            changed = self._apply([doc for doc in documents if doc.is_active], removed)
+            self.version = version
+            self.built_at = self.built_at or time.time()
+            self._stats["updates"] += 1
+            return changed
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[uuid.UUID], int]:
+        """
+        검색어로 메뉴 검색 (search_with_facets 참고)
+        Returns:
+            (관련도순 메뉴 id 목록, 필터 적용 후 전체 일치 수)
+        """
+        menu_ids, total, _ = self.search_with_facets(query, filters, offset, limit)
+        return menu_ids, total
+
+    def search_with_facets(
+        self,
+        query: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        offset: int = 0,
+        limit: int = 20,
+        facets: Sequence[str] = (),
+    ) -> Tuple[List[uuid.UUID], int, Dict[str, Any]]:
+        """
+        검색어 토큰의 포스팅 목록을 교집합으로 결합하고 속성 필터 적용
+        - 단어별로 모든 2-gram이 있어야 일치 (한 글자 단어는 그 글자로 시작하는 토큰)
+        - 점수 = 토큰 가중치 합 (+ 단어 전체 일치 가산), 동점은 평점 → 이름 순
+        - 낱자모가 섞인 입력(초성, 입력 중 음절)은 메뉴명 초성/자모 접두 일치
+        - 일치하는 메뉴가 없으면 메뉴명 자모 편집 거리(오타 허용)로 다시 찾음
+        - facets: 일치 결과 전체(필터 적용 후)의 속성 열을 한 번씩 세어 패싯별 수 집계
+        Returns:
+            (관련도순 메뉴 id 목록, 필터 적용 후 전체 일치 수, 패싯별 수)
+        Raises:
+            ValueError: 지원하지 않는 필터
+        """
+        words = split_words(query)
+        with self._lock:
+            self._stats["queries"] += 1
+            columns = self._ensure_columns()
+            n_slots = len(self._docs)
+            slots = np.zeros(0, dtype=np.int64)
+            if not words or n_slots == 0:
+                return [], 0, self._facet_counts(columns, slots, facets)
+            scores = None
+            if not has_jamo(query):
+                scores = self._keyword_scores(words, n_slots)
+            if scores is None or not scores.any():
+                scores = self._jamo_scores(query, n_slots)
+            matched = columns["alive"] & (scores > 0)
+            if matched.any():
+                matched &= self._filter_mask(columns, filters or {})
+                slots = np.flatnonzero(matched)
+            if not slots.size:
+                return [], 0, self._facet_counts(columns, slots, facets)
+            order = np.lexsort(
+                (
+                    columns["name_rank"][slots],
+                    -columns["rating"][slots],
+                    -scores[slots],
+                )
+            )
+            page = slots[order][offset : offset + limit]
+            return (
+                [self._docs[slot].menu_id for slot in page],
+                len(slots),
+                self._facet_counts(columns, slots, facets),
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "documents": len(self._slot_by_id),
+                "tokens": len(self._postings),
+                "posting_bytes": sum(len(data) for data in self._postings.values()),
+                "built_at": self.built_at,
+            }
+
+    def _apply(self, documents: List[MenuDocument], removed: List[uuid.UUID]) -> int:
+        """문서 추가/교체/제거 후 영향받은 토큰의 포스팅만 다시 압축"""
+        additions: Dict[str, Dict[int, int]] = {}
+        deletions: Dict[str, set] = {}
+        removed_slots = []
+        for menu_id in removed:
+            slot = self._slot_by_id.pop(menu_id, None)
+            if slot is None:
+                continue
+            removed_slots.append(slot)
+            for token in self._tokens_by_slot[slot]:
+                deletions.setdefault(token, set()).add(slot)
+            self._docs[slot] = None
+            self._tokens_by_slot[slot] = {}
+            self._free_slots.append(slot)
+        for doc in documents:
+            slot = self._slot_by_id.get(doc.menu_id)
+            if slot is None:
+                slot = self._allocate_slot()
+                self._slot_by_id[doc.menu_id] = slot
+            for token in self._tokens_by_slot[slot]:
+                deletions.setdefault(token, set()).add(slot)
+            token_weights = doc.token_weights()
+            for token, weight in token_weights.items():
+                additions.setdefault(token, {})[slot] = weight
+            self._docs[slot] = doc
+            self._tokens_by_slot[slot] = token_weights
+
+        for token in set(additions) | set(deletions):
+            self._rewrite_posting(
+                token, deletions.get(token, set()), additions.get(token, {})
+            )
+        self._jamo.update(
+            {self._slot_by_id[doc.menu_id]: doc.name for doc in documents},
+            removed_slots,
+        )
+        self._jamo.prepare()
+        if additions or deletions or removed or documents:
+            self._decoded.clear()
+            self._columns = None
+            self._vocabulary = None
+        return len(documents) + len(removed)
+
+    def _allocate_slot(self) -> int:
+        if self._free_slots:
+            return self._free_slots.pop()
+        self._docs.append(None)
+        self._tokens_by_slot.append({})
+        return len(self._docs) - 1
+
+    def _rewrite_posting(
+        self, token: str, removed_slots: set, added: Dict[int, int]
+    ) -> None:
+        entries: Dict[int, int] = {}
+        data = self._postings.get(token)
+        if data:
+            slots, weights = decode_postings(data)
+            entries = {
+                slot: weight
+                for slot, weight in zip(slots.tolist(), weights.tolist())
+                if slot not in removed_slots
+            }
+        entries.update(added)
+        if not entries:
+            self._postings.pop(token, None)
+            return
+        slots = np.array(sorted(entries), dtype=np.int64)
+        weights = np.array([entries[slot] for slot in slots.tolist()], dtype=np.int64)
+        self._postings[token] = encode_postings(slots, weights)
+
+    def _posting(self, token: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        decoded = self._decoded.get(token)
+        if decoded is None:
+            data = self._postings.get(token)
+            if data is None:
+                return None
+            if len(self._decoded) >= self.decoded_cache_size:
+                self._decoded.clear()
+            decoded = self._decoded[token] = decode_postings(data)
+        return decoded
+
+    def _keyword_scores(self, words: List[str], n_slots: int) -> np.ndarray:
+        """모든 단어가 일치하는 문서의 점수 합 (불일치 문서는 0)"""
+        scores = np.zeros(n_slots, dtype=np.int64)
+        matched = np.ones(n_slots, dtype=bool)
+        for word in words:
+            word_scores = self._word_scores(word, n_slots)
+            matched &= word_scores > 0
+            if not matched.any():
+                break
+            scores += word_scores
+        scores[~matched] = 0
+        return scores
+
+    def _jamo_scores(self, query: str, n_slots: int) -> np.ndarray:
+        """메뉴명 초성/자모 접두 일치 또는 편집 거리 일치 점수 (거리가 작을수록 높음)"""
+        scores = np.zeros(n_slots, dtype=np.int64)
+        if has_jamo(query):
+            slots = self._jamo.prefix_ids(query)
+            scores[slots] = JAMO_MATCH_SCORE
+        else:
+            for slot, distance in self._jamo.fuzzy(query):
+                scores[slot] = JAMO_MATCH_SCORE - distance
+        return scores
+
+    def _word_scores(self, word: str, n_slots: int) -> np.ndarray:
+        """검색어 단어 하나의 문서별 점수 (불일치 문서는 0)"""
+        if len(word) == 1:
+            # 한 글자 단어: 그 글자로 시작하는 토큰 중 하나라도 있으면 일치
+            scores = np.zeros(n_slots, dtype=np.int64)
+            for token in self._prefix_tokens(word):
+                slots, weights = self._posting(token)
+                np.maximum.at(scores, slots, weights)
+            return scores
+
+        scores = np.zeros(n_slots, dtype=np.int64)
+        required = np.ones(n_slots, dtype=bool)
+        for token in dict.fromkeys(bigram_tokens(word)):
+            posting = self._posting(token)
+            if posting is None:
+                return np.zeros(n_slots, dtype=np.int64)
+            slots, weights = posting
+            hit = np.zeros(n_slots, dtype=bool)
+            hit[slots] = True
+            required &= hit
+            scores[slots] += weights
+        exact = self._posting(WORD_TOKEN_PREFIX + word)
+        if exact is not None:
+            slots, weights = exact
+            scores[slots] += weights * WORD_MATCH_BOOST
+        scores[~required] = 0
+        return scores
+
+    def _prefix_tokens(self, prefix: str) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(
+                token
+                for token in self._postings
+                if not token.startswith(WORD_TOKEN_PREFIX)
+            )
+        vocabulary = self._vocabulary
+        start = int(np.searchsorted(vocabulary, prefix)) if vocabulary else 0
+        tokens = []
+        for token in vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            tokens.append(token)
+        return tokens
+
+    def _ensure_columns(self) -> Dict[str, np.ndarray]:
+        """문서 번호 순서의 속성 열 (변경 후 첫 조회 시 한 번 생성)"""
+        if self._columns is not None:
+            return self._columns
+        docs = self._docs
+        columns: Dict[str, np.ndarray] = {
+            "alive": np.array([doc is not None for doc in docs], dtype=bool),
+            "calories": np.array(
+                [
+                    doc.calories if doc and doc.calories is not None else np.nan
+                    for doc in docs
+                ],
+                dtype=np.float64,
+            ),
+            "rating": np.array(
+                [(doc.rating or 0.0) if doc else 0.0 for doc in docs], dtype=np.float64
+            ),
+        }
+        for name in EQUALITY_FILTERS:
+            columns[name] = np.array(
+                [getattr(doc, name) if doc else None for doc in docs], dtype=object
+            )
+        names = [doc.name if doc else "" for doc in docs]
+        name_rank = np.empty(len(docs), dtype=np.int64)
+        name_rank[sorted(range(len(docs)), key=names.__getitem__)] = np.arange(
+            len(docs)
+        )
+        columns["name_rank"] = name_rank
+        self._columns = columns
+        return columns
+
+    @staticmethod
+    def _facet_counts(
+        columns: Dict[str, np.ndarray], slots: np.ndarray, facets: Sequence[str]
+    ) -> Dict[str, Any]:
+        counts: Dict[str, Any] = {}
+        for name in facets:
+            values = columns[name][slots]
+            if name in FLAG_FILTERS:
+                counts[name] = int(np.count_nonzero(values.astype(bool)))
+            else:
+                counter = Counter(value for value in values if value is not None)
+                counts[name] = dict(counter.most_common())
+        return counts
+
+    @staticmethod
+    def _filter_mask(
+        columns: Dict[str, np.ndarray], filters: Mapping[str, Any]
+    ) -> np.ndarray:
+        mask = np.ones(len(columns["alive"]), dtype=bool)
+        for key, value in filters.items():
+            if value is None:
+                continue
+            if key in EQUALITY_FILTERS:
+                if key == "category_id":
+                    value = str(value)
+                mask &= columns[key] == value
+            elif key in RANGE_FILTERS:
+                column, compare = RANGE_FILTERS[key]
+                with np.errstate(invalid="ignore"):
+                    mask &= compare(columns[column], value)
+            else:
+                raise ValueError(f"지원하지 않는 검색 필터입니다: {key}")
+        return mask
+
+
+# 전역 메뉴 검색 색인 (워커 프로세스별)
+menu_search_index = MenuSearchIndex()
+
+
+# 색인/트라이 재구성은 워커 안에서 한 번에 하나만 (동시 호출은 앞선 재구성을 기다림)
+_refresh_lock = asyncio.Lock()
+
+
+class MenuSearchIndexService:
+    """
+    메뉴 검색 색인 관리 서비스
+    - 카탈로그 버전(메뉴/카테고리 수와 최종 수정 시각)이 바뀐 경우에만 DB 조회
+    - 메뉴만 바뀌었으면 수정 시각 이후 메뉴만 다시 색인, 카테고리가 바뀌면 전체 재색인
+    - 색인이 바뀔 때마다 자동완성 트라이도 재구성
+    - 자동완성 인기도(즐겨찾기 수)는 별도 주기로 확인 (refresh_popularity)
+    """
+
+    @staticmethod
+    async def load_version(db: AsyncSession) -> CatalogVersion:
+        menu_count, menu_updated = (
+            await db.execute(select(func.count(Menu.id), func.max(Menu.updated_at)))
+        ).one()
+        category_count, category_updated = (
+            await db.execute(
+                select(
+                    func.count(Category.id),
+                    func.max(func.coalesce(Category.updated_at, Category.created_at)),
+                )
+            )
+        ).one()
+        return (menu_count, menu_updated, category_count, category_updated)
+
+    @staticmethod
+    async def load_documents(
+        db: AsyncSession, since: Optional[datetime] = None
+    ) -> List[MenuDocument]:
+        """색인 대상 메뉴 (since가 있으면 그 이후 수정된 메뉴, 비활성 포함)"""
+        stmt = select(Menu).options(selectinload(Menu.category))
+        if since is None:
+            stmt = stmt.where(Menu.is_active)
+        else:
+            stmt = stmt.where(Menu.updated_at >= since)
+        result = await db.execute(stmt)
+        return [MenuDocument.from_menu(menu) for menu in result.scalars().all()]
+
+    @staticmethod
+    async def refresh(db: AsyncSession) -> int:
+        """
+        카탈로그 버전이 바뀌었으면 색인에 반영
+        Returns:
+            다시 색인한 문서 수 (변경 없으면 0)
+        """
+        async with _refresh_lock:
+            return await MenuSearchIndexService._refresh(db)
+
+    @staticmethod
+    async def refresh_popularity(db: AsyncSession) -> int:
+        """즐겨찾기 수가 바뀌었으면 현재 색인 문서로 자동완성 트라이 재구성"""
+        async with _refresh_lock:
+            if not menu_search_index.is_built:
+                return 0
+            return await SuggestService.refresh_popularity(
+                db, menu_search_index.documents()
+            )
+
+    @staticmethod
+    async def _refresh(db: AsyncSession) -> int:
+        version = await MenuSearchIndexService.load_version(db)
+        # 다른 워커/경로의 변경이면 통계 재집계 (이 워커 변경은 이미 증감 반영)
+        await SearchStatsService.sync(db, version)
+        current = menu_search_index.version
+        if (
+            version == current
+            and menu_search_index.is_built
+            and suggestion_trie.is_built
+        ):
+            return 0
+
+        started = time.perf_counter()
+        if current is None or current[1] is None or version[2:] != current[2:]:
+            documents = await MenuSearchIndexService.load_documents(db)
+            count = menu_search_index.rebuild(documents, version)
+            await SuggestService.rebuild(db, menu_search_index.documents())
+            logger.info(
+                f"메뉴 검색 색인 {count}건 재구성 "
+                f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+            )
+            return count
+
+        documents = await MenuSearchIndexService.load_documents(db, since=current[1])
+        # 삭제된 메뉴는 수정 시각으로 알 수 없으므로 현재 id 목록과 비교
+        live_ids = (await db.execute(select(Menu.id))).scalars().all()
+        count = menu_search_index.update(documents, live_ids, version)
+        await SuggestService.rebuild(db, menu_search_index.documents())
+        logger.debug(
+            f"메뉴 검색 색인 {count}건 증분 반영 "
+            f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+        )
+        return count
+
+    @staticmethod
+    async def menu_exists(db: AsyncSession, menu_id: uuid.UUID) -> bool:
+        """
+        메뉴 존재 확인 (색인된 활성 메뉴는 메모리에서 바로 확인)
+        - 색인에 없으면(색인 전, 신규/비활성 메뉴) 기본키 조회
+        """
+        if menu_id in menu_search_index:
+            return True
+        return await db.get(Menu, menu_id) is not None
+
+    @staticmethod
+    async def load() -> int:
+        """시작 시 색인 구성 (별도 세션)"""
+        async with AsyncSessionLocal() as db:
+            return await MenuSearchIndexService.refresh(db)
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        query: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        offset: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """색인 검색 결과 페이지 (search_with_facets 참고)"""
+        page, _ = await MenuSearchIndexService.search_with_facets(
+            db, query, filters, offset, limit, cursor
+        )
+        return page
+
+    @staticmethod
+    async def search_with_facets(
+        db: AsyncSession,
+        query: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        offset: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        facets: Sequence[str] = (),
+    ) -> Tuple[Page, Dict[str, Any]]:
+        """
+        색인으로 찾은 메뉴 id를 순서대로 적재 (카테고리 포함)
+        - 커서는 다음 시작 위치 (색인 안에서 건너뛰기 비용이 없어 키셋 불필요)
+        - 패싯별 수는 같은 검색에서 메모리로 집계 (DB 조회 없음)
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        if cursor:
+            offset = decode_offset_cursor(SEARCH_CURSOR_NAME, cursor)
+        menu_ids, total, facet_counts = menu_search_index.search_with_facets(
+            query, filters, offset, limit, facets
+        )
+        next_cursor = None
+        if total > offset + limit:
+            next_cursor = encode_offset_cursor(SEARCH_CURSOR_NAME, offset + limit)
+        if not menu_ids:
+            return Page([], next_cursor, total), facet_counts
+        result = await db.execute(
+            select(Menu)
+            .options(selectinload(Menu.category))
+            .where(Menu.id.in_(menu_ids))
+        )
+        menus = {menu.id: menu for menu in result.scalars().all()}
+        page = Page(
+            [menus[menu_id] for menu_id in menu_ids if menu_id in menus],
+            next_cursor,
+            total,
+        )
+        return page, facet_counts
+
+
+async def _menu_search_index_refresh_loop():
+    """카탈로그 버전 변경 확인 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(settings.menu_search_index_refresh_interval_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                await MenuSearchIndexService.refresh(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"메뉴 검색 색인 갱신 중 오류: {e}")
+
+
+async def _suggest_popularity_refresh_loop():
+    """자동완성 인기도(즐겨찾기 수) 확인 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(settings.suggest_popularity_refresh_interval_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                await MenuSearchIndexService.refresh_popularity(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"자동완성 인기도 갱신 중 오류: {e}")
+
+
+def start_suggest_popularity_scheduler() -> asyncio.Task:
+    """자동완성 인기도 갱신 백그라운드 작업 시작"""
+    task = asyncio.create_task(
+        _suggest_popularity_refresh_loop(), name="SuggestPopularityRefreshTask"
+    )
+    logger.info("자동완성 인기도 갱신 스케줄러 시작")
+    return task
+
+
+def start_menu_search_index_scheduler() -> asyncio.Task:
+    """메뉴 검색 색인 갱신 백그라운드 작업 시작"""
+    task = asyncio.create_task(
+        _menu_search_index_refresh_loop(), name="MenuSearchIndexRefreshTask"
+    )
+    logger.info("메뉴 검색 색인 갱신 스케줄러 시작")
+    return task
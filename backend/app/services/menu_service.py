@@ -5,12 +5,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.cache import cached
+from app.core.cache import cache_key, cached, search_count_cache
+from app.core.pagination import Page
 from app.models.favorite import Favorite
 from app.models.menu import Menu
 from app.core.exceptions import NotFoundException
 from app.repositories.menu_repository import MenuRepository
 from app.repositories.favorite_repository import FavoriteRepository
+from app.services.search_stats_service import menu_stats_key, search_stats
 
 
 class MenuService:
@@ -23,30 +25,52 @@ class MenuService:
         self.favorite_repository = FavoriteRepository(db)
 
     async def create(self, obj_in: Dict[str, Any]) -> Menu:
-        return await self.menu_repository.create(obj_in)
+        menu = await self.menu_repository.create(obj_in)
+        search_count_cache.clear()
+        search_stats.apply(None, menu_stats_key(menu), menu.updated_at)
+        return menu
 
     async def update(
         self, menu_id: uuid.UUID, obj_in: Dict[str, Any]
     ) -> Optional[Menu]:
-        return await self.menu_repository.update(menu_id, obj_in)
+        before = await self.menu_repository.get_by_id(menu_id)
+        before_key = menu_stats_key(before) if before else None
+        menu = await self.menu_repository.update(menu_id, obj_in)
+        search_count_cache.clear()
+        if menu is not None:
+            # 세션 식별 맵의 같은 객체일 수 있어 DB 값으로 다시 읽음
+            await self.menu_repository.db.refresh(menu)
+            search_stats.apply(before_key, menu_stats_key(menu), menu.updated_at)
+        return menu
 
     async def delete(self, menu_id: uuid.UUID) -> bool:
-        return await self.menu_repository.delete(menu_id)
+        before = await self.menu_repository.get_by_id(menu_id)
+        deleted = await self.menu_repository.delete(menu_id)
+        search_count_cache.clear()
+        if deleted and before is not None:
+            search_stats.apply(menu_stats_key(before), None)
+        return deleted
 
     @cached(ttl=3600, key_prefix="menu_by_id")
     async def get_by_id_with_category(self, menu_id: uuid.UUID) -> Optional[Menu]:
         return await self.menu_repository.get_by_id_with_category(menu_id)
 
     @cached(ttl=1800, key_prefix="menu_all")
-    async def get_all_with_category(self, skip: int = 0, limit: int = 50) -> List[Menu]:
-        return await self.menu_repository.get_all_with_category(skip, limit)
+    async def get_all_with_category(
+        self, skip: int = 0, limit: int = 50, cursor: Optional[str] = None
+    ) -> Page:
+        return await self.menu_repository.get_all_with_category(skip, limit, cursor)
 
     @cached(ttl=1800, key_prefix="menu_by_category")
     async def get_menus_by_category(
-        self, category_id: uuid.UUID, skip: int = 0, limit: int = 50
-    ) -> List[Menu]:
+        self,
+        category_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page:
         return await self.menu_repository.get_menus_by_category(
-            category_id, skip, limit
+            category_id, skip, limit, cursor
         )
 
     async def search_menus(
@@ -58,10 +82,32 @@ class MenuService:
         cooking_time: Optional[int] = None,
         skip: int = 0,
         limit: int = 50,
-    ) -> List[Menu]:
-        return await self.menu_repository.search_menus(
-            query, category_id, cuisine_type, difficulty, cooking_time, skip, limit
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Page:
+        """
+        메뉴 검색
+        - include_total이면 Page.total에 조건에 맞는 전체 건수를 채움
+          (첫 조회는 같은 쿼리의 count(*) OVER(), 커서 페이지는 조건별 캐시)
+        - 검색어 앞뒤/연속 공백은 조회 전에 정리 (건수 캐시 키와 같은 검색어로 조회)
+        """
+        query = " ".join((query or "").split())
+        filters = (query, category_id, cuisine_type, difficulty, cooking_time)
+        page = await self.menu_repository.search_menus(
+            *filters, skip, limit, cursor, with_total=include_total
         )
+        if not include_total:
+            return page
+        # 검색 조건은 대소문자를 구분하지 않으므로(ILIKE/tsquery) 소문자로 키 통일
+        key = cache_key(query.lower(), *filters[1:])
+        if page.total is not None:
+            search_count_cache.set(key, page.total)
+            return page
+        page.total = search_count_cache.get(key)
+        if page.total is None:
+            page.total = await self.menu_repository.count_search_menus(*filters)
+            search_count_cache.set(key, page.total)
+        return page
 
     @cached(ttl=900, key_prefix="menu_popular")
     async def get_popular_menus(self, limit: int = 10) -> List[Menu]:
@@ -96,8 +142,10 @@ class FavoriteService:
         )
         if existing:
             raise ValueError("이미 찜한 메뉴입니다.")
-        favorite_data = {"user_id": user_id, "menu_id": menu_id, "is_active": True}
-        favorite = await self.favorite_repository.create(favorite_data)
+        # 즐겨찾기 행과 메뉴 즐겨찾기 수를 한 트랜잭션으로 기록
+        favorite = await self.favorite_repository.add(user_id, menu_id)
+        await self.menu_repository.add_favorite_count(menu_id, 1)
+        await self.favorite_repository.db.commit()
         stmt = (
             select(Favorite)
             .options(selectinload(Favorite.menu).selectinload(Menu.category))
@@ -114,9 +162,15 @@ class FavoriteService:
         )
 
     async def get_user_favorites(
-        self, user_id: uuid.UUID, skip: int = 0, limit: int = 50
-    ) -> List[Favorite]:
-        return await self.favorite_repository.get_user_favorites(user_id, skip, limit)
+        self,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        return await self.favorite_repository.get_user_favorites(
+            user_id, skip, limit, cursor
+        )
 
     async def remove_favorite(self, user_id: uuid.UUID, menu_id: uuid.UUID) -> bool:
         favorite = await self.favorite_repository.get_favorite_by_user_and_menu(
@@ -124,5 +178,12 @@ class FavoriteService:
         )
         if not favorite:
             return False
-        await self.favorite_repository.delete(favorite.id)
-        return True
+        removed = await self.favorite_repository.remove(favorite.id)
+        if removed and favorite.is_active:
+            await self.menu_repository.add_favorite_count(menu_id, -1)
+        await self.favorite_repository.db.commit()
+        return removed
+
+    async def reconcile_favorite_counts(self) -> int:
+        """메뉴 즐겨찾기 수 카운터를 실제 즐겨찾기 수로 보정 (보정한 메뉴 수)"""
+        return await self.menu_repository.reconcile_favorite_counts()
@@ -0,0 +1,490 @@
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.preference_vector import BASE_FIELDS, PreferenceVector
+from app.models.favorite import Favorite
+from app.models.menu import Menu
+from app.models.user_preference import UserInteraction, UserPreference
+from app.schemas.user_preference import CollaborativeRecommendation
+
+logger = get_logger(__name__)
+
+# 유사도 계산에 사용하는 선호도 속성 (순서 고정)
+PREFERENCE_VECTOR_FIELDS = BASE_FIELDS
+
+
+def preference_to_vector(preference: UserPreference) -> np.ndarray:
+    """선호도 객체의 기본 속성 벡터 (패킹 벡터에서 복사, 변환 없음)"""
+    return preference.vector.base.copy()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (영벡터는 그대로 0)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+@dataclass
+class NeighborEntry:
+    """세션별 사전 계산 결과 (이웃 목록 + 후보 메뉴)"""
+
+    vector: np.ndarray
+    neighbors: List[Tuple[str, float]]
+    candidates: List[CollaborativeRecommendation]
+    computed_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class NeighborSnapshot:
+    """전체 재계산에 사용하는 활성 선호도/좋아요 스냅샷"""
+
+    session_ids: List[str]
+    user_ids: List[Optional[uuid.UUID]]
+    matrix: np.ndarray  # (n, 10) 원본 선호도 벡터
+    liked_by_session: Dict[str, Set[uuid.UUID]]
+    liked_by_user: Dict[uuid.UUID, Set[uuid.UUID]]
+    menu_names: Dict[uuid.UUID, str]
+    user_by_session: Dict[str, Optional[uuid.UUID]] = field(init=False)
+
+    def __post_init__(self):
+        self.user_by_session = dict(zip(self.session_ids, self.user_ids))
+
+
+class NeighborIndex:
+    """
+    협업 필터링 이웃 목록 저장소
+    - 활성 세션의 정규화된 선호도 행렬과 세션별 상위 N 이웃/후보 메뉴 보관
+    - 조회는 딕셔너리 한 번으로 끝남
+    - 선호도 변화량이 임계값을 넘은 세션만 dirty로 표시 후 개별 재계산
+    - 활성 행렬 밖 세션(처음 보는/익명 세션) 결과는 max_transient 개까지 LRU로 보관
+    - 스레드 안전 (참조 교체는 lock 안에서 원자적으로 수행, 행렬은 copy-on-write)
+    """
+
+    def __init__(
+        self,
+        neighbor_count: int = 20,
+        candidate_count: int = 50,
+        min_similarity: float = 0.3,
+        drift_threshold: float = 0.1,
+        max_transient: int = 10000,
+    ):
+        self.neighbor_count = neighbor_count
+        self.candidate_count = candidate_count
+        self.min_similarity = min_similarity
+        self.drift_threshold = drift_threshold
+        self.max_transient = max_transient
+        self._lock = threading.RLock()
+        self._entries: Dict[str, NeighborEntry] = {}
+        self._transient: "OrderedDict[str, NeighborEntry]" = OrderedDict()
+        self._dirty: Set[str] = set()
+        self._snapshot: Optional[NeighborSnapshot] = None
+        self._normalized = np.zeros((0, len(PREFERENCE_VECTOR_FIELDS)), np.float32)
+        self._row_by_session: Dict[str, int] = {}
+        self._stats = {"rebuilds": 0, "session_refreshes": 0, "hits": 0, "misses": 0}
+        self.built_at: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def get(self, session_id: str) -> Optional[NeighborEntry]:
+        """세션의 사전 계산 결과 조회"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                entry = self._transient.get(session_id)
+                if entry is not None:
+                    self._transient.move_to_end(session_id)
+            self._stats["hits" if entry else "misses"] += 1
+            return entry
+
+    def rebuild(self, snapshot: NeighborSnapshot) -> int:
+        """스냅샷으로 모든 활성 세션의 이웃 목록을 다시 계산 후 교체"""
+        self.pop_dirty()
+        return self.swap(snapshot, *self.compute(snapshot))
+
+    def compute(
+        self, snapshot: NeighborSnapshot
+    ) -> Tuple[np.ndarray, Dict[str, NeighborEntry]]:
+        """
+        스냅샷의 정규화 행렬과 세션별 이웃 목록 계산 (O(n²), 공유 상태 변경 없음)
+        - 인덱스 상태를 건드리지 않으므로 워커 스레드에서 실행 가능
+        """
+        normalized = _normalize_rows(snapshot.matrix.astype(np.float32))
+        entries: Dict[str, NeighborEntry] = {}
+        chunk_size = 1024
+        for start in range(0, len(snapshot.session_ids), chunk_size):
+            chunk = normalized[start : start + chunk_size]
+            similarities = chunk @ normalized.T
+            for offset in range(chunk.shape[0]):
+                row = start + offset
+                sims = similarities[offset]
+                sims[row] = -1.0  # 자기 자신 제외
+                neighbors = self._top_neighbors(sims, snapshot.session_ids)
+                session_id = snapshot.session_ids[row]
+                entries[session_id] = NeighborEntry(
+                    vector=snapshot.matrix[row].copy(),
+                    neighbors=neighbors,
+                    candidates=self._build_candidates(
+                        neighbors,
+                        snapshot,
+                        self._liked_menus(snapshot, session_id, snapshot.user_ids[row]),
+                    ),
+                )
+        return normalized, entries
+
+    def swap(
+        self,
+        snapshot: NeighborSnapshot,
+        normalized: np.ndarray,
+        entries: Dict[str, NeighborEntry],
+    ) -> int:
+        """
+        compute 결과로 참조 교체 (lock 안에서 원자적으로)
+        - dirty 표시는 유지 (스냅샷 적재 후 계산 중에 바뀐 세션은 다음 주기에 재계산)
+        """
+        with self._lock:
+            self._snapshot = snapshot
+            self._normalized = normalized
+            self._row_by_session = {
+                sid: idx for idx, sid in enumerate(snapshot.session_ids)
+            }
+            self._entries = entries
+            # 활성 행렬이 바뀌었으므로 행렬 밖 세션은 다음 조회 때 다시 계산
+            self._transient.clear()
+            self.built_at = time.time()
+            self._stats["rebuilds"] += 1
+        return len(entries)
+
+    def refresh_session(
+        self,
+        session_id: str,
+        user_id: Optional[uuid.UUID],
+        vector: np.ndarray,
+    ) -> NeighborEntry:
+        """
+        한 세션의 이웃 목록만 재계산
+        - 활성 세션이면 정규화 행렬의 해당 행을 복사본에서 바꿔 교체 (읽는 쪽은 이전 행렬 유지)
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector)) or 1.0
+        unit = vector / norm
+        with self._lock:
+            snapshot = self._snapshot
+            normalized = self._normalized
+            row = self._row_by_session.get(session_id)
+            if snapshot is not None and row is not None:
+                normalized = normalized.copy()
+                normalized[row] = unit
+                self._normalized = normalized
+
+        if snapshot is None:
+            entry = NeighborEntry(vector=vector.copy(), neighbors=[], candidates=[])
+        else:
+            sims = normalized @ unit
+            if row is not None:
+                sims[row] = -1.0
+            neighbors = self._top_neighbors(sims, snapshot.session_ids)
+            entry = NeighborEntry(
+                vector=vector.copy(),
+                neighbors=neighbors,
+                candidates=self._build_candidates(
+                    neighbors,
+                    snapshot,
+                    self._liked_menus(snapshot, session_id, user_id),
+                ),
+            )
+
+        with self._lock:
+            if row is not None:
+                self._entries[session_id] = entry
+            else:
+                self._transient[session_id] = entry
+                self._transient.move_to_end(session_id)
+                while len(self._transient) > self.max_transient:
+                    self._transient.popitem(last=False)
+            self._dirty.discard(session_id)
+            self._stats["session_refreshes"] += 1
+        return entry
+
+    def observe(self, session_id: str, vector: Iterable[float]) -> bool:
+        """
+        선호도 변경 통지
+        - 사전 계산 당시 벡터와의 L2 거리가 임계값을 넘으면 dirty로 표시
+        Returns:
+            dirty 표시 여부
+        """
+        with self._lock:
+            entry = self._entries.get(session_id) or self._transient.get(session_id)
+            if entry is None:
+                return False
+            drift = float(
+                np.linalg.norm(np.asarray(vector, dtype=np.float32) - entry.vector)
+            )
+            if drift > self.drift_threshold:
+                self._dirty.add(session_id)
+                return True
+            return False
+
+    def pop_dirty(self) -> Set[str]:
+        """재계산 대기 중인 세션 목록을 꺼냄"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            return dirty
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._transient.clear()
+            self._dirty.clear()
+            self._snapshot = None
+            self._normalized = np.zeros((0, len(PREFERENCE_VECTOR_FIELDS)), np.float32)
+            self._row_by_session = {}
+            self.built_at = None
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                **self._stats,
+                "sessions": len(self._entries),
+                "transient_sessions": len(self._transient),
+                "active_sessions": len(self._row_by_session),
+                "dirty": len(self._dirty),
+                "built_at": self.built_at or 0,
+            }
+
+    def _top_neighbors(
+        self, similarities: np.ndarray, session_ids: List[str]
+    ) -> List[Tuple[str, float]]:
+        """유사도 배열에서 임계값 이상인 상위 N개 이웃 추출"""
+        if similarities.size == 0:
+            return []
+        k = min(self.neighbor_count, similarities.size)
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [
+            (session_ids[i], float(similarities[i]))
+            for i in top
+            if similarities[i] > self.min_similarity
+        ]
+
+    @staticmethod
+    def _liked_menus(
+        snapshot: NeighborSnapshot, session_id: str, user_id: Optional[uuid.UUID]
+    ) -> Set[uuid.UUID]:
+        liked = set(snapshot.liked_by_session.get(session_id, ()))
+        if user_id is not None:
+            liked |= snapshot.liked_by_user.get(user_id, set())
+        return liked
+
+    def _build_candidates(
+        self,
+        neighbors: List[Tuple[str, float]],
+        snapshot: NeighborSnapshot,
+        own_liked: Set[uuid.UUID],
+    ) -> List[CollaborativeRecommendation]:
+        """이웃들이 좋아한 메뉴를 모아 유사도 평균 순으로 후보 생성"""
+        totals: Dict[uuid.UUID, List[float]] = {}
+        for neighbor_session, similarity in neighbors:
+            liked = self._liked_menus(
+                snapshot,
+                neighbor_session,
+                snapshot.user_by_session.get(neighbor_session),
+            )
+            for menu_id in liked:
+                if menu_id in own_liked or menu_id not in snapshot.menu_names:
+                    continue
+                totals.setdefault(menu_id, []).append(similarity)
+
+        candidates = [
+            CollaborativeRecommendation(
+                menu_id=menu_id,
+                menu_name=snapshot.menu_names[menu_id],
+                similarity_score=sum(sims) / len(sims),
+                similar_users_count=len(sims),
+                reason=f"유사한 취향의 사용자가 좋아한 메뉴 (유사도: {sum(sims) / len(sims):.2f})",
+            )
+            for menu_id, sims in totals.items()
+        ]
+        candidates.sort(
+            key=lambda c: (c.similarity_score, c.similar_users_count), reverse=True
+        )
+        return candidates[: self.candidate_count]
+
+
+# 전역 이웃 인덱스 인스턴스 (워커 프로세스별)
+neighbor_index = NeighborIndex(
+    neighbor_count=settings.collaborative_neighbor_count,
+    candidate_count=settings.collaborative_candidate_count,
+    min_similarity=settings.collaborative_min_similarity,
+    drift_threshold=settings.collaborative_drift_threshold,
+    max_transient=settings.collaborative_max_transient_sessions,
+)
+
+
+class NeighborService:
+    """
+    협업 필터링 이웃 목록 사전 계산/조회 서비스
+    """
+
+    @staticmethod
+    async def load_snapshot(db: AsyncSession) -> NeighborSnapshot:
+        """활성 선호도, 좋아요(즐겨찾기/찜 상호작용), 메뉴 이름을 한 번에 적재"""
+        pref_rows = (
+            (
+                await db.execute(
+                    select(UserPreference).where(
+                        UserPreference.total_interactions
+                        >= settings.collaborative_min_interactions
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        liked_by_user: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+        favorite_rows = await db.execute(
+            select(Favorite.user_id, Favorite.menu_id).where(Favorite.is_active)
+        )
+        for user_id, menu_id in favorite_rows.all():
+            liked_by_user.setdefault(user_id, set()).add(menu_id)
+
+        liked_by_session: Dict[str, Set[uuid.UUID]] = {}
+        interaction_rows = await db.execute(
+            select(UserInteraction.session_id, UserInteraction.menu_id).where(
+                UserInteraction.interaction_type == "favorite",
+                UserInteraction.menu_id.isnot(None),
+            )
+        )
+        for session_id, menu_id in interaction_rows.all():
+            liked_by_session.setdefault(session_id, set()).add(menu_id)
+
+        menu_rows = await db.execute(select(Menu.id, Menu.name).where(Menu.is_active))
+        menu_names = {menu_id: name for menu_id, name in menu_rows.all()}
+
+        matrix = (
+            np.vstack([preference_to_vector(p) for p in pref_rows])
+            if pref_rows
+            else np.zeros((0, len(PREFERENCE_VECTOR_FIELDS)), np.float32)
+        )
+        return NeighborSnapshot(
+            session_ids=[p.session_id for p in pref_rows],
+            user_ids=[p.user_id for p in pref_rows],
+            matrix=matrix,
+            liked_by_session=liked_by_session,
+            liked_by_user=liked_by_user,
+            menu_names=menu_names,
+        )
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> int:
+        """전체 이웃 목록 재계산"""
+        started = time.perf_counter()
+        # 이 시점까지의 변경은 스냅샷에 반영됨
+        neighbor_index.pop_dirty()
+        snapshot = await NeighborService.load_snapshot(db)
+        # 행렬 곱은 워커 스레드에서, 이벤트 루프에서는 참조 교체만
+        normalized, entries = await asyncio.to_thread(neighbor_index.compute, snapshot)
+        count = neighbor_index.swap(snapshot, normalized, entries)
+        logger.info(
+            f"협업 필터링 이웃 목록 {count}개 재계산 완료 "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+        return count
+
+    @staticmethod
+    async def refresh_dirty_sessions(db: AsyncSession) -> int:
+        """선호도가 크게 변한 세션의 이웃 목록만 재계산"""
+        dirty = neighbor_index.pop_dirty()
+        if not dirty:
+            return 0
+        result = await db.execute(
+            select(UserPreference).where(UserPreference.session_id.in_(dirty))
+        )
+        preferences = result.scalars().all()
+        for preference in preferences:
+            neighbor_index.refresh_session(
+                preference.session_id,
+                preference.user_id,
+                preference_to_vector(preference),
+            )
+        return len(preferences)
+
+    @staticmethod
+    async def get_recommendations(
+        db: AsyncSession,
+        preference: UserPreference,
+        limit: int = 5,
+    ) -> List[CollaborativeRecommendation]:
+        """
+        사전 계산된 후보 메뉴 조회
+        - 일반적인 경우 딕셔너리 조회 한 번
+        - 처음 보는 세션은 현재 활성 행렬과 한 번만 비교 후 저장
+        - 인덱스 구성 전(기동 직후)에는 빈 목록 (구성은 스케줄러가 담당)
+        """
+        entry = neighbor_index.get(preference.session_id)
+        if entry is None:
+            if not neighbor_index.is_built:
+                return []
+            entry = neighbor_index.refresh_session(
+                preference.session_id,
+                preference.user_id,
+                preference_to_vector(preference),
+            )
+        return [c.model_copy() for c in entry.candidates[:limit]]
+
+    @staticmethod
+    def notify_preference_changed(preference: UserPreference) -> None:
+        """선호도 학습 후 호출 - 변화량이 크면 다음 주기에 재계산"""
+        neighbor_index.observe(preference.session_id, preference_to_vector(preference))
+
+    @staticmethod
+    def notify_vector_changed(session_id: str, vector: PreferenceVector) -> None:
+        """SQL로 학습한 경우 (RETURNING 벡터로 변화량 확인)"""
+        neighbor_index.observe(session_id, vector.base.copy())
+
+
+async def _neighbor_refresh_loop():
+    """전체 재계산(긴 주기)과 dirty 세션 재계산(짧은 주기)을 수행하는 백그라운드 작업"""
+    from app.db.database import AsyncSessionLocal
+
+    last_rebuild = 0.0
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                now = time.time()
+                if (
+                    now - last_rebuild
+                    >= settings.collaborative_refresh_interval_seconds
+                ):
+                    await NeighborService.rebuild(db)
+                    last_rebuild = now
+                else:
+                    refreshed = await NeighborService.refresh_dirty_sessions(db)
+                    if refreshed:
+                        logger.debug(f"이웃 목록 {refreshed}개 세션 재계산")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"이웃 목록 재계산 중 오류: {e}")
+        await asyncio.sleep(settings.collaborative_dirty_check_interval_seconds)
+
+
+def start_neighbor_refresh_scheduler() -> asyncio.Task:
+    """이웃 목록 재계산 백그라운드 작업 시작"""
+    task = asyncio.create_task(_neighbor_refresh_loop(), name="NeighborRefreshTask")
+    logger.info("협업 필터링 이웃 목록 재계산 스케줄러 시작")
+    return task
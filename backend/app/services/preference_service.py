@@ -1,21 +1,53 @@
-import json
-import random
+import hashlib
 import uuid
-from typing import List, Optional
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.cache import cached
-from app.models.favorite import Favorite
+from app.core.config import settings
+from app.core.preference_vector import (
+    BASE_SIZE,
+    PreferenceVector,
+    country_dictionary,
+)
+from app.db.database import AsyncSessionLocal
+from app.models.category import Category
 from app.models.menu import Menu
-from app.models.user_preference import UserInteraction, UserPreference
+from app.models.user_preference import (
+    PreferenceCountry,
+    UserInteraction,
+    UserPreference,
+)
 from app.schemas.user_preference import (
     CollaborativeRecommendation,
     PreferenceAnalysis,
 )
-from app.repositories.user_preference_repository import UserPreferenceRepository
+from app.repositories.user_preference_repository import (
+    LearnedPreference,
+    UserPreferenceRepository,
+)
+from app.services.ab_test_service import AB_GROUPS, AbTestService, ab_bandit
+from app.services.neighbor_service import NeighborService
+from app.services.preference_store import preference_store
+
+
+def apply_interaction_learning(
+    preference: UserPreference, menu: Menu, interaction_strength: float
+) -> None:
+    """
+    메뉴 상호작용 하나를 선호도에 반영 (학습 규칙은 PreferenceVector.learn)
+    - 단건/배치 경로 모두 같은 규칙을 순서대로 적용해 결과가 같도록 유지
+    - menu.category가 로드되어 있고 국가가 사전에 있어야 국가별 선호도가 반영됨
+    """
+    vector = preference.vector
+    vector.learn(menu, interaction_strength)
+    preference.store_vector(vector)
+    preference.total_interactions = (preference.total_interactions or 0) + 1
 
 
 class PreferenceService:
@@ -28,166 +60,359 @@ class PreferenceService:
         self.user_preference_repository = UserPreferenceRepository(db)
 
     @staticmethod
-    @cached(ttl=1800, key_prefix="user_pref")  # 30분 캐싱
+    def assign_ab_group(session_id: str, user_id: Optional[uuid.UUID] = None) -> str:
+        """
+        A/B 테스트 그룹 결정 (행 생성/기본 선호도 시점에만 호출, 이후에는 행의 그룹 사용)
+        - 밴딧 사용 시 그룹별 사후분포에서 Thompson sampling (DB 조회 없음)
+          유저ID(없으면 세션ID)별 배정을 기억해 행 저장 전후 같은 그룹
+        - 밴딧을 끄면 같은 키의 해시로 균등 배정
+        """
+        key = str(user_id or session_id)
+        if settings.ab_bandit_enabled:
+            return ab_bandit.choose(key)
+        return AB_GROUPS[hashlib.md5(key.encode("utf-8")).digest()[0] % len(AB_GROUPS)]
+
+    @staticmethod
+    def prior_preference(
+        session_id: str, user_id: Optional[uuid.UUID] = None
+    ) -> UserPreference:
+        """
+        처음 보는 세션용 기본 선호도 (DB 세션에 추가하지 않는 임시 객체)
+        - 첫 상호작용/찜/퀴즈 답변 때 get_or_create_preference로 행이 생성됨
+        """
+        preference = UserPreference(
+            session_id=session_id,
+            user_id=user_id,
+            ab_group=PreferenceService.assign_ab_group(session_id, user_id),
+            total_interactions=0,
+        )
+        preference.store_vector(PreferenceVector.default())
+        return preference
+
+    @staticmethod
+    async def get_preference(
+        db: AsyncSession, session_id: str, user_id: Optional[uuid.UUID] = None
+    ) -> UserPreference:
+        """
+        추천/분석용 선호도 조회 (읽기 전용)
+        - 저장된 행이 없으면 기본 선호도를 반환하고 아무것도 쓰지 않음
+        - 선호도 저장소가 실행 중이면 메모리에서 조회 (없을 때만 DB)
+        """
+        if preference_store.is_running:
+            preference, _ = await preference_store.load(db, session_id, user_id)
+        else:
+            repo = UserPreferenceRepository(db)
+            preference = await repo.get_by_session_or_user(session_id, user_id)
+        return preference or PreferenceService.prior_preference(session_id, user_id)
+
+    @staticmethod
     async def get_or_create_preference(
         db: AsyncSession, session_id: str, user_id: Optional[uuid.UUID] = None
     ) -> UserPreference:
-        """사용자 선호도 조회 또는 생성 - 캐싱 적용"""
-        repo = UserPreferenceRepository(db)
-        preference = await repo.get_by_session_or_user(session_id, user_id)
-        if not preference:
-            ab_group = random.choice(["A", "B", "C"])
-            # A/B 테스트 그룹 무작위 할당
-            preference = UserPreference(
-                session_id=session_id, user_id=user_id, ab_group=ab_group
+        """
+        학습용 선호도 조회 또는 생성 (상호작용/찜/퀴즈 답변 경로)
+        - 생성은 ON CONFLICT 업서트라 동시 첫 요청에도 행이 하나만 생김
+        """
+        ab_group = PreferenceService.assign_ab_group(session_id, user_id)
+        if preference_store.is_running:
+            preference, created = await preference_store.load(
+                db, session_id, user_id, ab_group
             )
-            db.add(preference)
+        else:
+            repo = UserPreferenceRepository(db)
+            preference, created = await repo.get_or_create(
+                session_id, user_id, ab_group
+            )
+        if created:
             await db.commit()
-            await db.refresh(preference)
-
         return preference
 
     @staticmethod
     async def record_interaction(
         db: AsyncSession, interaction_data: dict
     ) -> UserInteraction:
-        """사용자 상호작용 기록"""
+        """
+        사용자 상호작용 기록
+        - 상호작용 INSERT와 선호도 학습 UPDATE를 한 트랜잭션으로 묶어 커밋 한 번
+          (둘 중 하나만 반영되는 일이 없음)
+        - 선호도 저장소 실행 여부와 관계없이 학습은 SQL 한 문장,
+          저장소에 보관 중인 항목은 커밋 후 RETURNING 값으로 갱신
+        """
         # 딕셔너리에서 직접 UserInteraction 모델 생성
         interaction = UserInteraction(**interaction_data)
         db.add(interaction)
-        await db.commit()
-        await db.refresh(interaction)
+        await db.flush()  # INSERT (기본값 채움), 커밋은 학습 후 함께
 
         # 선호도 업데이트
-        await PreferenceService._update_preference_from_interaction(db, interaction)
+        learned = await PreferenceService._update_preference_from_interaction(
+            db, interaction
+        )
+        await db.commit()
 
+        ab_group = None
+        if learned is not None:
+            preference_store.absorb(learned)
+            # 선호도 변화량이 크면 이웃 목록 재계산 대상으로 표시
+            NeighborService.notify_vector_changed(
+                learned.session_id,
+                PreferenceVector.from_packed(learned.preference_vector),
+            )
+            ab_group = learned.ab_group
+
+        # A/B 테스트 밴딧/시간별 집계 (선호도 행의 그룹 기준)
+        await AbTestService.record_event(
+            ab_group
+            or PreferenceService.assign_ab_group(
+                interaction.session_id, interaction.user_id
+            ),
+            interaction.interaction_type,
+        )
         return interaction
 
     @staticmethod
-    async def _update_preference_from_interaction(
-        db: AsyncSession, interaction: UserInteraction
-    ):
-        """상호작용을 기반으로 선호도 업데이트"""
-        if not interaction.menu_id:
-            return
+    async def record_interactions_bulk(
+        db: AsyncSession,
+        interactions: List[dict],
+        use_copy: bool = False,
+        menus: Optional[Dict[uuid.UUID, Menu]] = None,
+        commit: bool = True,
+        rollup_action_type: Optional[str] = None,
+    ) -> int:
+        """
+        상호작용 여러 건을 한 트랜잭션으로 기록
+        - 메뉴는 IN 조회 한 번, 상호작용은 다중 행 INSERT(또는 COPY) 한 번
+        - 같은 세션의 선호도는 한 번만 조회해 순서대로 학습 후 한 번에 UPDATE
+        - 카탈로그에 없는 menu_id는 버림
+        Args:
+            use_copy: asyncpg COPY로 기록 (대량 적재용)
+            menus: 이미 조회한 메뉴 맵 (없으면 조회)
+            commit: False면 호출 측 트랜잭션에서 커밋
+            rollup_action_type: A/B 집계에 기록할 타입 (없으면 상호작용 타입 그대로)
+        Returns:
+            기록된 상호작용 수
+        """
+        if menus is None:
+            menus = await PreferenceService.load_menus_by_ids(
+                db, (item.get("menu_id") for item in interactions)
+            )
+        rows = [
+            {**item, "id": item.get("id") or uuid.uuid4()}
+            for item in interactions
+            if not item.get("menu_id") or item["menu_id"] in menus
+        ]
+        if not rows:
+            return 0
 
-        # 메뉴 정보 조회 (category까지 eager load)
-        stmt = (
-            select(Menu)
-            .options(selectinload(Menu.category))
-            .where(Menu.id == interaction.menu_id)
+        await PreferenceService.ensure_countries(
+            menu.category.country for menu in menus.values() if menu.category
         )
-        result = await db.execute(stmt)
-        menu = result.scalar_one_or_none()
+        if use_copy:
+            await PreferenceService._copy_interactions(db, rows)
+        else:
+            await db.execute(insert(UserInteraction), rows)
+        preferences = await PreferenceService._learn_from_interactions(db, rows, menus)
+        if commit:
+            await db.commit()
 
-        if not menu:
-            return
+        for preference in {id(p): p for p in preferences.values()}.values():
+            NeighborService.notify_preference_changed(preference)
+
+        # A/B 테스트 밴딧/시간별 집계 (선호도 행의 그룹 기준, (그룹, 타입)별로 합쳐 한 번에)
+        counts = Counter()
+        for row in rows:
+            key = (row["session_id"], row.get("user_id"))
+            preference = preferences.get(key)
+            ab_group = (
+                preference.ab_group
+                if preference is not None
+                else PreferenceService.assign_ab_group(*key)
+            )
+            counts[(ab_group, rollup_action_type or row["interaction_type"])] += 1
+        await AbTestService.record_events(
+            (ab_group, action_type, count)
+            for (ab_group, action_type), count in counts.items()
+        )
+        return len(rows)
 
-        # 선호도 조회
-        preference = await PreferenceService.get_or_create_preference(
-            db, interaction.session_id, interaction.user_id
+    @staticmethod
+    async def _copy_interactions(db: AsyncSession, rows: List[dict]) -> None:
+        """
+        asyncpg COPY로 user_interactions 적재
+        - 세션의 현재 트랜잭션 안에서 실행 (커밋은 호출 측)
+        - created_at은 컬럼 기본값(now()) 사용
+        """
+        columns = [
+            "id",
+            "user_id",
+            "session_id",
+            "menu_id",
+            "interaction_type",
+            "interaction_strength",
+            "extra_data",
+        ]
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            UserInteraction.__tablename__,
+            records=[
+                (
+                    row["id"],
+                    row.get("user_id"),
+                    row["session_id"],
+                    row.get("menu_id"),
+                    row["interaction_type"],
+                    row.get("interaction_strength", 1.0),
+                    row.get("extra_data") or "{}",
+                )
+                for row in rows
+            ],
+            columns=columns,
         )
 
-        # 학습률 (시간이 지날수록 감소)
-        learning_rate = 0.1 * interaction.interaction_strength
+    @staticmethod
+    async def load_menus_by_ids(
+        db: AsyncSession, menu_ids: Iterable[Optional[uuid.UUID]]
+    ) -> Dict[uuid.UUID, Menu]:
+        """메뉴(category 포함)를 IN 조회 한 번으로 적재"""
+        ids = {menu_id for menu_id in menu_ids if menu_id}
+        if not ids:
+            return {}
+        stmt = select(Menu).options(selectinload(Menu.category)).where(Menu.id.in_(ids))
+        result = await db.execute(stmt)
+        return {menu.id: menu for menu in result.scalars().all()}
 
-        # 메뉴 속성에 따른 선호도 업데이트
-        if menu.is_spicy:
-            preference.spicy_preference = min(
-                1.0, preference.spicy_preference + learning_rate
-            )
-        else:
-            preference.spicy_preference = max(
-                0.0, preference.spicy_preference - learning_rate * 0.5
+    @staticmethod
+    async def ensure_countries(names: Iterable[Optional[str]]) -> None:
+        """
+        국가 사전에 없는 국가를 preference_countries에 추가 후 사전 갱신
+        - 인덱스가 호출 측 트랜잭션 롤백에 영향받지 않도록 별도 세션에서 커밋
+        - 모두 알고 있는 국가면 DB 조회 없음
+        """
+        missing = country_dictionary.missing(names)
+        if not missing:
+            return
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                pg_insert(PreferenceCountry)
+                .values([{"name": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=["name"])
             )
+            await session.commit()
+            await PreferenceService._reload_countries(session)
 
-        if menu.is_healthy:
-            preference.healthy_preference = min(
-                1.0, preference.healthy_preference + learning_rate
-            )
-        else:
-            preference.healthy_preference = max(
-                0.0, preference.healthy_preference - learning_rate * 0.5
-            )
+    @staticmethod
+    async def load_country_dictionary() -> int:
+        """시작 시 국가 사전 적재 (카테고리 국가 중 없는 것은 추가)"""
+        async with AsyncSessionLocal() as session:
+            await PreferenceService._reload_countries(session)
+            countries = await session.execute(select(Category.country).distinct())
+        await PreferenceService.ensure_countries(countries.scalars().all())
+        return country_dictionary.size - BASE_SIZE
 
-        if menu.is_vegetarian:
-            preference.vegetarian_preference = min(
-                1.0, preference.vegetarian_preference + learning_rate
-            )
-        else:
-            preference.vegetarian_preference = max(
-                0.0, preference.vegetarian_preference - learning_rate * 0.5
-            )
+    @staticmethod
+    async def _reload_countries(session: AsyncSession) -> None:
+        rows = await session.execute(
+            select(PreferenceCountry.id, PreferenceCountry.name)
+        )
+        country_dictionary.register(rows.all())
 
-        if menu.is_quick:
-            preference.quick_preference = min(
-                1.0, preference.quick_preference + learning_rate
-            )
-        else:
-            preference.quick_preference = max(
-                0.0, preference.quick_preference - learning_rate * 0.5
-            )
+    @staticmethod
+    async def _learn_from_interactions(
+        db: AsyncSession, interactions: List[dict], menus: Dict[uuid.UUID, Menu]
+    ) -> Dict[Tuple[str, Optional[uuid.UUID]], UserPreference]:
+        """
+        세션별로 묶어 선호도 학습 (커밋하지 않음)
+        - 상호작용 순서대로 같은 학습 규칙을 벡터에 적용하고 한 번만 패킹하므로
+          단건 경로를 여러 번 호출한 것과 같은 값이 됨
+        - 선호도 저장소가 실행 중이면 메모리에 적용하고 DB 기록은 저장소 flush에 맡김
+        - 아니면 행을 FOR UPDATE로 잠가 단건 학습 UPDATE와 직렬화
+        Returns:
+            (세션ID, 유저ID) → 학습한 선호도 (같은 행을 여러 키가 가리킬 수 있음)
+        """
+        groups: Dict[Tuple[str, Optional[uuid.UUID]], List[dict]] = {}
+        for item in interactions:
+            if item.get("menu_id") in menus:
+                key = (item["session_id"], item.get("user_id"))
+                groups.setdefault(key, []).append(item)
 
-        if menu.has_rice:
-            preference.rice_preference = min(
-                1.0, preference.rice_preference + learning_rate
-            )
-        else:
-            preference.rice_preference = max(
-                0.0, preference.rice_preference - learning_rate * 0.5
-            )
+        repo = UserPreferenceRepository(db)
+        preferences: Dict[Tuple[str, Optional[uuid.UUID]], UserPreference] = {}
+        # 행 잠금 순서를 고정해 동시 배치끼리 교착되지 않도록 정렬
+        ordered = sorted(groups.items(), key=lambda g: (g[0][0], str(g[0][1])))
+        for (session_id, user_id), items in ordered:
+            ab_group = PreferenceService.assign_ab_group(session_id, user_id)
+            if preference_store.is_running:
+                preference, _ = await preference_store.learn(
+                    db,
+                    session_id,
+                    user_id,
+                    [
+                        (menus[item["menu_id"]], item.get("interaction_strength", 1.0))
+                        for item in items
+                    ],
+                    ab_group,
+                )
+                preferences[(session_id, user_id)] = preference
+                continue
 
-        if menu.has_soup:
-            preference.soup_preference = min(
-                1.0, preference.soup_preference + learning_rate
+            # 학습 UPDATE(LEARNING_UPDATE)와 같은 행을 고치므로 잠근 뒤 읽고-수정-쓰기
+            preference, _ = await repo.get_or_create(
+                session_id, user_id, ab_group, for_update=True
             )
-        else:
-            preference.soup_preference = max(
-                0.0, preference.soup_preference - learning_rate * 0.5
+            vector = preference.vector
+            for item in items:
+                vector.learn(
+                    menus[item["menu_id"]], item.get("interaction_strength", 1.0)
+                )
+            preference.store_vector(vector)
+            preference.total_interactions = (preference.total_interactions or 0) + len(
+                items
             )
+            # 저장소의 낙관적 기록(version 비교)이 이 변경을 덮어쓰지 않도록 버전 증가
+            preference.version = (preference.version or 0) + 1
+            preferences[(session_id, user_id)] = preference
+        return preferences
 
-        if menu.has_meat:
-            preference.meat_preference = min(
-                1.0, preference.meat_preference + learning_rate
-            )
-        else:
-            preference.meat_preference = max(
-                0.0, preference.meat_preference - learning_rate * 0.5
-            )
+    @staticmethod
+    async def _update_preference_from_interaction(
+        db: AsyncSession, interaction: UserInteraction
+    ) -> Optional[LearnedPreference]:
+        """
+        상호작용 하나를 학습 UPDATE ... FROM menus ... RETURNING 한 문장으로 반영
+        - 행 잠금 안에서 계산하므로 같은 세션의 동시 상호작용/저장소 flush와도 유실 없음
+          (저장소 flush는 version이 바뀌었으므로 충돌 후 재적용)
+        - 첫 상호작용이면 행을 업서트한 뒤 한 번 더 (커밋하지 않음, 호출 측 트랜잭션)
+        Returns:
+            RETURNING 결과 (메뉴가 없어 학습하지 않았으면 None)
+        """
+        if not interaction.menu_id:
+            return None
 
-        # 시간대별 선호도 업데이트
-        if menu.time_slot == "breakfast":
-            preference.breakfast_preference = min(
-                1.0, preference.breakfast_preference + learning_rate
-            )
-        elif menu.time_slot == "lunch":
-            preference.lunch_preference = min(
-                1.0, preference.lunch_preference + learning_rate
-            )
-        elif menu.time_slot == "dinner":
-            preference.dinner_preference = min(
-                1.0, preference.dinner_preference + learning_rate
+        repo = UserPreferenceRepository(db)
+        args = (
+            interaction.session_id,
+            interaction.user_id,
+            interaction.menu_id,
+            interaction.interaction_strength,
+        )
+        learned = await repo.apply_interaction(*args)
+        if learned is None:
+            await repo.get_or_create(
+                interaction.session_id,
+                interaction.user_id,
+                PreferenceService.assign_ab_group(
+                    interaction.session_id, interaction.user_id
+                ),
             )
-
-        # 국가별 선호도 업데이트
-        if menu.category and menu.category.country:
-            country_prefs = json.loads(preference.country_preferences or "{}")
-            country = menu.category.country
-            current_pref = country_prefs.get(country, 0.5)
-            country_prefs[country] = min(1.0, current_pref + learning_rate)
-            preference.country_preferences = json.dumps(country_prefs)
-
-        preference.total_interactions += 1
-        await db.commit()
+            learned = await repo.apply_interaction(*args)
+        return learned
 
     @staticmethod
     async def get_preference_analysis(
         db: AsyncSession, session_id: str, user_id: Optional[uuid.UUID] = None
     ) -> PreferenceAnalysis:
         """사용자 선호도 분석"""
-        preference = await PreferenceService.get_or_create_preference(
-            db, session_id, user_id
-        )
+        preference = await PreferenceService.get_preference(db, session_id, user_id)
 
         # 선호도 요약
         preference_summary = {
@@ -219,7 +444,7 @@ class PreferenceService:
         last_activity = (
             recent_interaction.created_at
             if recent_interaction
-            else preference.last_updated
+            else preference.last_updated or datetime.now(timezone.utc)
         )
 
         return PreferenceAnalysis(
@@ -237,12 +462,12 @@ class PreferenceService:
         db: AsyncSession, session_id: str, user_id: Optional[uuid.UUID] = None
     ) -> Optional[UserInteraction]:
         """최근 상호작용 조회"""
+        condition = UserInteraction.session_id == session_id
+        if user_id is not None:
+            condition = condition | (UserInteraction.user_id == user_id)
         stmt = (
             select(UserInteraction)
-            .where(
-                (UserInteraction.session_id == session_id)
-                | (UserInteraction.user_id == user_id)
-            )
+            .where(condition)
             .order_by(desc(UserInteraction.created_at))
             .limit(1)
         )
@@ -257,137 +482,13 @@ class PreferenceService:
         user_id: Optional[uuid.UUID] = None,
         limit: int = 5,
     ) -> List[CollaborativeRecommendation]:
-        """협업 필터링 기반 추천"""
-        # 현재 사용자의 선호도
-        current_preference = await PreferenceService.get_or_create_preference(
+        """협업 필터링 기반 추천 (사전 계산된 이웃 목록 조회)"""
+        current_preference = await PreferenceService.get_preference(
             db, session_id, user_id
         )
-
-        # 다른 사용자들의 선호도 조회
-        stmt = select(UserPreference).where(
-            UserPreference.id != current_preference.id,
-            UserPreference.total_interactions >= 5,  # 최소 상호작용 수
-        )
-        result = await db.execute(stmt)
-        other_preferences = result.scalars().all()
-
-        if not other_preferences:
-            return []
-
-        # 유사도 계산 및 추천
-        recommendations = []
-        for other_pref in other_preferences:
-            similarity = PreferenceService._calculate_similarity(
-                current_preference, other_pref
-            )
-
-            if similarity > 0.3:  # 유사도 임계값
-                # 유사한 사용자가 좋아한 메뉴들 조회
-                similar_user_menus = await PreferenceService._get_user_favorite_menus(
-                    db, other_pref.session_id, other_pref.user_id
-                )
-
-                for menu in similar_user_menus:
-                    # 현재 사용자가 이미 좋아하는 메뉴는 제외
-                    if not await PreferenceService._is_user_favorite(
-                        db, session_id, user_id, menu.id
-                    ):
-                        recommendations.append(
-                            CollaborativeRecommendation(
-                                menu_id=menu.id,
-                                menu_name=menu.name,
-                                similarity_score=similarity,
-                                similar_users_count=1,
-                                reason=f"유사한 취향의 사용자가 좋아한 메뉴 (유사도: {similarity:.2f})",
-                            )
-                        )
-
-        # 중복 제거 및 정렬
-        unique_recommendations = {}
-        for rec in recommendations:
-            if rec.menu_id not in unique_recommendations:
-                unique_recommendations[rec.menu_id] = rec
-            else:
-                # 동일 메뉴에 대해 유사도 합산
-                existing = unique_recommendations[rec.menu_id]
-                existing.similarity_score = (
-                    existing.similarity_score + rec.similarity_score
-                ) / 2
-                existing.similar_users_count += 1
-
-        # 유사도 순으로 정렬
-        sorted_recommendations = sorted(
-            unique_recommendations.values(),
-            key=lambda x: x.similarity_score,
-            reverse=True,
-        )
-
-        return sorted_recommendations[:limit]
+        return await NeighborService.get_recommendations(db, current_preference, limit)
 
     @staticmethod
     def _calculate_similarity(pref1: UserPreference, pref2: UserPreference) -> float:
         """두 사용자의 선호도 유사도 계산 (코사인 유사도)"""
-        # 선호도 벡터 생성
-        vector1 = [
-            pref1.spicy_preference,
-            pref1.healthy_preference,
-            pref1.vegetarian_preference,
-            pref1.quick_preference,
-            pref1.rice_preference,
-            pref1.soup_preference,
-            pref1.meat_preference,
-            pref1.breakfast_preference,
-            pref1.lunch_preference,
-            pref1.dinner_preference,
-        ]
-
-        vector2 = [
-            pref2.spicy_preference,
-            pref2.healthy_preference,
-            pref2.vegetarian_preference,
-            pref2.quick_preference,
-            pref2.rice_preference,
-            pref2.soup_preference,
-            pref2.meat_preference,
-            pref2.breakfast_preference,
-            pref2.lunch_preference,
-            pref2.dinner_preference,
-        ]
-
-        # 코사인 유사도 계산
-        dot_product = sum(a * b for a, b in zip(vector1, vector2))
-        magnitude1 = sum(a * a for a in vector1) ** 0.5
-        magnitude2 = sum(b * b for b in vector2) ** 0.5
-
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-
-        return dot_product / (magnitude1 * magnitude2)
-
-    @staticmethod
-    async def _get_user_favorite_menus(
-        db: AsyncSession, session_id: str, user_id: Optional[uuid.UUID] = None
-    ) -> List[Menu]:
-        """사용자가 좋아한 메뉴들 조회"""
-        stmt = (
-            select(Menu)
-            .join(Favorite)
-            .where((Favorite.session_id == session_id) | (Favorite.user_id == user_id))
-        )
-        result = await db.execute(stmt)
-        return result.scalars().all()
-
-    @staticmethod
-    async def _is_user_favorite(
-        db: AsyncSession,
-        session_id: str,
-        user_id: Optional[uuid.UUID],
-        menu_id: uuid.UUID,
-    ) -> bool:
-        """사용자가 특정 메뉴를 좋아하는지 확인"""
-        stmt = select(Favorite).where(
-            Favorite.menu_id == menu_id,
-            (Favorite.session_id == session_id) | (Favorite.user_id == user_id),
-        )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return pref1.vector.cosine(pref2.vector)
@@ -0,0 +1,388 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Integer, column, func, inspect, select, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, REAL, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.preference_vector import BASE_FIELDS, PreferenceVector
+from app.db.database import AsyncSessionLocal
+from app.models.menu import Menu
+from app.models.user_preference import UserPreference
+from app.repositories.user_preference_repository import (
+    LearnedPreference,
+    UserPreferenceRepository,
+)
+
+logger = get_logger(__name__)
+
+PreferenceKey = Tuple[str, Optional[uuid.UUID]]
+LearnEvent = Tuple[Menu, float]
+
+# 행이 아직 보이지 않을 때(생성 트랜잭션 미커밋) 기록을 재시도할 최대 횟수
+MAX_MISSING_RETRIES = 3
+
+
+def _snapshot(preference: UserPreference) -> UserPreference:
+    """
+    보관 중인 선호도의 복사본 (요청마다 별도 인스턴스)
+    - 식별자를 유지한 분리(detached) 상태라 is_persisted는 원본과 같음
+    - 요청 측에서 값을 바꿔도 저장소 상태와 다른 요청에 영향 없음
+    """
+    copy = UserPreference(
+        **{
+            attr.key: getattr(preference, attr.key)
+            for attr in inspect(UserPreference).column_attrs
+        }
+    )
+    copy.preference_vector = list(preference.preference_vector or [])
+    make_transient_to_detached(copy)
+    return copy
+
+
+class _StoreEntry:
+    """선호도 행 하나의 메모리 상태"""
+
+    __slots__ = ("preference", "pending", "keys", "loaded_at", "missing")
+
+    def __init__(self, preference: UserPreference):
+        self.preference = preference
+        # 마지막 기록 이후 학습 이벤트 (충돌 시 재적용)
+        self.pending: List[LearnEvent] = []
+        self.keys: Set[PreferenceKey] = set()
+        self.loaded_at = time.monotonic()
+        self.missing = 0
+
+
+class PreferenceStore:
+    """
+    프로세스 내 선호도 write-back 저장소
+    - 자주 쓰는 세션의 선호도를 LRU로 보관 (조회는 딕셔너리 접근)
+    - 학습은 메모리에서 바로 적용하고 flush 주기마다 변경분만 UPDATE 한 번으로 기록
+    - 기록은 version이 같을 때만 성공 (낙관적 동시성 제어)
+      충돌하면 DB 값을 다시 읽어 아직 기록되지 않은 학습 이벤트를 재적용 후 다음 주기에 기록
+    - 변경 없는 항목은 ttl이 지나면 DB에서 다시 읽음 (다른 워커의 학습 반영)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 50000,
+        flush_interval: float = 5.0,
+        flush_batch_size: int = 500,
+        ttl: float = 300,
+    ):
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[uuid.UUID, _StoreEntry]" = OrderedDict()
+        self._keys: Dict[PreferenceKey, uuid.UUID] = {}
+        # 기록 전 변경분이 있는 항목 (LRU에서 밀려나도 기록 전까지 유지)
+        self._dirty: Dict[uuid.UUID, _StoreEntry] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "learned": 0,
+            "written": 0,
+            "conflicts": 0,
+            "flushes": 0,
+            "dropped": 0,
+            "evictions": 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get(
+        self, session_id: str, user_id: Optional[uuid.UUID] = None
+    ) -> Optional[UserPreference]:
+        """메모리에 있는 선호도의 복사본 조회 (없거나 만료되면 None)"""
+        entry = self._lookup(session_id, user_id)
+        return _snapshot(entry.preference) if entry else None
+
+    async def load(
+        self,
+        db: AsyncSession,
+        session_id: str,
+        user_id: Optional[uuid.UUID] = None,
+        create_ab_group: Optional[str] = None,
+    ) -> Tuple[Optional[UserPreference], bool]:
+        """
+        메모리에 없으면 DB에서 읽어 보관
+        - create_ab_group이 있으면 행이 없을 때 업서트로 생성 (커밋은 호출 측)
+        Returns:
+            (선호도 또는 None, 이번 호출에서 행을 생성했는지 여부)
+        """
+        entry, created = await self._load_entry(
+            db, session_id, user_id, create_ab_group
+        )
+        return (_snapshot(entry.preference) if entry else None), created
+
+    async def learn(
+        self,
+        db: AsyncSession,
+        session_id: str,
+        user_id: Optional[uuid.UUID],
+        events: List[LearnEvent],
+        ab_group: str,
+    ) -> Tuple[UserPreference, bool]:
+        """
+        학습 이벤트를 메모리 선호도에 순서대로 적용 (DB 기록은 다음 flush)
+        Returns:
+            (학습 후 선호도 복사본, 이번 호출에서 행을 생성했는지 여부)
+        """
+        entry, created = await self._load_entry(db, session_id, user_id, ab_group)
+        preference = entry.preference
+
+        vector = preference.vector
+        for menu, strength in events:
+            vector.learn(menu, strength)
+        preference.store_vector(vector)
+        preference.total_interactions = (preference.total_interactions or 0) + len(
+            events
+        )
+        entry.pending.extend(events)
+        self._dirty[preference.id] = entry
+        self._stats["learned"] += len(events)
+        return _snapshot(preference), created
+
+    def absorb(self, learned: LearnedPreference) -> None:
+        """
+        SQL 학습 UPDATE(커밋 완료)의 RETURNING 값을 보관 중인 항목에 반영
+        - 기록 전 학습이 남은 항목은 그대로 둠 (다음 flush가 버전 충돌로 DB 값을 읽어 재적용)
+        """
+        entry = self._entries.get(learned.id)
+        if entry is None or entry.pending:
+            return
+        preference = entry.preference
+        if learned.version <= (preference.version or 0):
+            return
+        preference.store_vector(PreferenceVector.from_packed(learned.preference_vector))
+        preference.total_interactions = learned.total_interactions
+        preference.version = learned.version
+        entry.loaded_at = time.monotonic()
+
+    async def flush(self) -> int:
+        """
+        변경된 선호도를 UPDATE ... FROM (VALUES ...) 로 기록
+        Returns:
+            기록된 행 수
+        """
+        async with self._flush_lock:
+            written = 0
+            dirty = list(self._dirty.items())
+            for start in range(0, len(dirty), self.flush_batch_size):
+                written += await self._flush_batch(
+                    dirty[start : start + self.flush_batch_size]
+                )
+            if dirty:
+                self._stats["flushes"] += 1
+            return written
+
+    def start(self) -> asyncio.Task:
+        """주기적 flush 백그라운드 작업 시작 (이벤트 루프 안에서 호출)"""
+        self._task = asyncio.create_task(self._run(), name="PreferenceStoreFlushTask")
+        logger.info(
+            f"선호도 저장소 시작 (최대 {self.max_entries}개, "
+            f"{self.flush_interval}초마다 기록)"
+        )
+        return self._task
+
+    async def stop(self) -> None:
+        """flush 작업 종료 후 남은 변경분 기록"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await self.flush()
+        logger.info(f"선호도 저장소 종료 ({self._stats})")
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys.clear()
+        self._dirty.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "dirty": len(self._dirty),
+            "pending_events": sum(len(e.pending) for e in self._dirty.values()),
+            "max_entries": self.max_entries,
+        }
+
+    def _lookup(
+        self, session_id: str, user_id: Optional[uuid.UUID]
+    ) -> Optional[_StoreEntry]:
+        row_id = self._keys.get((session_id, user_id))
+        entry = self._entries.get(row_id) if row_id else None
+        if entry is None or (
+            row_id not in self._dirty and time.monotonic() - entry.loaded_at > self.ttl
+        ):
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(row_id)
+        self._stats["hits"] += 1
+        return entry
+
+    async def _load_entry(
+        self,
+        db: AsyncSession,
+        session_id: str,
+        user_id: Optional[uuid.UUID],
+        create_ab_group: Optional[str],
+    ) -> Tuple[Optional[_StoreEntry], bool]:
+        entry = self._lookup(session_id, user_id)
+        if entry is not None:
+            return entry, False
+
+        repo = UserPreferenceRepository(db)
+        created = False
+        if create_ab_group:
+            preference, created = await repo.get_or_create(
+                session_id, user_id, create_ab_group
+            )
+        else:
+            preference = await repo.get_by_session_or_user(session_id, user_id)
+        if preference is None:
+            return None, False
+        db.expunge(preference)  # 요청 세션과 분리해 저장소만 보관 (요청에는 복사본)
+        return self._adopt(preference, (session_id, user_id)), created
+
+    def _adopt(self, preference: UserPreference, key: PreferenceKey) -> _StoreEntry:
+        """
+        DB에서 읽은 선호도를 보관
+        - 같은 행에 기록 전 변경분이 있으면 메모리 쪽을 유지 (DB 값이 더 오래됨)
+        """
+        entry = self._dirty.get(preference.id)
+        if entry is None:
+            entry = self._entries.get(preference.id)
+            if entry is None:
+                entry = _StoreEntry(preference)
+            else:
+                entry.preference = preference
+                entry.loaded_at = time.monotonic()
+        entry.keys.add(key)
+        self._keys[key] = preference.id
+        self._entries[preference.id] = entry
+        self._entries.move_to_end(preference.id)
+        while len(self._entries) > self.max_entries:
+            row_id, evicted = self._entries.popitem(last=False)
+            for evicted_key in evicted.keys:
+                if self._keys.get(evicted_key) == row_id:
+                    del self._keys[evicted_key]
+            self._stats["evictions"] += 1
+        return entry
+
+    async def _flush_batch(self, batch: List[Tuple[uuid.UUID, _StoreEntry]]) -> int:
+        # (행 ID, 항목, 보낸 버전, 보낸 이벤트 수) - 기록 중 추가된 학습은 다음 주기로
+        snapshots = [
+            (row_id, entry, entry.preference.version or 0, len(entry.pending))
+            for row_id, entry in batch
+        ]
+        table = UserPreference.__table__
+        rows = values(
+            column("id", UUID(as_uuid=True)),
+            column("version", Integer),
+            column("total", Integer),
+            column("vec", ARRAY(REAL)),
+            name="v",
+        ).data(
+            [
+                (
+                    row_id,
+                    version,
+                    entry.preference.total_interactions or 0,
+                    entry.preference.vector.to_packed(),
+                )
+                for row_id, entry, version, _ in snapshots
+            ]
+        )
+        stmt = (
+            update(table)
+            .where(table.c.id == rows.c.id, table.c.version == rows.c.version)
+            .values(
+                preference_vector=rows.c.vec,
+                total_interactions=rows.c.total,
+                version=table.c.version + 1,
+                last_updated=func.now(),
+                **{field: rows.c.vec[i + 1] for i, field in enumerate(BASE_FIELDS)},
+            )
+            .returning(table.c.id)
+        )
+
+        async with AsyncSessionLocal() as db:
+            written = set((await db.execute(stmt)).scalars().all())
+            await db.commit()
+            stale = [row_id for row_id, *_ in snapshots if row_id not in written]
+            fresh: Dict[uuid.UUID, UserPreference] = {}
+            if stale:
+                result = await db.execute(
+                    select(UserPreference).where(UserPreference.id.in_(stale))
+                )
+                fresh = {p.id: p for p in result.scalars().all()}
+
+        for row_id, entry, version, sent in snapshots:
+            if row_id in written:
+                entry.preference.version = version + 1
+                entry.missing = 0
+                del entry.pending[:sent]
+                if not entry.pending:
+                    self._dirty.pop(row_id, None)
+            elif row_id in fresh:
+                self._rebase(entry, fresh[row_id])
+            else:
+                entry.missing += 1
+                if entry.missing > MAX_MISSING_RETRIES:
+                    self._dirty.pop(row_id, None)
+                    self._entries.pop(row_id, None)
+                    self._stats["dropped"] += len(entry.pending)
+                    logger.warning(
+                        f"선호도 행을 찾을 수 없어 학습 {len(entry.pending)}건 버림: {row_id}"
+                    )
+        self._stats["written"] += len(written)
+        self._stats["conflicts"] += len(fresh)
+        return len(written)
+
+    def _rebase(self, entry: _StoreEntry, current: UserPreference) -> None:
+        """다른 워커가 먼저 기록한 값 위에 기록 전 학습 이벤트를 다시 적용"""
+        preference = entry.preference
+        vector = current.vector.copy()
+        for menu, strength in entry.pending:
+            vector.learn(menu, strength)
+        preference.store_vector(vector)
+        preference.total_interactions = (current.total_interactions or 0) + len(
+            entry.pending
+        )
+        preference.version = current.version
+        entry.loaded_at = time.monotonic()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                # 종료 중 취소되어도 진행 중인 기록은 끝까지 처리 (stop의 flush가 이어서 대기)
+                await asyncio.shield(self.flush())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"선호도 저장소 flush 실패: {e}")
+
+
+# 전역 선호도 저장소 (워커 프로세스별)
+preference_store = PreferenceStore(
+    max_entries=settings.preference_store_max_entries,
+    flush_interval=settings.preference_store_flush_interval_seconds,
+    flush_batch_size=settings.preference_store_flush_batch_size,
+    ttl=settings.preference_store_ttl_seconds,
+)
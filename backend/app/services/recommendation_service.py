@@ -4,22 +4,39 @@ import uuid
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.cache import cached
-from app.core.config_weights import get_weight_set
+from app.core.config_weights import compile_weights, weight_registry
 from app.core.utils import menu_to_dict
 from app.models.menu import Menu, TimeSlot
 from app.models.recommendation import RecommendationLog
 from app.models.user_answer import UserAnswer
 from app.models.user_preference import UserInteraction, UserPreference
 from app.schemas.menu import MenuRecommendation, MenuResponse
+from app.services.ab_test_service import AUTO_SELECT_ACTION_TYPE, AbTestService
+from app.services.als_service import ALSService
 from app.services.preference_service import PreferenceService
 from app.repositories.recommendation_repository import RecommendationRepository
 from app.repositories.menu_repository import MenuRepository
 from app.repositories.user_preference_repository import UserPreferenceRepository
 
+# 콘텐츠 기반 점수의 선호도 속성 가중치 (ATTRIBUTE_KEYS 순서 벡터)
+CONTENT_ATTRIBUTE_WEIGHTS = compile_weights(
+    {
+        "spicy": 2.0,
+        "healthy": 2.0,
+        "vegetarian": 2.0,
+        "quick": 1.5,
+        "rice": 1.5,
+        "soup": 1.5,
+        "meat": 1.5,
+    }
+)
+
 
 class RecommendationService:
     """
@@ -45,19 +62,13 @@ class RecommendationService:
         """시간대별 개인화 추천 (선호도 기반) - 캐싱 적용"""
         slot = time_slot.value if hasattr(time_slot, "value") else time_slot
 
-        # 사용자 선호도 조회
-        preference = await PreferenceService.get_or_create_preference(
-            db, session_id, user_id
-        )
+        # 사용자 선호도 조회 (처음 보는 세션은 저장하지 않는 기본 선호도)
+        preference = await PreferenceService.get_preference(db, session_id, user_id)
 
         # 시간대별 선호도에 따른 가중치 적용
-        time_weight = 1.0
-        if slot == "breakfast":
-            time_weight = preference.breakfast_preference
-        elif slot == "lunch":
-            time_weight = preference.lunch_preference
-        elif slot == "dinner":
-            time_weight = preference.dinner_preference
+        time_weight = preference.vector.time_slot(slot)
+        # ab_group 가중치 세트는 요청당 한 번만 조회
+        weights = weight_registry.get(preference.ab_group).vector
 
         # 메뉴 조회 및 점수 계산
         menu_repo = MenuRepository(db)
@@ -75,7 +86,7 @@ class RecommendationService:
         menu_scores = []
         for menu in menus:
             score = RecommendationService._calculate_personalized_score(
-                menu, preference, time_weight
+                menu, preference, time_weight, weights
             )
             menu_scores.append((menu, score))
 
@@ -106,6 +117,8 @@ class RecommendationService:
             {"time_slot": slot, "category_id": category_id},
             recommendations,
             "personalized_simple",
+            persist=preference.is_persisted,
+            ab_group=preference.ab_group,
         )
 
         return recommendations
@@ -140,9 +153,8 @@ class RecommendationService:
         )
         if not required_menus:
             return []
-        preference = await PreferenceService.get_or_create_preference(
-            db, session_id, user_id
-        )
+        # 행은 아래 답변 학습(_save_user_answers_and_learn)에서 생성
+        preference = await PreferenceService.get_preference(db, session_id, user_id)
         menu_scores = []
         for menu in required_menus:
             content_score = RecommendationService._calculate_content_score(
@@ -172,7 +184,7 @@ class RecommendationService:
                 )
             )
         await RecommendationService._save_user_answers_and_learn(
-            db, session_id, user_id, answers, recommendations
+            db, session_id, user_id, answers, recommendations, preference.ab_group
         )
         return recommendations
 
@@ -188,13 +200,21 @@ class RecommendationService:
             db, session_id, user_id, limit
         )
 
+        if not collaborative_recs:
+            return []
+
+        # 후보 메뉴 정보는 한 번에 조회
+        stmt = (
+            select(Menu)
+            .options(selectinload(Menu.category))
+            .where(Menu.id.in_([rec.menu_id for rec in collaborative_recs]))
+        )
+        result = await db.execute(stmt)
+        menus_by_id = {menu.id: menu for menu in result.scalars().all()}
+
         recommendations = []
         for rec in collaborative_recs:
-            # 메뉴 정보 조회
-            stmt = select(Menu).where(Menu.id == rec.menu_id)
-            result = await db.execute(stmt)
-            menu = result.scalar_one_or_none()
-
+            menu = menus_by_id.get(rec.menu_id)
             if menu:
                 # 유사도 점수를 0-1 범위로 정규화
                 normalized_score = min(rec.similarity_score, 1.0)
@@ -209,6 +229,52 @@ class RecommendationService:
 
         return recommendations
 
+    @staticmethod
+    async def get_latent_recommendations(
+        db: AsyncSession,
+        session_id: str,
+        preference: UserPreference,
+        limit: int = 5,
+    ) -> List[MenuRecommendation]:
+        """
+        ALS 잠재요인 기반 추천 (오프라인 학습 요인 행렬 사용)
+        - preference는 호출 측에서 조회한 선호도 (A/B 그룹, 로그 저장 여부에 사용)
+        """
+        scored = await ALSService.get_recommendations(db, session_id, limit)
+        if not scored:
+            return []
+
+        stmt = (
+            select(Menu)
+            .options(selectinload(Menu.category))
+            .where(Menu.id.in_([menu_id for menu_id, _ in scored]), Menu.is_active)
+        )
+        result = await db.execute(stmt)
+        menus_by_id = {menu.id: menu for menu in result.scalars().all()}
+
+        # 내적 점수를 0-1 범위로 정규화 (최고 점수 기준)
+        max_score = max(scored[0][1], 1e-6)
+        recommendations = [
+            MenuRecommendation(
+                menu=MenuResponse.model_validate(menu_to_dict(menus_by_id[menu_id])),
+                score=max(0.0, min(score / max_score, 1.0)),
+                reason="비슷한 선택 패턴을 가진 사용자들의 취향을 반영한 추천",
+            )
+            for menu_id, score in scored
+            if menu_id in menus_by_id
+        ]
+
+        await RecommendationService._save_recommendation_log(
+            db,
+            session_id,
+            {},
+            recommendations,
+            "als_latent",
+            persist=preference.is_persisted,
+            ab_group=preference.ab_group,
+        )
+        return recommendations
+
     @staticmethod
     async def record_user_interaction(
         db: AsyncSession,
@@ -236,31 +302,19 @@ class RecommendationService:
 
     @staticmethod
     def _calculate_personalized_score(
-        menu: Menu, preference: UserPreference, time_weight: float
+        menu: Menu,
+        preference: UserPreference,
+        time_weight: float,
+        weights: np.ndarray,
     ) -> float:
         """
-        ab_group별로 가중치 세트 다르게 적용 (config_weights.py 연동)
+        ab_group별로 가중치 세트 다르게 적용
+        - weights: 호출 측이 요청당 한 번 조회한 컴파일된 가중치 벡터 (config_weights)
         """
-        ab_group = getattr(preference, "ab_group", None) or "A"
-        weights = get_weight_set(ab_group)
-
         score = 5.0  # 기본 점수
 
         # 메뉴 속성별 가중치 적용
-        if menu.is_spicy:
-            score += preference.spicy_preference * weights["spicy"]
-        if menu.is_healthy:
-            score += preference.healthy_preference * weights["healthy"]
-        if menu.is_vegetarian:
-            score += preference.vegetarian_preference * weights["vegetarian"]
-        if menu.is_quick:
-            score += preference.quick_preference * weights["quick"]
-        if menu.has_rice:
-            score += preference.rice_preference * weights["rice"]
-        if menu.has_soup:
-            score += preference.soup_preference * weights["soup"]
-        if menu.has_meat:
-            score += preference.meat_preference * weights["meat"]
+        score += preference.vector.attribute_score(menu, weights)
 
         # 시간대 가중치 적용
         score *= time_weight
@@ -298,20 +352,7 @@ class RecommendationService:
                 score += 2.0
 
         # 선호도 기반 추가 점수
-        if menu.is_spicy:
-            score += preference.spicy_preference * 2.0
-        if menu.is_healthy:
-            score += preference.healthy_preference * 2.0
-        if menu.is_vegetarian:
-            score += preference.vegetarian_preference * 2.0
-        if menu.is_quick:
-            score += preference.quick_preference * 1.5
-        if menu.has_rice:
-            score += preference.rice_preference * 1.5
-        if menu.has_soup:
-            score += preference.soup_preference * 1.5
-        if menu.has_meat:
-            score += preference.meat_preference * 1.5
+        score += preference.vector.attribute_score(menu, CONTENT_ATTRIBUTE_WEIGHTS)
 
         if menu.rating:
             score += menu.rating
@@ -464,6 +505,7 @@ class RecommendationService:
         user_id: Optional[uuid.UUID],
         answers: Dict[str, str],
         recommendations: List[MenuRecommendation],
+        ab_group: Optional[str] = None,
     ):
         """사용자 답변 저장 및 선호도 학습"""
         # 사용자 답변 저장 (answers를 JSON 문자열로 변환)
@@ -474,17 +516,38 @@ class RecommendationService:
         )
         db.add(user_answer)
 
-        # 추천 로그 저장
+        # 추천 로그 저장 (커밋은 아래에서 한 번에)
         await RecommendationService._save_recommendation_log(
-            db, session_id, answers, recommendations, "hybrid_quiz"
+            db,
+            session_id,
+            answers,
+            recommendations,
+            "hybrid_quiz",
+            commit=False,
+            ab_group=ab_group,
         )
 
         # 상호작용 기록 (선호도 학습용)
-        for rec in recommendations:
-            await RecommendationService.record_user_interaction(
-                db, session_id, rec.menu.id, "recommend_select", user_id, 0.8
-            )
-
+        # - 다중 행 INSERT 한 번 + 추천 순서대로 학습한 선호도 UPDATE 한 번
+        # - 답변/로그/상호작용/선호도를 한 트랜잭션으로 커밋
+        # - 사용자가 고른 것이 아니므로 A/B 집계에는 auto_select로 기록 (전환율 제외)
+        interactions = [
+            {
+                "user_id": user_id,
+                "session_id": session_id,
+                "menu_id": rec.menu.id,
+                "interaction_type": "recommend_select",
+                "interaction_strength": 0.8,
+                "extra_data": json.dumps({"source": "quiz"}, ensure_ascii=False),
+            }
+            for rec in recommendations
+        ]
+        await PreferenceService.record_interactions_bulk(
+            db,
+            interactions,
+            commit=False,
+            rollup_action_type=AUTO_SELECT_ACTION_TYPE,
+        )
         await db.commit()
 
     @staticmethod
@@ -494,12 +557,27 @@ class RecommendationService:
         answers: Dict[str, str],
         recommendations: List[MenuRecommendation],
         rec_type: str,
-    ):
-        """추천 로그 저장 (Recommendation + RecommendationLog)"""
+        commit: bool = True,
+        persist: bool = True,
+        ab_group: Optional[str] = None,
+    ) -> Optional[RecommendationLog]:
+        """
+        추천 로그 저장 (Recommendation + RecommendationLog)
+        - 로그 저장 여부와 관계없이 A/B 테스트 밴딧/시간별 집계에 노출 1건 반영
+        """
+        ab_group = ab_group or PreferenceService.assign_ab_group(session_id)
         rec_repo = RecommendationRepository(db)
-        await rec_repo.save_recommendation_log(
-            session_id, answers, recommendations, rec_type
+        log = await rec_repo.save_recommendation_log(
+            session_id,
+            answers,
+            recommendations,
+            rec_type,
+            commit=commit,
+            persist=persist,
+            ab_group=ab_group,
         )
+        await AbTestService.record_event(ab_group, rec_type)
+        return log
 
     @staticmethod
     async def get_ab_group_statistics(
@@ -509,46 +587,15 @@ class RecommendationService:
     ) -> dict:
         """
         ab_group별 추천 성공률(클릭률, 즐겨찾기율 등) 집계
-        - 최근 days일 기준, action_types별로 집계
+        - 최근 days일 기준, action_types별로 집계 (시간별 집계 테이블 사용)
         - 반환: {ab_group: {action_type: 비율, ...}, ...}
         """
-        from datetime import datetime, timedelta
-
-        from sqlalchemy import func
-
-        since = datetime.now() - timedelta(days=days)
-        # 전체 추천 로그 중 기간 내 ab_group/action_type별 카운트 집계
-        stmt = (
-            db.query(
-                RecommendationLog.ab_group,
-                RecommendationLog.action_type,
-                func.count().label("cnt"),
-            )
-            .filter(RecommendationLog.created_at >= since)
-            .filter(RecommendationLog.action_type.in_(action_types))
-            .group_by(RecommendationLog.ab_group, RecommendationLog.action_type)
-        )
-        result = await db.execute(stmt)
-        rows = result.fetchall()
-
-        # 전체 ab_group별 추천 로그 수
-        total_stmt = (
-            db.query(RecommendationLog.ab_group, func.count().label("total"))
-            .filter(RecommendationLog.created_at >= since)
-            .group_by(RecommendationLog.ab_group)
-        )
-        total_result = await db.execute(total_stmt)
-        total_rows = total_result.fetchall()
-        total_map = {row.ab_group: row.total for row in total_rows}
-
-        # 비율 계산
-        stats = {}
-        for row in rows:
-            ab_group = row.ab_group or "A"
-            action_type = row.action_type
-            cnt = row.cnt
-            total = total_map.get(ab_group, 1)
-            if ab_group not in stats:
-                stats[ab_group] = {}
-            stats[ab_group][action_type] = cnt / total
-        return stats
+        statistics = await AbTestService.get_statistics(db, days)
+        return {
+            ab_group: {
+                action_type: rate
+                for action_type, rate in group["rates"].items()
+                if action_type in action_types
+            }
+            for ab_group, group in statistics["groups"].items()
+        }
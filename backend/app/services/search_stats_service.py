@@ -0,0 +1,240 @@
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.category import Category
+from app.models.menu import Menu
+
+logger = get_logger(__name__)
+
+# 시간대 분포에 항상 포함하는 시간대
+STATS_TIME_SLOTS = ("breakfast", "lunch", "dinner")
+
+# 메뉴 하나가 통계에 더하는 값 (시간대, 카테고리 id, 평점)
+MenuStatsKey = Tuple[Optional[str], Optional[uuid.UUID], Optional[float]]
+
+
+def menu_stats_key(menu: Menu) -> MenuStatsKey:
+    return (menu.time_slot, menu.category_id, menu.rating)
+
+
+class SearchStats:
+    """
+    검색 통계 집계 (전체 메뉴 수, 시간대별/국가별 분포, 평균 평점)
+    - 구성은 GROUPING SETS 한 번의 결과 행으로, 이후 메뉴 변경은 증감만 반영
+    - 국가 분포는 카테고리별 수로 보관하고 조회 시 카테고리 → 국가로 합침
+    - 스레드 안전
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._total = 0
+            self._time_slots: Dict[str, int] = {}
+            self._categories: Dict[uuid.UUID, int] = {}
+            self._countries: Dict[uuid.UUID, str] = {}
+            self._rating_count = 0
+            self._rating_sum = 0.0
+            # 마지막 구성 이후 이 워커가 만든/수정한 메뉴의 updated_at
+            self._local_updates: Set[datetime] = set()
+            self.version: Optional[Any] = None
+            self.built_at: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def rebuild(self, rows: Iterable[Tuple], version: Any = None) -> None:
+        """
+        집계 행으로 다시 구성
+        Args:
+            rows: (시간대 그룹 여부, 카테고리 그룹 여부, 시간대, 카테고리 id, 국가,
+                   메뉴 수, 평점 있는 메뉴 수, 평점 합)
+                  그룹 여부는 GROUPING() 값 (0이면 해당 키로 묶인 행)
+        """
+        total, rating_count, rating_sum = 0, 0, 0.0
+        time_slots, categories, countries = {}, {}, {}
+        for (
+            slot_grouped,
+            category_grouped,
+            time_slot,
+            category_id,
+            country,
+            count,
+            rated,
+            rating_total,
+        ) in rows:
+            if not slot_grouped:
+                time_slots[time_slot] = count
+            elif not category_grouped:
+                if category_id is not None:
+                    categories[category_id] = count
+                    countries[category_id] = country
+            else:
+                total, rating_count, rating_sum = count, rated, rating_total or 0.0
+        with self._lock:
+            self._total = total
+            self._time_slots = time_slots
+            self._categories = categories
+            self._countries = countries
+            self._rating_count = rating_count
+            self._rating_sum = float(rating_sum)
+            self._local_updates = set()
+            self.version = version
+            self.built_at = time.time()
+
+    def apply(
+        self,
+        before: Optional[MenuStatsKey],
+        after: Optional[MenuStatsKey],
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        메뉴 생성(before 없음)/수정/삭제(after 없음) 증감 반영
+        - updated_at은 변경 후 메뉴 수정 시각 (카탈로그 버전이 이 워커 변경인지 판단용)
+        """
+        with self._lock:
+            if not self.is_built:
+                return
+            if updated_at is not None:
+                self._local_updates.add(updated_at)
+            for key, sign in ((before, -1), (after, 1)):
+                if key is None:
+                    continue
+                time_slot, category_id, rating = key
+                self._total += sign
+                self._time_slots[time_slot] = self._time_slots.get(time_slot, 0) + sign
+                if category_id is not None:
+                    self._categories[category_id] = (
+                        self._categories.get(category_id, 0) + sign
+                    )
+                if rating is not None:
+                    self._rating_count += sign
+                    self._rating_sum += sign * rating
+
+    def explains(self, version: Any) -> bool:
+        """
+        새 카탈로그 버전이 이 워커의 메뉴 변경(이미 증감 반영)만으로 설명되는지
+        - version은 (메뉴 수, 메뉴 최종 수정 시각, 카테고리 수, 카테고리 최종 수정 시각)
+        - 카테고리가 그대로이고 메뉴 수가 통계와 같으며 최종 수정 시각이
+          이전 버전 또는 이 워커가 만든 수정 시각이면 True
+        """
+        with self._lock:
+            if self.version is None or version is None:
+                return False
+            menu_count, menu_updated = version[0], version[1]
+            return (
+                tuple(version[2:]) == tuple(self.version[2:])
+                and menu_count == self._total
+                and (
+                    menu_updated == self.version[1]
+                    or menu_updated in self._local_updates
+                )
+            )
+
+    def adopt(self, version: Any) -> None:
+        """재집계 없이 버전만 갱신 (explains가 True일 때)"""
+        with self._lock:
+            self.version = version
+
+    def snapshot(self) -> Dict[str, Any]:
+        """/search/stats 응답 형식"""
+        with self._lock:
+            country_stats: Dict[str, int] = {}
+            for category_id, count in self._categories.items():
+                country = self._countries.get(category_id)
+                # 마지막 구성 이후 생긴 카테고리는 다음 재구성 때 국가가 채워짐
+                if country is not None and count:
+                    country_stats[country] = country_stats.get(country, 0) + count
+            average = self._rating_sum / self._rating_count if self._rating_count else 0
+            return {
+                "total_menus": self._total,
+                "time_slot_distribution": {
+                    slot: self._time_slots.get(slot, 0) for slot in STATS_TIME_SLOTS
+                },
+                "country_distribution": country_stats,
+                "average_rating": round(average, 2),
+            }
+
+
+# 전역 검색 통계 (워커 프로세스별, 카탈로그 버전이 바뀌면 재구성)
+search_stats = SearchStats()
+
+
+class SearchStatsService:
+    """
+    검색 통계 관리 서비스
+    - 전체/시간대별/카테고리(국가)별 분포를 GROUPING SETS 쿼리 한 번으로 집계
+    - 같은 워커의 메뉴 변경은 MenuService에서 증감 반영,
+      다른 경로의 변경은 카탈로그 버전 확인(메뉴 검색 색인 갱신 작업) 때 재구성
+    - 이 워커의 변경으로만 바뀐 버전은 재집계하지 않고, 대신 느린 주기
+      (search_stats_rebuild_interval_seconds)로 한 번씩 다시 맞춤
+    """
+
+    @staticmethod
+    def aggregate_query():
+        return (
+            select(
+                func.grouping(Menu.time_slot),
+                func.grouping(Menu.category_id),
+                Menu.time_slot,
+                Menu.category_id,
+                Category.country,
+                func.count(Menu.id),
+                func.count(Menu.rating),
+                func.sum(Menu.rating),
+            )
+            .outerjoin(Category, Menu.category_id == Category.id)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(),
+                    tuple_(Menu.time_slot),
+                    tuple_(Menu.category_id, Category.country),
+                )
+            )
+        )
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, version: Any = None) -> None:
+        started = time.perf_counter()
+        result = await db.execute(SearchStatsService.aggregate_query())
+        search_stats.rebuild(result.all(), version)
+        logger.debug(
+            f"검색 통계 재구성 ({(time.perf_counter() - started) * 1000:.1f}ms)"
+        )
+
+    @staticmethod
+    async def sync(db: AsyncSession, version: Any) -> bool:
+        """
+        카탈로그 버전에 맞춰 통계 유지
+        Returns:
+            재집계했으면 True
+        """
+        if search_stats.version == version:
+            return False
+        stale = (
+            search_stats.built_at is None
+            or time.time() - search_stats.built_at
+            > settings.search_stats_rebuild_interval_seconds
+        )
+        if not stale and search_stats.explains(version):
+            search_stats.adopt(version)
+            return False
+        await SearchStatsService.rebuild(db, version)
+        return True
+
+    @staticmethod
+    async def get_stats(db: AsyncSession) -> Dict[str, Any]:
+        if not search_stats.is_built:
+            await SearchStatsService.rebuild(db)
+        return search_stats.snapshot()
@@ -0,0 +1,188 @@
+import heapq
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.hangul import JamoIndex, has_jamo
+from app.core.logging import get_logger
+from app.models.menu import Menu
+
+logger = get_logger(__name__)
+
+# 노드마다 미리 골라 두는 상위 추천어 수 (요청 limit 최대값)
+SUGGESTION_TOP_K = 10
+
+
+def normalize_key(text: str) -> str:
+    """자동완성 비교 키 (소문자, 공백 제거)"""
+    return "".join((text or "").lower().split())
+
+
+def suggestion_keys(text: str) -> List[str]:
+    """
+    추천어 하나를 찾을 수 있는 키 목록
+    - 전체 문자열 + 두 번째 단어부터 시작하는 부분 (예: "한국 전통 요리" → "요리"로도 검색)
+    """
+    words = (text or "").split()
+    return list(
+        dict.fromkeys(normalize_key(" ".join(words[i:])) for i in range(len(words)))
+    )
+
+
+class _TrieNode:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.top: List[str] = []
+
+
+class SuggestionTrie:
+    """
+    자동완성 접두어 트라이
+    - 노드마다 그 아래 추천어 중 인기순 상위 K개를 구성 시 미리 저장
+    - 조회는 접두어 길이만큼 딕셔너리를 따라간 뒤 목록을 잘라 반환
+    - 초성/입력 중 음절/오타는 같은 추천어의 자모 색인으로 찾음 (id = 인기 순위)
+    - 재구성은 새 트라이를 만든 뒤 루트 참조만 교체
+    """
+
+    def __init__(self, top_k: int = SUGGESTION_TOP_K):
+        self.top_k = top_k
+        self._root = _TrieNode()
+        self._texts: List[str] = []
+        self._jamo = JamoIndex()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.built_at: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def build(self, entries: Iterable[Tuple[str, float, Iterable[str]]]) -> int:
+        """
+        (추천어, 인기 점수, 검색 키 목록)으로 다시 구성
+        - 점수 내림차순으로 삽입하므로 노드별 목록은 앞에서부터 채우면 상위 K개
+        """
+        root = _TrieNode()
+        ordered = sorted(entries, key=lambda entry: (-entry[1], entry[0]))
+        for text, _, keys in ordered:
+            for key in keys:
+                node = root
+                for char in key:
+                    node = node.children.setdefault(char, _TrieNode())
+                    self._offer(node, text)
+        texts = [text for text, _, _ in ordered]
+        jamo = JamoIndex()
+        jamo.update(dict(enumerate(texts)))
+        jamo.prepare()
+        with self._lock:
+            self._root = root
+            self._texts = texts
+            self._jamo = jamo
+            self._size = len(ordered)
+            self.built_at = time.time()
+        return len(ordered)
+
+    def suggest(self, prefix: str, limit: int = SUGGESTION_TOP_K) -> List[str]:
+        """
+        접두어로 시작하는 인기순 추천어
+        - 낱자모가 섞이면 초성/자모 접두 일치, 일치가 없으면 자모 오타 허용 검색
+        """
+        key = normalize_key(prefix)
+        if not key:
+            return []
+        with self._lock:
+            texts, jamo = self._texts, self._jamo
+        if has_jamo(key):
+            ranks = heapq.nsmallest(limit, jamo.prefix_ids(key))
+            return [texts[rank] for rank in ranks]
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                break
+        else:
+            return node.top[:limit]
+        return [texts[rank] for rank, _ in jamo.fuzzy(key)[:limit]]
+
+    def _offer(self, node: _TrieNode, text: str) -> None:
+        if len(node.top) < self.top_k and text not in node.top:
+            node.top.append(text)
+
+
+# 전역 자동완성 트라이 (워커 프로세스별, 카탈로그 변경 시 재구성)
+suggestion_trie = SuggestionTrie()
+
+
+class SuggestService:
+    """
+    자동완성 추천어 관리 서비스
+    - 메뉴명, 카테고리명, 재료를 인기도(즐겨찾기 수) 가중치로 트라이에 적재
+    - 카테고리/재료 점수는 해당 메뉴들의 점수 합
+    - 즐겨찾기는 메뉴 수정 시각을 바꾸지 않으므로 인기도는 별도 주기로 다시 읽음
+    """
+
+    # 마지막으로 트라이에 반영한 메뉴별 즐겨찾기 수 (바뀌었을 때만 재구성)
+    _popularity: Dict = {}
+
+    @staticmethod
+    async def load_popularity(db: AsyncSession) -> Dict:
+        """메뉴별 즐겨찾기 수 (메뉴 카운터 열)"""
+        result = await db.execute(
+            select(Menu.id, Menu.favorite_count).where(Menu.favorite_count > 0)
+        )
+        return dict(result.all())
+
+    @staticmethod
+    def build_entries(
+        documents: Iterable, popularity: Dict
+    ) -> List[Tuple[str, float, List[str]]]:
+        """색인 문서(MenuDocument) → (추천어, 점수, 키 목록)"""
+        scores: Dict[str, float] = {}
+        for doc in documents:
+            # 즐겨찾기 수 + 평점(동점 정렬용 소수부)
+            score = 1.0 + popularity.get(doc.menu_id, 0) + (doc.rating or 0.0) / 10
+            texts = [doc.name, doc.category_name] + [
+                ingredient.strip() for ingredient in (doc.ingredients or "").split(",")
+            ]
+            for text in dict.fromkeys(t for t in texts if t):
+                scores[text] = scores.get(text, 0.0) + score
+        return [(text, score, suggestion_keys(text)) for text, score in scores.items()]
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, documents: Iterable) -> int:
+        started = time.perf_counter()
+        popularity = await SuggestService.load_popularity(db)
+        count = suggestion_trie.build(
+            SuggestService.build_entries(documents, popularity)
+        )
+        SuggestService._popularity = popularity
+        logger.info(
+            f"자동완성 추천어 {count}개 재구성 "
+            f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+        )
+        return count
+
+    @staticmethod
+    async def refresh_popularity(db: AsyncSession, documents: Iterable) -> int:
+        """
+        즐겨찾기 수가 바뀌었으면 트라이 재구성
+        Returns:
+            재구성한 추천어 수 (변경 없으면 0)
+        """
+        popularity = await SuggestService.load_popularity(db)
+        if popularity == SuggestService._popularity:
+            return 0
+        count = suggestion_trie.build(
+            SuggestService.build_entries(documents, popularity)
+        )
+        SuggestService._popularity = popularity
+        logger.debug(f"자동완성 인기도 갱신 ({count}개 재구성)")
+        return count
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import uuid
+from typing import Dict, Mapping
+
+from sqlalchemy import func, insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import invalidate_cached_results
+from app.core.config import settings
+from app.core.config_weights import (
+    WEIGHT_SETS,
+    CompiledWeightSet,
+    compile_weights,
+    weight_registry,
+)
+from app.core.logging import get_logger
+from app.db.database import AsyncSessionLocal
+from app.models.weight_set import WeightSet
+
+logger = get_logger(__name__)
+
+# 가중치로 점수를 계산해 캐싱하는 추천 결과 (@cached key_prefix)
+WEIGHTED_RESULT_CACHE_PREFIXES = ("simple_rec", "quiz_rec")
+
+# 동시 저장으로 같은 버전 번호가 충돌했을 때 다시 시도하는 횟수
+CREATE_VERSION_ATTEMPTS = 3
+
+
+class WeightSetConflictError(Exception):
+    """동시 저장이 계속 충돌해 새 버전을 만들지 못함"""
+
+
+class WeightSetService:
+    """
+    DB 가중치 세트 관리 서비스
+    - 그룹별 최신 버전만 비교해 바뀐 경우에만 다시 읽고 레지스트리 교체
+    - 교체 후 가중치로 계산해 캐싱된 추천 결과 무효화
+    """
+
+    @staticmethod
+    async def refresh(db: AsyncSession) -> bool:
+        """
+        그룹별 최신 버전이 레지스트리와 다르면 다시 적재
+        Returns:
+            교체했으면 True
+        """
+        result = await db.execute(
+            select(WeightSet.ab_group, func.max(WeightSet.version)).group_by(
+                WeightSet.ab_group
+            )
+        )
+        latest: Dict[str, int] = dict(result.all())
+        expected = {**dict.fromkeys(WEIGHT_SETS, 0), **latest}
+        if expected == weight_registry.versions():
+            return False
+
+        rows = []
+        if latest:
+            result = await db.execute(
+                select(WeightSet).where(
+                    tuple_(WeightSet.ab_group, WeightSet.version).in_(
+                        list(latest.items())
+                    )
+                )
+            )
+            rows = [
+                (row.ab_group, row.version, json.loads(row.weights))
+                for row in result.scalars().all()
+            ]
+        weight_registry.swap(rows)
+        invalidate_cached_results(*WEIGHTED_RESULT_CACHE_PREFIXES)
+        logger.info(f"가중치 세트 교체: {weight_registry.versions()}")
+        return True
+
+    @staticmethod
+    async def load() -> bool:
+        """시작 시 적재 (별도 세션)"""
+        async with AsyncSessionLocal() as db:
+            return await WeightSetService.refresh(db)
+
+    @staticmethod
+    async def create_version(
+        db: AsyncSession, ab_group: str, weights: Mapping[str, float]
+    ) -> CompiledWeightSet:
+        """
+        가중치 세트 새 버전 저장 후 이 워커에 바로 반영
+        - 다른 워커는 다음 갱신 주기에 반영
+        - 같은 그룹을 동시에 저장해 버전 번호가 겹치면(uq_weight_sets_group_version)
+          다음 번호로 다시 시도
+        Raises:
+            ValueError: 가중치 키가 올바르지 않음
+            WeightSetConflictError: 재시도 후에도 충돌
+        """
+        compile_weights(weights)  # 저장 전 검증
+        next_version = (
+            select(func.coalesce(func.max(WeightSet.version), 0) + 1)
+            .where(WeightSet.ab_group == ab_group)
+            .scalar_subquery()
+        )
+        for attempt in range(CREATE_VERSION_ATTEMPTS):
+            try:
+                await db.execute(
+                    insert(WeightSet).values(
+                        id=uuid.uuid4(),
+                        ab_group=ab_group,
+                        version=next_version,
+                        weights=json.dumps(dict(weights), ensure_ascii=False),
+                    )
+                )
+                await db.commit()
+                break
+            except IntegrityError:
+                await db.rollback()
+                logger.warning(
+                    f"가중치 세트 버전 충돌 ({ab_group}, 시도 {attempt + 1})"
+                )
+        else:
+            raise WeightSetConflictError(
+                f"가중치 세트 저장이 동시에 몰려 실패했습니다: {ab_group}"
+            )
+        await WeightSetService.refresh(db)
+        return weight_registry.get(ab_group)
+
+
+async def _weight_set_refresh_loop():
+    """가중치 세트 버전 변경 확인 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(settings.weight_set_refresh_interval_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                await WeightSetService.refresh(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"가중치 세트 갱신 중 오류: {e}")
+
+
+def start_weight_set_refresh_scheduler() -> asyncio.Task:
+    """가중치 세트 갱신 백그라운드 작업 시작"""
+    task = asyncio.create_task(_weight_set_refresh_loop(), name="WeightSetRefreshTask")
+    logger.info("가중치 세트 갱신 스케줄러 시작")
+    return task
@@ -10,8 +10,25 @@ from app.core.cache import start_cache_cleanup_scheduler
 from app.core.config import settings
 from app.core.logging import get_logger, setup_logging
 from app.core.middleware import setup_middleware
+from app.db.batch_writer import recommendation_log_writer
 from app.db.init_db import init_db
 from app.schemas.common import error_response
+from app.services.ab_test_service import ab_bandit, ab_rollup_counter
+from app.services.als_service import start_als_reload_scheduler
+from app.services.interaction_buffer import interaction_buffer
+from app.services.item_cf_service import start_item_cf_refresh_scheduler
+from app.services.menu_search_index import (
+    MenuSearchIndexService,
+    start_menu_search_index_scheduler,
+    start_suggest_popularity_scheduler,
+)
+from app.services.neighbor_service import start_neighbor_refresh_scheduler
+from app.services.preference_service import PreferenceService
+from app.services.preference_store import preference_store
+from app.services.weight_set_service import (
+    WeightSetService,
+    start_weight_set_refresh_scheduler,
+)
 
 # 로깅 설정 초기화
 setup_logging()
@@ -26,11 +43,48 @@ async def lifespan(app: FastAPI):
     if settings.env != "prod":
         logger.info("개발 환경: 샘플 데이터 초기화 중...")
         await init_db()
+    # 선호도 벡터의 국가 인덱스 사전 적재
+    await PreferenceService.load_country_dictionary()
+    # A/B 테스트 가중치 세트 적재 (이후 버전 변경 시 교체)
+    await WeightSetService.load()
+    # A/B 그룹 배정 밴딧 사후분포 적재
+    if settings.ab_bandit_enabled:
+        await ab_bandit.flush()
+    # 메뉴 검색 역색인/자동완성 트라이 구성 (이후 카탈로그 버전 변경 시 반영)
+    await MenuSearchIndexService.load()
+    menu_search_task = start_menu_search_index_scheduler()
+    suggest_task = start_suggest_popularity_scheduler()
     start_cache_cleanup_scheduler()
+    neighbor_task = start_neighbor_refresh_scheduler()
+    item_cf_task = start_item_cf_refresh_scheduler()
+    weight_set_task = start_weight_set_refresh_scheduler()
+    als_task = start_als_reload_scheduler()
+    if settings.interaction_buffer_enabled:
+        interaction_buffer.start()
+    if settings.recommendation_log_async_enabled:
+        recommendation_log_writer.start()
+    if settings.preference_store_enabled:
+        preference_store.start()
+    if settings.ab_rollup_enabled:
+        ab_rollup_counter.start()
+    if settings.ab_bandit_enabled:
+        ab_bandit.start()
     logger.info("애플리케이션 시작 완료")
     yield
     # 종료 시 실행
     logger.info("애플리케이션 종료 중...")
+    neighbor_task.cancel()
+    item_cf_task.cancel()
+    weight_set_task.cancel()
+    menu_search_task.cancel()
+    suggest_task.cancel()
+    als_task.cancel()
+    # 큐에 남은 상호작용/추천 로그/집계는 모두 기록 후 종료
+    await interaction_buffer.stop()
+    await recommendation_log_writer.stop()
+    await preference_store.stop()
+    await ab_rollup_counter.stop()
+    await ab_bandit.stop()
 
 
 # FastAPI 앱 생성
@@ -0,0 +1,15 @@
+import asyncio
+
+from app.db.database import AsyncSessionLocal
+from app.services.menu_service import FavoriteService
+
+
+async def main():
+    print("메뉴 즐겨찾기 수를 실제 즐겨찾기와 비교해 보정합니다...")
+    async with AsyncSessionLocal() as db:
+        fixed = await FavoriteService(db).reconcile_favorite_counts()
+    print(f"보정 완료: 메뉴 {fixed}개")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
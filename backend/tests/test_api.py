@@ -4,6 +4,7 @@ import random
 import uuid
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
@@ -54,6 +55,14 @@ async def test_user():
     return user
 
 
+@pytest.fixture
+def logged_in(test_user):
+    """로그인 사용자로 호출 (관리자 API 등 인증 필요 경로)"""
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    yield test_user
+    app.dependency_overrides.pop(get_current_user, None)
+
+
 # ---------------- 카카오 로그인 ----------------
 @pytest.mark.asyncio
 @patch("app.services.auth_service.requests.get")
@@ -208,6 +217,160 @@ async def test_simple_recommendation():
         assert "total_count" in data
 
 
+@pytest.mark.asyncio
+async def test_simple_recommendation_first_session_no_writes():
+    """처음 보는 세션의 간단 추천은 선호도/추천 로그 행을 만들지 않음"""
+    from sqlalchemy import func, select
+
+    from app.models.recommendation import RecommendationLog
+    from app.models.user_preference import UserPreference
+
+    session_id = f"test-session-new-{uuid.uuid4()}"
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        req = {"time_slot": "lunch", "session_id": session_id}
+        resp = await client.post("/api/v1/recommendations/simple", json=req)
+        assert resp.status_code == 201
+        assert resp.json()["data"]["ab_test_info"]["ab_group"] in ("A", "B", "C")
+
+    async with AsyncSessionLocal() as session:
+        for model in (UserPreference, RecommendationLog):
+            count = await session.scalar(
+                select(func.count())
+                .select_from(model)
+                .where(model.session_id == session_id)
+            )
+            assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_ab_stats_from_hourly_rollups(logged_in):
+    """추천 노출/상호작용이 시간별 집계에 반영되고 /admin/ab-stats로 조회됨"""
+    from app.services.ab_test_service import ab_rollup_counter
+    from app.services.preference_service import PreferenceService
+
+    session_id = f"test-session-ab-{uuid.uuid4()}"
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        before = (await client.get("/api/v1/admin/ab-stats?days=1")).json()["data"]
+        req = {"time_slot": "dinner", "session_id": session_id}
+        resp = await client.post("/api/v1/recommendations/simple", json=req)
+        ab_group = resp.json()["data"]["ab_test_info"]["ab_group"]
+        assert ab_group == PreferenceService.assign_ab_group(session_id)
+        menu_id = resp.json()["data"]["recommendations"][0]["menu"]["id"]
+        payload = {
+            "session_id": session_id,
+            "menu_id": menu_id,
+            "interaction_type": "click",
+        }
+        resp = await client.post("/api/v1/recommendations/interaction", json=payload)
+        assert resp.status_code == 201
+        await ab_rollup_counter.flush()
+        after = (await client.get("/api/v1/admin/ab-stats?days=1")).json()["data"]
+
+    def counts(data):
+        group = data["groups"].get(ab_group, {})
+        return group.get("recommendations", 0), group.get("interactions", {})
+
+    assert counts(after)[0] == counts(before)[0] + 1
+    assert counts(after)[1]["click"] == counts(before)[1].get("click", 0) + 1
+    assert after["groups"][ab_group]["rates"]["click"] > 0
+
+
+@pytest.mark.asyncio
+async def test_ab_stats_quiz_auto_select_excluded_from_rates(logged_in):
+    """퀴즈의 자동 recommend_select는 auto_select로 집계되고 비율에는 나오지 않음"""
+    from app.services.ab_test_service import ab_rollup_counter
+
+    session_id = f"test-session-ab-quiz-{uuid.uuid4()}"
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        before = (await client.get("/api/v1/admin/ab-stats?days=1")).json()["data"]
+        req = {"answers": {"question1": "매운맛"}, "session_id": session_id}
+        resp = await client.post("/api/v1/recommendations/quiz", json=req)
+        assert resp.status_code == 201
+        data = resp.json()["data"]
+        ab_group = data["ab_test_info"]["ab_group"]
+        await ab_rollup_counter.flush()
+        after = (await client.get("/api/v1/admin/ab-stats?days=1")).json()["data"]
+
+    def interactions(stats):
+        return stats["groups"].get(ab_group, {}).get("interactions", {})
+
+    assert interactions(after).get("auto_select", 0) == interactions(before).get(
+        "auto_select", 0
+    ) + len(data["recommendations"])
+    assert interactions(after).get("recommend_select", 0) == interactions(before).get(
+        "recommend_select", 0
+    )
+    assert "auto_select" not in after["groups"][ab_group]["rates"]
+
+
+@pytest.mark.asyncio
+async def test_weight_set_new_version_hot_reload(logged_in):
+    """가중치 세트를 저장하면 새 버전이 바로 적용되고 잘못된 키는 거절됨"""
+    weights = {
+        "spicy": 1.0,
+        "healthy": 1.0,
+        "vegetarian": 1.0,
+        "quick": 1.0,
+        "rice": 1.0,
+        "soup": 1.0,
+        "meat": 5.0,
+    }
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        before = (await client.get("/api/v1/admin/weight-sets")).json()["data"]
+        resp = await client.put(
+            "/api/v1/admin/weight-sets/C", json={"weights": weights}
+        )
+        assert resp.status_code == 200
+        assert resp.json()["data"]["version"] == before["C"]["version"] + 1
+
+        after = (await client.get("/api/v1/admin/weight-sets")).json()["data"]
+        assert after["C"]["weights"]["meat"] == 5.0
+        assert after["A"] == before["A"]
+
+        resp = await client.put(
+            "/api/v1/admin/weight-sets/C", json={"weights": {"spicy": 1.0}}
+        )
+        assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_weight_set_concurrent_updates_get_distinct_versions(logged_in):
+    """같은 그룹을 동시에 저장해도 500 없이 서로 다른 버전으로 저장"""
+    weights = {
+        "spicy": 1.0,
+        "healthy": 1.0,
+        "vegetarian": 1.0,
+        "quick": 1.0,
+        "rice": 1.0,
+        "soup": 1.0,
+        "meat": 2.0,
+    }
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        responses = await asyncio.gather(
+            *(
+                client.put("/api/v1/admin/weight-sets/B", json={"weights": weights})
+                for _ in range(3)
+            )
+        )
+    assert all(resp.status_code in (200, 409) for resp in responses)
+    versions = [
+        resp.json()["data"]["version"] for resp in responses if resp.status_code == 200
+    ]
+    assert len(versions) == len(set(versions))
+
+
+@pytest.mark.asyncio
+async def test_admin_requires_login():
+    """관리자 API는 인증 없이 호출하면 401"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.put(
+            "/api/v1/admin/weight-sets/C", json={"weights": {"spicy": 1.0}}
+        )
+        assert resp.status_code == 401
+        resp = await client.get("/api/v1/admin/ab-stats")
+        assert resp.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_quiz_recommendation():
     """질답 기반 추천 API 테스트"""
@@ -327,6 +490,165 @@ async def test_preference_analysis():
         assert "recommendation_confidence" in data
 
 
+@pytest.mark.asyncio
+async def test_concurrent_preference_creation_single_row():
+    """같은 세션의 동시 첫 요청도 선호도 행은 하나만 생성"""
+    from sqlalchemy import func, select
+
+    from app.models.user_preference import UserPreference
+    from app.repositories.user_preference_repository import (
+        UserPreferenceRepository,
+    )
+
+    session_id = f"test-session-race-{uuid.uuid4()}"
+
+    async def create():
+        async with AsyncSessionLocal() as session:
+            repo = UserPreferenceRepository(session)
+            preference, _ = await repo.get_or_create(session_id, None, "A")
+            await session.commit()
+            return preference.id
+
+    ids = await asyncio.gather(*[create() for _ in range(5)])
+    assert len(set(ids)) == 1
+    async with AsyncSessionLocal() as session:
+        count = await session.scalar(
+            select(func.count())
+            .select_from(UserPreference)
+            .where(UserPreference.session_id == session_id)
+        )
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_preference_store_flush_and_conflict():
+    """저장소 학습은 flush 때 기록, 다른 쪽이 먼저 갱신하면 재적용 후 기록"""
+    from sqlalchemy import select, update
+
+    from app.models.menu import Menu
+    from app.models.user_preference import UserPreference
+    from app.services.preference_store import PreferenceStore
+
+    store = PreferenceStore()
+    session_id = f"test-session-store-{uuid.uuid4()}"
+    async with AsyncSessionLocal() as session:
+        menu = (await session.execute(select(Menu).limit(1))).scalar_one()
+        preference, created = await store.learn(
+            session, session_id, None, [(menu, 1.0)], "A"
+        )
+        await session.commit()
+    assert created and preference.total_interactions == 1
+    assert await store.flush() == 1
+
+    # 다른 워커가 먼저 기록한 상황 (version 증가)
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(UserPreference.__table__)
+            .where(UserPreference.__table__.c.id == preference.id)
+            .values(total_interactions=10, version=UserPreference.version + 1)
+        )
+        await session.commit()
+
+    async with AsyncSessionLocal() as session:
+        await store.learn(session, session_id, None, [(menu, 1.0)], "A")
+    assert await store.flush() == 0  # 버전 충돌 → DB 값 위에 재적용
+    assert await store.flush() == 1
+    assert store.get_stats()["conflicts"] == 1
+
+    async with AsyncSessionLocal() as session:
+        row = await session.scalar(
+            select(UserPreference).where(UserPreference.session_id == session_id)
+        )
+    assert row.total_interactions == 11
+    assert row.version == 3
+
+
+@pytest.mark.asyncio
+async def test_interaction_learns_in_sql_with_store_running():
+    """저장소 실행 중에도 상호작용 학습은 SQL 한 문장으로 바로 기록되고 저장소 항목도 갱신"""
+    from sqlalchemy import select
+
+    from app.models.menu import Menu
+    from app.models.user_preference import UserPreference
+    from app.services.preference_service import PreferenceService
+    from app.services.preference_store import preference_store
+
+    session_id = f"test-session-sql-store-{uuid.uuid4()}"
+    preference_store.start()
+    try:
+        async with AsyncSessionLocal() as session:
+            menu_id = (await session.execute(select(Menu.id).limit(1))).scalar_one()
+            await PreferenceService.get_or_create_preference(session, session_id)
+        async with AsyncSessionLocal() as session:
+            await PreferenceService.record_interaction(
+                session,
+                {
+                    "session_id": session_id,
+                    "menu_id": menu_id,
+                    "interaction_type": "click",
+                },
+            )
+        assert preference_store.get_stats()["dirty"] == 0  # 메모리 학습 아님
+        cached = preference_store.get(session_id)
+        async with AsyncSessionLocal() as session:
+            row = await session.scalar(
+                select(UserPreference).where(UserPreference.session_id == session_id)
+            )
+        assert row.total_interactions == 1
+        assert cached.total_interactions == 1
+        assert cached.version == row.version
+    finally:
+        await preference_store.stop()
+
+
+@pytest.mark.asyncio
+async def test_sql_learning_matches_rule_without_lost_updates():
+    """UPDATE 한 문장 학습이 PreferenceVector.learn과 같고 동시 실행에도 유실 없음"""
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+
+    from app.core.preference_vector import PreferenceVector
+    from app.models.menu import Menu
+    from app.repositories.user_preference_repository import (
+        UserPreferenceRepository,
+    )
+    from app.services.preference_service import PreferenceService
+
+    session_id = f"test-session-sql-{uuid.uuid4()}"
+    async with AsyncSessionLocal() as session:
+        await PreferenceService.load_country_dictionary()
+        menu = (
+            await session.execute(
+                select(Menu).options(selectinload(Menu.category)).limit(1)
+            )
+        ).scalar_one()
+        preference, _ = await UserPreferenceRepository(session).get_or_create(
+            session_id, None, "A"
+        )
+        await session.commit()
+
+    async def learn():
+        async with AsyncSessionLocal() as session:
+            repo = UserPreferenceRepository(session)
+            learned = await repo.apply_interaction(session_id, None, menu.id, 0.5)
+            await session.commit()
+            return learned
+
+    results = await asyncio.gather(*[learn() for _ in range(8)])
+    assert max(r.total_interactions for r in results) == 8
+
+    expected = PreferenceVector.default()
+    for _ in range(8):
+        expected.learn(menu, 0.5)
+    final = max(results, key=lambda r: r.total_interactions)
+    assert np.allclose(
+        PreferenceVector.from_packed(final.preference_vector).values,
+        expected.values,
+        atol=1e-5,
+        equal_nan=True,
+    )
+
+
 @pytest.mark.asyncio
 def override_get_current_user():
     class DummyUser:
@@ -399,6 +721,178 @@ async def test_record_interaction():
     app.dependency_overrides = {}
 
 
+async def _active_menu_ids(count: int):
+    from sqlalchemy import select
+
+    from app.models.menu import Menu
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Menu.id).where(Menu.is_active).order_by(Menu.name).limit(count)
+        )
+        return [str(menu_id) for menu_id in result.scalars().all()]
+
+
+async def _interaction_count(session_id: str) -> int:
+    from sqlalchemy import func, select
+
+    from app.models.user_preference import UserInteraction
+
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(
+            select(func.count())
+            .select_from(UserInteraction)
+            .where(UserInteraction.session_id == session_id)
+        )
+
+
+@pytest.mark.asyncio
+async def test_interactions_batch_round_trip():
+    """대량 적재: 알 수 없는 메뉴는 거절, 나머지는 기록, 건수 초과는 검증 전 413"""
+    import json
+
+    from app.core.config import settings
+
+    menu_a, menu_b = await _active_menu_ids(2)
+    session_id = f"test-session-batch-{uuid.uuid4()}"
+    records = [
+        {"session_id": session_id, "menu_id": menu_a, "interaction_type": "click"},
+        {"session_id": session_id, "menu_id": menu_b, "interaction_type": "favorite"},
+        {
+            "session_id": session_id,
+            "menu_id": str(uuid.uuid4()),
+            "interaction_type": "click",
+        },
+    ]
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.post(
+            "/api/v1/recommendations/interactions:batch", json=records
+        )
+        assert resp.status_code == 201
+        data = resp.json()["data"]
+        assert data["received"] == 3 and data["inserted"] == 2
+        assert [r["index"] for r in data["rejected"]] == [2]
+        assert await _interaction_count(session_id) == 2
+
+        ndjson = "\n".join(json.dumps(r) for r in records)
+        with patch.object(settings, "interaction_batch_max_records", 2):
+            resp = await client.post(
+                "/api/v1/recommendations/interactions:batch",
+                content=ndjson.encode(),
+                headers={"content-type": "application/x-ndjson"},
+            )
+        assert resp.status_code == 413
+        with patch.object(settings, "interaction_batch_max_bytes", 10):
+            resp = await client.post(
+                "/api/v1/recommendations/interactions:batch", json=records
+            )
+        assert resp.status_code == 413
+    assert await _interaction_count(session_id) == 2
+
+
+@pytest.mark.asyncio
+async def test_similar_menus_round_trip():
+    """함께 고른 메뉴: 같은 세션에서 함께 선택된 메뉴가 결과에 포함"""
+    from app.services.item_cf_service import ItemCFService
+
+    menu_a, menu_b = await _active_menu_ids(2)
+    records = [
+        {
+            "session_id": f"test-session-cf-{i}",
+            "menu_id": m,
+            "interaction_type": "click",
+        }
+        for i in range(3)
+        for m in (menu_a, menu_b)
+    ]
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.post(
+            "/api/v1/recommendations/interactions:batch", json=records
+        )
+        assert resp.status_code == 201
+        async with AsyncSessionLocal() as session:
+            await ItemCFService.rebuild(session)
+
+        resp = await client.get(
+            f"/api/v1/recommendations/similar-menus?menu_ids={menu_a}&limit=5"
+        )
+        assert resp.status_code == 200
+        similar = [r["menu"]["id"] for r in resp.json()["data"]]
+        assert menu_b in similar and menu_a not in similar
+
+
+@pytest.mark.asyncio
+async def test_latent_recommendation_round_trip(tmp_path):
+    """ALS 잠재요인: 학습한 요인을 로드한 뒤 학습된 세션에 활성 메뉴 추천"""
+    from app.core.config import settings
+    from app.services.als_service import ALSService, als_model
+
+    menu_ids = await _active_menu_ids(4)
+    session_id = f"test-session-als-{uuid.uuid4()}"
+    records = [
+        {"session_id": session_id, "menu_id": m, "interaction_type": "click"}
+        for m in menu_ids[:2]
+    ]
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.post(
+            "/api/v1/recommendations/interactions:batch", json=records
+        )
+        assert resp.status_code == 201
+
+        with patch.object(settings, "als_model_dir", str(tmp_path)):
+            async with AsyncSessionLocal() as session:
+                assert await ALSService.train(session)
+                assert await ALSService.refresh(session)
+        try:
+            resp = await client.post(
+                "/api/v1/recommendations/latent",
+                json={"session_id": session_id, "limit": 3},
+            )
+            assert resp.status_code == 201
+            data = resp.json()["data"]
+            assert data["ab_test_info"]["recommendation_type"] == "als_latent"
+            assert 0 < data["total_count"] <= 3
+            assert all(r["menu"]["is_active"] for r in data["recommendations"])
+        finally:
+            als_model.__init__()
+
+
+@pytest.mark.asyncio
+async def test_buffered_interaction_round_trip():
+    """버퍼 모드: 알 수 없는 메뉴는 202 전에 404, 접수한 상호작용은 종료 시 기록"""
+    from app.services.interaction_buffer import interaction_buffer
+
+    (menu_id,) = await _active_menu_ids(1)
+    session_id = f"test-session-buffer-{uuid.uuid4()}"
+    interaction_buffer.start()
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            resp = await client.post(
+                "/api/v1/recommendations/interaction",
+                json={
+                    "session_id": session_id,
+                    "menu_id": menu_id,
+                    "interaction_type": "click",
+                },
+            )
+            assert resp.status_code == 202
+            assert resp.json()["data"]["queued"] is True
+
+            resp = await client.post(
+                "/api/v1/recommendations/interaction",
+                json={
+                    "session_id": session_id,
+                    "menu_id": str(uuid.uuid4()),
+                    "interaction_type": "click",
+                },
+            )
+            assert resp.status_code == 404
+    finally:
+        await interaction_buffer.stop()
+    assert await _interaction_count(session_id) == 1
+    assert interaction_buffer.get_stats()["failed"] == 0
+
+
 @pytest.mark.asyncio
 async def test_collaborative_users():
     async with AsyncClient(app=app, base_url="http://test") as client:
@@ -484,6 +978,41 @@ def test_favorite_add_and_get(test_user):
     app.dependency_overrides = {}
 
 
+@pytest.mark.asyncio
+async def test_favorite_count_counter_and_reconcile(test_user):
+    """찜 추가/해제가 메뉴 즐겨찾기 수를 같은 트랜잭션에서 증감, 어긋나면 보정"""
+    from sqlalchemy import select, update
+
+    from app.models.menu import Menu
+    from app.services.menu_service import FavoriteService, MenuService
+
+    async def favorite_count(session, menu_id):
+        result = await session.execute(
+            select(Menu.favorite_count).where(Menu.id == menu_id)
+        )
+        return result.scalar_one()
+
+    async with AsyncSessionLocal() as session:
+        menu = (await session.execute(select(Menu).limit(1))).scalar_one()
+        before = await favorite_count(session, menu.id)
+        service = FavoriteService(session)
+
+        await service.add_favorite(test_user.id, menu.id)
+        assert await favorite_count(session, menu.id) == before + 1
+        popular = await MenuService(session).menu_repository.get_popular_menus(100)
+        assert menu.id in [m.id for m in popular]
+
+        await service.remove_favorite(test_user.id, menu.id)
+        assert await favorite_count(session, menu.id) == before
+
+        await session.execute(
+            update(Menu).where(Menu.id == menu.id).values(favorite_count=999)
+        )
+        await session.commit()
+        assert await service.reconcile_favorite_counts() >= 1
+        assert await favorite_count(session, menu.id) == before
+
+
 # ---------------- 사용자 프로필 ----------------
 @pytest.mark.asyncio
 @patch("app.services.auth_service.requests.get")
@@ -540,6 +1069,32 @@ async def test_search_menus():
         assert isinstance(data, list)
 
 
+@pytest.mark.asyncio
+async def test_search_menus_facets():
+    """패싯별 수가 해당 필터를 건 검색 결과 수와 같음 (SQL/색인 경로 모두)"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        for q in (None, "찌개"):
+            params = {"facets": "is_spicy,time_slot", "limit": 100}
+            if q:
+                params["q"] = q
+            resp = await client.get("/api/v1/search/menus", params=params)
+            assert resp.status_code == 200
+            facets = resp.json()["facets"]
+
+            resp = await client.get(
+                "/api/v1/search/menus", params={**params, "is_spicy": "true"}
+            )
+            assert facets["is_spicy"] == len(resp.json()["data"])
+            for time_slot, count in facets["time_slot"].items():
+                resp = await client.get(
+                    "/api/v1/search/menus", params={**params, "time_slot": time_slot}
+                )
+                assert count == len(resp.json()["data"])
+
+        resp = await client.get("/api/v1/search/menus", params={"facets": "nope"})
+        assert resp.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_search_categories():
     """카테고리 검색 API 테스트"""
@@ -564,6 +1119,339 @@ async def test_search_stats():
         assert "average_rating" in data
 
 
+@pytest.mark.asyncio
+async def test_search_stats_incremental_matches_rebuild():
+    """메뉴 변경 증감 반영 결과가 GROUPING SETS 재집계와 같음"""
+    from app.services.menu_service import MenuService
+    from app.services.search_stats_service import SearchStatsService, search_stats
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        async with AsyncSessionLocal() as session:
+            await SearchStatsService.rebuild(session)
+        resp = await client.get("/api/v1/search/stats")
+        before = resp.json()["data"]
+
+        async with AsyncSessionLocal() as session:
+            service = MenuService(session)
+            menu = await service.create(
+                {"name": "통계 테스트 메뉴", "time_slot": "breakfast", "rating": 3.0}
+            )
+            await service.update(menu.id, {"time_slot": "dinner"})
+            incremental = search_stats.snapshot()
+            await SearchStatsService.rebuild(session)
+            assert search_stats.snapshot() == incremental
+            await service.delete(menu.id)
+
+        resp = await client.get("/api/v1/search/stats")
+        assert resp.json()["data"]["total_menus"] == before["total_menus"]
+        assert incremental["total_menus"] == before["total_menus"] + 1
+        assert (
+            incremental["time_slot_distribution"]["dinner"]
+            == before["time_slot_distribution"]["dinner"] + 1
+        )
+
+
+@pytest.mark.asyncio
+async def test_search_stats_not_rebuilt_for_local_menu_edit():
+    """이 워커의 메뉴 변경으로 바뀐 카탈로그 버전은 재집계 없이 버전만 갱신"""
+    from app.services.menu_search_index import MenuSearchIndexService
+    from app.services.menu_service import MenuService
+    from app.services.search_stats_service import search_stats
+
+    async with AsyncSessionLocal() as session:
+        await MenuSearchIndexService.refresh(session)
+        service = MenuService(session)
+        menu = await service.create(
+            {"name": "통계 버전 테스트 메뉴", "time_slot": "lunch"}
+        )
+        await service.update(menu.id, {"time_slot": "dinner"})
+        built_at = search_stats.built_at
+        await MenuSearchIndexService.refresh(session)
+        assert search_stats.built_at == built_at
+        assert search_stats.version == await MenuSearchIndexService.load_version(
+            session
+        )
+        await service.delete(menu.id)
+
+
+@pytest.mark.asyncio
+async def test_search_menus_full_text_ranked():
+    """전문 검색: 글자 2-gram 일치 + 이름 일치가 먼저"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.get("/api/v1/search/menus", params={"q": "김치"})
+        assert resp.status_code == 200
+        names = [menu["name"] for menu in resp.json()["data"]]
+        assert {"김치볶음밥", "김치찌개"} <= set(names)
+        assert names[0] in ("김치볶음밥", "김치찌개")
+
+        # 카테고리명으로도 검색
+        resp = await client.get("/api/v1/search/menus", params={"q": "중국"})
+        names = [menu["name"] for menu in resp.json()["data"]]
+        assert "짜장면" in names
+
+        # 레포지토리 경로 (와일드카드 문자는 그대로 검색)
+        resp = await client.get("/api/v1/menus/search/", params={"q": "찌개"})
+        assert resp.status_code == 200
+        resp = await client.get("/api/v1/search/menus", params={"q": "%"})
+        assert resp.status_code == 200
+        assert resp.json()["data"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_menus_in_memory_index():
+    """역색인 구성 후 검색, 메뉴 수정은 다음 갱신에서 증분 반영"""
+    from app.services.menu_search_index import (
+        MenuSearchIndexService,
+        menu_search_index,
+    )
+    from app.services.menu_service import MenuService
+
+    async with AsyncSessionLocal() as session:
+        assert await MenuSearchIndexService.refresh(session) > 0
+        assert await MenuSearchIndexService.refresh(session) == 0  # 버전 동일
+        rebuilds = menu_search_index.get_stats()["rebuilds"]
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.get("/api/v1/search/menus", params={"q": "김치"})
+        names = [menu["name"] for menu in resp.json()["data"]]
+        assert {"김치볶음밥", "김치찌개"} <= set(names)
+
+        menu_id = next(
+            menu["id"] for menu in resp.json()["data"] if menu["name"] == "김치찌개"
+        )
+
+    async with AsyncSessionLocal() as session:
+        await MenuService(session).update(uuid.UUID(menu_id), {"name": "묵은지찌개"})
+        assert await MenuSearchIndexService.refresh(session) >= 1
+    assert menu_search_index.get_stats()["rebuilds"] == rebuilds
+    ids, _ = menu_search_index.search("묵은지")
+    assert [str(menu_id) for menu_id in ids] == [menu_id]
+
+    # 초성 / 자모 오타는 /search/menus에서도 일치
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        for q in ("ㄱㅊㅂㅇㅂ", "김치볶음빱"):
+            resp = await client.get("/api/v1/search/menus", params={"q": q})
+            names = [menu["name"] for menu in resp.json()["data"]]
+            assert names[0] == "김치볶음밥"
+
+
+@pytest.mark.asyncio
+async def test_search_menus_db_fallback_active_only():
+    """색인을 쓰지 않는 DB 경로도 인메모리 색인처럼 비활성 메뉴를 제외"""
+    from app.core.config import settings
+    from app.services.menu_service import MenuService
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.get("/api/v1/search/menus", params={"q": "김치찌개"})
+        menu_id = next(
+            menu["id"] for menu in resp.json()["data"] if menu["name"] == "김치찌개"
+        )
+
+    async with AsyncSessionLocal() as session:
+        await MenuService(session).update(uuid.UUID(menu_id), {"is_active": False})
+    try:
+        with patch.object(settings, "menu_search_index_enabled", False):
+            async with AsyncClient(app=app, base_url="http://test") as client:
+                for params in ({"q": "김치찌개"}, {"limit": 100, "facets": "is_spicy"}):
+                    resp = await client.get("/api/v1/search/menus", params=params)
+                    assert resp.status_code == 200
+                    ids = [menu["id"] for menu in resp.json()["data"]]
+                    assert menu_id not in ids
+    finally:
+        async with AsyncSessionLocal() as session:
+            await MenuService(session).update(uuid.UUID(menu_id), {"is_active": True})
+
+
+@pytest.mark.asyncio
+async def test_search_suggest():
+    """자동완성: 접두어로 시작하는 메뉴명/카테고리명/재료 최대 10개"""
+    from app.services.menu_search_index import MenuSearchIndexService
+
+    await MenuSearchIndexService.load()  # 앱 시작 시 적재와 같음
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.get("/api/v1/search/suggest", params={"prefix": "김"})
+        assert resp.status_code == 200
+        suggestions = resp.json()["data"]
+        assert 0 < len(suggestions) <= 10
+        assert "김치볶음밥" in suggestions
+
+        resp = await client.get(
+            "/api/v1/search/suggest", params={"prefix": "요리", "limit": 3}
+        )
+        assert len(resp.json()["data"]) <= 3
+
+        # 초성 입력
+        resp = await client.get("/api/v1/search/suggest", params={"prefix": "ㄱㅊㅂ"})
+        assert "김치볶음밥" in resp.json()["data"]
+
+        resp = await client.get("/api/v1/search/suggest")
+        assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_suggest_popularity_refresh():
+    """즐겨찾기 수만 바뀌어도 인기도 갱신 주기에 트라이 순위가 바뀜"""
+    from sqlalchemy import update
+
+    from app.models.menu import Menu
+    from app.services.menu_search_index import MenuSearchIndexService
+
+    await MenuSearchIndexService.load()
+    async with AsyncSessionLocal() as session:
+        assert await MenuSearchIndexService.refresh_popularity(session) == 0
+        await session.execute(
+            update(Menu)
+            .where(Menu.name == "김치찌개")
+            .values(favorite_count=Menu.favorite_count + 1000)
+        )
+        await session.commit()
+        assert await MenuSearchIndexService.refresh_popularity(session) > 0
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.get("/api/v1/search/suggest", params={"prefix": "김치"})
+        suggestions = resp.json()["data"]
+        assert suggestions.index("김치찌개") < suggestions.index("김치볶음밥")
+
+
+async def _explain(stmt) -> str:
+    """순차 스캔을 끈 상태의 실행 계획 (시드 데이터가 작아도 인덱스 사용 여부 확인)"""
+    from sqlalchemy import text
+    from sqlalchemy.dialects import postgresql
+
+    sql = str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    async with AsyncSessionLocal() as session:
+        await session.execute(text("SET LOCAL enable_seqscan = off"))
+        result = await session.execute(text(f"EXPLAIN {sql}"))
+        return "\n".join(row[0] for row in result.all())
+
+
+@pytest.mark.asyncio
+async def test_search_explain_uses_indexes():
+    """검색 조건이 GIN(tsvector) / pg_trgm 인덱스를 사용"""
+    from sqlalchemy import select
+
+    from app.core.text_search import text_match_and_rank
+    from app.models.menu import Menu
+
+    _, condition, _ = text_match_and_rank(Menu.search_vector, Menu.name, "김치찌개")
+    plan = await _explain(select(Menu.id).where(condition))
+    assert "ix_menus_search_vector" in plan
+    assert "ix_menus_name_trgm" in plan
+
+    plan = await _explain(
+        select(Menu.id).where(Menu.name.ilike("%볶음밥%", escape="\\"))
+    )
+    assert "ix_menus_name_trgm" in plan
+
+
+@pytest.mark.asyncio
+async def test_menus_cursor_pagination():
+    """커서로 끝까지 넘긴 결과가 offset 조회와 같고 중복 없음"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.get("/api/v1/menus/", params={"limit": 100})
+        expected = [menu["id"] for menu in resp.json()["data"]]
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            resp = await client.get("/api/v1/menus/", params=params)
+            assert resp.status_code == 200
+            body = resp.json()
+            seen.extend(menu["id"] for menu in body["data"])
+            cursor = body["next_cursor"]
+            if not cursor:
+                break
+        assert seen == expected
+        assert len(set(seen)) == len(seen)
+
+        # 검색 결과도 커서로 이어서 조회
+        resp = await client.get("/api/v1/search/menus", params={"limit": 2})
+        first = resp.json()
+        resp = await client.get(
+            "/api/v1/search/menus",
+            params={"limit": 2, "cursor": first["next_cursor"]},
+        )
+        second = [menu["id"] for menu in resp.json()["data"]]
+        assert not set(second) & {menu["id"] for menu in first["data"]}
+
+        resp = await client.get("/api/v1/menus/", params={"cursor": "broken"})
+        assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_menu_search_total_matches_filters():
+    """/menus/search/ total은 검색 조건에 맞는 건수 (전체 메뉴 수가 아님)"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        params = {"q": "김치", "limit": 1}
+        resp = await client.get("/api/v1/menus/search/", params=params)
+        assert resp.status_code == 200
+        first = resp.json()["data"]
+        resp = await client.get(
+            "/api/v1/menus/search/", params={"q": "김치", "limit": 100}
+        )
+        matched = resp.json()["data"]["items"]
+        assert first["total"] == len(matched)
+        resp = await client.get("/api/v1/menus/", params={"limit": 100})
+        assert first["total"] < len(resp.json()["data"])
+
+        # 커서 페이지도 같은 total (조건별 캐시)
+        resp = await client.get(
+            "/api/v1/menus/search/",
+            params={**params, "cursor": first["next_cursor"]},
+        )
+        assert resp.json()["data"]["total"] == first["total"]
+
+        # 무한 스크롤용: 건수 생략
+        resp = await client.get(
+            "/api/v1/menus/search/", params={**params, "include_total": "false"}
+        )
+        assert resp.json()["data"]["total"] is None
+
+
+@pytest.mark.asyncio
+async def test_menu_search_whitespace_normalized():
+    """연속/앞뒤 공백이 다른 검색어도 같은 결과와 같은 total (건수 캐시 키와 일치)"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        totals = []
+        names = []
+        for q in ("김치 볶음밥", "  김치   볶음밥 "):
+            resp = await client.get(
+                "/api/v1/menus/search/", params={"q": q, "limit": 100}
+            )
+            data = resp.json()["data"]
+            totals.append(data["total"])
+            names.append([item["name"] for item in data["items"]])
+        assert totals[0] == totals[1] == len(names[0])
+        assert names[0] == names[1]
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_explain_uses_index():
+    """커서 조건이 정렬 식 인덱스 범위 스캔으로 처리됨"""
+    import uuid
+
+    from sqlalchemy import select
+
+    from app.models.menu import Menu
+    from app.repositories.menu_repository import MENU_DISPLAY_ORDER
+
+    after = MENU_DISPLAY_ORDER.after([10, "김치찌개", uuid.UUID(int=0)])
+    stmt = (
+        select(Menu.id)
+        .where(Menu.is_active, after)
+        .order_by(*MENU_DISPLAY_ORDER.order_by())
+        .limit(20)
+    )
+    plan = await _explain(stmt)
+    assert "ix_menus_active_display_order" in plan
+
+
 # ---------------- 즐겨찾기 ----------------
 @pytest.mark.asyncio
 @patch("app.services.auth_service.requests.get")
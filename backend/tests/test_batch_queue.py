@@ -0,0 +1,203 @@
+import asyncio
+
+import pytest
+
+from app.core.batch_queue import BatchQueue, BatchQueueFull
+
+
+class _Recorder:
+    def __init__(self, delay: float = 0.0):
+        self.batches = []
+        self.delay = delay
+
+    async def __call__(self, batch):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.batches.append(list(batch))
+
+
+@pytest.mark.asyncio
+async def test_flush_on_batch_size_and_interval():
+    """batch_size 도달 또는 flush_interval 경과 시 flush"""
+    recorder = _Recorder()
+    queue = BatchQueue("Test", recorder, batch_size=3, flush_interval=0.05)
+    queue.start()
+    for i in range(4):
+        await queue.put(i)
+    await asyncio.sleep(0.15)
+
+    assert recorder.batches == [[0, 1, 2], [3]]
+    assert queue.get_stats()["flushed"] == 4
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_rejects_when_full():
+    """큐가 가득 차면 put_timeout 후 BatchQueueFull"""
+    recorder = _Recorder(delay=0.5)
+    queue = BatchQueue(
+        "Test",
+        recorder,
+        max_size=1,
+        batch_size=1,
+        flush_interval=0.01,
+        put_timeout=0.05,
+    )
+    queue.start()
+    await queue.put(1)  # flush 중 (handler 대기)
+    await asyncio.sleep(0.02)
+    await queue.put(2)  # 큐에 대기
+    with pytest.raises(BatchQueueFull):
+        await queue.put(3)
+    assert queue.get_stats()["rejected"] == 1
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_pending_items():
+    """종료 시 남은 항목을 모두 flush"""
+    recorder = _Recorder()
+    queue = BatchQueue("Test", recorder, batch_size=100, flush_interval=10)
+    queue.start()
+    for i in range(5):
+        await queue.put(i)
+    await queue.stop()
+
+    assert [item for batch in recorder.batches for item in batch] == list(range(5))
+    assert not queue.is_running
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_counts_dropped():
+    """drop 정책은 대기 없이 버리고 dropped 카운터 증가"""
+    recorder = _Recorder(delay=0.2)
+    queue = BatchQueue(
+        "Test",
+        recorder,
+        max_size=1,
+        batch_size=1,
+        flush_interval=0.01,
+        overflow_policy="drop",
+    )
+    queue.start()
+    assert await queue.put(1)
+    await asyncio.sleep(0.02)  # 1은 flush 중
+    assert await queue.put(2)
+    assert not await queue.put(3)
+
+    stats = queue.get_stats()
+    assert stats["dropped"] == 1 and stats["rejected"] == 0
+    await queue.stop()
+    assert [item for batch in recorder.batches for item in batch] == [1, 2]
+
+
+class _Flaky(_Recorder):
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+        self.calls = 0
+
+    async def __call__(self, batch):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("db down")
+        await super().__call__(batch)
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_retried():
+    """handler 실패 시 백오프 후 같은 배치를 다시 기록"""
+    handler = _Flaky(failures=2)
+    queue = BatchQueue(
+        "Test", handler, batch_size=10, flush_interval=0.01, retry_backoff=0.01
+    )
+    queue.start()
+    for i in range(3):
+        await queue.put(i)
+    await asyncio.sleep(0.2)
+
+    assert handler.batches == [[0, 1, 2]]
+    stats = queue.get_stats()
+    assert stats["retries"] == 2 and stats["failed"] == 0 and stats["flushed"] == 3
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_go_to_dead_letter(tmp_path):
+    """재시도를 모두 실패한 배치는 dead-letter 파일에 남김"""
+    import json
+
+    from app.core.batch_queue import jsonl_dead_letter
+
+    path = tmp_path / "dead" / "test.jsonl"
+    queue = BatchQueue(
+        "Test",
+        _Flaky(failures=10),
+        batch_size=10,
+        flush_interval=0.01,
+        max_retries=1,
+        retry_backoff=0.01,
+        dead_letter=jsonl_dead_letter(str(path)),
+    )
+    queue.start()
+    await queue.put({"menu_id": "a"})
+    await queue.put({"menu_id": "b"})
+    await asyncio.sleep(0.2)
+
+    stats = queue.get_stats()
+    assert stats["failed"] == 2 and stats["dead_lettered"] == 2
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["menu_id"] for line in lines] == ["a", "b"]
+    await queue.stop()
+
+
+def test_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        BatchQueue("Test", _Recorder(), overflow_policy="ignore")
+
+
+def test_ab_rollup_counter_merges_increments():
+    """같은 (시각, 그룹, 타입) 증분은 flush 전까지 한 행으로 합쳐짐"""
+    from datetime import datetime, timezone
+
+    from app.services.ab_test_service import AbRollupCounter, hour_bucket
+
+    counter = AbRollupCounter()
+    counter.add([("A", "click", 1), ("A", "click", 2), ("B", "hybrid_quiz", 1)])
+
+    assert counter.get_stats()["pending"] == 2
+    assert counter.get_stats()["recorded"] == 4
+    assert hour_bucket(
+        datetime(2026, 1, 1, 9, 59, 30, tzinfo=timezone.utc)
+    ) == datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_recommendation_log_enqueued_as_one_item(monkeypatch):
+    """로그와 추천 행은 한 항목으로 큐에 들어가고, 저장 함수는 같은 id의 로그를 반환"""
+    import uuid
+    from types import SimpleNamespace
+
+    from app.db.batch_writer import recommendation_log_writer
+    from app.models.recommendation import Recommendation, RecommendationLog
+    from app.repositories.recommendation_repository import RecommendationRepository
+
+    recorder = _Recorder()
+    monkeypatch.setattr(recommendation_log_writer, "handler", recorder)
+    recommendation_log_writer.start()
+    recommendations = [
+        SimpleNamespace(menu=SimpleNamespace(id=uuid.uuid4()), score=0.5, reason="r")
+        for _ in range(3)
+    ]
+    try:
+        log = await RecommendationRepository(None).save_recommendation_log(
+            "session-log", {}, recommendations, "hybrid_quiz", ab_group="A"
+        )
+    finally:
+        await recommendation_log_writer.stop()
+
+    (batch,) = recorder.batches
+    (rows,) = batch
+    assert [model for model, _ in rows] == [RecommendationLog] + [Recommendation] * 3
+    assert isinstance(log, RecommendationLog)
+    assert log.id == rows[0][1]["id"] and log.ab_group == "A"
@@ -15,6 +15,7 @@ from app.core.cache import (
     recommendation_cache,
     user_preference_cache,
 )
+from app.core.recent_items import RecentItemsBuffer
 
 
 class TestMemoryCache:
@@ -255,3 +256,43 @@ class TestCacheStats:
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+class TestRecentItemsBuffer:
+    """세션별 최근 추천 메뉴 링 버퍼 테스트"""
+
+    def test_unknown_session_needs_seed(self):
+        """DB 이력을 채우기 전에는 None (호출 측 fallback)"""
+        buffer = RecentItemsBuffer()
+        assert buffer.get("s1") is None
+
+        buffer.record("s1", ["m3"])
+        assert buffer.get("s1") is None  # 아직 DB 이력 미반영
+
+        assert buffer.seed("s1", ["m1", "m2"]) == {"m1", "m2", "m3"}
+        assert buffer.get("s1") == {"m1", "m2", "m3"}
+
+        buffer.record("s1", ["m4"])
+        assert "m4" in buffer.get("s1")
+
+    def test_ring_buffer_capacity(self):
+        """세션당 용량을 넘으면 오래된 항목부터 밀려남"""
+        buffer = RecentItemsBuffer(items_per_session=3)
+        buffer.seed("s1", ["m1", "m2"])
+        buffer.record("s1", ["m3", "m4"])
+        assert buffer.get("s1") == {"m2", "m3", "m4"}
+
+    def test_session_limit_and_ttl(self):
+        """세션 수 상한(LRU)과 TTL 만료"""
+        buffer = RecentItemsBuffer(max_sessions=2, ttl=1)
+        buffer.seed("s1", ["m1"])
+        buffer.seed("s2", ["m2"])
+        buffer.get("s1")  # s1을 최근 사용으로
+        buffer.seed("s3", ["m3"])
+
+        assert buffer.get("s2") is None
+        assert buffer.get("s1") == {"m1"}
+        assert buffer.get_stats()["evictions"] == 1
+
+        time.sleep(1.1)
+        assert buffer.get("s1") is None
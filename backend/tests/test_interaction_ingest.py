@@ -0,0 +1,79 @@
+import json
+import uuid
+
+import pytest
+
+from app.services.interaction_ingest import (
+    InteractionBatchError,
+    InteractionBatchTooLarge,
+    parse_interaction_batch,
+    read_limited_body,
+)
+
+
+def _record(**overrides):
+    record = {
+        "session_id": "session-1",
+        "menu_id": str(uuid.uuid4()),
+        "interaction_type": "click",
+    }
+    record.update(overrides)
+    return record
+
+
+class TestParseInteractionBatch:
+    """대량 상호작용 본문 파싱/검증 테스트"""
+
+    def test_json_array_and_wrapped_object(self):
+        records = [_record(), _record(interaction_strength=0.5)]
+        parsed = parse_interaction_batch(json.dumps(records).encode())
+        assert [p.interaction_strength for p in parsed] == [1.0, 0.5]
+
+        wrapped = json.dumps({"interactions": records}).encode()
+        assert len(parse_interaction_batch(wrapped, "application/json")) == 2
+
+    def test_ndjson(self):
+        body = "\n".join(json.dumps(_record()) for _ in range(3)) + "\n\n"
+        parsed = parse_interaction_batch(body.encode(), "application/x-ndjson")
+        assert len(parsed) == 3
+        assert all(p.session_id == "session-1" for p in parsed)
+
+    def test_collects_all_validation_errors(self):
+        records = [_record(), _record(interaction_strength=2.0), {"session_id": "s"}]
+        with pytest.raises(InteractionBatchError) as exc_info:
+            parse_interaction_batch(json.dumps(records).encode())
+        indices = {error["index"] for error in exc_info.value.errors}
+        assert indices == {1, 2}
+
+    def test_record_limit_checked_before_validation(self):
+        """건수 초과는 검증 오류보다 먼저 (NDJSON은 초과 줄에서 중단)"""
+        records = [{"session_id": "s"}] * 3
+        with pytest.raises(InteractionBatchTooLarge):
+            parse_interaction_batch(json.dumps(records).encode(), max_records=2)
+        body = "\n".join(json.dumps(r) for r in records) + "\nnot json"
+        with pytest.raises(InteractionBatchTooLarge):
+            parse_interaction_batch(body.encode(), "application/x-ndjson", 2)
+        assert (
+            len(parse_interaction_batch(json.dumps([_record()]).encode(), None, 1)) == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_limited_body_stops_at_max_bytes(self):
+        consumed = []
+
+        async def chunks():
+            for chunk in (b"12345", b"67890", b"abcde"):
+                consumed.append(chunk)
+                yield chunk
+
+        assert await read_limited_body(chunks(), 15) == b"1234567890abcde"
+        consumed.clear()
+        with pytest.raises(InteractionBatchTooLarge):
+            await read_limited_body(chunks(), 8)
+        assert consumed == [b"12345", b"67890"]
+
+    def test_rejects_non_array_body(self):
+        with pytest.raises(InteractionBatchError):
+            parse_interaction_batch(b'{"session_id": "s"}')
+        with pytest.raises(InteractionBatchError):
+            parse_interaction_batch(b"not json")
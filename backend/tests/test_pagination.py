@@ -0,0 +1,54 @@
+import pytest
+
+from app.core.pagination import (
+    KeysetOrder,
+    decode_offset_cursor,
+    encode_offset_cursor,
+)
+
+
+class TestKeysetCursor:
+    """키셋 페이지 커서 테스트"""
+
+    def _order(self, *directions):
+        from sqlalchemy import column
+
+        keys = [(column(name), desc) for name, desc in zip("abc", directions)]
+        return KeysetOrder("test", *keys)
+
+    def test_cursor_round_trip(self):
+        """UUID/datetime/None 값도 그대로 복원"""
+        import uuid
+        from datetime import datetime, timezone
+
+        order = self._order(False, False, False)
+        values = [None, datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc), uuid.uuid4()]
+        assert order.decode(order.encode(values)) == values
+
+    def test_rejects_foreign_or_broken_cursor(self):
+        """다른 정렬의 커서나 깨진 토큰은 ValueError"""
+        order = self._order(False, False)
+        cursor = order.encode([1, "a"])
+        with pytest.raises(ValueError):
+            KeysetOrder("other", *order.keys).decode(cursor)
+        with pytest.raises(ValueError):
+            self._order(False).decode(cursor)
+        with pytest.raises(ValueError):
+            order.decode("not-a-cursor")
+        with pytest.raises(ValueError):
+            decode_offset_cursor("test", cursor)
+
+    def test_offset_cursor(self):
+        cursor = encode_offset_cursor("index", 40)
+        assert decode_offset_cursor("index", cursor) == 40
+        with pytest.raises(ValueError):
+            decode_offset_cursor("index", encode_offset_cursor("index", -1))
+
+    def test_after_condition(self):
+        """방향이 같으면 행 비교, 섞이면 첫 키 범위 + OR 조건"""
+        same = str(self._order(True, True).after([1, 2]))
+        assert "(a, b) < (" in same
+
+        mixed = str(self._order(True, False).after([1, 2]))
+        assert "a <= " in mixed
+        assert " OR " in mixed
@@ -0,0 +1,812 @@
+import os
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.config_weights import WeightSetRegistry, compile_weights
+from app.core.hangul import (
+    JamoIndex,
+    chosung,
+    decompose_jamo,
+    substring_edit_distance,
+)
+from app.core.preference_vector import (
+    BASE_SIZE,
+    PreferenceVector,
+    country_dictionary,
+)
+from app.core.text_search import bigram_tokens, build_tsquery, like_pattern
+from app.models.user_preference import UserPreference
+from app.services.ab_test_service import AbGroupBandit
+from app.services.als_service import ALSModel, save_factors, train_als
+from app.services.item_cf_service import CooccurrenceModel, SourceWatermark
+from app.services.menu_search_index import (
+    MenuDocument,
+    MenuSearchIndex,
+    decode_postings,
+    encode_postings,
+    parse_facets,
+)
+from app.services.neighbor_service import NeighborIndex, NeighborSnapshot
+from app.repositories.user_preference_repository import LearnedPreference
+from app.services.preference_store import PreferenceStore
+from app.services.search_stats_service import SearchStats
+from app.services.suggest_service import SuggestionTrie, SuggestService
+from app.services.preference_service import (
+    PreferenceService,
+    apply_interaction_learning,
+)
+
+
+def _snapshot(vectors, liked_by_session=None):
+    menu_ids = [uuid.uuid4() for _ in range(3)]
+    session_ids = [f"session-{i}" for i in range(len(vectors))]
+    return (
+        NeighborSnapshot(
+            session_ids=session_ids,
+            user_ids=[None] * len(vectors),
+            matrix=np.array(vectors, dtype=np.float32),
+            liked_by_session=liked_by_session(menu_ids) if liked_by_session else {},
+            liked_by_user={},
+            menu_names={menu_id: f"메뉴{i}" for i, menu_id in enumerate(menu_ids)},
+        ),
+        menu_ids,
+    )
+
+
+class TestNeighborIndex:
+    """협업 필터링 이웃 인덱스 테스트"""
+
+    def test_rebuild_and_lookup(self):
+        """전체 재계산 후 세션별 이웃/후보 조회"""
+        snapshot, menu_ids = _snapshot(
+            [[1.0] + [0.0] * 9, [0.9, 0.1] + [0.0] * 8, [0.0] * 9 + [1.0]],
+            liked_by_session=lambda ids: {
+                "session-0": {ids[0]},
+                "session-1": {ids[1], ids[0]},
+                "session-2": {ids[2]},
+            },
+        )
+        index = NeighborIndex(neighbor_count=5, min_similarity=0.3)
+        assert index.rebuild(snapshot) == 3
+
+        entry = index.get("session-0")
+        assert [sid for sid, _ in entry.neighbors] == ["session-1"]
+        # 이미 좋아한 메뉴는 제외, 유사하지 않은 세션의 메뉴도 제외
+        assert [c.menu_id for c in entry.candidates] == [menu_ids[1]]
+        assert entry.candidates[0].similar_users_count == 1
+
+    def test_drift_marks_only_changed_session_dirty(self):
+        """선호도 변화량이 임계값을 넘은 세션만 dirty 표시"""
+        snapshot, _ = _snapshot([[0.5] * 10, [0.5] * 10])
+        index = NeighborIndex(drift_threshold=0.1)
+        index.rebuild(snapshot)
+
+        assert not index.observe("session-0", [0.52] + [0.5] * 9)
+        assert index.observe("session-1", [1.0] + [0.5] * 9)
+        assert not index.observe("unknown", [1.0] * 10)
+        assert index.pop_dirty() == {"session-1"}
+        assert index.pop_dirty() == set()
+
+    def test_dirty_marks_during_compute_survive_swap(self):
+        """워커 스레드 계산 중 표시된 dirty 세션은 참조 교체 후에도 남음"""
+        snapshot, _ = _snapshot([[0.5] * 10, [0.5] * 10])
+        index = NeighborIndex(drift_threshold=0.1)
+        index.rebuild(snapshot)
+
+        normalized, entries = index.compute(snapshot)
+        assert index.observe("session-1", [1.0] + [0.5] * 9)
+        assert index.swap(snapshot, normalized, entries) == 2
+        assert index.pop_dirty() == {"session-1"}
+
+    def test_refresh_single_session(self):
+        """처음 보는 세션은 활성 행렬과 비교해 바로 저장"""
+        snapshot, menu_ids = _snapshot(
+            [[1.0] + [0.0] * 9, [0.0] * 9 + [1.0]],
+            liked_by_session=lambda ids: {"session-1": {ids[2]}},
+        )
+        index = NeighborIndex(min_similarity=0.3)
+        index.rebuild(snapshot)
+
+        entry = index.refresh_session("new-session", None, [0.0] * 9 + [0.8])
+        assert entry.neighbors[0][0] == "session-1"
+        assert [c.menu_id for c in entry.candidates] == [menu_ids[2]]
+        assert index.get("new-session") is entry
+
+    def test_transient_sessions_bounded_and_rows_copied(self):
+        """행렬 밖 세션은 LRU 상한 유지, 활성 세션 갱신은 기존 행렬을 건드리지 않음"""
+        snapshot, _ = _snapshot([[1.0] + [0.0] * 9, [0.0] * 9 + [1.0]])
+        index = NeighborIndex(max_transient=2)
+        index.rebuild(snapshot)
+        before = index._normalized
+
+        for i in range(3):
+            index.refresh_session(f"anon-{i}", None, [1.0] * 10)
+        assert index.get("anon-0") is None
+        assert index.get("anon-2") is not None
+        assert index.get_stats()["transient_sessions"] == 2
+
+        index.refresh_session("session-0", None, [0.0] * 9 + [1.0])
+        assert before[0, 0] == 1.0
+        assert index._normalized[0, 9] == 1.0
+        assert index.get_stats()["sessions"] == 2
+
+
+class TestCooccurrenceModel:
+    """아이템 동시출현(CSR) 모델 테스트"""
+
+    def setup_method(self):
+        self.menus = [uuid.uuid4() for _ in range(4)]
+        a, b, c, d = self.menus
+        self.pairs = [
+            ("s:1", a),
+            ("s:1", b),
+            ("s:2", a),
+            ("s:2", b),
+            ("s:2", c),
+            ("u:1", c),
+            ("u:1", d),
+            ("s:1", a),  # 같은 바구니 중복은 한 번만 집계
+        ]
+
+    def test_build_csr(self):
+        """CSR 구조와 코사인 정규화 가중치 확인"""
+        model = CooccurrenceModel()
+        model.build(self.pairs)
+        a, b = model.menu_index[self.menus[0]], model.menu_index[self.menus[1]]
+
+        assert model.indptr.shape == (5,)
+        assert model.indices.size == 8  # (a,b) (a,c) (b,c) (c,d) 양방향
+        assert model.item_counts[a] == 2
+        row = slice(model.indptr[a], model.indptr[a + 1])
+        weights = dict(zip(model.indices[row], model.weights[row]))
+        assert np.isclose(weights[b], 2 / np.sqrt(2 * 2))
+
+    def test_similar_excludes_seeds(self):
+        """시드 집합 조회 시 시드 자신은 제외하고 점수순 정렬"""
+        model = CooccurrenceModel()
+        model.build(self.pairs)
+        a, b, c, d = self.menus
+
+        result = model.similar([a], limit=10)
+        assert [menu_id for menu_id, _ in result] == [b, c]
+        assert model.similar([a, b], limit=1)[0][0] == c
+        assert model.similar([uuid.uuid4()]) == []
+
+    def test_incremental_add_matches_rebuild(self):
+        """증분 반영 후 압축한 결과가 전체 재구축과 동일"""
+        new_menu = uuid.uuid4()
+        extra = [("s:1", self.menus[2]), ("s:3", new_menu), ("s:3", self.menus[0])]
+
+        incremental = CooccurrenceModel(compact_threshold=10**9)
+        incremental.build(self.pairs)
+        for basket, menu_id in extra:
+            incremental.add(basket, menu_id)
+        before_compact = incremental.similar([self.menus[0]], limit=10)
+        incremental.compact()
+
+        rebuilt = CooccurrenceModel()
+        rebuilt.build(self.pairs + extra)
+
+        expected = rebuilt.similar([self.menus[0]], limit=10)
+        assert incremental.similar([self.menus[0]], limit=10) == expected
+        assert [m for m, _ in before_compact] == [m for m, _ in expected]
+
+    def test_memory_report(self):
+        """메모리 리포트에 주요 항목 포함"""
+        model = CooccurrenceModel()
+        model.build(self.pairs)
+        report = model.memory_report()
+        assert report["items"] == 4
+        assert report["baskets"] == 3
+        assert report["nnz"] == 8
+        assert report["total_bytes"] >= report["csr_bytes"] > 0
+
+    def test_source_watermark_rescans_overlap(self):
+        """늦게 커밋된 이른 시각 행은 겹침 구간 재조회로 반영, 이미 본 id는 제외"""
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        watermark = SourceWatermark(overlap=timedelta(seconds=60))
+        assert watermark.since is None
+        assert [
+            r[0] for r in watermark.take([(1, base), (2, base + timedelta(seconds=10))])
+        ] == [1, 2]
+        assert watermark.since == base + timedelta(seconds=10) - timedelta(seconds=60)
+
+        late = (3, base + timedelta(seconds=5))
+        rescanned = [(2, base + timedelta(seconds=10)), late]
+        assert watermark.take(rescanned) == [late]
+        assert watermark.take(rescanned) == []
+        assert watermark.watermark == base + timedelta(seconds=10)
+
+
+class TestALS:
+    """ALS 잠재요인 모델 테스트"""
+
+    def _interactions(self):
+        # 세션 0~9는 메뉴 0~2, 세션 10~19는 메뉴 3~5를 주로 선택
+        rows, cols = [], []
+        for session in range(20):
+            group = range(0, 3) if session < 10 else range(3, 6)
+            for menu in group:
+                if (session + menu) % 4:  # 일부는 비워 추천 대상으로 남김
+                    rows.append(session)
+                    cols.append(menu)
+        return np.array(rows), np.array(cols), np.ones(len(rows))
+
+    def test_train_recovers_groups(self):
+        """같은 그룹 메뉴가 다른 그룹 메뉴보다 높은 점수"""
+        rows, cols, strengths = self._interactions()
+        users, items = train_als(rows, cols, strengths, 20, 6, factors=2, iterations=10)
+
+        assert users.shape == (20, 2) and items.shape == (6, 2)
+        assert users.dtype == np.float32
+        scores = users @ items.T
+        assert scores[:10, :3].mean() > scores[:10, 3:].mean()
+        assert scores[10:, 3:].mean() > scores[10:, :3].mean()
+
+    def test_save_load_and_fold_in(self, tmp_path):
+        """mmap 로드 후 세션 조회 및 미학습 세션 fold-in"""
+        rows, cols, strengths = self._interactions()
+        users, items = train_als(rows, cols, strengths, 20, 6, factors=2, iterations=10)
+        session_ids = [f"session-{i}" for i in range(20)]
+        menu_ids = [uuid.uuid4() for _ in range(6)]
+        save_factors(
+            str(tmp_path), session_ids, users, menu_ids, items, {"alpha": 20.0}
+        )
+
+        model = ALSModel()
+        assert model.load(str(tmp_path))
+        assert not model.load(str(tmp_path))  # 같은 버전은 다시 읽지 않음
+        assert isinstance(model.session_factors, np.memmap)
+        assert np.allclose(model.session_vector("session-13"), users[13])
+        assert model.session_vector("unknown") is None
+
+        vector = model.fold_in({menu_ids[3]: 1.0, menu_ids[4]: 1.0})
+        top = [menu_id for menu_id, _ in model.recommend(vector, limit=3)]
+        assert set(top) == set(menu_ids[3:])
+        excluded = model.recommend(vector, limit=6, exclude=[menu_ids[3]])
+        assert menu_ids[3] not in [menu_id for menu_id, _ in excluded]
+
+        # 비활성 메뉴는 top-k 선택 전에 제외되어 limit 개수를 채움
+        model.set_inactive([menu_ids[3]])
+        top = [menu_id for menu_id, _ in model.recommend(vector, limit=3)]
+        assert len(top) == 3 and menu_ids[3] not in top
+
+    def test_save_prunes_old_versions(self, tmp_path):
+        """최신 keep_versions 개만 남기고 이전 버전 디렉토리 삭제"""
+        users = np.ones((1, 2), np.float32)
+        items = np.ones((1, 2), np.float32)
+        paths = [
+            save_factors(
+                str(tmp_path), ["s"], users, [uuid.uuid4()], items, {}, keep_versions=2
+            )
+            for _ in range(4)
+        ]
+        remaining = sorted(p.name for p in tmp_path.iterdir() if p.is_dir())
+        assert remaining == sorted(os.path.basename(p) for p in paths[-2:])
+        assert ALSModel().load(str(tmp_path))
+
+
+def _menu(country="한식", **flags):
+    attrs = {
+        "is_spicy": False,
+        "is_healthy": False,
+        "is_vegetarian": False,
+        "is_quick": False,
+        "has_rice": False,
+        "has_soup": False,
+        "has_meat": False,
+        "time_slot": "lunch",
+    }
+    attrs.update(flags)
+    return SimpleNamespace(category=SimpleNamespace(country=country), **attrs)
+
+
+@pytest.fixture
+def countries():
+    country_dictionary.clear()
+    country_dictionary.register([(1, "한식"), (2, "일식")])
+    yield
+    country_dictionary.clear()
+
+
+class TestPreferenceLearning:
+    """상호작용 학습 규칙 테스트 (단건/배치 경로 공통)"""
+
+    def test_sequential_updates(self, countries):
+        """추천 5개를 순서대로 반영한 결과 (퀴즈 학습 경로와 동일 규칙)"""
+        preference = UserPreference(session_id="session", total_interactions=0)
+        menus = [
+            _menu(is_spicy=True, has_rice=True),
+            _menu(is_spicy=True, has_soup=True, time_slot="dinner"),
+            _menu(country="일식", is_healthy=True),
+            _menu(is_spicy=True, has_meat=True),
+            _menu(is_quick=True, time_slot="breakfast"),
+        ]
+        for menu in menus:
+            apply_interaction_learning(preference, menu, 0.8)
+
+        assert preference.spicy_preference == pytest.approx(0.5 + 0.08 * 3 - 0.04 * 2)
+        assert preference.healthy_preference == pytest.approx(0.5 + 0.08 - 0.04 * 4)
+        assert preference.vegetarian_preference == pytest.approx(0.5 - 0.04 * 5)
+        assert preference.lunch_preference == pytest.approx(0.33 + 0.08 * 3)
+        assert preference.dinner_preference == pytest.approx(0.34 + 0.08)
+        assert preference.vector.country_preferences() == pytest.approx(
+            {"한식": 0.5 + 0.08 * 4, "일식": 0.58}
+        )
+        assert len(preference.preference_vector) == BASE_SIZE + 2
+        assert preference.total_interactions == 5
+
+    def test_clamped_to_unit_range(self, countries):
+        """선호도는 0.0 ~ 1.0 범위 유지"""
+        preference = UserPreference(session_id="session", total_interactions=0)
+        for _ in range(20):
+            apply_interaction_learning(preference, _menu(is_spicy=True), 1.0)
+        assert preference.spicy_preference == 1.0
+        assert preference.healthy_preference == 0.0
+
+
+class TestPreferenceVector:
+    """패킹 선호도 벡터 테스트"""
+
+    def test_legacy_columns_and_pack_roundtrip(self, countries):
+        """개별 컬럼에서 만든 벡터가 패킹 후에도 같음 (국가는 패킹 벡터에만 저장)"""
+        preference = UserPreference(session_id="session", spicy_preference=0.9)
+        vector = preference.vector
+        assert vector.values.dtype == np.float32
+        assert vector.get("spicy_preference") == pytest.approx(0.9)
+        assert vector.get("healthy_preference") == pytest.approx(0.5)
+        assert vector.country("일식") is None  # 학습 전 국가는 NaN
+        assert not hasattr(UserPreference, "country_preferences")
+
+        vector.learn(_menu(country="일식"), 1.0)
+        preference.store_vector(vector)
+        assert preference.vector.country("일식") == pytest.approx(0.6)
+        assert vector.country("한식") is None
+
+        packed = PreferenceVector.from_packed(vector.to_packed())
+        assert np.array_equal(packed.values, vector.values, equal_nan=True)
+        assert preference.vector is vector  # 같은 패킹 값이면 다시 변환하지 않음
+
+    def test_new_country_extends_vector(self, countries):
+        """사전에 국가가 추가되면 기존 벡터는 NaN으로 확장 후 학습"""
+        vector = PreferenceVector.default()
+        country_dictionary.register([(3, "태국")])
+        vector.learn(_menu(country="태국"), 1.0)
+        assert vector.values.size == BASE_SIZE + 3
+        assert vector.country("태국") == pytest.approx(0.6)
+        assert vector.country_preferences() == pytest.approx({"태국": 0.6})
+
+    def test_cosine_and_scores(self):
+        """유사도는 기본 속성 기준, 점수는 메뉴 속성 가중합"""
+        a = PreferenceVector.default()
+        b = PreferenceVector(a.values * 2)
+        assert a.cosine(b) == pytest.approx(1.0)
+        assert a.cosine(PreferenceVector(np.zeros(BASE_SIZE, np.float32))) == 0.0
+
+        weights = dict.fromkeys(["spicy", "healthy", "vegetarian", "quick"], 2.0)
+        weights.update(rice=1.0, soup=1.0, meat=1.0)
+        weights = compile_weights(weights)
+        menu = _menu(is_spicy=True, has_rice=True)
+        assert a.attribute_score(menu, weights) == pytest.approx(0.5 * 2 + 0.5 * 1)
+        assert a.time_slot("dinner") == pytest.approx(0.34)
+        assert a.time_slot(None) == 1.0
+
+
+class TestWeightSetRegistry:
+    """버전별 가중치 세트 레지스트리 테스트"""
+
+    def test_compiled_vectors_and_swap(self):
+        """가중치는 읽기 전용 벡터로 컴파일되고 교체는 그룹 단위로 반영"""
+        registry = WeightSetRegistry()
+        original = registry.get("B")
+        assert original.version == 0
+        assert not original.vector.flags.writeable
+        assert registry.get(None) is registry.get("A")
+        assert registry.get("unknown") is registry.get("A")
+
+        weights = dict.fromkeys(original.weights, 1.0)
+        registry.swap([("B", 3, weights)])
+        assert registry.versions() == {"A": 0, "B": 3, "C": 0}
+        assert registry.get("B").vector.tolist() == [1.0] * len(weights)
+        assert original.version == 0  # 교체 전 세트를 쥔 요청은 그대로 사용
+
+        with pytest.raises(ValueError):
+            compile_weights({"spicy": 1.0})
+
+
+class TestTextSearch:
+    """한국어 글자 2-gram 검색어 변환 테스트"""
+
+    def test_bigram_tokens(self):
+        """DB korean_bigrams()와 같은 규칙 (한 글자 단어는 그대로)"""
+        assert bigram_tokens("김치찌개") == ["김치", "치찌", "찌개"]
+        assert bigram_tokens("국, 김밥") == ["국", "김밥"]
+        assert bigram_tokens("  ") == []
+
+    def test_build_tsquery(self):
+        """2-gram AND 연결, 한 글자 단어는 접두 일치, 토큰 없으면 None"""
+        assert build_tsquery("김치찌개") == "'김치' & '치찌' & '찌개'"
+        assert build_tsquery("국 밥밥밥") == "'국':* & '밥밥'"
+        assert build_tsquery("%'&") is None
+
+    def test_like_pattern_escapes_wildcards(self):
+        """ILIKE 와일드카드 이스케이프"""
+        assert like_pattern("50%_할인") == "%50\\%\\_할인%"
+
+
+def _menu_doc(name, **kwargs):
+    fields = dict(
+        menu_id=uuid.uuid4(),
+        name=name,
+        description=None,
+        ingredients=None,
+        category_name="한국 전통 요리",
+        category_id="korean",
+        country="한국",
+        cuisine_type="한식",
+        time_slot="lunch",
+        difficulty="easy",
+        is_spicy=False,
+        is_healthy=False,
+        is_vegetarian=False,
+        is_quick=False,
+        has_rice=False,
+        has_soup=False,
+        has_meat=False,
+        calories=500,
+        rating=4.0,
+    )
+    fields.update(kwargs)
+    return MenuDocument(**fields)
+
+
+class TestMenuSearchIndex:
+    """메뉴 검색 인메모리 역색인 테스트"""
+
+    def test_postings_roundtrip(self):
+        """차분 varint 압축/복원"""
+        slots = np.array([0, 3, 200, 100000], dtype=np.int64)
+        weights = np.array([8, 1, 300, 2], dtype=np.int64)
+        data = encode_postings(slots, weights)
+        assert len(data) < slots.nbytes + weights.nbytes
+        decoded_slots, decoded_weights = decode_postings(data)
+        assert decoded_slots.tolist() == slots.tolist()
+        assert decoded_weights.tolist() == weights.tolist()
+
+    def test_search_ranks_and_filters(self):
+        """이름 일치가 재료 일치보다 먼저, 속성 필터는 교집합으로 적용"""
+        stew = _menu_doc("김치찌개", is_spicy=True, has_soup=True)
+        rice = _menu_doc("김치볶음밥", is_spicy=True, rating=4.5)
+        noodle = _menu_doc("비빔국수", ingredients="국수, 김치, 고추장")
+        sushi = _menu_doc("초밥", category_name="일본 요리", country="일본")
+        index = MenuSearchIndex()
+        assert index.rebuild([stew, rice, noodle, sushi], None) == 4
+
+        ids, total = index.search("김치")
+        assert total == 3
+        assert ids[-1] == noodle.menu_id
+        assert set(ids[:2]) == {stew.menu_id, rice.menu_id}
+
+        assert index.search("김치찌개")[0] == [stew.menu_id]
+        assert index.search("김치", {"has_soup": True})[0] == [stew.menu_id]
+        assert index.search("김치", {"max_calories": 100}) == ([], 0)
+        assert index.search("일본")[0] == [sushi.menu_id]  # 카테고리명
+        assert index.search("초")[0] == [sushi.menu_id]  # 한 글자 접두 일치
+        assert index.search("없는메뉴") == ([], 0)
+        assert index.search("ㄱㅊㅉㄱ")[0] == [stew.menu_id]  # 초성
+        assert index.search("김치ㅂ")[0] == [rice.menu_id]  # 입력 중 음절
+        assert index.search("김치찌게")[0] == [stew.menu_id]  # 자모 오타
+        with pytest.raises(ValueError):
+            index.search("김치", {"unknown": 1})
+
+    def test_incremental_update(self):
+        """바뀐 메뉴만 다시 색인하고 삭제/비활성 메뉴는 제거"""
+        stew = _menu_doc("김치찌개")
+        soup = _menu_doc("된장찌개")
+        index = MenuSearchIndex()
+        index.rebuild([stew, soup], None)
+
+        renamed = _menu_doc("부대찌개", menu_id=stew.menu_id)
+        added = _menu_doc("순두부찌개")
+        index.update([renamed, added], [stew.menu_id, soup.menu_id, added.menu_id], 1)
+        assert index.search("김치") == ([], 0)
+        assert index.search("부대")[0] == [stew.menu_id]
+        assert index.search("찌개")[1] == 3
+        assert index.version == 1
+
+        inactive = _menu_doc("순두부찌개", menu_id=added.menu_id, is_active=False)
+        index.update([inactive], [stew.menu_id, added.menu_id], 2)
+        assert len(index) == 1
+        assert index.search("찌개")[0] == [stew.menu_id]
+
+    def test_facets(self):
+        """패싯은 필터 적용 후 일치 결과 전체 기준 (페이지와 무관)"""
+        index = MenuSearchIndex()
+        index.rebuild(
+            [
+                _menu_doc("김치찌개", is_spicy=True, time_slot="dinner"),
+                _menu_doc("김치볶음밥", is_spicy=True),
+                _menu_doc("김치전", difficulty="medium"),
+                _menu_doc("김치라멘", country="일본"),
+                _menu_doc("된장찌개"),
+            ],
+            None,
+        )
+        facets = ["is_spicy", "time_slot", "country", "difficulty"]
+        ids, total, counts = index.search_with_facets("김치", limit=1, facets=facets)
+        assert (len(ids), total) == (1, 4)
+        assert counts == {
+            "is_spicy": 2,
+            "time_slot": {"lunch": 3, "dinner": 1},
+            "country": {"한국": 3, "일본": 1},
+            "difficulty": {"easy": 3, "medium": 1},
+        }
+
+        _, total, counts = index.search_with_facets(
+            "김치", {"is_spicy": True}, facets=["time_slot"]
+        )
+        assert total == 2
+        assert counts == {"time_slot": {"lunch": 1, "dinner": 1}}
+        assert index.search_with_facets("없는메뉴", facets=["is_spicy"])[2] == {
+            "is_spicy": 0
+        }
+        with pytest.raises(ValueError):
+            parse_facets("is_spicy,unknown")
+        assert parse_facets(" time_slot, is_spicy,time_slot") == [
+            "time_slot",
+            "is_spicy",
+        ]
+
+
+class TestSuggestionTrie:
+    """자동완성 트라이 테스트"""
+
+    def test_prefix_top_k_by_popularity(self):
+        """접두어별 인기순 상위 K개, 공백 무시, 두 번째 단어부터도 일치"""
+        trie = SuggestionTrie(top_k=2)
+        trie.build(
+            [
+                ("김치찌개", 5.0, ["김치찌개"]),
+                ("김치볶음밥", 9.0, ["김치볶음밥"]),
+                ("김밥", 7.0, ["김밥"]),
+                ("한국 전통 요리", 1.0, ["한국전통요리", "전통요리", "요리"]),
+            ]
+        )
+        assert trie.suggest("김") == ["김치볶음밥", "김밥"]
+        assert trie.suggest("김치") == ["김치볶음밥", "김치찌개"]
+        assert trie.suggest("김치 찌") == ["김치찌개"]
+        assert trie.suggest("요리") == ["한국 전통 요리"]
+        assert trie.suggest("없") == []
+        assert trie.suggest("ㄱㅊ") == ["김치볶음밥", "김치찌개"]
+        assert trie.suggest("ㅇㄹ") == ["한국 전통 요리"]
+        assert trie.suggest("김치찌게") == ["김치찌개"]
+        assert trie.suggest(" ") == []
+
+    def test_entries_weighted_by_menu_popularity(self):
+        """카테고리/재료 점수는 포함한 메뉴 점수의 합"""
+        stew = _menu_doc("김치찌개", ingredients="김치, 돼지고기")
+        rice = _menu_doc("김치볶음밥", ingredients="김치, 밥")
+        entries = SuggestService.build_entries(
+            [stew, rice], {stew.menu_id: 10, rice.menu_id: 1}
+        )
+        scores = {text: score for text, score, _ in entries}
+        assert scores["김치"] == pytest.approx(
+            scores["김치찌개"] + scores["김치볶음밥"]
+        )
+        assert scores["김치찌개"] > scores["김치볶음밥"]
+
+        trie = SuggestionTrie()
+        trie.build(entries)
+        assert trie.suggest("김치")[:2] == ["김치", "김치찌개"]
+
+
+class TestHangulJamo:
+    """초성/자모 분해와 자모 색인 테스트"""
+
+    def test_decompose(self):
+        """겹받침/이중모음은 자판 입력 단위로 분해, 공백 제거"""
+        assert decompose_jamo("닭") == "ㄷㅏㄹㄱ"
+        assert decompose_jamo("된장 국") == "ㄷㅗㅣㄴㅈㅏㅇㄱㅜㄱ"
+        assert chosung("김치 찌개") == "ㄱㅊㅉㄱ"
+        assert (
+            substring_edit_distance("ㅊㅣㅉㅣㄱㅔ", decompose_jamo("김치찌개"), 1) == 1
+        )
+        assert substring_edit_distance("ㅋㅋㅋㅋ", decompose_jamo("김치찌개"), 1) == 2
+
+    def test_prefix_and_fuzzy(self):
+        """초성/입력 중 음절 접두 일치, 자모 한 글자 오타 허용"""
+        index = JamoIndex()
+        index.update({0: "김치찌개", 1: "김치볶음밥", 2: "된장찌개", 3: "닭 갈비"})
+        assert index.prefix_ids("ㄱㅊㅉㄱ") == [0]
+        assert sorted(index.prefix_ids("ㄱㅊ")) == [0, 1]
+        assert index.prefix_ids("김치ㅂ") == [1]
+        assert index.prefix_ids("ㄱㅂ") == [3]  # 두 번째 단어부터
+        assert index.fuzzy("김치찌게") == [(0, 1)]
+        assert index.fuzzy("된잔찌개") == [(2, 1)]
+        assert index.fuzzy("킴") == []  # 짧은 입력은 오타 허용 안 함
+
+        index.update({0: "부대찌개"}, removed=[2])
+        assert index.prefix_ids("ㄱㅊㅉ") == []
+        assert index.prefix_ids("ㅂㄷ") == [0]
+        assert index.fuzzy("된잔찌개") == []
+
+
+class TestSearchStats:
+    """GROUPING SETS 결과 구성과 증감 반영 테스트"""
+
+    def test_rebuild_and_apply(self):
+        korean, chinese = uuid.uuid4(), uuid.uuid4()
+        stats = SearchStats()
+        stats.apply(None, ("lunch", korean, 4.0))  # 구성 전 증감은 무시
+        stats.rebuild(
+            [
+                (1, 1, None, None, None, 3, 2, 8.0),
+                (0, 1, "lunch", None, None, 2, 0, None),
+                (0, 1, "dinner", None, None, 1, 0, None),
+                (1, 0, None, korean, "한국", 2, 0, None),
+                (1, 0, None, chinese, "중국", 1, 0, None),
+            ]
+        )
+        assert stats.snapshot() == {
+            "total_menus": 3,
+            "time_slot_distribution": {"breakfast": 0, "lunch": 2, "dinner": 1},
+            "country_distribution": {"한국": 2, "중국": 1},
+            "average_rating": 4.0,
+        }
+
+        stats.apply(None, ("breakfast", korean, 5.0))
+        stats.apply(("lunch", chinese, None), ("dinner", chinese, 2.0))
+        stats.apply(("dinner", korean, None), None)
+        snapshot = stats.snapshot()
+        assert snapshot["total_menus"] == 3
+        assert snapshot["time_slot_distribution"] == {
+            "breakfast": 1,
+            "lunch": 1,
+            "dinner": 1,
+        }
+        assert snapshot["country_distribution"] == {"한국": 2, "중국": 1}
+        assert snapshot["average_rating"] == round(15.0 / 4, 2)
+
+    def test_local_changes_explain_new_version(self):
+        """이 워커의 변경으로만 바뀐 카탈로그 버전은 재집계 대상이 아님"""
+        korean = uuid.uuid4()
+        t0 = datetime(2026, 10, 1, 12, 0)
+        t1, t2 = t0 + timedelta(minutes=1), t0 + timedelta(minutes=2)
+        stats = SearchStats()
+        stats.rebuild([(1, 1, None, None, None, 2, 0, None)], (2, t0, 1, t0))
+
+        stats.apply(None, ("lunch", korean, None), t1)  # 이 워커에서 생성
+        assert stats.explains((3, t1, 1, t0))
+        assert not stats.explains((3, t2, 1, t0))  # 다른 워커의 수정 시각
+        assert not stats.explains((4, t1, 1, t0))  # 메뉴 수가 맞지 않음
+        assert not stats.explains((3, t1, 2, t1))  # 카테고리 변경
+
+        stats.adopt((3, t1, 1, t0))
+        stats.apply(("lunch", korean, None), None)  # 이 워커에서 삭제
+        assert stats.explains((2, t1, 1, t0))
+
+
+class TestPriorPreference:
+    """처음 보는 세션의 기본 선호도 테스트"""
+
+    def test_prior_is_transient_defaults(self):
+        """저장되지 않은 기본값 객체, 점수/사유 계산에 필요한 컬럼은 채워짐"""
+        preference = PreferenceService.prior_preference("new-session")
+        assert not preference.is_persisted
+        assert preference.total_interactions == 0
+        assert preference.spicy_preference == pytest.approx(0.5)
+        assert preference.dinner_preference == pytest.approx(0.34)
+        assert preference.vector.time_slot("lunch") == pytest.approx(0.33)
+
+    def test_ab_group_is_stable(self):
+        """같은 세션은 행 생성 전후 같은 A/B 그룹"""
+        groups = {PreferenceService.assign_ab_group(f"s-{i}") for i in range(100)}
+        assert groups == {"A", "B", "C"}
+        assert (
+            PreferenceService.assign_ab_group("s-1")
+            == PreferenceService.prior_preference("s-1").ab_group
+        )
+        user_id = uuid.uuid4()
+        assert PreferenceService.assign_ab_group(
+            "s-1", user_id
+        ) == PreferenceService.assign_ab_group("s-2", user_id)
+
+
+class TestAbGroupBandit:
+    """A/B 그룹 배정 밴딧 메모리 동작 테스트 (DB 기록은 test_api)"""
+
+    def test_traffic_moves_to_better_group(self):
+        """보상이 많은 그룹에 더 많이 배정, 배정된 키는 그룹 유지"""
+        bandit = AbGroupBandit()
+        sticky = bandit.choose("early-session")
+        for group, rewards in (("A", 50), ("B", 300), ("C", 50)):
+            bandit.observe(group, "personalized_simple", 1000)
+            bandit.observe(group, "recommend_select", rewards)
+            bandit.observe(group, "click", 500)  # 보상이 아닌 상호작용은 무시
+
+        alpha, beta = bandit.posteriors()
+        assert alpha.tolist() == [51, 301, 51]
+        assert beta.tolist() == [951, 701, 951]
+
+        chosen = [bandit.choose(f"s-{i}") for i in range(300)]
+        assert chosen.count("B") > 250
+        assert bandit.choose("early-session") == sticky
+
+    def test_quiz_auto_select_is_not_a_reward(self):
+        """퀴즈 자동 기록은 보상이 아니고, 성공은 노출 수를 넘지 않음"""
+        bandit = AbGroupBandit()
+        bandit.observe("A", "hybrid_quiz", 10)
+        bandit.observe("A", "auto_select", 50)  # 퀴즈마다 추천 결과 수만큼 자동 기록
+        bandit.observe("B", "personalized_simple", 10)
+        bandit.observe("B", "favorite", 30)
+
+        alpha, beta = bandit.posteriors()
+        assert (alpha[0], beta[0]) == (1, 11)
+        assert (alpha[1], beta[1]) == (11, 1)
+
+
+class TestPreferenceStore:
+    """선호도 write-back 저장소 메모리 동작 테스트 (DB 기록은 test_api)"""
+
+    @staticmethod
+    def _preference(session_id):
+        preference = PreferenceService.prior_preference(session_id)
+        preference.id = uuid.uuid4()
+        preference.version = 0
+        return preference
+
+    def test_lookup_by_session_and_lru(self):
+        """보관한 선호도는 DB 없이 조회, 상한을 넘으면 오래된 항목부터 제거"""
+        store = PreferenceStore(max_entries=2)
+        first = self._preference("s-1")
+        store._adopt(first, ("s-1", None))
+        store._adopt(self._preference("s-2"), ("s-2", None))
+        assert store.get("s-1").id == first.id  # s-1이 최근 사용으로 이동
+
+        store._adopt(self._preference("s-3"), ("s-3", None))
+        assert store.get("s-2") is None
+        assert store.get("s-1").id == first.id
+        assert store.get_stats()["evictions"] == 1
+
+    def test_get_returns_independent_copy(self):
+        """요청마다 복사본을 돌려주므로 한 요청의 변경이 저장소·다른 요청에 번지지 않음"""
+        store = PreferenceStore()
+        store._adopt(self._preference("s-1"), ("s-1", None))
+        first = store.get("s-1")
+        second = store.get("s-1")
+        assert first is not second
+        assert first.is_persisted
+
+        first.spicy_preference = 0.99
+        first.preference_vector[0] = 0.99
+        assert second.spicy_preference != 0.99
+        assert store.get("s-1").preference_vector[0] != 0.99
+
+    def test_clean_entry_expires(self):
+        """변경 없는 항목은 ttl이 지나면 다시 DB에서 읽도록 None"""
+        store = PreferenceStore(ttl=0)
+        store._adopt(self._preference("s-1"), ("s-1", None))
+        assert store.get("s-1") is None
+
+    def test_absorb_sql_learning(self):
+        """SQL 학습 결과는 기록 전 학습이 없는 항목에만 반영 (있으면 flush 충돌로 재적용)"""
+        store = PreferenceStore()
+        clean, dirty = self._preference("s-1"), self._preference("s-2")
+        store._adopt(clean, ("s-1", None))
+        store._adopt(dirty, ("s-2", None))
+        store._entries[dirty.id].pending.append((None, 1.0))
+
+        packed = [0.9] + [0.5] * 9
+        for row in (clean, dirty):
+            store.absorb(LearnedPreference(row.id, row.session_id, packed, 1, "A", 1))
+        assert store.get("s-1").spicy_preference == pytest.approx(0.9)
+        assert store.get("s-1").version == 1
+        assert store.get("s-2").version == 0
+
+        # 더 오래된 버전은 무시
+        store.absorb(LearnedPreference(clean.id, "s-1", [0.1] * 10, 0, "A", 0))
+        assert store.get("s-1").spicy_preference == pytest.approx(0.9)